@@ -0,0 +1,164 @@
+import typing
+
+import numpy as np
+
+from . import defaults
+from .EnergyTracker import EnergyTracker
+from .State import State
+
+
+class BatchState:
+    """Simulation state for a population of same-shaped individuals, stacked
+    along a leading individual axis.
+
+    Mirrors `State` attributes, so update components that operate on trailing
+    cell row and column axes apply to all individuals at once.
+
+    Attributes
+    ----------
+    px, py : np.ndarray
+        Cell positions, as 3-dimensional floating point arrays with shape
+        `(population_size, height, width)`.
+    vx, vy : np.ndarray
+        Cell velocities, as 3-dimensional floating point arrays with shape
+        `(population_size, height, width)`.
+    t : np.ndarray
+        Elapsed time for each individual, as 1-dimensional floating point
+        array with shape `(population_size,)`.
+    energy : EnergyTracker, optional
+        Opt-in energy accounting, with one value per individual.
+    """
+
+    # position
+    px: np.ndarray
+    py: np.ndarray
+
+    # velocity
+    vx: np.ndarray
+    vy: np.ndarray
+
+    # elapsed time
+    t: np.ndarray
+
+    # opt-in energy accounting, see EnergyTracker
+    energy: typing.Optional[EnergyTracker]
+
+    def __init__(
+        self: "BatchState",
+        population_size: int,
+        height: typing.Optional[int] = None,
+        width: typing.Optional[int] = None,
+        dtype: typing.Union[np.dtype, type, str, None] = None,
+    ) -> None:
+        """Initialize BatchState, with each individual default-initialized as
+        `State(height, width, dtype)`."""
+        if population_size < 0:
+            raise ValueError(f"{population_size=} must be non-negative")
+
+        state = State(height=height, width=width, dtype=dtype)
+        shape = (population_size, *state.px.shape)
+        self.px = np.broadcast_to(state.px, shape).copy()
+        self.py = np.broadcast_to(state.py, shape).copy()
+        self.vx = np.broadcast_to(state.vx, shape).copy()
+        self.vy = np.broadcast_to(state.vy, shape).copy()
+        self.t = np.full(population_size, state.t)
+        self.energy = None
+
+    def __eq__(self: "BatchState", other: "BatchState") -> bool:
+        """Test equality."""
+        return (
+            (type(self) == type(other))
+            and np.array_equal(self.px, other.px, equal_nan=True)
+            and np.array_equal(self.py, other.py, equal_nan=True)
+            and np.array_equal(self.vx, other.vx, equal_nan=True)
+            and np.array_equal(self.vy, other.vy, equal_nan=True)
+            and np.array_equal(self.t, other.t, equal_nan=True)
+        )
+
+    @staticmethod
+    def from_states(states: typing.Sequence[State]) -> "BatchState":
+        """Create `BatchState` by stacking copies of same-shaped `State`
+        objects.
+
+        Static factory method. If states track energy, their trackers are
+        stacked. Either all or none of `states` must track energy.
+        """
+        if not len(states):
+            raise ValueError("at least one State is required")
+        height, width = states[0].px.shape
+        res = BatchState(len(states), height=height, width=width)
+        res.px = np.stack([state.px for state in states])
+        res.py = np.stack([state.py for state in states])
+        res.vx = np.stack([state.vx for state in states])
+        res.vy = np.stack([state.vy for state in states])
+        res.t = np.array([state.t for state in states], dtype=float)
+
+        trackers = [state.energy for state in states]
+        if all(tracker is not None for tracker in trackers):
+            res.energy = EnergyTracker.stack(trackers)
+        elif any(tracker is not None for tracker in trackers):
+            raise ValueError("all or none of states must track energy")
+        return res
+
+    @property
+    def dtype(self: "BatchState") -> np.dtype:
+        """Floating point type of position and velocity arrays."""
+        return self.px.dtype
+
+    @property
+    def height(self: "BatchState") -> int:
+        """Number of cell rows in each individual."""
+        return self.px.shape[1]
+
+    @property
+    def ncells(self: "BatchState") -> int:
+        """Number of cells in each individual."""
+        return self.height * self.width
+
+    @property
+    def population_size(self: "BatchState") -> int:
+        """Number of individuals in batch."""
+        return self.px.shape[0]
+
+    @property
+    def width(self: "BatchState") -> int:
+        """Number of cell columns in each individual."""
+        return self.px.shape[2]
+
+    def get_state(self: "BatchState", index: int) -> State:
+        """Copy out State of individual at `index`."""
+        res = State(height=self.height, width=self.width)
+        res.px = self.px[index].copy()
+        res.py = self.py[index].copy()
+        res.vx = self.vx[index].copy()
+        res.vy = self.vy[index].copy()
+        res.t = float(self.t[index])
+        if self.energy is not None:
+            res.energy = self.energy.select(index)
+        return res
+
+    def select(self: "BatchState", mask: np.ndarray) -> "BatchState":
+        """Create `BatchState` containing copies of individuals where boolean
+        `mask` is True, in order."""
+        res = BatchState(0, height=self.height, width=self.width)
+        res.px = self.px[mask]
+        res.py = self.py[mask]
+        res.vx = self.vx[mask]
+        res.vy = self.vy[mask]
+        res.t = self.t[mask]
+        if self.energy is not None:
+            res.energy = self.energy.select(mask)
+        return res
+
+    def validate(self: "BatchState") -> bool:
+        """Test if any individual's state contains invalid values."""
+        # NaN propagates through min, so one reduction per array detects any
+        # NaN without allocating a temporary boolean array
+        return (
+            not np.isnan(self.px.min(initial=np.inf))
+            and not np.isnan(self.py.min(initial=np.inf))
+            and not np.isnan(self.vx.min(initial=np.inf))
+            and not np.isnan(self.vy.min(initial=np.inf))
+            and not np.isnan(self.t.min(initial=np.inf))
+            and self.t.min(initial=np.inf) >= 0
+        )
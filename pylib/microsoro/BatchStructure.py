@@ -0,0 +1,218 @@
+import typing
+
+import numpy as np
+
+from .Params import Params
+from .Structure import _get_lattice_stable_dt, Structure
+from .StructureConstants import StructureConstants
+
+
+_field_names = (
+    "bc",
+    "br",
+    "ba",
+    "bd",
+    "kc",
+    "kr",
+    "ka",
+    "kd",
+    "lc",
+    "lr",
+    "la",
+    "ld",
+    "m",
+)
+
+
+class BatchStructure:
+    """Fixed cell and inter-cell structure for a population of same-shaped
+    individuals, stacked along a leading individual axis.
+
+    Mirrors `Structure` attributes, so update components that operate on
+    trailing cell row and column axes apply to all individuals at once.
+
+    Attributes
+    ----------
+    bc, br, ba, bd : np.ndarray
+        Damping constants for columns, rows, ascending diagonals, and
+        descending diagonals, respectively, as 3-dimensional floating point
+        arrays.
+    kc, kr, ka, kd : np.ndarray
+        Spring constants (stiffness) for columns, rows, ascending diagonals,
+        and descending diagonals, respectively, as 3-dimensional floating point
+        arrays.
+    lc, lr, la, ld : np.ndarray
+        Spring rest lengths for columns, rows, ascending diagonals, and
+        descending diagonals, respectively, as 3-dimensional floating point
+        arrays.
+    m : np.ndarray
+        Cell masses, as 3-dimensional floating point array.
+
+    Properties
+    ----------
+    dtype : np.dtype
+        Floating point type of structure arrays.
+    height : int
+        Number of cell rows in each individual.
+    population_size : int
+        Number of individuals in batch.
+    width : int
+        Number of cell columns in each individual.
+    """
+
+    bc: np.ndarray  # damping constant, columns
+    br: np.ndarray  # damping constant, rows
+    ba: np.ndarray  # damping constant, ascending diagonals
+    bd: np.ndarray  # damping constant, descending diagonals
+
+    kc: np.ndarray  # spring constant, columns
+    kr: np.ndarray  # spring constant, rows
+    ka: np.ndarray  # spring constant, ascending diagonals
+    kd: np.ndarray  # spring constant, descending diagonals
+
+    lc: np.ndarray  # spring lengths, columns
+    lr: np.ndarray  # spring lengths, rows
+    la: np.ndarray  # spring lengths, ascending diagonals
+    ld: np.ndarray  # spring lengths, descending diagonals
+
+    m: np.ndarray  # masses
+
+    _constants: typing.Optional[StructureConstants]  # see get_constants
+
+    @property
+    def dtype(self: "BatchStructure") -> np.dtype:
+        """Floating point type of structure arrays."""
+        return self.m.dtype
+
+    @property
+    def height(self: "BatchStructure") -> int:
+        """Number of cell rows in each individual."""
+        return self.m.shape[1]
+
+    @property
+    def population_size(self: "BatchStructure") -> int:
+        """Number of individuals in batch."""
+        return self.m.shape[0]
+
+    @property
+    def width(self: "BatchStructure") -> int:
+        """Number of cell columns in each individual."""
+        return self.m.shape[2]
+
+    def __init__(
+        self: "BatchStructure",
+        population_size: int,
+        height: typing.Optional[int] = None,
+        width: typing.Optional[int] = None,
+        params: typing.Optional[Params] = None,
+    ) -> None:
+        """Initialize BatchStructure, with each individual default-initialized
+        as `Structure(height, width, params)`."""
+        if population_size < 0:
+            raise ValueError(f"{population_size=} must be non-negative")
+
+        self._constants = None
+        structure = Structure(height=height, width=width, params=params)
+        for field_name in _field_names:
+            field = getattr(structure, field_name)
+            shape = (population_size, *field.shape)
+            setattr(self, field_name, np.broadcast_to(field, shape).copy())
+
+    def __eq__(self: "BatchStructure", other: "BatchStructure") -> bool:
+        """Test equality."""
+        return type(self) == type(other) and all(
+            np.array_equal(
+                getattr(self, field_name), getattr(other, field_name)
+            )
+            for field_name in _field_names
+        )
+
+    @staticmethod
+    def from_structures(
+        structures: typing.Sequence[Structure],
+    ) -> "BatchStructure":
+        """Create `BatchStructure` by stacking copies of same-shaped
+        `Structure` objects.
+
+        Static factory method.
+        """
+        if not len(structures):
+            raise ValueError("at least one Structure is required")
+        res = BatchStructure(0, structures[0].height, structures[0].width)
+        for field_name in _field_names:
+            field = np.stack(
+                [getattr(structure, field_name) for structure in structures],
+            )
+            setattr(res, field_name, field)
+        return res
+
+    def get_constants(
+        self: "BatchStructure",
+        params: typing.Optional[Params] = None,
+    ) -> StructureConstants:
+        """Get constants derived from structure and `params.dt`, i.e., inverse
+        masses and clipped damping constants, for use by update components.
+
+        Constants are built lazily and cached. Cached constants are rebuilt if
+        `params.dt` changes or if structure arrays are reassigned. After
+        modifying structure array contents in place, call
+        `invalidate_constants`.
+
+        Parameters
+        ----------
+        params : Params, optional
+            Provides timestep size `dt`. If not provided, default-initialized
+            Params will be used.
+
+        Returns
+        -------
+        StructureConstants
+            Derived constants, with arrays shaped as corresponding structure
+            arrays.
+        """
+        if params is None:
+            params = Params()
+        constants = self._constants
+        if constants is None or not constants.is_current(self, params):
+            constants = StructureConstants(self, params)
+            self._constants = constants
+        return constants
+
+    def invalidate_constants(self: "BatchStructure") -> None:
+        """Discard cached derived constants, so they are rebuilt on next
+        `get_constants` call."""
+        self._constants = None
+
+    def get_structure(self: "BatchStructure", index: int) -> Structure:
+        """Copy out Structure of individual at `index`."""
+        res = Structure(height=self.height, width=self.width)
+        for field_name in _field_names:
+            field = getattr(self, field_name)[index].copy()
+            setattr(res, field_name, field)
+        return res
+
+    def stable_dt(
+        self: "BatchStructure",
+        params: typing.Optional[Params] = None,
+        safety: float = 0.9,
+    ) -> float:
+        """Estimate largest timestep stable for every individual under
+        explicit integration.
+
+        See `Structure.stable_dt`.
+        """
+        if not safety > 0:
+            raise ValueError(f"{safety=} must be positive")
+        if params is None:
+            params = Params()
+
+        res = _get_lattice_stable_dt(self).min(initial=np.inf)
+        return float(np.clip(safety * res, *params.dt_lim))
+
+    def select(self: "BatchStructure", mask: np.ndarray) -> "BatchStructure":
+        """Create `BatchStructure` containing copies of individuals where
+        boolean `mask` is True, in order."""
+        res = BatchStructure(0, self.height, self.width)
+        for field_name in _field_names:
+            setattr(res, field_name, getattr(self, field_name)[mask])
+        return res
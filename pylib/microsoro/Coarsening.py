@@ -0,0 +1,267 @@
+import typing
+
+import numpy as np
+
+from .Params import Params
+from .State import State
+from .Structure import Structure
+from .Workspace import Workspace
+
+
+# (head, tail) cell slices for each spring family, keyed on family letter
+# of structure field names (i.e., "c" for "kc")
+_family_slices = {
+    "c": (np.s_[:-1, :], np.s_[1:, :]),
+    "r": (np.s_[:, :-1], np.s_[:, 1:]),
+    "a": (np.s_[:-1, :-1], np.s_[1:, 1:]),
+    "d": (np.s_[:-1, 1:], np.s_[1:, :-1]),
+}
+
+
+def _get_block_centers(size: int, factor: int) -> np.ndarray:
+    """Get mean fine row (or column) index of each coarse row (or column),
+    merging `factor` at a time, with any remainder merged into the last
+    block."""
+    block_size = min(factor, size)
+    starts = np.arange(size // block_size) * block_size
+    stops = np.append(starts[1:], size)
+    return (starts + stops - 1) / 2
+
+
+def _get_interpolation(
+    centers: np.ndarray, size: int
+) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get lower and upper coarse indices and upper weights to linearly
+    interpolate (or, past outermost `centers`, extrapolate) values at coarse
+    `centers` onto `size` fine indices."""
+    if len(centers) == 1:
+        lower = np.zeros(size, dtype=int)
+        return lower, lower, np.zeros(size)
+
+    fine = np.arange(size)
+    lower = np.clip(np.searchsorted(centers, fine) - 1, 0, len(centers) - 2)
+    upper = lower + 1
+    weight = (fine - centers[lower]) / (centers[upper] - centers[lower])
+    return lower, upper, weight
+
+
+def _sum_blocks(
+    values: np.ndarray,
+    factor: int,
+    out: typing.Optional[np.ndarray] = None,
+    workspace: typing.Optional[Workspace] = None,
+) -> np.ndarray:
+    """Sum `values` over blocks of `factor` x `factor` cells, with any
+    remainder rows (or columns) summed into the last block."""
+    if workspace is None:
+        workspace = Workspace()
+    height, width = values.shape
+    row_block, col_block = min(factor, height), min(factor, width)
+    num_rows, num_cols = height // row_block, width // col_block
+
+    split = num_rows * row_block
+    row_sums = workspace.get("row_sums", (num_rows, width), values.dtype)
+    np.sum(
+        values[:split].reshape(num_rows, row_block, width),
+        axis=1,
+        out=row_sums,
+    )
+    if split < height:
+        row_sums[-1] += values[split:].sum(axis=0)
+
+    split = num_cols * col_block
+    if out is None:
+        out = np.empty((num_rows, num_cols), dtype=values.dtype)
+    np.sum(
+        row_sums[:, :split].reshape(num_rows, num_cols, col_block),
+        axis=2,
+        out=out,
+    )
+    if split < width:
+        out[:, -1] += row_sums[:, split:].sum(axis=1)
+    return out
+
+
+class Coarsening:
+    """Maps between the lattice of a `Structure` and a coarser lattice,
+    formed by merging square blocks of cells.
+
+    Coarse cells sit at the rest-position centroids of their blocks, with
+    block masses summed. Coarse spring stiffness and damping constants are
+    block means of the fine constants incident to each cell, which preserves
+    elastic moduli and mass density of the lattice, so gross motion is
+    reproduced at a fraction of the cells. Coarse spring rest lengths are
+    fine rest lengths scaled by the spacing between block centroids.
+
+    States are restricted to the coarse lattice by mass-weighted block means
+    of positions and velocities, which conserves momentum, and are prolonged
+    back to the fine lattice by linear interpolation between block
+    centroids. For uniform cell masses, restricting and then prolonging
+    reproduces translations, rotations, and uniform stretches exactly. Both
+    take a few passes over fine arrays, without allocating once scratch
+    buffers are warmed up.
+
+    Attributes
+    ----------
+    factor : int
+        Number of fine rows (and columns) merged into each coarse row (and
+        column). Any remainder rows (or columns) are merged into the last
+        block.
+    structure : Structure
+        Coarsened structure.
+    """
+
+    factor: int
+    structure: Structure
+
+    _col_interpolation: typing.Tuple[np.ndarray, np.ndarray, np.ndarray]
+    _row_interpolation: typing.Tuple[np.ndarray, np.ndarray, np.ndarray]
+    _fine_m: np.ndarray
+    _fine_shape: typing.Tuple[int, int]
+    _inv_coarse_m: np.ndarray
+    _workspace: Workspace
+
+    def __init__(
+        self: "Coarsening",
+        structure: Structure,
+        factor: int = 2,
+    ) -> None:
+        """Coarsen `structure` by `factor`.
+
+        Raises
+        ------
+        ValueError
+            If `factor` is not a positive integer.
+        """
+        if not (isinstance(factor, int) and factor > 0):
+            raise ValueError(f"{factor=} must be a positive integer")
+
+        self.factor = factor
+        self._fine_shape = (structure.height, structure.width)
+        self._fine_m = structure.m
+        self._workspace = Workspace()
+
+        row_centers = _get_block_centers(structure.height, factor)
+        col_centers = _get_block_centers(structure.width, factor)
+        self._row_interpolation = _get_interpolation(
+            row_centers, structure.height
+        )
+        self._col_interpolation = _get_interpolation(
+            col_centers, structure.width
+        )
+
+        res = Structure(
+            height=len(row_centers),
+            width=len(col_centers),
+            params=Params(dtype=structure.dtype),
+        )
+        res.m = _sum_blocks(structure.m, factor)
+        self._inv_coarse_m = 1 / res.m
+        block_counts = _sum_blocks(np.ones(self._fine_shape), factor)
+        dr = np.diff(row_centers)[:, None]  # coarse spacing, in fine cells
+        dc = np.diff(col_centers)[None, :]
+        for fields, scale in (
+            (("bc", "kc"), 1.0),
+            (("br", "kr"), 1.0),
+            (("ba", "ka"), 1.0),
+            (("bd", "kd"), 1.0),
+            (("lc",), dr),
+            (("lr",), dc),
+            (("la", "ld"), np.hypot(dr, dc) / np.sqrt(2)),
+        ):
+            for field in fields:
+                cellwise = self._get_cellwise(structure, field)
+                cellwise = _sum_blocks(cellwise, factor) / block_counts
+                springs = self._get_springs(cellwise, field) * scale
+                setattr(res, field, springs.astype(structure.dtype))
+        self.structure = res
+
+    @staticmethod
+    def _get_cellwise(structure: Structure, field: str) -> np.ndarray:
+        """Average spring values of `field` onto incident cells."""
+        values = getattr(structure, field)
+        sums = np.zeros(structure.m.shape)
+        counts = np.zeros(structure.m.shape)
+        for cells in _family_slices[field[1]]:
+            sums[cells] += values
+            counts[cells] += 1
+        # cells without springs of family (i.e., one-row lattice) take mean
+        mean = values.mean() if values.size else 0.0
+        return np.divide(
+            sums, counts, out=np.full(sums.shape, mean), where=counts > 0
+        )
+
+    @staticmethod
+    def _get_springs(cellwise: np.ndarray, field: str) -> np.ndarray:
+        """Average cellwise values onto springs of `field`'s family, as
+        `Structure.set_*_to_norms` does."""
+        head, tail = _family_slices[field[1]]
+        return (cellwise[head] + cellwise[tail]) / 2
+
+    def restrict(
+        self: "Coarsening",
+        state: State,
+        out: typing.Optional[State] = None,
+    ) -> State:
+        """Map fine `state` onto coarse lattice, by mass-weighted block means
+        of positions and velocities.
+
+        If `out` is provided, results are written into it.
+        """
+        if out is None:
+            out = State(
+                self.structure.height, self.structure.width, dtype=state.dtype
+            )
+        workspace = self._workspace
+        weighted = workspace.get("weighted", self._fine_shape, state.dtype)
+        for field in "px", "py", "vx", "vy":
+            coarse = getattr(out, field)
+            np.multiply(getattr(state, field), self._fine_m, out=weighted)
+            _sum_blocks(weighted, self.factor, coarse, workspace)
+            coarse *= self._inv_coarse_m
+        out.t = state.t
+        return out
+
+    def prolong(
+        self: "Coarsening",
+        coarse_state: State,
+        out: typing.Optional[State] = None,
+    ) -> State:
+        """Map `coarse_state` onto fine lattice, by linear interpolation of
+        positions and velocities between block centroids.
+
+        Interpolates along columns at coarse height first, so the fine
+        lattice takes only row gathers and one multiply-add.
+
+        If `out` is provided, results are written into it.
+        """
+        if out is None:
+            out = State(*self._fine_shape, dtype=coarse_state.dtype)
+        workspace = self._workspace
+        dtype = coarse_state.dtype
+        row_lower, __, row_weight = self._row_interpolation
+        col_lower, col_upper, col_weight = self._col_interpolation
+        coarse_height = self.structure.height
+        shape = (coarse_height, self._fine_shape[1])
+
+        rows = workspace.get("rows", shape, dtype)
+        row_steps = workspace.get("row_steps", shape, dtype)
+        steps = workspace.get("steps", self._fine_shape, dtype)
+        for field in "px", "py", "vx", "vy":
+            coarse = getattr(coarse_state, field)
+            fine = getattr(out, field)
+            # interpolate along columns, at coarse height
+            np.take(coarse, col_lower, axis=1, out=rows, mode="clip")
+            np.take(coarse, col_upper, axis=1, out=row_steps, mode="clip")
+            row_steps -= rows
+            row_steps *= col_weight
+            rows += row_steps
+            # then along rows, onto fine lattice
+            np.take(rows, row_lower, axis=0, out=fine, mode="clip")
+            if coarse_height > 1:
+                np.subtract(rows[1:], rows[:-1], out=row_steps[:-1])
+                np.take(row_steps, row_lower, axis=0, out=steps, mode="clip")
+                steps *= row_weight[:, None]
+                fine += steps
+        out.t = coarse_state.t
+        return out
@@ -0,0 +1,184 @@
+import typing
+
+import numpy as np
+
+from .Params import Params
+from .Structure import Structure
+
+
+class EnergyTracker:
+    """Running account of kinetic, gravitational potential, and elastic
+    potential energy, updated incrementally by update components.
+
+    Opt in by attaching a tracker to `State.energy` (or `BatchState.energy`),
+    i.e., with the `ApplyEnergyTracking` conditioner. Spring components then
+    record elastic potential energy of their spring families from spring
+    extensions they already compute, at the cost of one fused reduction per
+    family. `ApplyIncrementElapsedTime` closes out each step, summing spring
+    families and computing kinetic and gravitational energy with one fused
+    reduction over cells each. No spring geometry is recomputed.
+
+    Energies are reported as scalars, or as arrays with one value per
+    individual for `BatchState`. All are NaN until a step has been closed.
+
+    Attributes
+    ----------
+    elastic : float or np.ndarray
+        Spring potential energy, `0.5 * k * (length - rest length)**2`
+        summed over springs, as of last closed step.
+    gravitational : float or np.ndarray
+        Gravitational potential energy, `m * g * py` summed over cells, as of
+        last closed step.
+    kinetic : float or np.ndarray
+        Kinetic energy, `0.5 * m * |v|**2` summed over cells, as of last
+        closed step.
+
+    Notes
+    -----
+    Spring extensions are recorded when spring forces are applied, so under
+    "explicit" integration elastic energy lags positions by one step. Under
+    "verlet" integration, spring forces are reapplied at updated positions,
+    so all three energies are in sync. Components without energy accounting,
+    i.e., the numba backend and the tiled, multiprocess, and sleeping spring
+    components, leave elastic energy unrecorded.
+    """
+
+    elastic: typing.Union[float, np.ndarray]
+    gravitational: typing.Union[float, np.ndarray]
+    kinetic: typing.Union[float, np.ndarray]
+
+    _elastic_parts: typing.Dict[str, typing.Union[float, np.ndarray]]
+    _g: float
+    _m: np.ndarray
+
+    def __init__(
+        self: "EnergyTracker",
+        params: typing.Optional[Params] = None,
+        structure: typing.Optional[typing.Any] = None,
+    ) -> None:
+        """Initialize tracker.
+
+        Parameters
+        ----------
+        params : Params, optional
+            Configuration parameters, from which gravitational constant is
+            taken. If not provided, a default `Params` instance will be used.
+        structure : Structure, GraphStructure, or BatchStructure, optional
+            Structure from which cell masses are taken. If not provided, a
+            default `Structure` instance will be used.
+        """
+        if params is None:
+            params = Params()
+        if structure is None:
+            structure = Structure(params=params)
+        self._g = params.g
+        self._m = structure.m
+        self._elastic_parts = dict()
+        self.elastic = self.gravitational = self.kinetic = np.nan
+
+    @property
+    def total(self: "EnergyTracker") -> typing.Union[float, np.ndarray]:
+        """Sum of kinetic, gravitational, and elastic energy."""
+        return self.kinetic + self.gravitational + self.elastic
+
+    @staticmethod
+    def stack(trackers: typing.Sequence["EnergyTracker"]) -> "EnergyTracker":
+        """Create tracker for a `BatchState` stacked from `State` objects
+        tracked by `trackers`, with masses stacked along a leading axis.
+
+        Static factory method.
+        """
+        if not len(trackers):
+            raise ValueError("at least one EnergyTracker is required")
+        if len({tracker._g for tracker in trackers}) > 1:
+            raise ValueError("trackers must share gravitational constant")
+
+        res = EnergyTracker.__new__(EnergyTracker)
+        res._g = trackers[0]._g
+        res._m = np.stack(
+            [
+                np.broadcast_to(tracker._m, trackers[0]._m.shape)
+                for tracker in trackers
+            ]
+        )
+        res._elastic_parts = dict()
+        for field in ("elastic", "gravitational", "kinetic"):
+            setattr(
+                res,
+                field,
+                np.array([getattr(tracker, field) for tracker in trackers]),
+            )
+        return res
+
+    def select(
+        self: "EnergyTracker",
+        key: typing.Union[int, np.ndarray],
+    ) -> "EnergyTracker":
+        """Create tracker for individuals of a `BatchState` at index or
+        boolean mask `key`, i.e., to accompany `BatchState.get_state` or
+        `BatchState.select`."""
+        res = EnergyTracker.__new__(EnergyTracker)
+        res._g = self._g
+        res._m = self._m[key] if self._m.ndim > 2 else self._m
+        res._elastic_parts = dict()
+        for field in ("elastic", "gravitational", "kinetic"):
+            value = getattr(self, field)
+            setattr(res, field, value[key] if np.ndim(value) else value)
+        return res
+
+    def record_elastic(
+        self: "EnergyTracker",
+        family: str,
+        energy: typing.Union[float, np.ndarray],
+    ) -> None:
+        """Record elastic energy of a spring family for the current step.
+
+        Recording a family again within a step (i.e., for a second half-step
+        kick) replaces its energy.
+        """
+        self._elastic_parts[family] = energy
+
+    def record_springs(
+        self: "EnergyTracker",
+        family: str,
+        extension: np.ndarray,
+        k: np.ndarray,
+        num_spring_axes: int = 2,
+    ) -> None:
+        """Record elastic energy of a spring family for the current step,
+        from spring extensions.
+
+        Parameters
+        ----------
+        family : str
+            Identifies spring family.
+        extension : np.ndarray
+            Spring lengths less rest lengths.
+        k : np.ndarray
+            Spring constants, with the same trailing spring axes as
+            `extension`.
+        num_spring_axes : int, default 2
+            Number of trailing axes of `extension` indexing springs. Any
+            leading axes index individuals.
+        """
+        if num_spring_axes not in (1, 2):
+            raise ValueError(f"{num_spring_axes=} must be 1 or 2")
+        springs = "ij"[:num_spring_axes]
+        subscripts = f"...{springs},...{springs},...{springs}->..."
+        self.record_elastic(
+            family, 0.5 * np.einsum(subscripts, extension, extension, k)
+        )
+
+    def close_step(self: "EnergyTracker", state: typing.Any) -> None:
+        """Compute kinetic and gravitational energy of `state`, and total
+        recorded elastic energy, as energies of the completed step."""
+        m = self._m
+        subscripts = "...ij,...ij,...ij->..."
+        self.kinetic = 0.5 * (
+            np.einsum(subscripts, state.vx, state.vx, m)
+            + np.einsum(subscripts, state.vy, state.vy, m)
+        )
+        self.gravitational = self._g * np.einsum(
+            "...ij,...ij->...", m, state.py
+        )
+        self.elastic = sum(self._elastic_parts.values(), 0.0)
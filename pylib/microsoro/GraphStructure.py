@@ -0,0 +1,362 @@
+import typing
+import warnings
+
+import numpy as np
+from skimage import transform as skimg_transform
+
+from .Params import Params
+from .Structure import _get_cellwise_stable_dt, Structure
+
+
+# (head, tail) cell slices for each lattice spring family, with
+# corresponding damping constant field (diagonal springs are undamped)
+_lattice_families = (
+    (np.s_[:-1, :], np.s_[1:, :], "kc", "lc", "bc"),
+    (np.s_[:, :-1], np.s_[:, 1:], "kr", "lr", "br"),
+    (np.s_[:-1, :-1], np.s_[1:, 1:], "ka", "la", None),
+    (np.s_[:-1, 1:], np.s_[1:, :-1], "kd", "ld", None),
+)
+
+
+class GraphStructure:
+    """Fixed configuration for cell and inter-cell structure, as a graph of
+    springs between cells present in a mask.
+
+    Unlike `Structure`, springs are not restricted to the full rectangular
+    lattice, so body plans may have holes or missing cells. Cells are laid
+    out on the same `height` by `width` grid as `State`, and numbered in
+    row-major order. Cells outside the mask have no springs, and may be
+    excluded from evaluation.
+
+    Attributes
+    ----------
+    mask : np.ndarray
+        Which cells are present, as 2-dimensional boolean array.
+    i, j : np.ndarray
+        Row-major numbers of cells at each end of each spring, as
+        1-dimensional integer arrays.
+    k : np.ndarray
+        Spring constants (stiffness), as 1-dimensional floating point array.
+    l : np.ndarray
+        Spring rest lengths, as 1-dimensional floating point array.
+    b : np.ndarray
+        Damping constants, as 1-dimensional floating point array.
+    m : np.ndarray
+        Cell masses, as 2-dimensional floating point array.
+
+    Properties
+    ----------
+    dtype : np.dtype
+        Floating point type of structure arrays.
+    height : int
+        Number of cell rows in state.
+    num_edges : int
+        Number of springs.
+    width : int
+        Number of cell columns in state.
+    """
+
+    mask: np.ndarray  # cell presence
+
+    i: np.ndarray  # spring head cells
+    j: np.ndarray  # spring tail cells
+
+    k: np.ndarray  # spring constants
+    l: np.ndarray  # spring lengths
+    b: np.ndarray  # damping constants
+
+    m: np.ndarray  # masses
+
+    @property
+    def dtype(self: "GraphStructure") -> np.dtype:
+        """Floating point type of structure arrays."""
+        return self.m.dtype
+
+    @property
+    def height(self: "GraphStructure") -> int:
+        """Number of cell rows in state."""
+        return self.m.shape[0]
+
+    @property
+    def num_edges(self: "GraphStructure") -> int:
+        """Number of springs."""
+        return len(self.i)
+
+    @property
+    def width(self: "GraphStructure") -> int:
+        """Number of cell columns in state."""
+        return self.m.shape[1]
+
+    def __init__(
+        self: "GraphStructure",
+        mask: np.ndarray,
+        i: np.ndarray,
+        j: np.ndarray,
+        k: np.ndarray,
+        l: np.ndarray,
+        b: np.ndarray,
+        m: np.ndarray,
+    ) -> None:
+        """Initialize GraphStructure from cell mask, spring edge list, and
+        cell masses.
+
+        Parameters
+        ----------
+        mask : np.ndarray
+            Which cells are present, as 2D boolean array.
+        i, j : np.ndarray
+            Row-major numbers of cells at each end of each spring.
+
+            Both ends of each spring must be present in `mask`.
+        k, l, b : np.ndarray
+            Spring constants, spring rest lengths, and damping constants for
+            each spring, respectively.
+        m : np.ndarray
+            Cell masses, as 2D array shaped as `mask`.
+
+            Sets floating point type of structure arrays.
+
+        Raises
+        ------
+        ValueError
+            If array shapes are inconsistent, or if any spring does not join
+            two distinct cells present in `mask`.
+        """
+        m = np.asarray(m)
+        dtype = m.dtype
+        self.mask = np.asarray(mask, dtype=bool)
+        self.i = np.asarray(i, dtype=np.intp)
+        self.j = np.asarray(j, dtype=np.intp)
+        self.k = np.asarray(k, dtype=dtype)
+        self.l = np.asarray(l, dtype=dtype)
+        self.b = np.asarray(b, dtype=dtype)
+        self.m = m
+
+        if self.mask.shape != self.m.shape or self.m.ndim != 2:
+            raise ValueError(f"{mask.shape=} and {m.shape=} must match")
+        num_edges = len(self.i)
+        for field in self.i, self.j, self.k, self.l, self.b:
+            if field.shape != (num_edges,):
+                raise ValueError(f"{field.shape=} must be ({num_edges},)")
+
+        num_cells = self.m.size
+        endpoints = np.concatenate([self.i, self.j])
+        if np.any((endpoints < 0) | (endpoints >= num_cells)):
+            raise ValueError(f"{endpoints=} must be cells within {mask.shape}")
+        if np.any(self.i == self.j):
+            raise ValueError("springs must join distinct cells")
+        if not np.all(self.mask.ravel()[endpoints]):
+            raise ValueError("springs must join cells present in mask")
+
+    def __eq__(self: "GraphStructure", other: "GraphStructure") -> bool:
+        """Test equality."""
+        return type(self) == type(other) and all(
+            np.array_equal(
+                getattr(self, field_name), getattr(other, field_name)
+            )
+            for field_name in ("mask", "i", "j", "k", "l", "b", "m")
+        )
+
+    @staticmethod
+    def from_structure(
+        structure: Structure,
+        mask: typing.Optional[np.ndarray] = None,
+    ) -> "GraphStructure":
+        """Create `GraphStructure` equivalent to lattice `Structure`,
+        optionally with cells removed.
+
+        Static factory method.
+
+        Parameters
+        ----------
+        structure : Structure
+            Lattice structure to take springs and masses from.
+        mask : np.ndarray, optional
+            Which cells to keep, as 2D boolean array shaped as `structure`.
+
+            Springs touching removed cells are dropped. If not provided, all
+            cells are kept.
+
+        Returns
+        -------
+        GraphStructure
+            Springs ordered by family (columns, rows, ascending diagonals,
+            then descending diagonals) and then by row-major head cell.
+
+        Notes
+        -----
+        Diagonal springs are given zero damping, matching lattice update
+        components, which do not apply `ba` or `bd`.
+        """
+        shape = (structure.height, structure.width)
+        if mask is None:
+            mask = np.ones(shape, dtype=bool)
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != shape:
+            raise ValueError(f"{mask.shape=} must match structure {shape}")
+
+        cells = np.arange(np.prod(shape)).reshape(shape)
+        i, j, k, l, b = [], [], [], [], []
+        for head, tail, k_field, l_field, b_field in _lattice_families:
+            keep = mask[head] & mask[tail]
+            i.append(cells[head][keep])
+            j.append(cells[tail][keep])
+            k.append(getattr(structure, k_field)[keep])
+            l.append(getattr(structure, l_field)[keep])
+            if b_field is None:
+                b.append(np.zeros(np.count_nonzero(keep)))
+            else:
+                b.append(getattr(structure, b_field)[keep])
+
+        return GraphStructure(
+            mask=mask,
+            i=np.concatenate(i),
+            j=np.concatenate(j),
+            k=np.concatenate(k),
+            l=np.concatenate(l),
+            b=np.concatenate(b),
+            m=structure.m.copy(),
+        )
+
+    @staticmethod
+    def make_from_bytes(
+        height: typing.Optional[int] = None,
+        width: typing.Optional[int] = None,
+        params: typing.Optional[Params] = None,
+        b: typing.Optional[np.ndarray] = None,  # cellwise bytes
+        k: typing.Optional[np.ndarray] = None,  # cellwise bytes
+        l: typing.Optional[np.ndarray] = None,  # cellwise bytes
+        m: typing.Optional[np.ndarray] = None,  # cellwise bytes
+        mask: typing.Optional[np.ndarray] = None,  # cellwise bytes
+    ) -> "GraphStructure":
+        """Creates a `GraphStructure` instance from the provided byte arrays.
+
+        Lattice springs are built as by `Structure.make_from_bytes`, then
+        restricted to cells present according to `mask`.
+
+        Parameters
+        ----------
+        height : int, optional
+            Number of cell rows in state.
+
+            If not provided, defaults to `defaults.nrow`.
+        width : int, optional
+            Number of cell columns in state
+
+            If not provided, defaults to `defaults.ncol`.
+        params : Params, optional
+            Mapped-to ranges for cellwise norms and fallback parameters for any
+            unspecified structure elements.
+
+            If not provided, default-initialized Params will be used.
+        b, k, l, m : np.ndarray, optional
+            Cellwise values, each provided as a 2D array of integer values
+            between 0 and 255.
+
+            See `Structure.make_from_bytes`.
+        mask : np.ndarray, optional
+            Cellwise presence, provided as a 2D array of integer values
+            between 0 and 255.
+
+            Cells with values of 128 or greater are present. Nearest-neighbor
+            interpolated to match specified `height` and `width`, if needed.
+            If not provided, all cells are present.
+
+        Returns
+        -------
+        GraphStructure
+            Initialized object.
+
+        Raises
+        ------
+        ValueError
+            If `b`, `k`, `l`, `m`, or `mask` contain values not between 0 and
+            255.
+        """
+        if mask is not None and np.any(np.clip(mask, 0, 255) != mask):
+            raise ValueError(f"{mask=} must have values between 0 and 255")
+        structure = Structure.make_from_bytes(
+            height=height, width=width, params=params, b=b, k=k, l=l, m=m
+        )
+
+        if mask is not None:
+            shape = (structure.height, structure.width)
+            mask = np.asarray(mask) >= 128
+            if mask.shape != shape:  # interpolate if wrong shape
+                mask = skimg_transform.resize(
+                    mask, shape, order=0, anti_aliasing=False
+                )
+
+        return GraphStructure.from_structure(structure, mask=mask)
+
+    def stable_dt(
+        self: "GraphStructure",
+        params: typing.Optional[Params] = None,
+        safety: float = 0.9,
+    ) -> float:
+        """Estimate largest stable timestep for explicit integration.
+
+        Stiffness and damping constants of springs incident to each cell are
+        summed by `np.bincount` over the edge list. Otherwise, see
+        `Structure.stable_dt`.
+        """
+        if not safety > 0:
+            raise ValueError(f"{safety=} must be positive")
+        if params is None:
+            params = Params()
+
+        num_cells = self.m.size
+        stiffness, damping = (
+            np.bincount(self.i, weights=weights, minlength=num_cells)
+            + np.bincount(self.j, weights=weights, minlength=num_cells)
+            for weights in (self.k, self.b)
+        )
+        res = _get_cellwise_stable_dt(stiffness, damping, self.m.ravel())
+        return float(np.clip(safety * res.min(), *params.dt_lim))
+
+    def validate(
+        self: "GraphStructure",
+        params: typing.Optional[Params] = None,
+    ) -> bool:
+        """Test if structure contains invalid values."""
+        if params is None:
+            params = Params()
+
+        num_edges = self.num_edges
+        shapes_ok: bool = (
+            self.mask.shape == self.m.shape
+            and self.i.shape == (num_edges,)
+            and self.j.shape == (num_edges,)
+            and self.k.shape == (num_edges,)
+            and self.l.shape == (num_edges,)
+            and self.b.shape == (num_edges,)
+        )
+        if not shapes_ok:
+            warnings.warn("GraphStructure shape validation failed.")
+            return False
+
+        endpoints = np.concatenate([self.i, self.j])
+        edges_ok: bool = (
+            np.all((0 <= endpoints) & (endpoints < self.m.size))
+            and np.all(self.i != self.j)
+            and np.all(self.mask.ravel()[endpoints])
+        )
+        if not edges_ok:
+            warnings.warn("GraphStructure edge validation failed.")
+
+        # diagonal springs are undamped and have longer rest lengths
+        l_lim = (
+            min(params.l_lim[0], params.l_lim_diag[0]),
+            max(params.l_lim[1], params.l_lim_diag[1]),
+        )
+        b_lim = (min(params.b_lim[0], 0.0), params.b_lim[1])
+        values_ok: bool = (
+            np.all(np.clip(self.b, *b_lim) == self.b)
+            and np.all(np.clip(self.k, *params.k_lim) == self.k)
+            and np.all(np.clip(self.l, *l_lim) == self.l)
+            and np.all(np.clip(self.m, *params.m_lim) == self.m)
+        )
+        if not values_ok:
+            warnings.warn("GraphStructure value validation failed.")
+
+        return edges_ok and values_ok
@@ -11,6 +11,7 @@ class Params:
     b_lim: typing.Tuple[float, float]
     dt: float  # simulation time step
     dt_lim: typing.Tuple[float, float]
+    dtype: np.dtype  # floating point type of simulation arrays
     g: float  # gravitational constant
     g_lim: typing.Tuple[float, float]
     k: float  # spring constant
@@ -27,6 +28,7 @@ class Params:
         b_lim: typing.Optional[typing.Tuple[float, float]] = None,
         dt: typing.Optional[float] = None,
         dt_lim: typing.Optional[typing.Tuple[float, float]] = None,
+        dtype: typing.Union[np.dtype, type, str, None] = None,
         g: typing.Optional[float] = None,
         g_lim: typing.Optional[typing.Tuple[float, float]] = None,
         k: typing.Optional[float] = None,
@@ -56,6 +58,12 @@ class Params:
             raise ValueError(f"value {dt=} not within limits {dt_lim}")
         self.dt = float(dt)
 
+        if dtype is None:
+            dtype = defaults.dtype
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError(f"value {dtype=} not a floating point type")
+        self.dtype = np.dtype(dtype)
+
         if g_lim is None:
             g_lim = defaults.g_lim
         self.g_lim = tuple(map(float, g_lim))
@@ -3,6 +3,7 @@ import typing
 import numpy as np
 
 from . import defaults
+from .EnergyTracker import EnergyTracker
 
 
 class State:
@@ -15,16 +16,17 @@ class State:
     vx: np.ndarray
     vy: np.ndarray
 
-    # potential energy
-    # pe: np.ndarray
+    # opt-in energy accounting, see EnergyTracker
+    energy: typing.Optional[EnergyTracker]
 
-    # elapsed time
+    # elapsed time, kept double precision regardless of array dtype
     t: float
 
     def __init__(
         self: "State",
         height: typing.Optional[int] = None,
         width: typing.Optional[int] = None,
+        dtype: typing.Union[np.dtype, type, str, None] = None,
     ) -> None:
         if height is None:
             height = defaults.nrow
@@ -40,15 +42,22 @@ class State:
                 f"value {width=} not within limits {defaults.ncol_lim}",
             )
 
-        self.px = np.tile(np.linspace(0, float(width - 1), width), (height, 1))
+        if dtype is None:
+            dtype = defaults.dtype
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError(f"value {dtype=} not a floating point type")
+
+        self.px = np.tile(
+            np.linspace(0, float(width - 1), width, dtype=dtype), (height, 1)
+        )
         self.py = np.tile(
-            np.linspace(0, float(height - 1), height), (width, 1)
+            np.linspace(0, float(height - 1), height, dtype=dtype), (width, 1)
         ).T
 
-        self.vx = np.zeros((height, width))
-        self.vy = np.zeros((height, width))
+        self.vx = np.zeros((height, width), dtype=dtype)
+        self.vy = np.zeros((height, width), dtype=dtype)
 
-        # self.pe = np.zeros((height, width))
+        self.energy = None
 
         self.t = 0.0
 
@@ -62,16 +71,22 @@ class State:
             and (self.t == other.t)
         )
 
+    @property
+    def dtype(self: "State") -> np.dtype:
+        return self.px.dtype
+
     @property
     def ncells(self: "State") -> int:
         return self.px.size
 
     def validate(self: "State") -> bool:
+        # NaN propagates through min, so one reduction per array detects any
+        # NaN without allocating a temporary boolean array
         return (
-            not np.any(np.isnan(self.px))
-            and not np.any(np.isnan(self.py))
-            and not np.any(np.isnan(self.vx))
-            and not np.any(np.isnan(self.vy))
+            not np.isnan(self.px.min())
+            and not np.isnan(self.py.min())
+            and not np.isnan(self.vx.min())
+            and not np.isnan(self.vy.min())
             and not np.isnan(self.t)
             and self.t >= 0
         )
@@ -1,3 +1,4 @@
+import copy
 import typing
 import warnings
 
@@ -7,6 +8,72 @@ from skimage import transform as skimg_transform
 
 from . import defaults
 from .Params import Params
+from .StructureConstants import StructureConstants
+
+
+# fields indexed by cell row, and by pair of adjacent cell rows, respectively
+_within_row_field_names = ("br", "kr", "lr", "m")
+_between_row_field_names = (
+    "bc",
+    "ba",
+    "bd",
+    "kc",
+    "ka",
+    "kd",
+    "lc",
+    "la",
+    "ld",
+)
+
+# (head, tail) cell slices for each lattice spring family, with corresponding
+# stiffness and damping constant fields (diagonal springs are undamped)
+_spring_families = (
+    (np.s_[..., :-1, :], np.s_[..., 1:, :], "kc", "bc"),
+    (np.s_[..., :, :-1], np.s_[..., :, 1:], "kr", "br"),
+    (np.s_[..., :-1, :-1], np.s_[..., 1:, 1:], "ka", None),
+    (np.s_[..., :-1, 1:], np.s_[..., 1:, :-1], "kd", None),
+)
+
+
+def _get_cellwise_stable_dt(
+    stiffness: np.ndarray,
+    damping: np.ndarray,
+    m: np.ndarray,
+) -> np.ndarray:
+    """Bound stable semi-implicit Euler timestep at each cell, given summed
+    stiffness and damping constants of springs incident to each cell.
+
+    A damped oscillator `x'' = -w**2 x - c x'` integrated by semi-implicit
+    Euler is stable for `dt**2 w**2 + 2 c dt < 4`, i.e., for `dt` below
+    `4 / (c + sqrt(c**2 + 4 w**2))`. Gershgorin's theorem bounds network
+    modes involving each cell by `w**2 <= 2 * stiffness / m` and
+    `c <= 2 * damping / m`.
+    """
+    omega_squared = 2 * stiffness / m
+    c = 2 * damping / m
+    denominator = c + np.sqrt(c * c + 4 * omega_squared)
+
+    # cells without springs (i.e., removed from a graph) impose no bound
+    return np.divide(
+        4.0,
+        denominator,
+        out=np.full_like(denominator, np.inf),
+        where=denominator > 0,
+    )
+
+
+def _get_lattice_stable_dt(structure: typing.Any) -> np.ndarray:
+    """Bound stable timestep at each cell of a `Structure` or
+    `BatchStructure`, summing incident springs over all spring families."""
+    stiffness = np.zeros_like(structure.m)
+    damping = np.zeros_like(structure.m)
+    for head, tail, k_name, b_name in _spring_families:
+        for sums, field_name in ((stiffness, k_name), (damping, b_name)):
+            if field_name is not None:
+                sums[head] += getattr(structure, field_name)
+                sums[tail] += getattr(structure, field_name)
+
+    return _get_cellwise_stable_dt(stiffness, damping, structure.m)
 
 
 class Structure:
@@ -31,6 +98,8 @@ class Structure:
 
     Properties
     ----------
+    dtype : np.dtype
+        Floating point type of structure arrays.
     height : int
         Number of cell rows in state.
     width : int
@@ -54,6 +123,13 @@ class Structure:
 
     m: np.ndarray  # masses
 
+    _constants: typing.Optional[StructureConstants]  # see get_constants
+
+    @property
+    def dtype(self: "Structure") -> np.dtype:
+        """Floating point type of structure arrays."""
+        return self.m.dtype
+
     @property
     def height(self: "Structure") -> int:
         """Number of cell rows in state."""
@@ -94,7 +170,8 @@ class Structure:
             Mapped-to ranges for cellwise norms and fallback parameters for any
             unspecified structure elements.
 
-            If not provided, default-initialized Params will be used.
+            If not provided, default-initialized Params will be used. Structure
+            arrays are created with floating point type `params.dtype`.
         b, k, l, m : np.ndarray, optional
             Cellwise norms, each provided as a 2D array of floating point values between 0 and 1.
 
@@ -104,6 +181,8 @@ class Structure:
             not provided, the default parameter value from `params` will used
             in structure.
         """
+        self._constants = None
+
         if height is None:
             height = defaults.nrow
         if not np.clip(height, *defaults.nrow_lim) == height:
@@ -118,42 +197,47 @@ class Structure:
                 f"value {width=} not within limits {defaults.ncol_lim}",
             )
 
-        # set placeholder for height, width lookup, overwritten later
-        self.m = np.full((height, width), 1.0)
-
         if params is None:
             params = Params()
+        dtype = params.dtype
+
+        # set placeholder for height, width, dtype lookup, overwritten later
+        self.m = np.full((height, width), 1.0, dtype=dtype)
 
         if b is None:  # set from params
             assert np.clip(params.b, *params.b_lim) == params.b
-            self.bc = np.full((height - 1, width), params.b)
-            self.br = np.full((height, width - 1), params.b)
-            self.ba = np.full((height - 1, width - 1), params.b)
-            self.bd = np.full((height - 1, width - 1), params.b)
+            self.bc = np.full((height - 1, width), params.b, dtype=dtype)
+            self.br = np.full((height, width - 1), params.b, dtype=dtype)
+            self.ba = np.full((height - 1, width - 1), params.b, dtype=dtype)
+            self.bd = np.full((height - 1, width - 1), params.b, dtype=dtype)
         else:  # set from norm
             self.set_b_to_norms(b, params.b_lim)
 
         if k is None:  # set from params
             assert np.clip(params.k, *params.k_lim) == params.k
-            self.kc = np.full((height - 1, width), params.k)
-            self.kr = np.full((height, width - 1), params.k)
-            self.ka = np.full((height - 1, width - 1), params.k)
-            self.kd = np.full((height - 1, width - 1), params.k)
+            self.kc = np.full((height - 1, width), params.k, dtype=dtype)
+            self.kr = np.full((height, width - 1), params.k, dtype=dtype)
+            self.ka = np.full((height - 1, width - 1), params.k, dtype=dtype)
+            self.kd = np.full((height - 1, width - 1), params.k, dtype=dtype)
         else:  # set from norm
             self.set_k_to_norms(k, params.k_lim)
 
         if l is None:  # set from params
             assert np.clip(params.l, *params.l_lim) == params.l
-            self.lc = np.full((height - 1, width), params.l)
-            self.lr = np.full((height, width - 1), params.l)
-            self.la = np.full((height - 1, width - 1), params.l_diag)
-            self.ld = np.full((height - 1, width - 1), params.l_diag)
+            self.lc = np.full((height - 1, width), params.l, dtype=dtype)
+            self.lr = np.full((height, width - 1), params.l, dtype=dtype)
+            self.la = np.full(
+                (height - 1, width - 1), params.l_diag, dtype=dtype
+            )
+            self.ld = np.full(
+                (height - 1, width - 1), params.l_diag, dtype=dtype
+            )
         else:  # set from norm
             self.set_l_to_norms(l, params.l_lim)
 
         if m is None:  # set from params
             assert np.clip(params.m, *params.m_lim) == params.m
-            self.m = np.full((height, width), params.m)
+            self.m = np.full((height, width), params.m, dtype=dtype)
         else:  # set from norm
             self.set_m_to_norms(m, params.m_lim)
 
@@ -313,6 +397,120 @@ class Structure:
         assert res.validate()
         return res
 
+    def get_constants(
+        self: "Structure",
+        params: typing.Optional[Params] = None,
+    ) -> StructureConstants:
+        """Get constants derived from structure and `params.dt`, i.e., inverse
+        masses and clipped damping constants, for use by update components.
+
+        Constants are built lazily and cached. Cached constants are rebuilt if
+        `params.dt` changes or if structure arrays are reassigned (i.e., by
+        `set_*_to_norms`). After modifying structure array contents in place,
+        call `invalidate_constants`.
+
+        Parameters
+        ----------
+        params : Params, optional
+            Provides timestep size `dt`. If not provided, default-initialized
+            Params will be used.
+
+        Returns
+        -------
+        StructureConstants
+            Derived constants, with arrays shaped as corresponding structure
+            arrays.
+        """
+        if params is None:
+            params = Params()
+        constants = self._constants
+        if constants is None or not constants.is_current(self, params):
+            constants = StructureConstants(self, params)
+            self._constants = constants
+        return constants
+
+    def get_rows(self: "Structure", start: int, stop: int) -> "Structure":
+        """Create Structure for cell rows `start` through `stop - 1`, and the
+        springs among them.
+
+        Arrays are views of this structure's arrays, not copies. Derived
+        constants are cached separately, so get rows again after reassigning
+        or modifying this structure's arrays.
+
+        Raises
+        ------
+        ValueError
+            If `start` and `stop` do not span a nonempty range of rows.
+        """
+        if not 0 <= start < stop <= self.height:
+            raise ValueError(
+                f"{start=} and {stop=} not a row range within {self.height=}",
+            )
+
+        res = copy.copy(self)
+        for field_name in _within_row_field_names:
+            setattr(res, field_name, getattr(self, field_name)[start:stop])
+        for field_name in _between_row_field_names:
+            setattr(
+                res, field_name, getattr(self, field_name)[start : stop - 1]
+            )
+        res._constants = None
+        return res
+
+    def invalidate_constants(self: "Structure") -> None:
+        """Discard cached derived constants, so they are rebuilt on next
+        `get_constants` call."""
+        self._constants = None
+
+    def stable_dt(
+        self: "Structure",
+        params: typing.Optional[Params] = None,
+        safety: float = 0.9,
+    ) -> float:
+        """Estimate largest stable timestep for explicit integration.
+
+        Sums stiffness and damping constants of springs incident to each
+        cell, vectorized over spring families, and bounds each cell's
+        fastest oscillation from these sums relative to its mass (see
+        `_get_cellwise_stable_dt`). The least bound over cells is taken.
+        Cost is a few passes over structure arrays.
+
+        Parameters
+        ----------
+        params : Params, optional
+            Provides timestep limits `dt_lim`, to which the estimate is
+            clipped. If not provided, default-initialized Params will be used.
+        safety : float, default 0.9
+            Factor applied to estimated stability limit.
+
+        Returns
+        -------
+        float
+            Largest timestep expected to keep "explicit" and "verlet"
+            integration stable.
+
+        Raises
+        ------
+        ValueError
+            If `safety` is not positive.
+
+        Notes
+        -----
+        The Gershgorin bound is conservative. For random structures,
+        simulations remained stable at 1.2x the unscaled estimate, and
+        first diverged between 1.5x and more than 3x. Bounds from exact
+        eigenvalues of the linearized spring network are about 1.8x larger,
+        but diverge for some structures at 1.0x, where large deformations
+        and damping couple modes.
+        """
+        if not safety > 0:
+            raise ValueError(f"{safety=} must be positive")
+        if params is None:
+            params = Params()
+
+        res = _get_lattice_stable_dt(self).min()
+        return float(np.clip(safety * res, *params.dt_lim))
+
     def validate(
         self: "Structure",
         params: typing.Optional[Params] = None,
@@ -414,6 +612,7 @@ class Structure:
 
         lb, ub = lim
         target_values = cellwise_norms * (ub - lb) + lb
+        target_values = target_values.astype(self.dtype, copy=False)
         self.bc = (target_values[:-1, :] + target_values[1:, :]) / 2
         self.br = (target_values[:, :-1] + target_values[:, 1:]) / 2
         self.ba = (target_values[:-1, :-1] + target_values[1:, 1:]) / 2
@@ -448,6 +647,7 @@ class Structure:
 
         lb, ub = lim
         target_values = cellwise_norms * (ub - lb) + lb
+        target_values = target_values.astype(self.dtype, copy=False)
         self.kc = (target_values[:-1, :] + target_values[1:, :]) / 2
         self.kr = (target_values[:, :-1] + target_values[:, 1:]) / 2
         self.ka = (target_values[:-1, :-1] + target_values[1:, 1:]) / 2
@@ -482,6 +682,7 @@ class Structure:
 
         lb, ub = lim
         target_values = cellwise_norms * (ub - lb) + lb
+        target_values = target_values.astype(self.dtype, copy=False)
         self.lc = (target_values[:-1, :] + target_values[1:, :]) / 2
         self.lr = (target_values[:, :-1] + target_values[:, 1:]) / 2
 
@@ -618,4 +819,5 @@ class Structure:
 
         lb, ub = lim
         target_values = cellwise_norms * (ub - lb) + lb
+        target_values = target_values.astype(self.dtype, copy=False)
         self.m = target_values
@@ -0,0 +1,84 @@
+import typing
+
+import numpy as np
+
+from .Params import Params
+
+
+# structure fields that derived constants are computed from
+_source_field_names = ("bc", "br", "kc", "kr", "ka", "kd", "m")
+
+
+class StructureConstants:
+    """Invariant quantities derived from a `Structure` (or `BatchStructure`)
+    and timestep size, precomputed for use by update components.
+
+    Obtain through `Structure.get_constants`, which caches instances and
+    rebuilds them as needed.
+
+    Attributes
+    ----------
+    dt : float
+        Timestep size constants were computed for.
+    inv_m : np.ndarray
+        Inverse cell masses, `1 / m`.
+    dt_per_m : np.ndarray
+        Timestep size divided by cell masses, `dt / m`.
+    kc_dt, kr_dt, ka_dt, kd_dt : np.ndarray
+        Spring constants for columns, rows, ascending diagonals, and
+        descending diagonals, respectively, scaled by timestep size.
+    bc_clipped, br_clipped : np.ndarray
+        Damping constants for columns and rows, respectively, clipped to
+        `1 / dt` to prevent any overshoot.
+    """
+
+    dt: float
+    inv_m: np.ndarray
+    dt_per_m: np.ndarray
+    kc_dt: np.ndarray
+    kr_dt: np.ndarray
+    ka_dt: np.ndarray
+    kd_dt: np.ndarray
+    bc_clipped: np.ndarray
+    br_clipped: np.ndarray
+
+    # source structure arrays, held to detect reassignment
+    _sources: typing.Tuple[np.ndarray, ...]
+
+    def __init__(
+        self: "StructureConstants",
+        structure: typing.Any,
+        params: Params,
+    ) -> None:
+        """Compute constants from `structure` arrays and `params.dt`."""
+        dt = params.dt
+        self.dt = dt
+        self._sources = tuple(
+            getattr(structure, field_name)
+            for field_name in _source_field_names
+        )
+
+        m = structure.m
+        self.inv_m = np.divide(1.0, m, dtype=m.dtype)
+        self.dt_per_m = np.divide(dt, m, dtype=m.dtype)
+        self.kc_dt = structure.kc * dt
+        self.kr_dt = structure.kr * dt
+        self.ka_dt = structure.ka * dt
+        self.kd_dt = structure.kd * dt
+        self.bc_clipped = np.minimum(structure.bc, 1 / dt)
+        self.br_clipped = np.minimum(structure.br, 1 / dt)
+
+    def is_current(
+        self: "StructureConstants",
+        structure: typing.Any,
+        params: Params,
+    ) -> bool:
+        """Are constants up to date with `structure` arrays and `params.dt`?
+
+        Detects reassignment of structure arrays and changes to timestep
+        size, but not in-place modification of structure array contents.
+        """
+        return self.dt == params.dt and all(
+            getattr(structure, field_name) is source
+            for field_name, source in zip(_source_field_names, self._sources)
+        )
@@ -0,0 +1,66 @@
+import typing
+
+import numpy as np
+
+
+class Workspace:
+    """Reusable scratch buffers for temporaries computed within update
+    components.
+
+    Buffers are keyed on name, shape, and dtype, and are allocated on first
+    request then returned as-is on subsequent requests. Components write into
+    buffers using ufunc `out=` arguments, so steady-state simulation steps
+    perform no array allocations.
+
+    A single workspace may be shared among components that are called in
+    sequence (e.g., within an update regimen), because buffer contents are
+    only meaningful during a single component call. Do not share a workspace
+    among components called concurrently.
+    """
+
+    _buffers: typing.Dict[typing.Tuple, np.ndarray]
+
+    def __init__(self: "Workspace") -> None:
+        """Initialize empty workspace."""
+        self._buffers = dict()
+
+    def __len__(self: "Workspace") -> int:
+        """Count allocated buffers."""
+        return len(self._buffers)
+
+    def clear(self: "Workspace") -> None:
+        """Release all allocated buffers."""
+        self._buffers.clear()
+
+    def get(
+        self: "Workspace",
+        name: str,
+        shape: typing.Tuple[int, ...],
+        dtype: typing.Union[np.dtype, type] = float,
+    ) -> np.ndarray:
+        """Get scratch buffer, allocating it if not already allocated.
+
+        Parameters
+        ----------
+        name : str
+            Identifies temporary buffer is to hold.
+
+            Temporaries needed simultaneously within a component must have
+            distinct names.
+        shape : tuple[int, ...]
+            Shape of buffer.
+        dtype : np.dtype or type, default float
+            Data type of buffer.
+
+        Returns
+        -------
+        np.ndarray
+            Buffer with unspecified contents.
+        """
+        key = (name, shape, dtype)
+        try:
+            return self._buffers[key]
+        except KeyError:
+            res = np.empty(shape, dtype=dtype)
+            self._buffers[key] = res
+            return res
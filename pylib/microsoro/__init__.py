@@ -4,23 +4,46 @@ from . import conditioners
 from . import events
 from . import simulation
 from . import viz
+from .BatchState import BatchState
+from .BatchStructure import BatchStructure
+from .Coarsening import Coarsening
+from .EnergyTracker import EnergyTracker
+from .GraphStructure import GraphStructure
 from .Params import Params
-from .simulation import get_default_update_regimen, perform_simulation
+from .simulation import (
+    compile_regimen,
+    get_default_update_regimen,
+    perform_arena_simulation,
+    perform_batch_simulation,
+    perform_simulation,
+)
 from .State import State
 from .Structure import Structure
+from .StructureConstants import StructureConstants
 from .viz import Style
+from .Workspace import Workspace
 
 
 __all__ = [
+    "BatchState",
+    "BatchStructure",
+    "Coarsening",
+    "compile_regimen",
     "defaults",
     "components",
     "conditioners",
+    "EnergyTracker",
     "events",
     "get_default_update_regimen",
+    "GraphStructure",
     "Params",
+    "perform_arena_simulation",
+    "perform_batch_simulation",
     "perform_simulation",
     "State",
     "Structure",
+    "StructureConstants",
     "Style",
     "viz",
+    "Workspace",
 ]
@@ -0,0 +1,5 @@
+"""Alternate implementations of simulation components.
+
+Backends depend on optional packages, so are not imported by `microsoro`
+itself. Import them explicitly, e.g., `from microsoro.backends import numba`.
+"""
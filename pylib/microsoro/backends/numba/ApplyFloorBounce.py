@@ -0,0 +1,61 @@
+import typing
+
+import numpy as np
+
+from ...components import update
+from ...events import EventBuffer, RenderFloorEvent
+from ...State import State
+from . import _kernels
+
+
+class ApplyFloorBounce(update.ApplyFloorBounce):
+    """Compiled equivalent of `components.ApplyFloorBounce`.
+
+    Falls back to NumPy implementation if numba is unavailable or if State
+    has leading batch axes.
+    """
+
+    _below_floor_mask: np.ndarray  # scratch buffer, reused between calls
+
+    def __init__(
+        self: "ApplyFloorBounce",
+        e: float = 1.0,
+        m: float = 0.0,
+        b: float = 0.0,
+    ) -> None:
+        """Initialize functor.
+
+        See `components.ApplyFloorBounce` for parameter descriptions.
+        """
+        super().__init__(e=e, m=m, b=b)
+        self._below_floor_mask = np.empty((0, 0), dtype=bool)
+
+    def __call__(
+        self: "ApplyFloorBounce",
+        state: State,
+        event_buffer: typing.Optional[EventBuffer] = None,
+    ) -> None:
+        """If any tresspass past floor boundaries has occurred, correct cell
+        positions (i.e., retroactively) and reflect cell velocities off
+        surface."""
+        if not _kernels.is_available() or state.px.ndim != 2:
+            return super().__call__(state, event_buffer)
+
+        m = self._slope
+        b = self._intercept
+        if event_buffer is not None:
+            event_buffer.enqueue(RenderFloorEvent(m=m, b=b, flavor="floor"))
+
+        if self._below_floor_mask.shape != state.px.shape:
+            self._below_floor_mask = np.empty(state.px.shape, dtype=bool)
+
+        _kernels.apply_floor_bounce(
+            state.px,
+            state.py,
+            state.vx,
+            state.vy,
+            self._below_floor_mask,
+            self._elasticity,
+            m,
+            b,
+        )
@@ -0,0 +1,24 @@
+import typing
+
+from ...components import update
+from ...State import State
+from . import _kernels
+
+
+class ApplyGravity(update.ApplyGravity):
+    """Compiled equivalent of `components.ApplyGravity`.
+
+    Falls back to NumPy implementation if numba is unavailable or if State
+    has leading batch axes.
+    """
+
+    def __call__(
+        self: "ApplyGravity",
+        state: State,
+        event_buffer: typing.Optional = None,
+    ) -> None:
+        if not _kernels.is_available() or state.px.ndim != 2:
+            return super().__call__(state, event_buffer)
+
+        params = self._params
+        _kernels.apply_gravity(state.vy, params.g, params.dt)
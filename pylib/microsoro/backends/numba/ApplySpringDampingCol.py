@@ -0,0 +1,32 @@
+import typing
+
+from ...components import update
+from ...State import State
+from . import _kernels
+
+
+class ApplySpringDampingCol(update.ApplySpringDampingCol):
+    """Compiled equivalent of `components.ApplySpringDampingCol`.
+
+    Falls back to NumPy implementation if numba is unavailable or if State
+    has leading batch axes.
+    """
+
+    def __call__(
+        self: "ApplySpringDampingCol",
+        state: State,
+        event_buffer: typing.Optional = None,
+    ) -> None:
+        """Calculate spring damping forces between vertical pairs of cells and
+        apply to State velocity."""
+        if not _kernels.is_available() or state.px.ndim != 2:
+            return super().__call__(state, event_buffer)
+
+        structure = self._structure
+        _kernels.apply_spring_damping_col(
+            state.vx,
+            state.vy,
+            structure.m,
+            structure.bc,
+            self._params.dt,
+        )
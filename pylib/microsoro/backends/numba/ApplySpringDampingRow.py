@@ -0,0 +1,32 @@
+import typing
+
+from ...components import update
+from ...State import State
+from . import _kernels
+
+
+class ApplySpringDampingRow(update.ApplySpringDampingRow):
+    """Compiled equivalent of `components.ApplySpringDampingRow`.
+
+    Falls back to NumPy implementation if numba is unavailable or if State
+    has leading batch axes.
+    """
+
+    def __call__(
+        self: "ApplySpringDampingRow",
+        state: State,
+        event_buffer: typing.Optional = None,
+    ) -> None:
+        """Calculate spring damping forces between horizontal pairs of cells and
+        apply to State velocity."""
+        if not _kernels.is_available() or state.px.ndim != 2:
+            return super().__call__(state, event_buffer)
+
+        structure = self._structure
+        _kernels.apply_spring_damping_row(
+            state.vx,
+            state.vy,
+            structure.m,
+            structure.br,
+            self._params.dt,
+        )
@@ -0,0 +1,43 @@
+import typing
+
+from ...components import update
+from ...State import State
+from . import _kernels
+
+
+class ApplySpringNetwork(update.ApplySpringNetwork):
+    """Compiled equivalent of `components.ApplySpringNetwork`.
+
+    Falls back to NumPy implementation if numba is unavailable or if State
+    has leading batch axes.
+    """
+
+    def __call__(
+        self: "ApplySpringNetwork",
+        state: State,
+        event_buffer: typing.Optional = None,
+    ) -> None:
+        """Calculate spring and spring damping forces between all connected
+        pairs of cells and apply to State velocity."""
+        if not _kernels.is_available() or state.px.ndim != 2:
+            return super().__call__(state, event_buffer)
+
+        structure = self._structure
+        _kernels.apply_spring_network(
+            state.px,
+            state.py,
+            state.vx,
+            state.vy,
+            structure.m,
+            structure.kc,
+            structure.kr,
+            structure.ka,
+            structure.kd,
+            structure.lc,
+            structure.lr,
+            structure.la,
+            structure.ld,
+            structure.bc,
+            structure.br,
+            self._params.dt,
+        )
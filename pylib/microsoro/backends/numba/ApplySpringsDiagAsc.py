@@ -0,0 +1,39 @@
+import typing
+
+from ...components import update
+from ...State import State
+from . import _kernels
+
+
+class ApplySpringsDiagAsc(update.ApplySpringsDiagAsc):
+    """Compiled equivalent of `components.ApplySpringsDiagAsc`.
+
+    Falls back to NumPy implementation if numba is unavailable or if State
+    has leading batch axes.
+    """
+
+    def __call__(
+        self: "ApplySpringsDiagAsc",
+        state: State,
+        event_buffer: typing.Optional = None,
+    ) -> None:
+        """Calculate spring forces between pairs of cells along ascending diagonals and apply to
+        State velocity."""
+        if not _kernels.is_available() or state.px.ndim != 2:
+            return super().__call__(state, event_buffer)
+
+        structure = self._structure
+        _kernels.apply_springs(
+            state.px,
+            state.py,
+            state.vx,
+            state.vy,
+            structure.m,
+            structure.ka,
+            structure.la,
+            self._params.dt,
+            0,
+            0,
+            1,
+            1,
+        )
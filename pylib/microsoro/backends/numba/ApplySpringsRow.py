@@ -0,0 +1,39 @@
+import typing
+
+from ...components import update
+from ...State import State
+from . import _kernels
+
+
+class ApplySpringsRow(update.ApplySpringsRow):
+    """Compiled equivalent of `components.ApplySpringsRow`.
+
+    Falls back to NumPy implementation if numba is unavailable or if State
+    has leading batch axes.
+    """
+
+    def __call__(
+        self: "ApplySpringsRow",
+        state: State,
+        event_buffer: typing.Optional = None,
+    ) -> None:
+        """Calculate spring forces between horizontal pairs of cells and apply to
+        State velocity."""
+        if not _kernels.is_available() or state.px.ndim != 2:
+            return super().__call__(state, event_buffer)
+
+        structure = self._structure
+        _kernels.apply_springs(
+            state.px,
+            state.py,
+            state.vx,
+            state.vy,
+            structure.m,
+            structure.kr,
+            structure.lr,
+            self._params.dt,
+            0,
+            0,
+            0,
+            1,
+        )
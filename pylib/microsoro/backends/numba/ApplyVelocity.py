@@ -0,0 +1,25 @@
+import typing
+
+from ...components import update
+from ...State import State
+from . import _kernels
+
+
+class ApplyVelocity(update.ApplyVelocity):
+    """Compiled equivalent of `components.ApplyVelocity`.
+
+    Falls back to NumPy implementation if numba is unavailable or if State
+    has leading batch axes.
+    """
+
+    def __call__(
+        self: "ApplyVelocity",
+        state: State,
+        event_buffer: typing.Optional = None,
+    ) -> None:
+        if not _kernels.is_available() or state.px.ndim != 2:
+            return super().__call__(state, event_buffer)
+
+        _kernels.apply_velocity(
+            state.px, state.py, state.vx, state.vy, self._params.dt
+        )
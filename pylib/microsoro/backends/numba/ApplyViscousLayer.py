@@ -0,0 +1,42 @@
+import typing
+
+from ...components import update
+from ...events import EventBuffer, RenderFloorEvent
+from ...State import State
+from . import _kernels
+
+
+class ApplyViscousLayer(update.ApplyViscousLayer):
+    """Compiled equivalent of `components.ApplyViscousLayer`.
+
+    Falls back to NumPy implementation if numba is unavailable or if State
+    has leading batch axes.
+    """
+
+    def __call__(
+        self: "ApplyViscousLayer",
+        state: State,
+        event_buffer: typing.Optional[EventBuffer] = None,
+    ) -> None:
+        """Apply resistance to any cell moving through viscous layer."""
+        if not _kernels.is_available() or state.px.ndim != 2:
+            return super().__call__(state, event_buffer)
+
+        m = self._slope
+        b = self._intercept
+        if event_buffer is not None:
+            event_buffer.enqueue(
+                RenderFloorEvent(m=m, b=b, flavor="viscous layer")
+            )
+
+        _kernels.apply_viscous_layer(
+            state.px,
+            state.py,
+            state.vx,
+            state.vy,
+            self._structure.m,
+            self._mu,
+            m,
+            b,
+            self._params.dt,
+        )
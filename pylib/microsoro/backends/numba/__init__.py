@@ -0,0 +1,39 @@
+"""Optional JIT-compiled backend, using numba.
+
+Provides compiled equivalents of core update components, which may be mixed
+freely with NumPy components. If numba is not installed, all components fall
+back to their NumPy implementations.
+"""
+
+from ._kernels import is_available
+from .ApplyFloorBounce import ApplyFloorBounce
+from .ApplyGravity import ApplyGravity
+from .ApplySpringDampingCol import ApplySpringDampingCol
+from .ApplySpringDampingRow import ApplySpringDampingRow
+from .ApplySpringNetwork import ApplySpringNetwork
+from .ApplySpringsCol import ApplySpringsCol
+from .ApplySpringsDiagAsc import ApplySpringsDiagAsc
+from .ApplySpringsDiagDesc import ApplySpringsDiagDesc
+from .ApplySpringsRow import ApplySpringsRow
+from .ApplyVelocity import ApplyVelocity
+from .ApplyViscousLayer import ApplyViscousLayer
+from .get_default_update_regimen import get_default_update_regimen
+from .perform_simulation import perform_simulation
+
+
+__all__ = [
+    "ApplyFloorBounce",
+    "ApplyGravity",
+    "ApplySpringDampingCol",
+    "ApplySpringDampingRow",
+    "ApplySpringNetwork",
+    "ApplySpringsCol",
+    "ApplySpringsDiagAsc",
+    "ApplySpringsDiagDesc",
+    "ApplySpringsRow",
+    "ApplyVelocity",
+    "ApplyViscousLayer",
+    "get_default_update_regimen",
+    "is_available",
+    "perform_simulation",
+]
@@ -0,0 +1,235 @@
+"""Compiled kernels underlying numba backend components.
+
+Kernels loop over cells in place, without temporary arrays. If numba is not
+installed, kernels are left as uncompiled Python functions and backend
+components fall back to NumPy implementations instead of calling them.
+"""
+import math
+
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+
+def is_available() -> bool:
+    """Is numba installed, so that compiled kernels can be used?"""
+    return numba is not None
+
+
+def _jit(function):
+    if numba is None:  # pragma: no cover
+        return function
+    return numba.njit(cache=True, nogil=True)(function)
+
+
+@_jit
+def apply_gravity(vy, g, dt):
+    nrow, ncol = vy.shape
+    for i in range(nrow):
+        for j in range(ncol):
+            vy[i, j] -= g * dt
+
+
+@_jit
+def apply_velocity(px, py, vx, vy, dt):
+    nrow, ncol = px.shape
+    for i in range(nrow):
+        for j in range(ncol):
+            px[i, j] += vx[i, j] * dt
+            py[i, j] += vy[i, j] * dt
+
+
+@_jit
+def apply_springs(px, py, vx, vy, m, k, l, dt, hi, hj, ti, tj):
+    """Apply springs indexed over `k` and `l`, running from head cell at
+    offset `(hi, hj)` to tail cell at offset `(ti, tj)`."""
+    nrow, ncol = k.shape
+    for i in range(nrow):
+        for j in range(ncol):
+            head_i, head_j = i + hi, j + hj
+            tail_i, tail_j = i + ti, j + tj
+            dist_horiz = px[tail_i, tail_j] - px[head_i, head_j]
+            dist_vert = py[tail_i, tail_j] - py[head_i, head_j]
+            dist = math.sqrt(dist_horiz * dist_horiz + dist_vert * dist_vert)
+
+            # net force: negative is repulsion, positive is attraction
+            f = k[i, j] * (dist - l[i, j]) / dist
+            fx, fy = f * dist_horiz, f * dist_vert
+
+            vx[head_i, head_j] += fx / m[head_i, head_j] * dt
+            vy[head_i, head_j] += fy / m[head_i, head_j] * dt
+            vx[tail_i, tail_j] -= fx / m[tail_i, tail_j] * dt
+            vy[tail_i, tail_j] -= fy / m[tail_i, tail_j] * dt
+
+
+@_jit
+def apply_spring_damping_col(vx, vy, m, b, dt):
+    """Apply damping between vertical pairs of cells.
+
+    Sweeps down each column, carrying pre-update velocity of the head cell
+    so that all damping forces are computed from pre-update velocities.
+    """
+    nrow, ncol = b.shape
+    b_max = 1.0 / dt  # damping constant, clipped to prevent any overshoot
+    for j in range(ncol):
+        head_vx, head_vy = vx[0, j], vy[0, j]
+        for i in range(nrow):
+            tail_vx, tail_vy = vx[i + 1, j], vy[i + 1, j]
+            b_ = min(b[i, j], b_max)
+            fx = b_ * (tail_vx - head_vx)
+            fy = b_ * (tail_vy - head_vy)
+            vx[i, j] += fx / m[i, j] * dt
+            vy[i, j] += fy / m[i, j] * dt
+            vx[i + 1, j] -= fx / m[i + 1, j] * dt
+            vy[i + 1, j] -= fy / m[i + 1, j] * dt
+            head_vx, head_vy = tail_vx, tail_vy
+
+
+@_jit
+def apply_spring_damping_row(vx, vy, m, b, dt):
+    """Apply damping between horizontal pairs of cells.
+
+    Sweeps across each row, carrying pre-update velocity of the head cell
+    so that all damping forces are computed from pre-update velocities.
+    """
+    nrow, ncol = b.shape
+    b_max = 1.0 / dt  # damping constant, clipped to prevent any overshoot
+    for i in range(nrow):
+        head_vx, head_vy = vx[i, 0], vy[i, 0]
+        for j in range(ncol):
+            tail_vx, tail_vy = vx[i, j + 1], vy[i, j + 1]
+            b_ = min(b[i, j], b_max)
+            fx = b_ * (tail_vx - head_vx)
+            fy = b_ * (tail_vy - head_vy)
+            vx[i, j] += fx / m[i, j] * dt
+            vy[i, j] += fy / m[i, j] * dt
+            vx[i, j + 1] -= fx / m[i, j + 1] * dt
+            vy[i, j + 1] -= fy / m[i, j + 1] * dt
+            head_vx, head_vy = tail_vx, tail_vy
+
+
+@_jit
+def apply_spring_network(
+    px, py, vx, vy, m, kc, kr, ka, kd, lc, lr, la, ld, bc, br, dt
+):
+    """Apply all springs, then column and row spring damping."""
+    apply_springs(px, py, vx, vy, m, kc, lc, dt, 0, 0, 1, 0)
+    apply_springs(px, py, vx, vy, m, kr, lr, dt, 0, 0, 0, 1)
+    apply_springs(px, py, vx, vy, m, ka, la, dt, 0, 0, 1, 1)
+    apply_springs(px, py, vx, vy, m, kd, ld, dt, 0, 1, 1, 0)
+    apply_spring_damping_col(vx, vy, m, bc, dt)
+    apply_spring_damping_row(vx, vy, m, br, dt)
+
+
+@_jit
+def apply_floor_bounce(px, py, vx, vy, below_floor_mask, e, m, b):
+    """Bounce cells off a sloped floor.
+
+    Marks cells below floor in `below_floor_mask` scratch buffer. Returns
+    whether any cells were below floor.
+    """
+    nrow, ncol = px.shape
+    tolerance_factor = 1e-12
+
+    # find cells below floor, and correction to shift state above floor
+    any_below_floor = False
+    max_y_penetration = -math.inf
+    for i in range(nrow):
+        for j in range(ncol):
+            y_floor = m * px[i, j] + b
+            is_below = py[i, j] < y_floor
+            below_floor_mask[i, j] = is_below
+            if is_below:
+                any_below_floor = True
+                max_y_penetration = max(max_y_penetration, y_floor - py[i, j])
+
+    if not any_below_floor:
+        return False
+
+    for i in range(nrow):
+        for j in range(ncol):
+            py[i, j] += max_y_penetration + tolerance_factor
+
+    if m != 0.0:
+        max_x_penetration = -math.inf
+        for i in range(nrow):
+            for j in range(ncol):
+                if below_floor_mask[i, j]:
+                    x_floor = (py[i, j] - b) / m
+                    max_x_penetration = max(
+                        max_x_penetration, x_floor - px[i, j]
+                    )
+        sign_m = 1.0 if m > 0 else -1.0
+        for i in range(nrow):
+            for j in range(ncol):
+                px[i, j] += sign_m * max_x_penetration + tolerance_factor
+
+    # reflect velocities of cells below floor off of floor normal
+    norm = math.sqrt(m * m + 1.0)
+    normal_x, normal_y = -m / norm, 1.0 / norm
+    for i in range(nrow):
+        for j in range(ncol):
+            if below_floor_mask[i, j]:
+                dot_product = vx[i, j] * normal_x + vy[i, j] * normal_y
+                reflection_x = vx[i, j] - 2 * dot_product * normal_x
+                reflection_y = vy[i, j] - 2 * dot_product * normal_y
+                vx[i, j] = reflection_x * e
+                vy[i, j] = abs(reflection_y) * e
+
+    return True
+
+
+@_jit
+def apply_viscous_layer(px, py, vx, vy, masses, mu, m, b, dt):
+    """Slow cells within a viscous layer.
+
+    Returns whether any cells were within the layer.
+    """
+    nrow, ncol = px.shape
+    mu = min(mu, 1.0 / dt)  # clipped to prevent any overshoot
+    any_below_floor = False
+    for i in range(nrow):
+        for j in range(ncol):
+            if py[i, j] < m * px[i, j] + b:
+                any_below_floor = True
+                vx[i, j] += -vx[i, j] * mu / masses[i, j] * dt
+                vy[i, j] += -vy[i, j] * mu / masses[i, j] * dt
+    return any_below_floor
+
+
+@_jit
+def step_default_update_regimen(
+    px,
+    py,
+    vx,
+    vy,
+    t,
+    m,
+    kc,
+    kr,
+    ka,
+    kd,
+    lc,
+    lr,
+    la,
+    ld,
+    bc,
+    br,
+    below_floor_mask,
+    g,
+    dt,
+    target_duration,
+):
+    """Repeatedly apply default update regimen until elapsed time passes
+    `target_duration`, returning final elapsed time."""
+    while True:
+        apply_gravity(vy, g, dt)
+        apply_spring_network(
+            px, py, vx, vy, m, kc, kr, ka, kd, lc, lr, la, ld, bc, br, dt
+        )
+        apply_velocity(px, py, vx, vy, dt)
+        apply_floor_bounce(px, py, vx, vy, below_floor_mask, 1.0, 0.0, 0.0)
+        t += dt
+        if t > target_duration:
+            return t
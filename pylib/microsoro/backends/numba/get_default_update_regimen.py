@@ -0,0 +1,54 @@
+import typing
+
+from ... import components
+from ...Params import Params
+from ...Structure import Structure
+from .ApplyFloorBounce import ApplyFloorBounce
+from .ApplyGravity import ApplyGravity
+from .ApplySpringNetwork import ApplySpringNetwork
+from .ApplyVelocity import ApplyVelocity
+
+
+def get_default_update_regimen(
+    params: typing.Optional[Params] = None,
+    structure: typing.Optional[Structure] = None,
+) -> typing.List[typing.Callable]:
+    """Lists compiled equivalents of core simulation components as ordered,
+    callable objects.
+
+    Springs and spring damping are applied by a single fused
+    `ApplySpringNetwork` component. Components fall back to NumPy
+    implementations if numba is unavailable.
+
+    Parameters
+    ----------
+    params : Params, optional
+        Configuration parameters for the update regimen. If not provided,
+        a default `Params` instance will be used.
+    structure : Structure, optional
+        Cell and inter-cell configuration for the update regimen. If not
+        provided, a default `Structure` instance will be used.
+
+    Returns
+    -------
+    list[typing.Callable]
+        List of callable components that make up the default update regimen.
+
+    Notes
+    -----
+    Does not include any halting component to terminate simulation. Users
+    should append an appropriate halting component for their application.
+    """
+    if params is None:
+        params = Params()
+    if structure is None:
+        structure = Structure(params=params)
+
+    return [
+        components.ClearEventBuffer(),  # 1st (not last) so handle events after
+        ApplyGravity(params),
+        ApplySpringNetwork(params, structure),
+        ApplyVelocity(params),
+        ApplyFloorBounce(),
+        components.ApplyIncrementElapsedTime(params),
+    ]
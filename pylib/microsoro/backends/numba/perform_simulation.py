@@ -0,0 +1,150 @@
+import typing
+
+import numpy as np
+
+from ...components import HaltAfterElapsedTime
+from ...conditioners import ApplyTranslate
+from ...Params import Params
+from ...simulation import perform_simulation as perform_simulation_
+from ...simulation.perform_simulation import _validation_policies
+from ...State import State
+from ...Structure import Structure
+from . import _kernels
+from .get_default_update_regimen import get_default_update_regimen
+
+
+def perform_simulation(
+    setup_regimen_conditioners: typing.Optional[
+        typing.List[typing.Callable]
+    ] = None,
+    update_regimen_components: typing.Optional[
+        typing.List[typing.Callable]
+    ] = None,
+    yield_intermediate_states: bool = False,
+    validation: str = "always",
+    validation_interval: int = 1,
+    check_every: int = 1,
+    dtype: typing.Union[np.dtype, type, str, None] = None,
+) -> typing.Union[State, typing.Any, typing.Iterator]:
+    """Perform simulation through composition of callable ingredients, using
+    compiled components.
+
+    Drop-in replacement for `simulation.perform_simulation`. If no update
+    regimen is specified, the entire default update loop (halting after 10
+    seconds of simulation time) runs inside a single compiled kernel.
+    Otherwise, defers to `simulation.perform_simulation`.
+
+    Parameters
+    ----------
+    setup_regimen_conditioners : list[Callable], optional
+        Sequence of callable conditioners to set up the initial state of the
+        simulation.
+
+        If not specified, default behavior will apply a translation of
+        `dpy=-5.0`.
+    update_regimen_components : list[Callable], optional
+        Sequence of callable components to be applied to simulation state each
+        update loop.
+
+        Defaults to compiled `get_default_update_regimen()` components,
+        halting after 10 seconds of simulation time.
+    yield_intermediate_states : bool, default False
+        Should intermediate state instances be yielded from the simulation
+        loop? Defaults to False.
+    validation : str, default "always"
+        When should State be checked for invalid values? See
+        `simulation.perform_simulation`.
+    validation_interval : int, default 1
+        Number of update steps between checks under "every_n_steps" policy.
+    check_every : int, default 1
+        Number of update steps to advance between halting checks. See
+        `simulation.perform_simulation`.
+    dtype : np.dtype, type, or str, optional
+        Floating point type of simulation State arrays. See
+        `simulation.perform_simulation`.
+
+    Returns
+    -------
+    State, Any, Iterator
+        Returns the final state after the simulation ends. If
+        `yield_intermediate_states` is set, instead iterates over sequential
+        simulation states from each update step.
+
+    Notes
+    -----
+    Within the compiled default update loop, State validity is checked only
+    once simulation halts (i.e., "on_halt_only"), unless `validation` is
+    "off". Because invalid (NaN) values persist once introduced, invalid
+    simulations are still detected.
+    """
+    if validation not in _validation_policies:
+        raise ValueError(f"{validation=} not one of {_validation_policies}")
+    if validation_interval < 1:
+        raise ValueError(f"{validation_interval=} must be positive")
+    if check_every < 1:
+        raise ValueError(f"{check_every=} must be positive")
+
+    if setup_regimen_conditioners is None:
+        setup_regimen_conditioners = [ApplyTranslate(dpy=-5.0)]
+
+    if (
+        update_regimen_components is not None
+        or yield_intermediate_states
+        or not _kernels.is_available()
+    ):
+        if update_regimen_components is None:
+            update_regimen_components = [
+                *get_default_update_regimen(Params(dtype=dtype)),
+                HaltAfterElapsedTime(10.0),
+            ]
+        return perform_simulation_(
+            setup_regimen_conditioners=setup_regimen_conditioners,
+            update_regimen_components=update_regimen_components,
+            yield_intermediate_states=yield_intermediate_states,
+            validation=validation,
+            validation_interval=validation_interval,
+            check_every=check_every,
+            dtype=dtype,
+        )
+
+    params = Params(dtype=dtype)
+    structure = Structure(params=params)
+    state = State(dtype=dtype)
+
+    # perform setup using conditioner regimen
+    for conditioner in setup_regimen_conditioners:
+        conditioner(state)
+        assert state.validate(), conditioner
+
+    # compiled kernel updates arrays in place, so ensure they are writeable
+    # and not aliased (i.e., conditioners may have assigned views)
+    for attr in "px", "py", "vx", "vy":
+        setattr(
+            state, attr, np.array(getattr(state, attr), dtype=params.dtype)
+        )
+
+    state.t = _kernels.step_default_update_regimen(
+        state.px,
+        state.py,
+        state.vx,
+        state.vy,
+        state.t,
+        structure.m,
+        structure.kc,
+        structure.kr,
+        structure.ka,
+        structure.kd,
+        structure.lc,
+        structure.lr,
+        structure.la,
+        structure.ld,
+        structure.bc,
+        structure.br,
+        np.empty(state.px.shape, dtype=bool),
+        params.g,
+        params.dt,
+        10.0,  # target duration, as per HaltAfterElapsedTime(10.0)
+    )
+    if validation != "off":
+        assert state.validate(), "step_default_update_regimen"
+    return state
@@ -1,23 +1,95 @@
 import typing
 
+import opytional as opyt
+
+from ...BatchState import BatchState
 from ...events import EventBuffer
 from ...State import State
+from ..halt import DivergenceFailure
 
 
 class EvaluateDuration:
+    """Reports elapsed simulation time once `halting_component` triggers
+    simulation halt.
+
+    If `halting_component` halts with `sentinel`, reports `sentinel_duration`
+    instead. For example, with `HaltOnQuiescence`, `sentinel_duration` can be
+    set to the timeout a settled structure would otherwise run until.
+
+    If `halting_component` halts with a `DivergenceFailure` (i.e., from
+    `HaltOnDivergence`), reports `failure_duration`, or passes the failure
+    through if `failure_duration` is not provided.
 
+    If passed a `BatchState`, returns a list with halted individuals' elapsed
+    time (or None for individuals that continue), or None if no individual
+    halts.
+    """
+
+    _failure_duration: typing.Optional[float]
     _halting_component: typing.Callable
+    _sentinel: typing.Any
+    _sentinel_duration: typing.Optional[float]
 
     def __init__(
         self: "EvaluateDuration",
         halting_component: typing.Callable,
+        sentinel: typing.Any = "quiescent",
+        sentinel_duration: typing.Optional[float] = None,
+        failure_duration: typing.Optional[float] = None,
     ) -> None:
+        """Initialize functor.
+
+        Parameters
+        ----------
+        halting_component : Callable
+            Component whose non-None return triggers halt.
+        sentinel : Any, default "quiescent"
+            Halting result to report as `sentinel_duration`.
+
+            Default matches `HaltOnQuiescence`'s default sentinel.
+        sentinel_duration : float, optional
+            Duration reported when `halting_component` returns `sentinel`.
+
+            If not provided, elapsed time is reported for all halts.
+        failure_duration : float, optional
+            Duration reported when `halting_component` returns a
+            `DivergenceFailure`, i.e., a penalty value such as `1e9`.
+
+            If not provided, `DivergenceFailure` results are reported as-is.
+        """
+        self._failure_duration = failure_duration
         self._halting_component = halting_component
+        self._sentinel = sentinel
+        self._sentinel_duration = sentinel_duration
+
+    def _get_duration(
+        self: "EvaluateDuration",
+        t: float,
+        halting_res: typing.Any,
+    ) -> typing.Union[float, DivergenceFailure]:
+        """Get reported duration for an individual halting at time `t`."""
+        if isinstance(halting_res, DivergenceFailure):
+            return opyt.or_value(self._failure_duration, halting_res)
+        if (
+            self._sentinel_duration is not None
+            and type(halting_res) is type(self._sentinel)
+            and halting_res == self._sentinel
+        ):
+            return self._sentinel_duration
+        return t
 
     def __call__(
         self: "EvaluateDuration",
         state: State,
         event_buffer: typing.Optional[EventBuffer],
-    ) -> typing.Optional[float]:
-        if self._halting_component(state, event_buffer) is not None:
-            return state.t
+    ) -> typing.Union[float, typing.List[typing.Optional[float]], None]:
+        res = self._halting_component(state, event_buffer)
+        if isinstance(state, BatchState) and res is not None:
+            return [
+                self._get_duration(float(t), individual_res)
+                if individual_res is not None
+                else None
+                for t, individual_res in zip(state.t, res)
+            ]
+        elif res is not None:
+            return self._get_duration(state.t, res)
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+import typing
+
+
+@dataclass(frozen=True, eq=True)
+class DivergenceFailure:
+    """Reports numerical divergence of a simulation run, in place of raising.
+
+    See Also
+    --------
+    HaltOnDivergence
+        Originates failure result.
+    """
+
+    t: float  # elapsed simulation time when divergence was detected
+    reason: typing.Literal["nonfinite", "speed", "length"]  # bound tripped
+    max_speed: float  # greatest cell speed
+    max_length: float  # greatest spring length
+    speed_limit: float  # bound on cell speed
+    length_limit: float  # bound on spring length
@@ -1,12 +1,17 @@
 import typing
 
+from ...BatchState import BatchState
 from ...State import State
 from ...Params import Params
 
 
 class HaltAfterElapsedTime:
     """Inspects simulation and triggers simulation halt by returning non-None
-    value when `target_duration` simulation time has elapsed."""
+    value when `target_duration` simulation time has elapsed.
+
+    If passed a `BatchState`, returns a list with halted individuals' State
+    (or None for individuals that continue), or None if no individual halts.
+    """
 
     _target_duration: float
 
@@ -19,5 +24,14 @@ class HaltAfterElapsedTime:
         self: "HaltAfterElapsedTime",
         state: State,
         event_buffer: typing.Optional = None,
-    ) -> typing.Optional[State]:
+    ) -> typing.Union[State, typing.List[typing.Optional[State]], None]:
+        if isinstance(state, BatchState):
+            halted = state.t > self._target_duration
+            if not halted.any():
+                return None
+            return [
+                state.get_state(index) if is_halted else None
+                for index, is_halted in enumerate(halted)
+            ]
+
         return state if state.t > self._target_duration else None
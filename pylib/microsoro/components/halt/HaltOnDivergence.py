@@ -0,0 +1,177 @@
+import typing
+
+import numpy as np
+
+from ...BatchState import BatchState
+from ...events import EventBuffer
+from ...GraphStructure import GraphStructure
+from ...Params import Params
+from ...State import State
+from .DivergenceFailure import DivergenceFailure
+
+
+class HaltOnDivergence:
+    """Inspects state and triggers simulation halt by returning a
+    `DivergenceFailure` once cell speeds or spring lengths exceed bounds that
+    no stable simulation approaches.
+
+    Bounds are derived from `Params`. Cell speed is bounded by the speed at
+    which a cell would cross `speed_fraction` of the longest allowed spring
+    rest length in a single timestep, motion explicit spring forces can't
+    resolve. Spring length is bounded by `length_factor` times the longest
+    allowed rest length. Unstable runs grow exponentially, so either bound
+    trips within a few steps of instability onset, typically long before
+    non-finite values appear. So, runs can be aborted without wasting steps
+    and without raising through callers (i.e., pool workers).
+
+    Spring lengths are measured between row and column neighbors, or along
+    the springs of a `GraphStructure` if one is provided.
+
+    If passed a `BatchState`, returns a list with halted individuals'
+    `DivergenceFailure` (or None for individuals that continue), or None if
+    no individual halts.
+    """
+
+    _edges: typing.Optional[typing.Tuple[np.ndarray, np.ndarray]]
+    _length_limit: float
+    _speed_limit: float
+
+    def __init__(
+        self: "HaltOnDivergence",
+        speed_fraction: float = 0.5,
+        length_factor: float = 4.0,
+        params: typing.Optional[Params] = None,
+        structure: typing.Optional[GraphStructure] = None,
+    ) -> None:
+        """Initialize functor.
+
+        Parameters
+        ----------
+        speed_fraction : float, default 0.5
+            Fraction of longest allowed spring rest length, `params.l_lim`,
+            a cell may travel per timestep, `params.dt`.
+        length_factor : float, default 4.0
+            Multiple of longest allowed spring rest length, `params.l_lim`,
+            a spring may stretch to.
+        params : Params, optional
+            Simulation parameters bounds are derived from.
+
+            If not provided, default `Params` will be used.
+        structure : GraphStructure, optional
+            Graph structure whose springs spring lengths are measured along.
+
+            If not provided, springs are taken to join row and column
+            neighbors.
+
+        Raises
+        ------
+        ValueError
+            If `speed_fraction` or `length_factor` is not positive.
+        """
+        if not speed_fraction > 0.0:
+            raise ValueError(f"{speed_fraction=} must be positive")
+        if not length_factor > 0.0:
+            raise ValueError(f"{length_factor=} must be positive")
+
+        if params is None:
+            params = Params()
+        max_rest_length = params.l_lim[1]
+        self._speed_limit = speed_fraction * max_rest_length / params.dt
+        self._length_limit = length_factor * max_rest_length
+
+        if isinstance(structure, GraphStructure):
+            self._edges = (structure.i, structure.j)
+        else:
+            self._edges = None
+
+    def _get_max_length(
+        self: "HaltOnDivergence",
+        state: State,
+        cell_axes: typing.Optional[typing.Tuple[int, int]],
+    ) -> np.ndarray:
+        """Get greatest spring length, per individual."""
+        px, py = state.px, state.py
+        if self._edges is not None:
+            i, j = self._edges
+            flat_x = px.reshape(*px.shape[:-2], -1)
+            flat_y = py.reshape(*py.shape[:-2], -1)
+            lengths = np.hypot(
+                flat_x[..., i] - flat_x[..., j],
+                flat_y[..., i] - flat_y[..., j],
+            )
+            return np.max(lengths, axis=-1, initial=0.0)
+
+        # slice differences and whole-array reductions where possible, which
+        # run several times faster than np.diff and tuple-axis reductions
+        # for small arrays
+        res = np.zeros(px.shape[:-2], dtype=px.dtype)
+        if px.shape[-1] > 1:  # row springs
+            lengths = np.hypot(
+                px[..., 1:] - px[..., :-1], py[..., 1:] - py[..., :-1]
+            )
+            res = np.maximum(res, lengths.max(axis=cell_axes))
+        if px.shape[-2] > 1:  # column springs
+            lengths = np.hypot(
+                px[..., 1:, :] - px[..., :-1, :],
+                py[..., 1:, :] - py[..., :-1, :],
+            )
+            res = np.maximum(res, lengths.max(axis=cell_axes))
+        return res
+
+    def _make_failure(
+        self: "HaltOnDivergence",
+        t: float,
+        max_speed: float,
+        max_length: float,
+    ) -> DivergenceFailure:
+        """Package failure result for an individual, reporting which bound
+        was exceeded."""
+        max_speed, max_length = float(max_speed), float(max_length)
+        if not (np.isfinite(max_speed) and np.isfinite(max_length)):
+            reason = "nonfinite"
+        elif max_speed > self._speed_limit:
+            reason = "speed"
+        else:
+            reason = "length"
+
+        return DivergenceFailure(
+            t=float(t),
+            reason=reason,
+            max_speed=max_speed,
+            max_length=max_length,
+            speed_limit=self._speed_limit,
+            length_limit=self._length_limit,
+        )
+
+    def __call__(
+        self: "HaltOnDivergence",
+        state: State,
+        event_buffer: typing.Optional[EventBuffer] = None,
+    ) -> typing.Union[
+        DivergenceFailure,
+        typing.List[typing.Optional[DivergenceFailure]],
+        None,
+    ]:
+        """Report `DivergenceFailure` if speed or length bounds are exceeded,
+        or if state has non-finite values."""
+        cell_axes = (-2, -1) if isinstance(state, BatchState) else None
+        max_speed = np.hypot(state.vx, state.vy).max(axis=cell_axes)
+        max_length = self._get_max_length(state, cell_axes)
+
+        # negated comparisons so that NaN values register as divergent
+        diverged = ~(
+            (max_speed <= self._speed_limit)
+            & (max_length <= self._length_limit)
+        )
+        if not diverged.any():
+            return None
+
+        if isinstance(state, BatchState):
+            return [
+                self._make_failure(t, speed, length) if is_diverged else None
+                for t, speed, length, is_diverged in zip(
+                    state.t, max_speed, max_length, diverged
+                )
+            ]
+
+        return self._make_failure(state.t, max_speed, max_length)
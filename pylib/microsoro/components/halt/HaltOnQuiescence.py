@@ -0,0 +1,139 @@
+import typing
+
+import numpy as np
+
+from ...BatchState import BatchState
+from ...events import EventBuffer
+from ...State import State
+
+
+class HaltOnQuiescence:
+    """Inspects state and triggers simulation halt by returning `sentinel`
+    once bulk motion has stayed below thresholds for a sliding window of
+    simulation time.
+
+    Motion is measured as bulk kinetic energy, from mean cell velocity, and
+    as centroid displacement. An individual is quiet while bulk kinetic
+    energy is below `kinetic_energy_threshold` and its centroid remains
+    within `displacement_threshold` of where it was when it became quiet.
+    Any motion past either threshold restarts the window. So, each call
+    costs only a few reductions over cells, with no stored history.
+
+    Intended to end runs early for structures that fall and settle, which
+    would otherwise idle until a timeout. Pair with `EvaluateDuration`'s
+    `sentinel_duration` to report the timeout duration for quiesced runs.
+
+    If passed a `BatchState`, returns a list with `sentinel` for halted
+    individuals (or None for individuals that continue), or None if no
+    individual halts.
+
+    Notes
+    -----
+    Kinetic energy of internal vibration is excluded, because undamped
+    diagonal springs keep settled lattices ringing indefinitely (i.e., at a
+    mean kinetic energy of about 0.1 per cell for random structures).
+    Quiescence is tracked across calls, so an instance should be used for
+    only one simulation at a time. Tracking restarts if elapsed time goes
+    backwards (i.e., on replay) or population size changes.
+    """
+
+    _anchor_x: typing.Optional[np.ndarray]
+    _anchor_y: typing.Optional[np.ndarray]
+    _displacement_threshold: float
+    _kinetic_energy_threshold: float
+    _last_t: typing.Optional[np.ndarray]
+    _quiet_since: typing.Optional[np.ndarray]
+    _sentinel: typing.Any
+    _window: float
+
+    def __init__(
+        self: "HaltOnQuiescence",
+        window: float = 1.0,
+        kinetic_energy_threshold: float = 0.05,
+        displacement_threshold: float = 0.05,
+        sentinel: typing.Any = "quiescent",
+    ) -> None:
+        """Initialize functor.
+
+        Parameters
+        ----------
+        window : float, default 1.0
+            Duration of simulation time motion must stay below thresholds
+            before halting.
+        kinetic_energy_threshold : float, default 0.05
+            Bulk kinetic energy per unit mass, `0.5 * |mean velocity|**2`,
+            below which an individual is considered still.
+        displacement_threshold : float, default 0.05
+            Centroid distance from start of window within which an
+            individual is considered still.
+        sentinel : Any, default "quiescent"
+            Value returned to report halt.
+
+        Raises
+        ------
+        ValueError
+            If `window` or either threshold is negative.
+        """
+        for name, value in (
+            ("window", window),
+            ("kinetic_energy_threshold", kinetic_energy_threshold),
+            ("displacement_threshold", displacement_threshold),
+        ):
+            if not value >= 0.0:
+                raise ValueError(f"{name}={value} must be non-negative")
+
+        self._window = float(window)
+        self._kinetic_energy_threshold = float(kinetic_energy_threshold)
+        self._displacement_threshold = float(displacement_threshold)
+        self._sentinel = sentinel
+
+        self._anchor_x = None
+        self._anchor_y = None
+        self._last_t = None
+        self._quiet_since = None
+
+    def __call__(
+        self: "HaltOnQuiescence",
+        state: State,
+        event_buffer: typing.Optional[EventBuffer] = None,
+    ) -> typing.Any:
+        """Update quiescence tracking and report halt if motion has stayed
+        below thresholds for window duration."""
+        t = np.array(state.t, dtype=float)
+        cell_axes = (-2, -1)
+        centroid_x = np.mean(state.px, axis=cell_axes)
+        centroid_y = np.mean(state.py, axis=cell_axes)
+        velocity_x = np.mean(state.vx, axis=cell_axes)
+        velocity_y = np.mean(state.vy, axis=cell_axes)
+
+        if (
+            self._last_t is None
+            or self._last_t.shape != t.shape
+            or np.any(t < self._last_t)
+        ):
+            self._quiet_since = t.copy()
+            self._anchor_x = centroid_x
+            self._anchor_y = centroid_y
+
+        # restart window of any individual in motion
+        kinetic_energy = 0.5 * (velocity_x**2 + velocity_y**2)
+        displacement = np.hypot(
+            centroid_x - self._anchor_x, centroid_y - self._anchor_y
+        )
+        moving = (kinetic_energy >= self._kinetic_energy_threshold) | (
+            displacement >= self._displacement_threshold
+        )
+        self._quiet_since = np.where(moving, t, self._quiet_since)
+        self._anchor_x = np.where(moving, centroid_x, self._anchor_x)
+        self._anchor_y = np.where(moving, centroid_y, self._anchor_y)
+        self._last_t = t
+
+        halted = t - self._quiet_since >= self._window
+        if isinstance(state, BatchState):
+            if not halted.any():
+                return None
+            return [
+                self._sentinel if is_halted else None for is_halted in halted
+            ]
+
+        return self._sentinel if halted else None
@@ -2,6 +2,7 @@ import typing
 
 import numpy as np
 
+from ...BatchState import BatchState
 from ...events import EventBuffer, RenderThresholdEvent
 from ...State import State
 from ...Params import Params
@@ -9,7 +10,11 @@ from ...Params import Params
 
 class HaltPastFinishLine:
     """Inspects state and triggers simulation halt by returning non-None value
-    when cell positions pass a threshold."""
+    when cell positions pass a threshold.
+
+    If passed a `BatchState`, returns a list with halted individuals' State
+    (or None for individuals that continue), or None if no individual halts.
+    """
 
     _m: float
     _b: float
@@ -47,6 +52,9 @@ class HaltPastFinishLine:
             To terminate when all cells are past finish line, use `np.all`. To
             terminate when cells go below the finish line (with respect to the
             dependent axis), use `np.less`.
+
+            For use with `BatchState`, comparator must accept an `axis`
+            keyword argument specifying the cell axes to reduce over.
         """
         self._m = float(m)
         self._b = float(b)
@@ -59,8 +67,12 @@ class HaltPastFinishLine:
         self._independent_axis = independent_axis
         if comparator is None:
             comparator = {
-                "vertical": lambda a, b: np.any(np.greater(a, b)),
-                "horizontal": lambda a, b: np.any(np.less(a, b)),
+                "vertical": lambda a, b, axis=None: np.any(
+                    np.greater(a, b), axis=axis
+                ),
+                "horizontal": lambda a, b, axis=None: np.any(
+                    np.less(a, b), axis=axis
+                ),
             }[independent_axis]
         self._comparator = comparator
 
@@ -82,6 +94,9 @@ class HaltPastFinishLine:
         -------
         typing.Optional[State]
             The state if cells cross the finish line, None otherwise.
+
+            If `state` is a `BatchState`, a list of per-individual results is
+            returned instead if any individual crosses the finish line.
         """
 
         independent_axis = self._independent_axis
@@ -103,7 +118,17 @@ class HaltPastFinishLine:
         }[independent_axis]
 
         threshold_positions = m * independent_positions + b
-        if comparator(dependent_positions, threshold_positions):
+        if isinstance(state, BatchState):
+            halted = comparator(
+                dependent_positions, threshold_positions, axis=(-2, -1)
+            )
+            if not np.any(halted):
+                return None
+            return [
+                state.get_state(index) if is_halted else None
+                for index, is_halted in enumerate(halted)
+            ]
+        elif comparator(dependent_positions, threshold_positions):
             return state
         else:
             return None
@@ -1,8 +1,14 @@
+from .DivergenceFailure import DivergenceFailure
 from .HaltAfterElapsedTime import HaltAfterElapsedTime
+from .HaltOnDivergence import HaltOnDivergence
+from .HaltOnQuiescence import HaltOnQuiescence
 from .HaltPastFinishLine import HaltPastFinishLine
 
 
 __all__ = [
+    "DivergenceFailure",
     "HaltAfterElapsedTime",
+    "HaltOnDivergence",
+    "HaltOnQuiescence",
     "HaltPastFinishLine",
 ]
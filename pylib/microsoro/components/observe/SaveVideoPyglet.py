@@ -4,7 +4,12 @@ import pyglet as pyg
 from pyglet.window import Window as pyg_Window
 
 from ....auxlib import ffmpegVideoRenderWorker
-from ...events import EventBuffer, RenderFloorEvent, RenderThresholdEvent
+from ...events import (
+    EventBuffer,
+    RenderFloorEvent,
+    RenderTerrainEvent,
+    RenderThresholdEvent,
+)
 from ...Params import Params
 from ...State import State
 from ...viz import (
@@ -86,6 +91,11 @@ class SaveVideoPyglet:
                     DrawPygletFloor(style=self._style),
                     skip_duplicates=True,
                 )
+                + event_buffer.consume(
+                    RenderTerrainEvent,
+                    DrawPygletFloor(style=self._style),
+                    skip_duplicates=True,
+                )
                 + event_buffer.consume(
                     RenderThresholdEvent,
                     DrawPygletThreshold(style=self._style),
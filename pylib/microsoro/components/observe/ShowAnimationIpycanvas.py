@@ -9,7 +9,12 @@ from ipycanvas import hold_canvas as ipy_hold_canvas
 from IPython.display import display as IPy_display
 
 from ....auxlib import decorate_with_context
-from ...events import EventBuffer, RenderFloorEvent, RenderThresholdEvent
+from ...events import (
+    EventBuffer,
+    RenderFloorEvent,
+    RenderTerrainEvent,
+    RenderThresholdEvent,
+)
 from ...State import State
 from ...viz import (
     draw_ipycanvas_State,
@@ -72,6 +77,11 @@ class ShowAnimationIpycanvas:
                 DrawIpycanvasFloor(canvas=self._canvas, style=self._style),
                 skip_duplicates=True,
             )
+            event_buffer.consume(
+                RenderTerrainEvent,
+                DrawIpycanvasFloor(canvas=self._canvas, style=self._style),
+                skip_duplicates=True,
+            )
             event_buffer.consume(
                 RenderThresholdEvent,
                 DrawIpycanvasThreshold(canvas=self._canvas, style=self._style),
@@ -7,7 +7,12 @@ import pause
 import pyglet as pyg
 from pyglet.window import Window as pyg_Window
 
-from ...events import EventBuffer, RenderFloorEvent, RenderThresholdEvent
+from ...events import (
+    EventBuffer,
+    RenderFloorEvent,
+    RenderTerrainEvent,
+    RenderThresholdEvent,
+)
 from ...State import State
 from ...viz import (
     draw_pyglet_State,
@@ -72,6 +77,11 @@ class ShowAnimationPyglet:
                         DrawPygletFloor(style=self._style),
                         skip_duplicates=True,
                     )
+                    + event_buffer.consume(
+                        RenderTerrainEvent,
+                        DrawPygletFloor(style=self._style),
+                        skip_duplicates=True,
+                    )
                     + event_buffer.consume(
                         RenderThresholdEvent,
                         DrawPygletThreshold(style=self._style),
@@ -0,0 +1,131 @@
+import copy
+import typing
+
+import numpy as np
+
+from ...events import EventBuffer
+from ...Params import Params
+from ...State import State
+
+
+class ApplyAdaptiveTimestep:
+    """Advance simulation by one error-controlled step of adaptive size.
+
+    Wraps update components that read timestep size from a shared `Params`.
+    Each call applies wrapped components twice at half-step size `dt`, and
+    separately once at full-step size `2 * dt` from the same starting State.
+    The largest discrepancy in cell position between the two results
+    estimates local error. If estimated error exceeds `tolerance`, the step
+    is rejected and retried at smaller size. Otherwise, the (more accurate)
+    half-step result is kept.
+
+    After each accepted step, `dt` is grown or shrunk toward the largest
+    size expected to meet `tolerance`, within `params.dt_lim`. So, steps are
+    long through smooth motion (e.g., free fall) and short through stiff
+    spring oscillation and floor contact.
+    """
+
+    _components: typing.Sequence[typing.Callable]
+    _dt: float
+    _params: Params
+    _tolerance: float
+
+    def __init__(
+        self: "ApplyAdaptiveTimestep",
+        components: typing.Sequence[typing.Callable],
+        params: typing.Optional[Params] = None,
+        tolerance: float = 1e-4,
+    ) -> None:
+        """Initialize functor.
+
+        Parameters
+        ----------
+        components : list[Callable]
+            Update components to apply each step, i.e., a default update
+            regimen from `get_default_update_regimen`.
+
+            All components that depend on timestep size, including
+            `ApplyIncrementElapsedTime`, must be included and must read
+            timestep size from `params`. Return values of wrapped components
+            are ignored, so halting components should be applied separately
+            after this component.
+        params : Params, optional
+            Parameters shared with `components`.
+
+            Initial step size is taken from `params.dt`. Over simulation,
+            `params.dt` is set to the size of each step as it is applied, and
+            left at the size of the last accepted half-step. If not provided,
+            a default `Params` instance will be used.
+        tolerance : float, default 1e-4
+            Maximum estimated local error in cell position per step.
+
+            Steps at the lower limit of `params.dt_lim` are accepted
+            regardless of error.
+
+        Raises
+        ------
+        ValueError
+            If `tolerance` is not positive.
+        """
+        if not tolerance > 0:
+            raise ValueError(f"{tolerance=} must be positive")
+
+        if params is None:
+            params = Params()
+        self._components = components
+        self._dt = params.dt
+        self._params = params
+        self._tolerance = float(tolerance)
+
+    def _apply(
+        self: "ApplyAdaptiveTimestep",
+        state: State,
+        event_buffer: typing.Optional[EventBuffer],
+        dt: float,
+    ) -> None:
+        """Apply wrapped components once, with timestep size `dt`."""
+        self._params.dt = dt
+        for component in self._components:
+            component(state, event_buffer)
+
+    def __call__(
+        self: "ApplyAdaptiveTimestep",
+        state: State,
+        event_buffer: typing.Optional[EventBuffer] = None,
+    ) -> None:
+        """Apply one accepted adaptive step, comprising two half-steps of
+        wrapped components."""
+        dt_min, dt_max = self._params.dt_lim
+        dt = float(np.clip(self._dt, dt_min, dt_max))
+        start = copy.deepcopy((state, event_buffer))
+
+        while True:
+            trial, __ = copy.deepcopy(start)
+            self._apply(trial, None, 2 * dt)  # trial events are discarded
+            self._apply(state, event_buffer, dt)
+            self._apply(state, event_buffer, dt)
+
+            error = np.maximum(
+                np.max(np.abs(trial.px - state.px), initial=0.0),
+                np.max(np.abs(trial.py - state.py), initial=0.0),
+            )
+
+            # local error of semi-implicit Euler scales as dt squared,
+            # limit growth and shrinkage per step to keep control smooth
+            # (NaN error, i.e., from instability, shrinks maximally)
+            ratio = self._tolerance / error if error else np.inf
+            factor = np.clip(0.9 * np.sqrt(ratio), 0.2, 2.0)
+            factor = np.nan_to_num(factor, nan=0.2)
+            next_dt = float(np.clip(dt * factor, dt_min, dt_max))
+
+            if error <= self._tolerance or dt <= dt_min:
+                self._dt = next_dt
+                self._params.dt = dt
+                return
+
+            # reject step, retrying from starting State and events
+            start_state, start_event_buffer = copy.deepcopy(start)
+            vars(state).update(vars(start_state))
+            if event_buffer is not None:
+                vars(event_buffer).update(vars(start_event_buffer))
+            dt = next_dt
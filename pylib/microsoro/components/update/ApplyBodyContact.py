@@ -0,0 +1,234 @@
+import typing
+
+import numpy as np
+
+from ...State import State
+from ...Params import Params
+from .ApplySelfCollision import _find_close_pairs
+
+
+class ApplyBodyContact:
+    """Repel cells of different bodies that come closer than a contact radius.
+
+    Multi-body counterpart of `ApplySelfCollision`, for arenas where several
+    soft bodies, each with its own `State` and structure, share a world (see
+    `perform_arena_simulation`). Each overlapping pair of cells from
+    different bodies is pushed apart by a penalty spring of stiffness `k`,
+    acting along the line between cells in proportion to overlap.
+
+    Contact is resolved in two phases. Broadphase sweeps and prunes body
+    axis-aligned bounding boxes, padded by half of contact radius: boxes are
+    sorted by lower x bound, each box is tested only against boxes that
+    begin before it ends along x, and then for y overlap. Narrowphase then
+    runs only for overlapping body pairs, and only over cells of each body
+    that lie near the other's bounding box, finding close cell pairs through
+    the same spatial hash as `ApplySelfCollision`. So, contact cost scales
+    with cells in overlapping regions rather than all pairs of cells across
+    bodies.
+
+    Unlike other update components, called with sequences of `State` and of
+    structures, one per body, rather than a single State.
+
+    Notes
+    -----
+    Contact within bodies is not considered; add `ApplySelfCollision` to
+    body update regimens for that.
+    """
+
+    _k: float
+    _params: Params
+    _radius: float
+
+    def __init__(
+        self: "ApplyBodyContact",
+        radius: typing.Optional[float] = None,
+        k: typing.Optional[float] = None,
+        params: typing.Optional[Params] = None,
+    ) -> None:
+        """Initialize functor.
+
+        Parameters
+        ----------
+        radius : float, optional
+            Contact distance, below which cells of different bodies repel.
+
+            If not provided, defaults to half of spring natural length
+            `params.l`.
+        k : float, optional
+            Stiffness of contact repulsion.
+
+            If not provided, defaults to spring stiffness `params.k`.
+        params : Params, optional
+            Configuration parameters. If not provided, a default `Params`
+            instance will be used.
+
+        Raises
+        ------
+        ValueError
+            If `radius` is not positive or if `k` is negative.
+        """
+        if params is None:
+            params = Params()
+        self._params = params
+
+        if radius is None:
+            radius = params.l / 2
+        if not radius > 0:
+            raise ValueError(f"{radius=} must be positive")
+        self._radius = float(radius)
+
+        if k is None:
+            k = params.k
+        if not k >= 0:
+            raise ValueError(f"{k=} must be non-negative")
+        self._k = float(k)
+
+    def _find_body_pairs(
+        self: "ApplyBodyContact",
+        bounds: np.ndarray,
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Find all pairs of bodies with overlapping bounding boxes, by sweep
+        and prune.
+
+        Parameters
+        ----------
+        bounds : np.ndarray
+            Padded bounding box of each body, as rows of
+            `(x_min, x_max, y_min, y_max)`.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            Body numbers of pair members, with first less than second.
+        """
+        x_min, x_max, y_min, y_max = bounds.T
+
+        # sweep along x, pairing each box with boxes that begin before it
+        # ends, then prune pairs without y overlap
+        order = np.argsort(x_min, kind="stable")
+        ends = np.searchsorted(x_min[order], x_max[order], side="right")
+        num_candidates = np.maximum(ends - np.arange(len(order)) - 1, 0)
+        first = np.repeat(np.arange(len(order)), num_candidates)
+        second = np.arange(num_candidates.sum()) - np.repeat(
+            np.cumsum(num_candidates) - num_candidates, num_candidates
+        )
+        second += first + 1
+        first, second = order[first], order[second]
+
+        keep = (y_min[first] <= y_max[second]) & (
+            y_min[second] <= y_max[first]
+        )
+        first, second = first[keep], second[keep]
+        return np.minimum(first, second), np.maximum(first, second)
+
+    def _apply_pair(
+        self: "ApplyBodyContact",
+        state_a: State,
+        m_a: np.ndarray,
+        bounds_a: np.ndarray,
+        state_b: State,
+        m_b: np.ndarray,
+        bounds_b: np.ndarray,
+    ) -> None:
+        """Apply contact repulsion between cells of two bodies."""
+        radius = self._radius
+
+        # restrict to cells near the other body's padded bounding box
+        def get_nearby_cells(state: State, bounds: np.ndarray) -> np.ndarray:
+            x_min, x_max, y_min, y_max = bounds
+            px, py = state.px.ravel(), state.py.ravel()
+            return np.flatnonzero(
+                (px >= x_min - radius / 2)
+                & (px <= x_max + radius / 2)
+                & (py >= y_min - radius / 2)
+                & (py <= y_max + radius / 2)
+            )
+
+        cells_a = get_nearby_cells(state_a, bounds_b)
+        cells_b = get_nearby_cells(state_b, bounds_a)
+        if not (len(cells_a) and len(cells_b)):
+            return
+
+        px = np.concatenate(
+            [state_a.px.ravel()[cells_a], state_b.px.ravel()[cells_b]]
+        )
+        py = np.concatenate(
+            [state_a.py.ravel()[cells_a], state_b.py.ravel()[cells_b]]
+        )
+        bodies = np.repeat([0, 1], [len(cells_a), len(cells_b)])
+        first, second = _find_close_pairs(
+            px, py, bodies, radius, same_group=False
+        )
+        if not len(first):
+            return
+
+        # penalty force along unit vector from body b cell to body a cell
+        dists_horiz = px[first] - px[second]
+        dists_vert = py[first] - py[second]
+        dists = np.hypot(dists_horiz, dists_vert)
+        f = np.divide(
+            self._k * (radius - dists),
+            dists,
+            out=np.zeros_like(dists),
+            where=dists > 0,
+        )
+
+        # apply equal and opposite impulses, first members are of body a
+        dt = self._params.dt
+        first_cells = cells_a[first]
+        second_cells = cells_b[second - len(cells_a)]
+        for state, cells, m, sign in (
+            (state_a, first_cells, m_a, 1.0),
+            (state_b, second_cells, m_b, -1.0),
+        ):
+            dt_per_m = sign * dt / np.broadcast_to(m, state.px.shape).ravel()
+            for v, d in (state.vx, dists_horiz), (state.vy, dists_vert):
+                dv = np.bincount(cells, weights=f * d, minlength=v.size)
+                dv *= dt_per_m
+                v += dv.reshape(v.shape)
+
+    def __call__(
+        self: "ApplyBodyContact",
+        states: typing.Sequence[State],
+        structures: typing.Sequence[typing.Any],
+        event_buffer: typing.Optional = None,
+    ) -> None:
+        """Apply contact repulsion between cells of different bodies within
+        contact radius to body State velocities.
+
+        Parameters
+        ----------
+        states : list[State]
+            State of each body.
+        structures : list[Structure or GraphStructure]
+            Structure of each body, providing cell masses.
+        event_buffer : EventBuffer, optional
+            Unused.
+        """
+        if len(states) != len(structures):
+            raise ValueError(f"{len(states)=} and {len(structures)=} differ")
+        if len(states) < 2:
+            return
+
+        pad = self._radius / 2
+        bounds = np.array(
+            [
+                (
+                    np.min(state.px) - pad,
+                    np.max(state.px) + pad,
+                    np.min(state.py) - pad,
+                    np.max(state.py) + pad,
+                )
+                for state in states
+            ],
+        )
+
+        for a, b in zip(*self._find_body_pairs(bounds)):
+            self._apply_pair(
+                states[a],
+                structures[a].m,
+                bounds[a],
+                states[b],
+                structures[b].m,
+                bounds[b],
+            )
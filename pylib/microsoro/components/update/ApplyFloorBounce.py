@@ -4,6 +4,7 @@ import numpy as np
 
 from ...State import State
 from ...events import EventBuffer, RenderFloorEvent
+from ...Workspace import Workspace
 
 
 class ApplyFloorBounce:
@@ -11,13 +12,16 @@ class ApplyFloorBounce:
 
     _elasticity: float
     _intercept: float
+    _normal: typing.Tuple[float, float]
     _slope: float
+    _workspace: Workspace
 
     def __init__(
         self: "ApplyFloorBounce",
         e: float = 1.0,
         m: float = 0.0,
         b: float = 0.0,
+        workspace: typing.Optional[Workspace] = None,
     ) -> None:
         """Initialize functor.
 
@@ -31,6 +35,10 @@ class ApplyFloorBounce:
             Slope of the floor, default flat.
         b : float, default 0.0
             Y-intercept of the floor.
+        workspace : Workspace, optional
+            Holds scratch buffers for temporaries.
+
+            If not provided, a private workspace is used.
 
         Raises:
         ------
@@ -45,6 +53,18 @@ class ApplyFloorBounce:
         self._intercept = float(b)
         self._slope = float(m)
 
+        # Determine the normalized normal vector to the slope
+        normal = np.array([-m, 1])
+        normal /= np.linalg.norm(normal)
+        assert np.isclose(
+            np.dot(normal, np.array([1, m])), 0
+        )  # should be perpendicular to slope
+        self._normal = tuple(map(float, normal))
+
+        if workspace is None:
+            workspace = Workspace()
+        self._workspace = workspace
+
     def __call__(
         self: "ApplyFloorBounce",
         state: State,
@@ -58,26 +78,33 @@ class ApplyFloorBounce:
         if event_buffer is not None:
             event_buffer.enqueue(RenderFloorEvent(m=m, b=b, flavor="floor"))
 
+        workspace = self._workspace
+        shape = state.px.shape
+        dtype = state.px.dtype
+
         # Get the floor y-values for all x-positions
-        y_floor = m * state.px + b
+        y_floor = np.multiply(
+            state.px, m, out=workspace.get("y_floor", shape, dtype)
+        )
+        y_floor += b
 
         # Find the cells which are below the floor
-        below_floor_mask = state.py < y_floor
+        below_floor_mask = np.less(
+            state.py, y_floor, out=workspace.get("below_floor", shape, bool)
+        )
 
         # if no cells are below floor, we are done
-        if not np.any(below_floor_mask):
+        if not below_floor_mask.any():
             return
 
-        # Determine the normalized normal vector to the slope
-        normal = np.array([-m, 1])
-        normal /= np.linalg.norm(normal)
-        assert np.isclose(
-            np.dot(normal, np.array([1, m])), 0
-        )  # should be perpendicular to slope
-
         # rough calculation of max ppenetration past surface
         # independently along x and y axes (may overestimate
         tolerance_factor = 1e-12  # should this be configurabe?
+        if dtype != np.float64:  # widen to cover rounding at low precision
+            magnitude = max(abs(y_floor.max()), abs(y_floor.min()), 1.0)
+            tolerance_factor = max(
+                tolerance_factor, 8 * magnitude * float(np.finfo(dtype).eps)
+            )
 
         # update state position to correct penetration
         # for now, just shift entire state
@@ -87,39 +114,100 @@ class ApplyFloorBounce:
         # and then perform corrections so that the pre-existing less-than and
         # greater-than relationships between successive rows are maintained
         # i.e., any slippage of one layer past the other is corrected
-        y_penetration = y_floor[below_floor_mask] - state.py[below_floor_mask]
-        state.py += np.max(y_penetration) + tolerance_factor
+        #
+        # any leading (i.e., batch) axes are shifted independently, so
+        # reduce only over trailing cell row and column axes
+        cell_axes = (-2, -1)
+        reduced_shape = (*shape[:-2], 1, 1)
+        none_below_floor = np.logical_not(
+            np.any(
+                below_floor_mask,
+                axis=cell_axes,
+                keepdims=True,
+                out=workspace.get("any_below_floor", reduced_shape, bool),
+            ),
+            out=workspace.get("none_below_floor", reduced_shape, bool),
+        )
+        penetration = workspace.get("penetration", shape, dtype)
+        max_penetration = workspace.get(
+            "max_penetration", reduced_shape, dtype
+        )
+
+        penetration.fill(-np.inf)
+        np.subtract(y_floor, state.py, out=penetration, where=below_floor_mask)
+        np.max(penetration, axis=cell_axes, keepdims=True, out=max_penetration)
+        max_penetration += tolerance_factor
+        np.copyto(max_penetration, 0.0, where=none_below_floor)
+        state.py += max_penetration
 
         # y = mx + b
         # so y / m - b / m = x
         if m:
-            x_floor = (state.py[below_floor_mask] - b) / m
-            x_penetration = x_floor - state.px[below_floor_mask]
+            x_floor = np.subtract(
+                state.py, b, out=workspace.get("x_floor", shape, dtype)
+            )
+            x_floor /= m
+            penetration.fill(-np.inf)
+            np.subtract(
+                x_floor, state.px, out=penetration, where=below_floor_mask
+            )
+            np.max(
+                penetration, axis=cell_axes, keepdims=True, out=max_penetration
+            )
             # update state x positions to correct any penetration
             # shifts all x positions, see note above for y penetration
-            state.px += np.sign(m) * np.max(x_penetration) + tolerance_factor
+            max_penetration *= np.sign(m)
+            max_penetration += tolerance_factor
+            np.copyto(max_penetration, 0.0, where=none_below_floor)
+            state.px += max_penetration
 
         # Check that all cells now above the floor
-        assert not np.any(state.py < m * state.px + b)
+        np.multiply(state.px, m, out=y_floor)
+        y_floor += b
+        assert not np.less(
+            state.py, y_floor, out=workspace.get("check", shape, bool)
+        ).any()
 
         # Compute dot product of incoming velocity with normal for cells below
         # the floor
-        dot_product = (
-            state.vx[below_floor_mask] * normal[0]
-            + state.vy[below_floor_mask] * normal[1]
+        normal_x, normal_y = self._normal
+        dot_product = np.multiply(
+            state.vx, normal_x, out=workspace.get("dot_product", shape, dtype)
         )
+        dot_product += np.multiply(state.vy, normal_y, out=y_floor)
 
         # Reflect the velocities of the cells below the floor
-        reflection_x = state.vx[below_floor_mask] - 2 * dot_product * normal[0]
-        reflection_y = state.vy[below_floor_mask] - 2 * dot_product * normal[1]
+        reflection_x = np.multiply(
+            dot_product,
+            -2 * normal_x,
+            out=workspace.get("reflection_x", shape, dtype),
+        )
+        reflection_x += state.vx
+        reflection_y = np.multiply(
+            dot_product,
+            -2 * normal_y,
+            out=workspace.get("reflection_y", shape, dtype),
+        )
+        reflection_y += state.vy
 
         # Make robust: correct sign to ensure upwards bounce
         # (needed due to interactions between intersecting floors)
         # reflection_x = reflection_x * np.sign(reflection_y)
         # ^^^ logically, x component would be reversed when reversing velocity,
         # but this causes a bad feedback loop with other floors
-        reflection_y = np.abs(reflection_y)
-
-        # Update velocities, applying velocity loss to imperfect elasticity
-        state.vx[below_floor_mask] = reflection_x * self._elasticity
-        state.vy[below_floor_mask] = reflection_y * self._elasticity
+        np.abs(reflection_y, out=reflection_y)
+
+        # Update velocities of cells below the floor, applying velocity loss
+        # to imperfect elasticity
+        np.multiply(
+            reflection_x,
+            self._elasticity,
+            out=state.vx,
+            where=below_floor_mask,
+        )
+        np.multiply(
+            reflection_y,
+            self._elasticity,
+            out=state.vy,
+            where=below_floor_mask,
+        )
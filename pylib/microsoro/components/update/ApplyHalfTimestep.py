@@ -0,0 +1,54 @@
+import typing
+
+from ...events import EventBuffer
+from ...Params import Params
+from ...State import State
+
+
+class ApplyHalfTimestep:
+    """Apply wrapped update components with half of the timestep size.
+
+    Timestep size `params.dt` is halved while wrapped components are applied,
+    then restored. Used to split force components into two half-step "kicks"
+    around a full-step position "drift" for velocity Verlet integration.
+    """
+
+    _components: typing.Sequence[typing.Callable]
+    _params: Params
+
+    def __init__(
+        self: "ApplyHalfTimestep",
+        components: typing.Sequence[typing.Callable],
+        params: typing.Optional[Params] = None,
+    ) -> None:
+        """Initialize functor.
+
+        Parameters
+        ----------
+        components : list[Callable]
+            Update components to apply, which must read timestep size from
+            `params`.
+
+            Return values of wrapped components are ignored.
+        params : Params, optional
+            Parameters shared with `components`. If not provided, a default
+            `Params` instance will be used.
+        """
+        if params is None:
+            params = Params()
+        self._components = components
+        self._params = params
+
+    def __call__(
+        self: "ApplyHalfTimestep",
+        state: State,
+        event_buffer: typing.Optional[EventBuffer] = None,
+    ) -> None:
+        """Apply wrapped components in sequence at half timestep size."""
+        dt = self._params.dt
+        self._params.dt = dt / 2
+        try:
+            for component in self._components:
+                component(state, event_buffer)
+        finally:
+            self._params.dt = dt
@@ -22,3 +22,5 @@ class ApplyIncrementElapsedTime:
         event_buffer: typing.Optional = None,
     ) -> None:
         state.t += self._params.dt
+        if state.energy is not None:
+            state.energy.close_step(state)
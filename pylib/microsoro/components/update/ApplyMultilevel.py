@@ -0,0 +1,264 @@
+import typing
+
+import numpy as np
+
+from ...Coarsening import Coarsening
+from ...events import EventBuffer
+from ...Params import Params
+from ...State import State
+
+
+class ApplyMultilevel:
+    """Advance State on a coarsened lattice while gross motion suffices,
+    refining to the full lattice while strain or contact demands it.
+
+    At the coarse level, `coarse_components` step a coarse State, and results
+    are prolonged onto the fine State every `prolong_interval` steps, so
+    downstream components (i.e., halting components) see the fine State as
+    usual. At the fine level, `components` step the fine State directly.
+
+    Refinement is demanded when any coarse row or column spring is strained
+    past `strain_threshold`, or on impact, when any coarse cell comes near
+    the floor (`py` below `contact_height`) moving toward it faster than
+    `impact_speed`. Cells already near the floor do not demand refinement,
+    so bodies resting on the floor (which `ApplyFloorBounce` holds up by
+    shifting positions, leaving downward velocities) return to the coarse
+    level. Demand is evaluated on the coarse State, restricted from the fine
+    State at the fine level. Once refined, the fine level is kept until
+    demand has been absent for `window` of simulation time, then the coarse
+    State is resumed from the restricted fine State.
+
+    Coarse cells sit at block centroids, `(coarsening.factor - 1) / 2`
+    spacings above the bottom cells of their blocks, so coarse positions are
+    held that much lower, letting coarse cells meet the floor where their
+    bottom cells would.
+
+    Fine-scale detail (i.e., internal vibration) is discarded on each return
+    to the coarse level, so use for screening evaluations where gross
+    motion matters, such as distance traveled.
+
+    Notes
+    -----
+    Measured on a default 128x128 structure at its stable `dt`, dropped from
+    height 5 and propelled sideways, over 1000 steps: steps took 2170
+    microseconds at full resolution, versus 1860 and 1620 microseconds
+    (refined for 39% and 25% of steps) with factor 4 and 8 coarsenings, and
+    1380 and 1130 microseconds with `prolong_interval=10`. Maximum centroid
+    deviation from the full-resolution run was 1.4 and 2.4. Never refining,
+    steps took 370 and 270 microseconds, with deviation 2.0 and 3.1.
+
+    At the coarse level, changes made to the fine State between calls are
+    overwritten. Tracking restarts from the fine State if a different State
+    is passed or elapsed time goes backwards (i.e., on replay). At the coarse
+    level, `State.energy` is not updated.
+
+    Treated as a pure-update component by `compile_regimen` and chunked
+    `perform_simulation`, so `components` and `coarse_components` should not
+    include halting components. When chunked `perform_simulation` replays
+    from a snapshot, tracking restarts from the snapshot's fine State, so
+    replayed steps may differ slightly from a `check_every=1` run.
+    """
+
+    _coarse_components: typing.Sequence[typing.Callable]
+    _coarse_state: typing.Optional[State]
+    _coarsening: Coarsening
+    _components: typing.Sequence[typing.Callable]
+    _contact_height: float
+    _demanded_at: float
+    _floor_offset: float
+    _fine_state: typing.Optional[State]
+    _impact_speed: float
+    _is_refined: bool
+    _near_floor: typing.Optional[np.ndarray]
+    _prolong_interval: int
+    _steps_since_prolong: int
+    _strain_threshold: float
+    _window: float
+
+    def __init__(
+        self: "ApplyMultilevel",
+        components: typing.Sequence[typing.Callable],
+        coarse_components: typing.Sequence[typing.Callable],
+        coarsening: Coarsening,
+        params: typing.Optional[Params] = None,
+        strain_threshold: float = 0.2,
+        contact_height: typing.Optional[float] = None,
+        impact_speed: float = 1.0,
+        window: float = 0.1,
+        prolong_interval: int = 1,
+    ) -> None:
+        """Initialize functor.
+
+        Parameters
+        ----------
+        components : list[Callable]
+            Update components for fine State, i.e., a default update regimen
+            for the fine structure.
+        coarse_components : list[Callable]
+            Update components for coarse State, i.e., a default update
+            regimen for `coarsening.structure`, sharing timestep size with
+            `components`.
+        coarsening : Coarsening
+            Maps between fine and coarse lattices.
+        params : Params, optional
+            Provides cell spacing `l`, for default `contact_height` and to
+            hold coarse cells above the floor. If not provided, a default
+            `Params` instance will be used.
+        strain_threshold : float, default 0.2
+            Relative extension or compression of coarse springs past which
+            refinement is demanded. Tall bodies resting under gravity sag by
+            about 0.1 near the floor, so lower thresholds keep them refined.
+        contact_height : float, optional
+            Height above floor at y = 0 within which arriving coarse cells
+            demand refinement.
+
+            If not provided, half a coarse cell spacing,
+            `coarsening.factor * params.l / 2`, is used.
+        impact_speed : float, default 1.0
+            Downward speed past which coarse cells arriving near the floor
+            demand refinement.
+        window : float, default 0.1
+            Duration of simulation time without demand before returning to
+            the coarse level.
+        prolong_interval : int, default 1
+            Number of coarse steps between prolongations onto the fine
+            State, which always precede refinement. Elapsed time is updated
+            every step.
+
+            Prolongation takes a few passes over the fine lattice, so larger
+            intervals speed up the coarse level when downstream components
+            only read elapsed time (i.e., `HaltAfterElapsedTime`).
+
+        Raises
+        ------
+        ValueError
+            If `strain_threshold`, `impact_speed`, or `window` is negative,
+            or if `prolong_interval` is not positive.
+        """
+        for name, value in (
+            ("strain_threshold", strain_threshold),
+            ("impact_speed", impact_speed),
+            ("window", window),
+        ):
+            if not value >= 0.0:
+                raise ValueError(f"{name}={value} must be non-negative")
+        if prolong_interval < 1:
+            raise ValueError(f"{prolong_interval=} must be positive")
+
+        if params is None:
+            params = Params()
+        if contact_height is None:
+            contact_height = coarsening.factor * params.l / 2
+
+        self._components = components
+        self._coarse_components = coarse_components
+        self._coarsening = coarsening
+        self._strain_threshold = float(strain_threshold)
+        self._contact_height = float(contact_height)
+        self._impact_speed = float(impact_speed)
+        self._window = float(window)
+        self._floor_offset = (coarsening.factor - 1) / 2 * params.l
+        self._prolong_interval = prolong_interval
+        self._steps_since_prolong = 0
+
+        self._coarse_state = None
+        self._fine_state = None
+        self._demanded_at = -np.inf
+        self._is_refined = False
+        self._near_floor = None
+
+    @property
+    def is_refined(self: "ApplyMultilevel") -> bool:
+        """Is the fine level currently being simulated?"""
+        return self._is_refined
+
+    def _restrict(
+        self: "ApplyMultilevel",
+        state: State,
+        out: typing.Optional[State] = None,
+    ) -> State:
+        """Map fine `state` onto coarse lattice, lowered by floor offset."""
+        res = self._coarsening.restrict(state, out=out)
+        res.py -= self._floor_offset
+        return res
+
+    def _prolong(self: "ApplyMultilevel", state: State) -> None:
+        """Map coarse State onto fine `state`, raised by floor offset."""
+        self._coarsening.prolong(self._coarse_state, out=state)
+        state.py += self._floor_offset
+        self._steps_since_prolong = 0
+
+    def _is_demanded(self: "ApplyMultilevel", coarse_state: State) -> bool:
+        """Does coarse State demand refinement, due to strain or impact?
+
+        Tracks which coarse cells are near the floor, to detect impacts.
+        """
+        near_floor = coarse_state.py < self._contact_height
+        arriving = near_floor.copy()
+        if self._near_floor is not None:
+            arriving &= ~self._near_floor
+        self._near_floor = near_floor
+        if np.any(coarse_state.vy[arriving] < -self._impact_speed):
+            return True
+
+        structure = self._coarsening.structure
+        px, py = coarse_state.px, coarse_state.py
+        for head, tail, rest_lengths in (
+            (np.s_[:-1, :], np.s_[1:, :], structure.lc),
+            (np.s_[:, :-1], np.s_[:, 1:], structure.lr),
+        ):
+            lengths = np.hypot(px[tail] - px[head], py[tail] - py[head])
+            if np.any(
+                np.abs(lengths - rest_lengths)
+                > self._strain_threshold * rest_lengths
+            ):
+                return True
+
+        return False
+
+    def __call__(
+        self: "ApplyMultilevel",
+        state: State,
+        event_buffer: typing.Optional[EventBuffer] = None,
+    ) -> typing.Optional[typing.Any]:
+        """Advance fine State one step, at the current level.
+
+        Returns the first non-None component return value, if any.
+        """
+        if state is not self._fine_state or self._coarse_state.t > state.t:
+            self._fine_state = state
+            self._coarse_state = self._restrict(state)
+            self._near_floor = None
+            self._is_refined = self._is_demanded(self._coarse_state)
+            self._demanded_at = state.t if self._is_refined else -np.inf
+
+        res = None
+        if self._is_refined:
+            for component in self._components:
+                res = component(state, event_buffer)
+                if res is not None:
+                    break
+            coarse_state = self._restrict(state, out=self._coarse_state)
+            if self._is_demanded(coarse_state):
+                self._demanded_at = state.t
+            elif state.t - self._demanded_at >= self._window:
+                self._is_refined = False
+        else:
+            coarse_state = self._coarse_state
+            for component in self._coarse_components:
+                res = component(coarse_state, event_buffer)
+                if res is not None:
+                    break
+            self._steps_since_prolong += 1
+            if self._is_demanded(coarse_state):
+                self._is_refined = True
+                self._demanded_at = coarse_state.t
+            if (
+                self._is_refined
+                or self._steps_since_prolong >= self._prolong_interval
+            ):
+                self._prolong(state)
+            else:
+                state.t = coarse_state.t
+
+        return res
@@ -0,0 +1,244 @@
+import typing
+
+import numpy as np
+
+from ...State import State
+from ...Structure import Structure
+from ...Params import Params
+
+
+# stencil of neighboring hash grid bins, including own bin
+_neighbor_offsets = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+
+# large primes for spatial hashing, as in Teschner et al. (2003)
+_hash_primes = (73856093, 19349663, 83492791)
+
+
+def _find_close_pairs(
+    px: np.ndarray,
+    py: np.ndarray,
+    groups: np.ndarray,
+    radius: float,
+    same_group: bool = True,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Find all pairs of cells within `radius` through a spatial hash.
+
+    Parameters
+    ----------
+    px, py : np.ndarray
+        Flattened cell positions.
+    groups : np.ndarray
+        Flattened group number of each cell (i.e., individual or body).
+    radius : float
+        Contact distance, also used as hash grid bin side.
+    same_group : bool, default True
+        Should only pairs within the same group be found? If False, only
+        pairs between different groups are found.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        Cell numbers of pair members, with first less than second.
+    """
+    num_cells = len(px)
+    with np.errstate(invalid="ignore"):
+        bin_x = np.floor(px / radius).astype(np.int64)
+        bin_y = np.floor(py / radius).astype(np.int64)
+
+    # hash table sized to next power of two at least twice cell count
+    table_size = 1 << int(2 * num_cells - 1).bit_length()
+
+    def get_table_entries(bin_x: np.ndarray, bin_y: np.ndarray) -> np.ndarray:
+        p1, p2, p3 = _hash_primes
+        res = bin_x * p1
+        res ^= bin_y * p2
+        if same_group:  # keep groups apart, even within the same bin
+            res ^= groups * p3
+        res &= table_size - 1
+        return res
+
+    # sort cells by hash table entry, delimited by counts
+    entries = get_table_entries(bin_x, bin_y)
+    order = np.argsort(entries, kind="stable")
+    counts = np.bincount(entries, minlength=table_size)
+    starts = np.cumsum(counts) - counts
+
+    cells = np.arange(num_cells)
+    firsts, seconds = [], []
+    for dx, dy in _neighbor_offsets:
+        neighbor_x, neighbor_y = bin_x + dx, bin_y + dy
+        neighbor_entries = get_table_entries(neighbor_x, neighbor_y)
+        num_candidates = counts[neighbor_entries]
+
+        # expand each cell against all cells in neighbor's table entry
+        total = num_candidates.sum()
+        first = np.repeat(cells, num_candidates)
+        within_entry = np.arange(total) - np.repeat(
+            np.cumsum(num_candidates) - num_candidates, num_candidates
+        )
+        second = order[
+            np.repeat(starts[neighbor_entries], num_candidates) + within_entry
+        ]
+
+        # discard hash collisions and count each pair once
+        keep = first < second
+        keep &= bin_x[second] == neighbor_x[first]
+        keep &= bin_y[second] == neighbor_y[first]
+        if same_group:
+            keep &= groups[second] == groups[first]
+        else:
+            keep &= groups[second] != groups[first]
+        firsts.append(first[keep])
+        seconds.append(second[keep])
+
+    first, second = np.concatenate(firsts), np.concatenate(seconds)
+    dists = np.hypot(px[second] - px[first], py[second] - py[first])
+    close = dists < radius
+    return first[close], second[close]
+
+
+class ApplySelfCollision:
+    """Repel cells of the same body that come closer than a contact radius.
+
+    Keeps cells from passing through each other when the lattice folds
+    (i.e., under strong torsion or spin). Each overlapping pair of cells is
+    pushed apart by a penalty spring of stiffness `k`, acting along the line
+    between cells in proportion to overlap.
+
+    Close pairs are found through a uniform-grid spatial hash rebuilt each
+    call: cells are binned into square grid bins of side `radius`, bins are
+    hashed into a table sized to cell count, and cells are sorted by table
+    entry with bin counts from `np.bincount`. Candidate pairs then come
+    from each cell's 3x3 neighborhood of bins, so work scales with cell
+    count and local crowding rather than all pairs of cells.
+
+    Operates on `State` or `BatchState`. Cells of different individuals in
+    a batch never collide.
+
+    Notes
+    -----
+    All pairs of cells within contact radius interact, including cells
+    joined by springs (which are only that close under heavy compression).
+    Exactly coincident cells have no defined contact direction, and are not
+    separated.
+    """
+
+    _k: float
+    _params: Params
+    _radius: float
+    _structure: Structure
+
+    def __init__(
+        self: "ApplySelfCollision",
+        radius: typing.Optional[float] = None,
+        k: typing.Optional[float] = None,
+        params: typing.Optional[Params] = None,
+        structure: typing.Optional[Structure] = None,
+    ) -> None:
+        """Initialize functor.
+
+        Parameters
+        ----------
+        radius : float, optional
+            Contact distance, below which cells repel.
+
+            If not provided, defaults to half of spring natural length
+            `params.l`, so that cells of a relaxed lattice are never in
+            contact.
+        k : float, optional
+            Stiffness of contact repulsion.
+
+            If not provided, defaults to spring stiffness `params.k`.
+        params : Params, optional
+            Configuration parameters. If not provided, a default `Params`
+            instance will be used.
+        structure : Structure, BatchStructure, or GraphStructure, optional
+            Provides cell masses. If not provided, a default `Structure`
+            instance will be used.
+
+        Raises
+        ------
+        ValueError
+            If `radius` is not positive or if `k` is negative.
+        """
+        if params is None:
+            params = Params()
+        self._params = params
+        if structure is None:
+            structure = Structure(params=params)
+        self._structure = structure
+
+        if radius is None:
+            radius = params.l / 2
+        if not radius > 0:
+            raise ValueError(f"{radius=} must be positive")
+        self._radius = float(radius)
+
+        if k is None:
+            k = params.k
+        if not k >= 0:
+            raise ValueError(f"{k=} must be non-negative")
+        self._k = float(k)
+
+    def _find_pairs(
+        self: "ApplySelfCollision",
+        px: np.ndarray,
+        py: np.ndarray,
+        individuals: np.ndarray,
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Find all pairs of cells of the same individual within contact
+        radius.
+
+        Parameters
+        ----------
+        px, py : np.ndarray
+            Flattened cell positions.
+        individuals : np.ndarray
+            Flattened individual number of each cell.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            Cell numbers of pair members, with first less than second.
+        """
+        return _find_close_pairs(px, py, individuals, self._radius)
+
+    def __call__(
+        self: "ApplySelfCollision",
+        state: State,
+        event_buffer: typing.Optional = None,
+    ) -> None:
+        """Apply contact repulsion between all cells within contact radius to
+        State velocity."""
+        px = state.px.ravel()
+        py = state.py.ravel()
+        num_cells = px.size
+        cells_per_individual = state.px.shape[-2] * state.px.shape[-1]
+        individuals = np.arange(num_cells) // max(cells_per_individual, 1)
+
+        first, second = self._find_pairs(px, py, individuals)
+        if not len(first):
+            return
+
+        # penalty force along unit vector from second to first cell
+        dists_horiz = px[first] - px[second]
+        dists_vert = py[first] - py[second]
+        dists = np.hypot(dists_horiz, dists_vert)
+        f = np.divide(
+            self._k * (self._radius - dists),
+            dists,
+            out=np.zeros_like(dists),
+            where=dists > 0,
+        )
+
+        # apply equal and opposite impulses
+        dt_per_m = (
+            self._params.dt
+            / np.broadcast_to(self._structure.m, state.px.shape).ravel()
+        )
+        for v, d in (state.vx, dists_horiz), (state.vy, dists_vert):
+            impulses = f * d
+            dv = np.bincount(first, weights=impulses, minlength=num_cells)
+            dv -= np.bincount(second, weights=impulses, minlength=num_cells)
+            dv *= dt_per_m
+            v += dv.reshape(v.shape)
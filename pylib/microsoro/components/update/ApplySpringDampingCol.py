@@ -5,6 +5,7 @@ import numpy as np
 from ...State import State
 from ...Structure import Structure
 from ...Params import Params
+from ...Workspace import Workspace
 
 
 class ApplySpringDampingCol:
@@ -12,19 +13,28 @@ class ApplySpringDampingCol:
 
     _params: Params
     _structure: Structure
+    _workspace: Workspace
 
     def __init__(
         self: "ApplySpringDampingCol",
         params: typing.Optional[Params] = None,
         structure: typing.Optional[Structure] = None,
+        workspace: typing.Optional[Workspace] = None,
     ) -> None:
-        """Initialize functor."""
+        """Initialize functor.
+
+        If `workspace` is provided, temporaries are held in its scratch
+        buffers. Otherwise, a private workspace is used.
+        """
         if params is None:
             params = Params()
         self._params = params
         if structure is None:
             structure = Structure(params=params)
         self._structure = structure
+        if workspace is None:
+            workspace = Workspace()
+        self._workspace = workspace
 
     def __call__(
         self: "ApplySpringDampingCol",
@@ -33,52 +43,44 @@ class ApplySpringDampingCol:
     ) -> None:
         """Calculate spring damping forces between vertical pairs of cells and
         apply to State velocity."""
-        # how far apart are vertical pairs of cells?
-        col_relvels_horiz = np.diff(state.vx, axis=0)
-        col_relvels_vert = np.diff(state.vy, axis=0)
-        col_relvels = np.sqrt(col_relvels_horiz**2 + col_relvels_vert**2)
-
-        # decomposed unit vector
-        # make 0/0 -> 0, see https://stackoverflow.com/a/37977222/17332200
-        divide_mask = col_relvels != 0
-        normed_col_relvels_horiz = np.divide(
-            col_relvels_horiz,
-            col_relvels,
-            out=np.zeros_like(col_relvels_horiz),
-            where=divide_mask,
-        )
-        normed_col_relvels_vert = np.divide(
-            col_relvels_vert,
-            col_relvels,
-            out=np.zeros_like(col_relvels_vert),
-            where=divide_mask,
-        )
+        constants = self._structure.get_constants(self._params)
+        workspace = self._workspace
+        shape = state.px[..., 1:, :].shape
+        dtype = state.px.dtype
 
-        # net forces: negative is repulsion, positive is attraction
         # damping constant, clipped to prevent any overshoot
-        b = np.minimum(self._structure.bc, 1 / self._params.dt)
-        f = b * col_relvels
+        b = constants.bc_clipped
 
-        # decompose force into horizontal and vertical components
-        fx = f * normed_col_relvels_horiz
-        fy = f * normed_col_relvels_vert
-
-        # is clipping necessary?
-        # fx = np.clip(fx, -1e12, 1e12)
-        # fy = np.clip(fy, -1e12, 1e12)
+        # relative velocities of paired cells
+        # damping force is proportional to relative velocity, so no need to
+        # decompose into unit vector and magnitude
+        fx = np.subtract(
+            state.vx[..., 1:, :],
+            state.vx[..., :-1, :],
+            out=workspace.get("fx", shape, dtype),
+        )
+        fx *= b
+        fy = np.subtract(
+            state.vy[..., 1:, :],
+            state.vy[..., :-1, :],
+            out=workspace.get("fy", shape, dtype),
+        )
+        fy *= b
 
         # horizontal components of acceleration
-        ax = np.zeros_like(state.vx)
-        ax[:-1, :] += fx[:, :]  # up-facing forces
-        ax[1:, :] -= fx[:, :]  # down-facing forces
-        ax /= self._structure.m
-        # apply acceleration to state
-        state.vx += ax * self._params.dt
+        ax = workspace.get("ax", state.vx.shape, dtype)
+        ax.fill(0.0)
+        ax[..., :-1, :] += fx  # up-facing forces
+        ax[..., 1:, :] -= fx  # down-facing forces
+        ax *= constants.dt_per_m
+        # apply change in velocity to state
+        state.vx += ax
 
         # vertical components of acceleration
-        ay = np.zeros_like(state.vy)
-        ay[:-1, :] += fy[:, :]  # up-facing forces
-        ay[1:, :] -= fy[:, :]  # down-facing forces
-        ay /= self._structure.m
-        # apply acceleration to state
-        state.vy += ay * self._params.dt
+        ay = workspace.get("ay", state.vy.shape, dtype)
+        ay.fill(0.0)
+        ay[..., :-1, :] += fy  # up-facing forces
+        ay[..., 1:, :] -= fy  # down-facing forces
+        ay *= constants.dt_per_m
+        # apply change in velocity to state
+        state.vy += ay
@@ -0,0 +1,168 @@
+import typing
+
+import numpy as np
+
+from ...GraphStructure import GraphStructure
+from ...State import State
+from ...Structure import Structure
+from ...Params import Params
+
+
+class ApplySpringGraph:
+    """Simulate action of all springs and spring damping in a
+    `GraphStructure`.
+
+    Graph counterpart of `ApplySpringNetwork`. Per-spring forces are computed
+    over the edge list, then summed onto cells by `np.bincount` segment
+    reductions keyed by precomputed head and tail cells. Only springs are
+    visited, so body plans with holes or missing cells cost in proportion to
+    their springs rather than the full grid.
+
+    Per spring, this is roughly 2x slower than the fused dense lattice
+    arithmetic of `ApplySpringNetwork`, so it pays off for sparse body plans
+    (i.e., fewer than about half of lattice springs present).
+
+    Operates on `State` or `BatchState`, with all individuals sharing the
+    same structure.
+
+    Notes
+    -----
+    As in `ApplySpringNetwork`, spring impulses are applied first, and
+    damping then acts on spring-updated velocities. Spring impulses match
+    `ApplySpringNetwork` exactly for lattice-equivalent graphs. Damping of
+    all springs is computed together, rather than columns then rows, so to
+    prevent overshoot at cells with several heavily damped springs, each
+    cell's total damping rate `dt * sum(b) / m` is limited to 1/2. This
+    keeps every velocity mode decaying monotonically, without oscillation
+    that can destabilize spring integration. So, damped trajectories match
+    `ApplySpringNetwork` closely but not exactly, and differ most for light
+    cells with stiff damping.
+    """
+
+    _segment_ids: typing.Dict[int, typing.Tuple[np.ndarray, np.ndarray]]
+    _segment_sources: typing.Tuple[np.ndarray, ...]
+    _params: Params
+    _structure: GraphStructure
+
+    def __init__(
+        self: "ApplySpringGraph",
+        params: typing.Optional[Params] = None,
+        structure: typing.Optional[GraphStructure] = None,
+    ) -> None:
+        """Initialize functor.
+
+        Parameters
+        ----------
+        params : Params, optional
+            Configuration parameters. If not provided, a default `Params`
+            instance will be used.
+        structure : GraphStructure, optional
+            Cell and inter-cell configuration. If not provided, a graph
+            equivalent to a default `Structure` instance will be used.
+        """
+        if params is None:
+            params = Params()
+        self._params = params
+        if structure is None:
+            structure = GraphStructure.from_structure(Structure(params=params))
+        self._structure = structure
+        self._segment_ids = dict()
+        self._segment_sources = (None, None)
+
+    def _get_segment_ids(
+        self: "ApplySpringGraph",
+        num_rows: int,
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Get destination cells of spring heads and of spring tails, tiled
+        and offset for `num_rows` stacked rows of cells.
+
+        Cached by `num_rows` until structure edge arrays are reassigned.
+        """
+        structure = self._structure
+        sources = (structure.i, structure.j)
+        if not all(a is b for a, b in zip(sources, self._segment_sources)):
+            self._segment_ids.clear()
+            self._segment_sources = sources
+
+        try:
+            return self._segment_ids[num_rows]
+        except KeyError:
+            pass
+
+        offsets = np.arange(num_rows)[:, None] * structure.m.size
+        res = tuple((offsets + ends[None, :]).ravel() for ends in sources)
+        self._segment_ids[num_rows] = res
+        return res
+
+    def _reduce(
+        self: "ApplySpringGraph",
+        edge_values: np.ndarray,
+        tail_sign: int = -1,
+    ) -> np.ndarray:
+        """Sum per-spring values onto cells, positively at spring heads and
+        with sign `tail_sign` at spring tails.
+
+        Leading axes of `edge_values` are kept, and the last axis is reduced
+        from springs to cells.
+        """
+        leading_shape = edge_values.shape[:-1]
+        num_rows = int(np.prod(leading_shape))
+        num_cells = self._structure.m.size
+        head_ids, tail_ids = self._get_segment_ids(num_rows)
+        weights = edge_values.ravel()
+
+        minlength = num_rows * num_cells
+        res = np.bincount(head_ids, weights=weights, minlength=minlength)
+        tail_sums = np.bincount(tail_ids, weights=weights, minlength=minlength)
+        if tail_sign < 0:
+            res -= tail_sums
+        else:
+            res += tail_sums
+        return res.reshape(*leading_shape, num_cells)
+
+    def __call__(
+        self: "ApplySpringGraph",
+        state: State,
+        event_buffer: typing.Optional = None,
+    ) -> None:
+        """Calculate spring and spring damping forces along all springs and
+        apply to State velocity."""
+        structure = self._structure
+        dt = self._params.dt
+        i, j = structure.i, structure.j
+
+        # flatten cells, keeping any leading population axis
+        flat_shape = (*state.px.shape[:-2], -1)
+        px = state.px.reshape(flat_shape)
+        py = state.py.reshape(flat_shape)
+        dt_per_m = dt / structure.m.ravel()
+
+        # spring impulses along unit vectors toward tail cells
+        dists_horiz = px[..., j] - px[..., i]
+        dists_vert = py[..., j] - py[..., i]
+        dists = np.hypot(dists_horiz, dists_vert)
+        f = dists - structure.l
+        if state.energy is not None:  # extension, before scaling
+            state.energy.record_springs(
+                "graph", f, structure.k, num_spring_axes=1
+            )
+        f *= structure.k
+        f /= dists
+        vx = state.vx.reshape(flat_shape) + (
+            self._reduce(f * dists_horiz) * dt_per_m
+        )
+        vy = state.vy.reshape(flat_shape) + (
+            self._reduce(f * dists_vert) * dt_per_m
+        )
+
+        # damping, against spring-updated velocities, with each cell's total
+        # damping rate limited to 1/2 to prevent any overshoot
+        b = np.minimum(structure.b, 1 / dt)
+        rates = self._reduce(b, tail_sign=1) * dt_per_m
+        damping_scale = dt_per_m / np.maximum(2 * rates, 1.0)
+        vx += self._reduce(b * (vx[..., j] - vx[..., i])) * damping_scale
+        vy += self._reduce(b * (vy[..., j] - vy[..., i])) * damping_scale
+
+        # apply net change in velocity to state
+        state.vx[...] = vx.reshape(state.vx.shape)
+        state.vy[...] = vy.reshape(state.vy.shape)
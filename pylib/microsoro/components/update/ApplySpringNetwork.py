@@ -0,0 +1,184 @@
+import typing
+
+import numpy as np
+
+from ...State import State
+from ...Structure import Structure
+from ...Params import Params
+from ...Workspace import Workspace
+
+
+# (head, tail) cell slices for each spring family; springs run head -> tail
+_col_slices = (np.s_[..., :-1, :], np.s_[..., 1:, :])
+_row_slices = (np.s_[..., :, :-1], np.s_[..., :, 1:])
+_asc_slices = (np.s_[..., :-1, :-1], np.s_[..., 1:, 1:])
+_desc_slices = (np.s_[..., :-1, 1:], np.s_[..., 1:, :-1])
+
+
+class ApplySpringNetwork:
+    """Simulate action of all springs and spring damping in a single pass.
+
+    Fused equivalent of applying `ApplySpringsCol`, `ApplySpringsRow`,
+    `ApplySpringsDiagAsc`, `ApplySpringsDiagDesc`, `ApplySpringDampingCol`,
+    and `ApplySpringDampingRow` in sequence.
+    """
+
+    _params: Params
+    _structure: Structure
+    _workspace: Workspace
+
+    def __init__(
+        self: "ApplySpringNetwork",
+        params: typing.Optional[Params] = None,
+        structure: typing.Optional[Structure] = None,
+        workspace: typing.Optional[Workspace] = None,
+    ) -> None:
+        """Initialize functor.
+
+        If `workspace` is provided, temporaries are held in its scratch
+        buffers. Otherwise, a private workspace is used.
+        """
+        if params is None:
+            params = Params()
+        self._params = params
+        if structure is None:
+            structure = Structure(params=params)
+        self._structure = structure
+        if workspace is None:
+            workspace = Workspace()
+        self._workspace = workspace
+
+    def __call__(
+        self: "ApplySpringNetwork",
+        state: State,
+        event_buffer: typing.Optional = None,
+    ) -> None:
+        """Calculate spring and spring damping forces between all connected
+        pairs of cells and apply to State velocity."""
+        structure = self._structure
+        constants = structure.get_constants(self._params)
+        workspace = self._workspace
+        dtype = state.vx.dtype
+
+        # net spring impulses (force times dt) on each cell, accumulated across
+        # all spring families
+        fx_net = workspace.get("fx_net", state.vx.shape, dtype)
+        fy_net = workspace.get("fy_net", state.vy.shape, dtype)
+        fx_net.fill(0.0)
+        fy_net.fill(0.0)
+
+        for family, (head, tail), k, k_dt, l_naught in (
+            (
+                "col",
+                _col_slices,
+                structure.kc,
+                constants.kc_dt,
+                structure.lc,
+            ),
+            (
+                "row",
+                _row_slices,
+                structure.kr,
+                constants.kr_dt,
+                structure.lr,
+            ),
+            (
+                "asc",
+                _asc_slices,
+                structure.ka,
+                constants.ka_dt,
+                structure.la,
+            ),
+            (
+                "desc",
+                _desc_slices,
+                structure.kd,
+                constants.kd_dt,
+                structure.ld,
+            ),
+        ):
+            shape = state.px[head].shape
+
+            # how far apart are paired cells?
+            dists_horiz = np.subtract(
+                state.px[tail],
+                state.px[head],
+                out=workspace.get("dists_horiz", shape, dtype),
+            )
+            dists_vert = np.subtract(
+                state.py[tail],
+                state.py[head],
+                out=workspace.get("dists_vert", shape, dtype),
+            )
+            dists = np.hypot(
+                dists_horiz,
+                dists_vert,
+                out=workspace.get("dists", shape, dtype),
+            )
+
+            # net forces: negative is repulsion, positive is attraction
+            # scaled by inverse distance to decompose along unit vector
+            f = np.subtract(
+                dists, l_naught, out=workspace.get("f", shape, dtype)
+            )
+            if state.energy is not None:  # extension, before scaling
+                state.energy.record_springs(family, f, k)
+            f *= k_dt
+            f /= dists
+
+            fx = np.multiply(f, dists_horiz, out=dists_horiz)
+            fx_net[head] += fx
+            fx_net[tail] -= fx
+
+            fy = np.multiply(f, dists_vert, out=dists_vert)
+            fy_net[head] += fy
+            fy_net[tail] -= fy
+
+        # apply spring impulses, holding velocity in local buffers so that
+        # State velocity is only written once
+        inv_m = constants.inv_m
+        dt_per_m = constants.dt_per_m
+        vx = np.multiply(
+            fx_net, inv_m, out=workspace.get("vx", state.vx.shape, dtype)
+        )
+        vx += state.vx
+        vy = np.multiply(
+            fy_net, inv_m, out=workspace.get("vy", state.vy.shape, dtype)
+        )
+        vy += state.vy
+
+        # damping is applied against spring-updated velocities, column then
+        # row, to match sequential application of damping components
+        # (damping constants are clipped to prevent any overshoot)
+        for (head, tail), b in (
+            (_col_slices, constants.bc_clipped),
+            (_row_slices, constants.br_clipped),
+        ):
+            shape = vx[head].shape
+
+            # damping force is proportional to relative velocity, so no need
+            # to decompose into unit vector and magnitude
+            fx_net.fill(0.0)
+            fx = np.subtract(
+                vx[tail], vx[head], out=workspace.get("fx", shape, dtype)
+            )
+            fx *= b
+            fx_net[head] += fx
+            fx_net[tail] -= fx
+
+            fy_net.fill(0.0)
+            fy = np.subtract(
+                vy[tail], vy[head], out=workspace.get("fy", shape, dtype)
+            )
+            fy *= b
+            fy_net[head] += fy
+            fy_net[tail] -= fy
+
+            fx_net *= dt_per_m
+            vx += fx_net
+            fy_net *= dt_per_m
+            vy += fy_net
+
+        # apply net change in velocity to state
+        state.vx[...] = vx
+        state.vy[...] = vy
@@ -0,0 +1,366 @@
+import copy
+import multiprocessing
+from multiprocessing import shared_memory
+import os
+import threading
+import typing
+import weakref
+
+import numpy as np
+
+from ...Params import Params
+from ...State import State
+from ...Structure import Structure
+from ...Workspace import Workspace
+from .ApplySpringNetwork import ApplySpringNetwork
+from .ApplySpringNetworkTiled import _get_bands
+
+
+# control block layout, shared with worker processes
+_dt_index = 0  # timestep size for current step
+_stop_index = 1  # nonzero signals workers to exit
+
+
+def _run_worker(
+    state_name: str,
+    control_name: str,
+    shape: typing.Tuple[int, int],
+    dtype: np.dtype,
+    band: typing.Tuple[int, int, int, int],
+    structure: Structure,
+    params: Params,
+    apply_velocity: bool,
+    barrier: threading.Barrier,
+) -> None:
+    """Step rows of `band` whenever the main process passes `barrier`, until
+    signaled to stop.
+
+    Each step synchronizes at three barriers: before computing, between
+    computing from shared state and writing owned rows back, and after.
+    """
+    state_memory = shared_memory.SharedMemory(name=state_name)
+    control_memory = shared_memory.SharedMemory(name=control_name)
+    try:
+        _step_worker(
+            state_memory.buf,
+            control_memory.buf,
+            shape,
+            dtype,
+            band,
+            structure,
+            params,
+            apply_velocity,
+            barrier,
+        )
+    except BaseException:
+        barrier.abort()  # fail main process, rather than deadlock it
+        raise
+    state_memory.close()
+    control_memory.close()
+
+
+def _step_worker(
+    state_buffer: memoryview,
+    control_buffer: memoryview,
+    shape: typing.Tuple[int, int],
+    dtype: np.dtype,
+    band: typing.Tuple[int, int, int, int],
+    structure: Structure,
+    params: Params,
+    apply_velocity: bool,
+    barrier: threading.Barrier,
+) -> None:
+    """Implementation of `_run_worker`, holding array views of shared
+    buffers only while running."""
+    px, py, vx, vy = np.ndarray((4, *shape), dtype=dtype, buffer=state_buffer)
+    control = np.ndarray((2,), dtype=np.float64, buffer=control_buffer)
+
+    start, stop, halo_start, halo_stop = band
+    halo = np.s_[halo_start:halo_stop]
+    owned = np.s_[start - halo_start : stop - halo_start]
+
+    workspace = Workspace()
+    network = ApplySpringNetwork(params, structure, workspace)
+    band_state = State(halo_stop - halo_start, shape[1], dtype=dtype)
+    band_state.px = px[halo]
+    band_state.py = py[halo]
+    while True:
+        barrier.wait()
+        if control[_stop_index]:
+            return
+        params.dt = float(control[_dt_index])
+
+        band_state.vx[...] = vx[halo]
+        band_state.vy[...] = vy[halo]
+        network(band_state)
+        barrier.wait()
+
+        vx[start:stop] = band_state.vx[owned]
+        vy[start:stop] = band_state.vy[owned]
+        if apply_velocity:  # as ApplyVelocity, over owned rows
+            dp = workspace.get("dp", vx[start:stop].shape, dtype)
+            px[start:stop] += np.multiply(vx[start:stop], params.dt, out=dp)
+            py[start:stop] += np.multiply(vy[start:stop], params.dt, out=dp)
+        barrier.wait()
+
+
+def _shut_down(
+    processes: typing.List[multiprocessing.process.BaseProcess],
+    barrier: threading.Barrier,
+    control: np.ndarray,
+    memories: typing.List[shared_memory.SharedMemory],
+    timeout: typing.Optional[float],
+) -> None:
+    """Signal worker processes to stop, wait for them to exit, and unlink
+    shared memory.
+
+    Mappings are released once arrays viewing them are released.
+    """
+    # workers may already be gone, i.e., terminated after failure, in which
+    # case the barrier would never be passed
+    if not barrier.broken and all(process.is_alive() for process in processes):
+        control[_stop_index] = 1.0
+        try:
+            barrier.wait(timeout)
+        except threading.BrokenBarrierError:
+            pass
+    for process in processes:
+        process.join(timeout)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+    for memory in memories:
+        memory.unlink()
+
+
+class ApplySpringNetworkMultiprocess:
+    """Simulate action of all springs and spring damping, decomposing the
+    grid into row blocks each stepped by its own worker process.
+
+    Equivalent to `ApplySpringNetwork`, optionally followed by
+    `ApplyVelocity`. On first call, State arrays are moved into
+    `multiprocessing.shared_memory`, and worker processes are started. Each
+    worker owns a block of rows, reading two halo rows on either side (see
+    `ApplySpringNetworkTiled`). Workers and the calling process synchronize
+    at barriers every step, so halo rows are always current and State may be
+    read and modified between calls as usual, i.e., by halting components
+    within `perform_simulation`.
+
+    Intended for bodies too large for one process to step at acceptable
+    speed (i.e., 4096x4096 and up), where per-step synchronization overhead
+    (tens of microseconds) is negligible.
+
+    Notes
+    -----
+    Operates on `State` only, which must match `structure` in shape. Structure
+    arrays and timestep limits are sent to workers at startup, so changes
+    afterward are not seen, but `params.dt` is read every call. Elastic energy
+    is left unrecorded for `State.energy`.
+
+    Call `close` to stop workers and release shared memory, after which State
+    arrays are restored to private memory. Workers are also stopped when the
+    component is garbage collected or at interpreter exit.
+    """
+
+    _apply_velocity: bool
+    _arrays: typing.Optional[typing.Tuple[np.ndarray, ...]]
+    _barrier: typing.Optional[threading.Barrier]
+    _control: typing.Optional[np.ndarray]
+    _finalizer: typing.Optional[weakref.finalize]
+    _num_processes: int
+    _params: Params
+    _state: typing.Optional[State]
+    _structure: Structure
+    _timeout: typing.Optional[float]
+
+    def __init__(
+        self: "ApplySpringNetworkMultiprocess",
+        params: typing.Optional[Params] = None,
+        structure: typing.Optional[Structure] = None,
+        num_processes: typing.Optional[int] = None,
+        apply_velocity: bool = False,
+        timeout: typing.Optional[float] = None,
+    ) -> None:
+        """Initialize functor.
+
+        Worker processes are not started until first call.
+
+        Parameters
+        ----------
+        params : Params, optional
+            Configuration parameters. If not provided, a default `Params`
+            instance will be used.
+        structure : Structure, optional
+            Cell and inter-cell configuration. If not provided, a default
+            `Structure` instance will be used.
+        num_processes : int, optional
+            Number of worker processes, each owning a block of rows, at most
+            one per row.
+
+            If not provided, one process per available CPU will be used.
+        apply_velocity : bool, default False
+            Should positions also be advanced under updated velocities, as
+            by `ApplyVelocity`, within workers?
+        timeout : float, optional
+            Seconds to wait on workers at each barrier before failing.
+
+            If not provided, waits indefinitely. Workers that raise fail the
+            calling process regardless.
+
+        Raises
+        ------
+        ValueError
+            If `num_processes` is not positive.
+        """
+        if num_processes is None:
+            num_processes = os.cpu_count() or 1
+        if not num_processes > 0:
+            raise ValueError(f"{num_processes=} must be positive")
+
+        if params is None:
+            params = Params()
+        self._params = params
+        if structure is None:
+            structure = Structure(params=params)
+        self._structure = structure
+        self._num_processes = num_processes
+        self._apply_velocity = apply_velocity
+        self._timeout = timeout
+
+        self._arrays = None
+        self._barrier = None
+        self._control = None
+        self._finalizer = None
+        self._state = None
+
+    def _start(
+        self: "ApplySpringNetworkMultiprocess", dtype: np.dtype
+    ) -> None:
+        """Allocate shared memory and start worker processes."""
+        shape = (self._structure.height, self._structure.width)
+        state_memory = shared_memory.SharedMemory(
+            create=True, size=4 * int(np.prod(shape)) * dtype.itemsize
+        )
+        control_memory = shared_memory.SharedMemory(
+            create=True, size=2 * np.dtype(np.float64).itemsize
+        )
+
+        # NumPy arrays don't pin shared memory buffers, so defer unmapping
+        # until arrays (and any views, i.e., held by callers) are released
+        # (at interpreter exit, mappings are left for the OS to release)
+        arrays = np.ndarray((4, *shape), dtype=dtype, buffer=state_memory.buf)
+        self._control = np.ndarray(
+            (2,), dtype=np.float64, buffer=control_memory.buf
+        )
+        for array, memory in (
+            (arrays, state_memory),
+            (self._control, control_memory),
+        ):
+            weakref.finalize(array, memory.close).atexit = False
+        self._arrays = tuple(arrays)
+        self._control[...] = 0.0
+
+        bands = _get_bands(shape[0], self._num_processes)
+        self._barrier = multiprocessing.Barrier(len(bands) + 1)
+        processes = [
+            multiprocessing.Process(
+                target=_run_worker,
+                args=(
+                    state_memory.name,
+                    control_memory.name,
+                    shape,
+                    dtype,
+                    band,
+                    self._structure.get_rows(*band[2:]),
+                    copy.copy(self._params),
+                    self._apply_velocity,
+                    self._barrier,
+                ),
+                daemon=True,
+            )
+            for band in bands
+        ]
+        for process in processes:
+            process.start()
+
+        # shut down when closed, garbage collected, or at interpreter exit,
+        # before multiprocessing terminates daemonic workers
+        self._finalizer = weakref.finalize(
+            self,
+            _shut_down,
+            processes,
+            self._barrier,
+            self._control,
+            [state_memory, control_memory],
+            self._timeout,
+        )
+
+    def _wait(self: "ApplySpringNetworkMultiprocess") -> None:
+        """Wait at barrier for all workers, raising if any has failed."""
+        try:
+            self._barrier.wait(self._timeout)
+        except threading.BrokenBarrierError as e:
+            self.close()
+            raise RuntimeError("worker process failed or timed out") from e
+
+    def _release_state(self: "ApplySpringNetworkMultiprocess") -> None:
+        """Restore arrays of attached State to private memory."""
+        state = self._state
+        self._state = None
+        if state is not None and state.px is self._arrays[0]:
+            state.px = state.px.copy()
+            state.py = state.py.copy()
+            state.vx = state.vx.copy()
+            state.vy = state.vy.copy()
+
+    def _attach_state(
+        self: "ApplySpringNetworkMultiprocess", state: State
+    ) -> None:
+        """Move arrays of `state` into shared memory, if not already."""
+        px, py, vx, vy = self._arrays
+        if state is self._state and state.px is px:
+            return
+
+        self._release_state()
+        if state.px.shape != px.shape:
+            raise ValueError(
+                f"{state.px.shape=} does not match structure {px.shape}",
+            )
+        px[...], py[...], vx[...], vy[...] = (
+            state.px,
+            state.py,
+            state.vx,
+            state.vy,
+        )
+        state.px, state.py, state.vx, state.vy = px, py, vx, vy
+        self._state = state
+
+    def close(self: "ApplySpringNetworkMultiprocess") -> None:
+        """Stop worker processes and release shared memory.
+
+        The component restarts workers if called again.
+        """
+        if self._finalizer is not None:
+            self._release_state()
+            self._finalizer()
+
+        self._arrays = self._control = None
+        self._barrier = None
+        self._finalizer = None
+
+    def __call__(
+        self: "ApplySpringNetworkMultiprocess",
+        state: State,
+        event_buffer: typing.Optional = None,
+    ) -> None:
+        """Calculate spring and spring damping forces between all connected
+        pairs of cells and apply to State velocity, across worker
+        processes."""
+        if self._finalizer is None:
+            self._start(state.dtype)
+        self._attach_state(state)
+
+        self._control[_dt_index] = self._params.dt
+        self._wait()  # workers compute from shared state
+        self._wait()  # workers write owned rows
+        self._wait()  # workers done
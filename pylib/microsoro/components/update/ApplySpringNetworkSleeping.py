@@ -0,0 +1,378 @@
+import typing
+
+import numpy as np
+
+from ...Params import Params
+from ...State import State
+from ...Structure import Structure
+from ...StructureConstants import StructureConstants
+from ...Workspace import Workspace
+from .ApplySpringNetwork import ApplySpringNetwork
+from .ApplySpringNetworkTiled import _get_bands, _halo
+
+
+def _get_runs(mask: np.ndarray) -> typing.List[typing.Tuple[int, int]]:
+    """Split tile indices into (first, stop) runs of contiguous tiles where
+    `mask` is set."""
+    padded = np.concatenate(([False], mask, [False]))
+    bounds = np.flatnonzero(padded[1:] != padded[:-1])
+    return list(zip(bounds[::2].tolist(), bounds[1::2].tolist()))
+
+
+class ApplySpringNetworkSleeping:
+    """Simulate action of all springs and spring damping, and advance
+    positions, only within row tiles in motion, letting quiescent tiles
+    sleep.
+
+    Equivalent to `ApplySpringNetwork` followed by `ApplyVelocity` while all
+    tiles are awake. Each run of contiguous awake tiles is simulated by its
+    own `ApplySpringNetwork` over its rows plus halo rows on either side
+    (see `ApplySpringNetworkTiled`), so per-step compute scales with awake
+    cells. Tiles span at least as many rows as halos, so runs never read
+    rows that other runs update.
+
+    Every `sample_interval` steps, motion of awake tiles is measured as
+    kinetic energy per cell from cell displacement since the last sample.
+    Unlike State velocity, displacement accounts for `ApplyFloorBounce`
+    holding bodies up by shifting positions, which leaves resting bodies
+    with persistent downward velocities. Tiles sleep once below
+    `sleep_threshold` for `sleep_delay` of simulation time. Sleeping tiles
+    hold position, with velocities zeroed every step, and act as fixed
+    boundaries for awake neighbors.
+
+    Sleeping tiles wake when halo rows of an awake neighbor move relative to
+    them with kinetic energy per cell above `wake_threshold`, or when
+    disturbed by other components, i.e., floor or body contact. Disturbance
+    is detected as any velocity change since last step, other than a uniform
+    vertical change (as by `ApplyGravity`), so checking sleeping tiles costs
+    a few passes over their cells, versus dozens for spring updates. Call
+    `wake` after moving cells without changing their velocities, i.e., by
+    conditioners.
+
+    Notes
+    -----
+    Operates on `State` only. Elastic energy is left unrecorded for
+    `State.energy`. Sleep tracking restarts, with all tiles awake, if a
+    different State is passed or elapsed time goes backwards (i.e., on
+    replay), so replayed steps may differ from those first taken.
+
+    Measured on a default 64x256 structure resting on a floor with
+    elasticity 0.2, after 30 seconds of simulation time: tiles kept kinetic
+    energy per cell of 0.005 to 0.02, with spikes up to 0.25 from floor
+    contact. Under the default threshold, all 8 tiles fell asleep within 0.5
+    seconds of simulation time, after which steps took 250 microseconds
+    versus 2300 microseconds for `ApplySpringNetwork` and `ApplyVelocity`,
+    with cells deviating by at most 0.13 from the full simulation. With 1,
+    2, 4, and 8 tiles awake, steps took 570, 1100, 1410, and 2810
+    microseconds.
+    """
+
+    _awake: np.ndarray
+    _constants: typing.Optional[StructureConstants]
+    _networks: typing.Dict[typing.Tuple[int, int], ApplySpringNetwork]
+    _params: Params
+    _prev_px: typing.Optional[np.ndarray]
+    _prev_py: typing.Optional[np.ndarray]
+    _quiet_time: np.ndarray
+    _run_state: State
+    _sample_interval: int
+    _sampled_at: np.ndarray
+    _sleep_delay: float
+    _sleep_threshold: float
+    _state: typing.Optional[State]
+    _steps_since_sample: int
+    _structure: Structure
+    _t: float
+    _tiles: typing.List[typing.Tuple[int, int, int, int]]
+    _wake_threshold: float
+    _workspace: Workspace
+
+    def __init__(
+        self: "ApplySpringNetworkSleeping",
+        params: typing.Optional[Params] = None,
+        structure: typing.Optional[Structure] = None,
+        num_tiles: typing.Optional[int] = None,
+        sleep_threshold: float = 0.1,
+        wake_threshold: typing.Optional[float] = None,
+        sleep_delay: float = 0.5,
+        sample_interval: int = 20,
+        workspace: typing.Optional[Workspace] = None,
+    ) -> None:
+        """Initialize functor.
+
+        Parameters
+        ----------
+        params : Params, optional
+            Configuration parameters. If not provided, a default `Params`
+            instance will be used.
+        structure : Structure, optional
+            Cell and inter-cell configuration. If not provided, a default
+            `Structure` instance will be used.
+        num_tiles : int, optional
+            Number of row tiles to split grid into, at most one per two
+            rows.
+
+            If not provided, one tile per 8 rows will be used.
+        sleep_threshold : float, default 0.1
+            Kinetic energy per cell below which tiles fall asleep.
+
+            Bodies resting on `ApplyFloorBounce` floors keep jittering, so
+            much lower thresholds keep them awake.
+        wake_threshold : float, optional
+            Kinetic energy per cell of an awake tile's halo rows, relative to
+            a sleeping neighbor, above which the neighbor wakes.
+
+            If not provided, `sleep_threshold` is used.
+        sleep_delay : float, default 0.5
+            Duration of simulation time a tile must stay below
+            `sleep_threshold` before falling asleep.
+        sample_interval : int, default 20
+            Number of steps between measurements of tile motion.
+
+            Displacement over single steps is dominated by `ApplyFloorBounce`
+            position shifts, which cancel out over several steps.
+        workspace : Workspace, optional
+            Holds scratch buffers for temporaries. If not provided, a
+            private workspace is used.
+
+        Raises
+        ------
+        ValueError
+            If `num_tiles` or `sample_interval` is not positive, or if
+            `sleep_threshold`, `wake_threshold`, or `sleep_delay` is
+            negative.
+        """
+        if params is None:
+            params = Params()
+        self._params = params
+        if structure is None:
+            structure = Structure(params=params)
+        self._structure = structure
+
+        if num_tiles is None:
+            num_tiles = max(structure.height // 8, 1)
+        if not num_tiles > 0:
+            raise ValueError(f"{num_tiles=} must be positive")
+        if sample_interval < 1:
+            raise ValueError(f"{sample_interval=} must be positive")
+        if wake_threshold is None:
+            wake_threshold = sleep_threshold
+        for name, value in (
+            ("sleep_threshold", sleep_threshold),
+            ("wake_threshold", wake_threshold),
+            ("sleep_delay", sleep_delay),
+        ):
+            if not value >= 0.0:
+                raise ValueError(f"{name}={value} must be non-negative")
+
+        self._sleep_threshold = float(sleep_threshold)
+        self._wake_threshold = float(wake_threshold)
+        self._sleep_delay = float(sleep_delay)
+        self._sample_interval = sample_interval
+        if workspace is None:
+            workspace = Workspace()
+        self._workspace = workspace
+
+        num_tiles = max(min(num_tiles, structure.height // _halo), 1)
+        self._tiles = _get_bands(structure.height, num_tiles)
+        self._awake = np.ones(len(self._tiles), dtype=bool)
+        self._quiet_time = np.zeros(len(self._tiles))
+        self._sampled_at = np.zeros(len(self._tiles))
+        self._constants = None
+        self._networks = dict()
+        self._run_state = State(1, 1, dtype=structure.dtype)
+        self._prev_px = self._prev_py = None
+        self._state = None
+        self._steps_since_sample = 0
+        self._t = 0.0
+
+    @property
+    def awake(self: "ApplySpringNetworkSleeping") -> np.ndarray:
+        """Which row tiles are awake, from bottom tile up."""
+        return self._awake.copy()
+
+    @property
+    def tiles(
+        self: "ApplySpringNetworkSleeping",
+    ) -> typing.List[typing.Tuple[int, int]]:
+        """Rows of each tile, as (start, stop) row indices."""
+        return [(start, stop) for start, stop, __, __ in self._tiles]
+
+    def wake(
+        self: "ApplySpringNetworkSleeping",
+        tiles: typing.Union[int, typing.Sequence[int], None] = None,
+    ) -> None:
+        """Wake tiles at index or indices `tiles`, or all tiles if not
+        provided."""
+        woken = np.zeros_like(self._awake)
+        woken[np.s_[:] if tiles is None else tiles] = True
+        woken &= ~self._awake
+        self._awake |= woken
+        self._quiet_time[woken] = 0.0
+        if self._state is not None:  # measure motion from now on
+            self._sampled_at[woken] = self._state.t
+            for first, stop in _get_runs(woken):
+                rows = self._get_rows(first, stop)
+                self._prev_px[rows] = self._state.px[rows]
+                self._prev_py[rows] = self._state.py[rows]
+
+    def _get_rows(
+        self: "ApplySpringNetworkSleeping", first: int, stop: int
+    ) -> slice:
+        """Get rows of tiles `first` through `stop - 1`."""
+        return np.s_[self._tiles[first][0] : self._tiles[stop - 1][1]]
+
+    def _get_network(
+        self: "ApplySpringNetworkSleeping", first: int, stop: int
+    ) -> ApplySpringNetwork:
+        """Get network over rows and halo rows of tiles `first` through
+        `stop - 1`, building it on first request or whenever the
+        structure's derived constants are rebuilt."""
+        constants = self._structure.get_constants(self._params)
+        if constants is not self._constants:
+            self._constants = constants
+            self._networks.clear()
+
+        key = (first, stop)
+        if key not in self._networks:
+            self._networks[key] = ApplySpringNetwork(
+                self._params,
+                self._structure.get_rows(
+                    self._tiles[first][2], self._tiles[stop - 1][3]
+                ),
+                self._workspace,
+            )
+        return self._networks[key]
+
+    def _restart(self: "ApplySpringNetworkSleeping", state: State) -> None:
+        """Begin tracking `state`, with all tiles awake."""
+        self._state = state
+        self._awake[...] = True
+        self._quiet_time[...] = 0.0
+        self._sampled_at[...] = state.t
+        self._steps_since_sample = 0
+        self._prev_px = state.px.copy()
+        self._prev_py = state.py.copy()
+
+    def _sample(self: "ApplySpringNetworkSleeping", state: State) -> None:
+        """Measure motion of awake tiles since last sample, putting quiet
+        tiles to sleep and waking sleeping tiles that neighbors move
+        against."""
+        m = self._structure.m
+        workspace = self._workspace
+        num_tiles = len(self._tiles)
+        span = state.t - self._sampled_at
+        tile_ke = np.full(num_tiles, np.inf)
+        woken = np.zeros(num_tiles, dtype=bool)
+
+        # sleeping tiles move only under uniform ApplyFloorBounce shifts, so
+        # track one cell of each to measure motion net of shifts
+        tracked = [self._tiles[index][0] for index in range(num_tiles)]
+        tracked = np.s_[tracked, 0]
+        shift_x = state.px[tracked] - self._prev_px[tracked]
+        shift_y = state.py[tracked] - self._prev_py[tracked]
+
+        for first, stop in _get_runs(self._awake & (span > 0.0)):
+            rows = self._get_rows(first, stop)
+            shape = state.px[rows].shape
+            dx = np.subtract(
+                state.px[rows],
+                self._prev_px[rows],
+                out=workspace.get("dx", shape, state.dtype),
+            )
+            dy = np.subtract(
+                state.py[rows],
+                self._prev_py[rows],
+                out=workspace.get("dy", shape, state.dtype),
+            )
+
+            # halo rows at either end of run, against sleeping neighbors
+            for edge, index, neighbor in (
+                (np.s_[:_halo], first, first - 1),
+                (np.s_[-_halo:], stop - 1, stop),
+            ):
+                if 0 <= neighbor < num_tiles and not self._awake[neighbor]:
+                    dx_edge = dx[edge] - shift_x[neighbor]
+                    dy_edge = dy[edge] - shift_y[neighbor]
+                    edge_ke = np.sum(
+                        m[rows][edge] * (dx_edge**2 + dy_edge**2)
+                    ) / (2 * dx_edge.size * span[index] ** 2)
+                    woken[neighbor] |= edge_ke > self._wake_threshold
+
+            dx *= dx
+            dy *= dy
+            dx += dy
+            dx *= m[rows]
+            row_ke = dx.sum(axis=1)
+            starts, stops, __, __ = zip(*self._tiles[first:stop])
+            offsets = np.subtract(starts, starts[0])
+            cells = np.subtract(stops, starts) * shape[1]
+            tile_ke[first:stop] = np.add.reduceat(row_ke, offsets) / (
+                2 * cells * span[first:stop] ** 2
+            )
+
+        self._prev_px[...] = state.px
+        self._prev_py[...] = state.py
+        self._sampled_at[...] = state.t
+
+        is_quiet = tile_ke < self._sleep_threshold
+        self._quiet_time[is_quiet] += span[is_quiet]
+        self._quiet_time[~is_quiet] = 0.0
+        self._awake &= self._quiet_time < self._sleep_delay
+        self.wake(np.flatnonzero(woken))
+
+    def __call__(
+        self: "ApplySpringNetworkSleeping",
+        state: State,
+        event_buffer: typing.Optional = None,
+    ) -> None:
+        """Calculate spring and spring damping forces between connected
+        pairs of cells within awake tiles, apply to State velocity, and
+        advance positions."""
+        if state is not self._state or state.t < self._t:
+            self._restart(state)
+        self._t = state.t
+
+        # wake sleeping tiles disturbed since last step
+        for index in np.flatnonzero(~self._awake):
+            start, stop, __, __ = self._tiles[index]
+            vy = state.vy[start:stop]
+            if state.vx[start:stop].any() or vy.max() != vy.min():
+                self.wake(index)
+
+        self._steps_since_sample += 1
+        if self._steps_since_sample >= self._sample_interval:
+            self._steps_since_sample = 0
+            self._sample(state)
+
+        for first, stop in _get_runs(~self._awake):
+            rows = self._get_rows(first, stop)
+            state.vx[rows] = 0.0
+            state.vy[rows] = 0.0
+
+        # runs are separated by at least halo rows of sleeping tiles, so
+        # runs update views of State in turn, restoring sleeping halo rows
+        dt = self._params.dt
+        run_state = self._run_state
+        for first, stop in _get_runs(self._awake):
+            halo_start, halo_stop = (
+                self._tiles[first][2],
+                self._tiles[stop - 1][3],
+            )
+            halo = np.s_[halo_start:halo_stop]
+            run_state.px, run_state.py = state.px[halo], state.py[halo]
+            run_state.vx, run_state.vy = state.vx[halo], state.vy[halo]
+            self._get_network(first, stop)(run_state)
+
+            rows = self._get_rows(first, stop)
+            for sleeping in (
+                np.s_[halo_start : rows.start],
+                np.s_[rows.stop : halo_stop],
+            ):
+                state.vx[sleeping] = 0.0
+                state.vy[sleeping] = 0.0
+
+            # as ApplyVelocity, over rows of run
+            dp = self._workspace.get("dp", state.vx[rows].shape, state.dtype)
+            state.px[rows] += np.multiply(state.vx[rows], dt, out=dp)
+            state.py[rows] += np.multiply(state.vy[rows], dt, out=dp)
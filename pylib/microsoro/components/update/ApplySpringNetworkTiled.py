@@ -0,0 +1,205 @@
+from concurrent import futures
+import os
+import typing
+
+import numpy as np
+
+from ...Params import Params
+from ...State import State
+from ...Structure import Structure
+from ...StructureConstants import StructureConstants
+from ...Workspace import Workspace
+from .ApplySpringNetwork import ApplySpringNetwork
+
+
+# halo rows needed on either side of a band, because damping acts on the
+# spring-updated velocities of neighboring rows, which in turn depend on the
+# positions of their neighboring rows
+_halo = 2
+
+
+def _get_bands(
+    height: int, num_bands: int
+) -> typing.List[typing.Tuple[int, int, int, int]]:
+    """Split `height` rows into at most `num_bands` contiguous bands, as
+    (owned start, owned stop, halo start, halo stop) row indices."""
+    bounds = np.linspace(0, height, min(num_bands, height) + 1).astype(int)
+    return [
+        (start, stop, max(start - _halo, 0), min(stop + _halo, height))
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+
+
+class ApplySpringNetworkTiled:
+    """Simulate action of all springs and spring damping, splitting the grid
+    into row bands processed concurrently on a thread pool.
+
+    Equivalent to `ApplySpringNetwork`, optionally followed by
+    `ApplyVelocity`. Each band is simulated by its own `ApplySpringNetwork`
+    over its rows plus halo rows on either side, with results for halo rows
+    discarded. Updates proceed in two passes, so no band writes state that
+    another band is still reading: first, each band computes updated
+    velocities from a private copy; then, each band writes velocities (and
+    advances positions) for its own rows.
+
+    NumPy releases the GIL within array kernels, so bands run in parallel
+    across cores for large grids (i.e., 1024x1024). For small grids,
+    dispatch overhead outweighs any gain, so prefer `ApplySpringNetwork`.
+
+    Notes
+    -----
+    Operates on `State` only. Elastic energy is left unrecorded for
+    `State.energy`, because halo springs are simulated by more than one band.
+    """
+
+    _apply_velocity: bool
+    _bands: typing.List[typing.Tuple[int, int, int, int]]
+    _band_networks: typing.List[ApplySpringNetwork]
+    _band_states: typing.List[State]
+    _band_workspaces: typing.List[Workspace]
+    _constants: typing.Optional[StructureConstants]
+    _executor: typing.Optional[futures.Executor]
+    _owns_executor: bool
+    _params: Params
+    _structure: Structure
+
+    def __init__(
+        self: "ApplySpringNetworkTiled",
+        params: typing.Optional[Params] = None,
+        structure: typing.Optional[Structure] = None,
+        num_tiles: typing.Optional[int] = None,
+        executor: typing.Optional[futures.Executor] = None,
+        apply_velocity: bool = False,
+    ) -> None:
+        """Initialize functor.
+
+        Parameters
+        ----------
+        params : Params, optional
+            Configuration parameters. If not provided, a default `Params`
+            instance will be used.
+        structure : Structure, optional
+            Cell and inter-cell configuration. If not provided, a default
+            `Structure` instance will be used.
+        num_tiles : int, optional
+            Number of row bands to split grid into, at most one per row.
+
+            If not provided, one band per available CPU will be used.
+        executor : concurrent.futures.Executor, optional
+            Thread pool to process bands on, i.e., to share among
+            components.
+
+            If not provided, a private `ThreadPoolExecutor` with one worker
+            per band will be used.
+        apply_velocity : bool, default False
+            Should positions also be advanced under updated velocities, as
+            by `ApplyVelocity`, within the same pass over bands?
+
+        Raises
+        ------
+        ValueError
+            If `num_tiles` is not positive.
+        """
+        if num_tiles is None:
+            num_tiles = os.cpu_count() or 1
+        if not num_tiles > 0:
+            raise ValueError(f"{num_tiles=} must be positive")
+
+        if params is None:
+            params = Params()
+        self._params = params
+        if structure is None:
+            structure = Structure(params=params)
+        self._structure = structure
+        self._apply_velocity = apply_velocity
+        self._constants = None
+
+        self._bands = _get_bands(structure.height, num_tiles)
+        self._band_networks = []
+        self._band_states = [
+            State(stop - start, structure.width, dtype=structure.dtype)
+            for __, __, start, stop in self._bands
+        ]
+        self._band_workspaces = [Workspace() for __ in self._bands]
+
+        self._owns_executor = executor is None and len(self._bands) > 1
+        if self._owns_executor:
+            executor = futures.ThreadPoolExecutor(
+                max_workers=len(self._bands),
+                thread_name_prefix="ApplySpringNetworkTiled",
+            )
+        self._executor = executor
+
+    def __del__(self: "ApplySpringNetworkTiled") -> None:
+        """Release private thread pool, if any."""
+        if getattr(self, "_owns_executor", False):
+            self._executor.shutdown(wait=False)
+
+    def _refresh_bands(self: "ApplySpringNetworkTiled") -> None:
+        """Rebuild band structures from views of current structure arrays,
+        whenever the structure's derived constants are rebuilt."""
+        constants = self._structure.get_constants(self._params)
+        if constants is self._constants:
+            return
+
+        self._constants = constants
+        self._band_networks = [
+            ApplySpringNetwork(
+                self._params,
+                self._structure.get_rows(start, stop),
+                workspace,
+            )
+            for (__, __, start, stop), workspace in zip(
+                self._bands, self._band_workspaces
+            )
+        ]
+
+    def _map(
+        self: "ApplySpringNetworkTiled",
+        fn: typing.Callable[[int], None],
+    ) -> None:
+        """Apply `fn` to each band index, waiting for all to complete."""
+        if self._executor is None:
+            for index in range(len(self._bands)):
+                fn(index)
+        else:  # list forces completion and raises any worker exception
+            list(self._executor.map(fn, range(len(self._bands))))
+
+    def __call__(
+        self: "ApplySpringNetworkTiled",
+        state: State,
+        event_buffer: typing.Optional = None,
+    ) -> None:
+        """Calculate spring and spring damping forces between all connected
+        pairs of cells and apply to State velocity, band by band."""
+        self._refresh_bands()
+
+        def simulate_band(index: int) -> None:
+            __, __, start, stop = self._bands[index]
+            band_state = self._band_states[index]
+            band_state.px = state.px[start:stop]
+            band_state.py = state.py[start:stop]
+            band_state.vx[...] = state.vx[start:stop]
+            band_state.vy[...] = state.vy[start:stop]
+            self._band_networks[index](band_state)
+
+        def write_band(index: int) -> None:
+            start, stop, halo_start, __ = self._bands[index]
+            band_state = self._band_states[index]
+            owned = np.s_[start - halo_start : stop - halo_start]
+            state.vx[start:stop] = band_state.vx[owned]
+            state.vy[start:stop] = band_state.vy[owned]
+            if self._apply_velocity:  # as ApplyVelocity, over owned rows
+                dp = self._band_workspaces[index].get(
+                    "dp", band_state.vx[owned].shape, state.px.dtype
+                )
+                dt = self._params.dt
+                state.px[start:stop] += np.multiply(
+                    band_state.vx[owned], dt, out=dp
+                )
+                state.py[start:stop] += np.multiply(
+                    band_state.vy[owned], dt, out=dp
+                )
+
+        self._map(simulate_band)
+        self._map(write_band)
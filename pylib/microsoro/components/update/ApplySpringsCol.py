@@ -5,6 +5,7 @@ import numpy as np
 from ...State import State
 from ...Structure import Structure
 from ...Params import Params
+from ...Workspace import Workspace
 
 
 class ApplySpringsCol:
@@ -12,19 +13,28 @@ class ApplySpringsCol:
 
     _params: Params
     _structure: Structure
+    _workspace: Workspace
 
     def __init__(
         self: "ApplySpringsCol",
         params: typing.Optional[Params] = None,
         structure: typing.Optional[Structure] = None,
+        workspace: typing.Optional[Workspace] = None,
     ) -> None:
-        """Initialize functor."""
+        """Initialize functor.
+
+        If `workspace` is provided, temporaries are held in its scratch
+        buffers. Otherwise, a private workspace is used.
+        """
         if params is None:
             params = Params()
         self._params = params
         if structure is None:
             structure = Structure(params=params)
         self._structure = structure
+        if workspace is None:
+            workspace = Workspace()
+        self._workspace = workspace
 
     def __call__(
         self: "ApplySpringsCol",
@@ -33,39 +43,57 @@ class ApplySpringsCol:
     ) -> None:
         """Calculate spring forces between vertical pairs of cells and apply to
         State velocity."""
-        # how far apart are vertical pairs of cells?
-        col_dists_horiz = np.diff(state.px, axis=0)
-        col_dists_vert = np.diff(state.py, axis=0)
-        col_dists = np.sqrt(col_dists_horiz**2 + col_dists_vert**2)
+        constants = self._structure.get_constants(self._params)
+        workspace = self._workspace
+        shape = state.px[..., 1:, :].shape
+        dtype = state.px.dtype
 
-        # decomposed unit vector
-        normed_col_dists_horiz = col_dists_horiz / col_dists
-        normed_col_dists_vert = col_dists_vert / col_dists
+        # how far apart are vertical pairs of cells?
+        col_dists_horiz = np.subtract(
+            state.px[..., 1:, :],
+            state.px[..., :-1, :],
+            out=workspace.get("dists_horiz", shape, dtype),
+        )
+        col_dists_vert = np.subtract(
+            state.py[..., 1:, :],
+            state.py[..., :-1, :],
+            out=workspace.get("dists_vert", shape, dtype),
+        )
+        col_dists = np.hypot(
+            col_dists_horiz,
+            col_dists_vert,
+            out=workspace.get("dists", shape, dtype),
+        )
 
         # net forces: negative is repulsion, positive is attraction
+        # scaled by inverse distance to decompose along unit vector
         l_naught = self._structure.lc  # natural length of springs
-        f = self._structure.kc * (col_dists - l_naught)
+        f = np.subtract(
+            col_dists, l_naught, out=workspace.get("f", shape, dtype)
+        )
+        if state.energy is not None:  # extension, before scaling
+            state.energy.record_springs("col", f, self._structure.kc)
+        f *= constants.kc_dt  # scaled by dt, for impulse
+        f /= col_dists
 
         # decompose force into horizontal and vertical components
-        fx = f * normed_col_dists_horiz
-        fy = f * normed_col_dists_vert
-
-        # is clipping necessary?
-        # fx = np.clip(fx, -1e12, 1e12)
-        # fy = np.clip(fy, -1e12, 1e12)
+        fx = np.multiply(f, col_dists_horiz, out=col_dists_horiz)
+        fy = np.multiply(f, col_dists_vert, out=col_dists_vert)
 
         # horizontal components of acceleration
-        ax = np.zeros_like(state.vx)
-        ax[:-1, :] += fx[:, :]  # up-facing forces
-        ax[1:, :] -= fx[:, :]  # down-facing forces
-        ax /= self._structure.m
-        # apply acceleration to state
-        state.vx += ax * self._params.dt
+        ax = workspace.get("ax", state.vx.shape, dtype)
+        ax.fill(0.0)
+        ax[..., :-1, :] += fx  # up-facing forces
+        ax[..., 1:, :] -= fx  # down-facing forces
+        ax *= constants.inv_m
+        # apply change in velocity to state
+        state.vx += ax
 
         # vertical components of acceleration
-        ay = np.zeros_like(state.vy)
-        ay[:-1, :] += fy[:, :]  # up-facing forces
-        ay[1:, :] -= fy[:, :]  # down-facing forces
-        ay /= self._structure.m
-        # apply acceleration to state
-        state.vy += ay * self._params.dt
+        ay = workspace.get("ay", state.vy.shape, dtype)
+        ay.fill(0.0)
+        ay[..., :-1, :] += fy  # up-facing forces
+        ay[..., 1:, :] -= fy  # down-facing forces
+        ay *= constants.inv_m
+        # apply change in velocity to state
+        state.vy += ay
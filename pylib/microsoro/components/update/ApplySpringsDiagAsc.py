@@ -5,6 +5,7 @@ import numpy as np
 from ...State import State
 from ...Structure import Structure
 from ...Params import Params
+from ...Workspace import Workspace
 
 
 class ApplySpringsDiagAsc:
@@ -13,19 +14,28 @@ class ApplySpringsDiagAsc:
 
     _params: Params
     _structure: Structure
+    _workspace: Workspace
 
     def __init__(
         self: "ApplySpringsDiagAsc",
         params: typing.Optional[Params] = None,
         structure: typing.Optional[Structure] = None,
+        workspace: typing.Optional[Workspace] = None,
     ) -> None:
-        """Initialize functor."""
+        """Initialize functor.
+
+        If `workspace` is provided, temporaries are held in its scratch
+        buffers. Otherwise, a private workspace is used.
+        """
         if params is None:
             params = Params()
         self._params = params
         if structure is None:
             structure = Structure(params=params)
         self._structure = structure
+        if workspace is None:
+            workspace = Workspace()
+        self._workspace = workspace
 
     def __call__(
         self: "ApplySpringsDiagAsc",
@@ -34,39 +44,57 @@ class ApplySpringsDiagAsc:
     ) -> None:
         """Calculate spring forces between pairs of cells along ascending
         diagonals and apply to State velocity."""
-        # how far apart are pairs of cells along ascending diagonals?
-        diag_dists_horiz = state.px[:-1, :-1] - state.px[1:, 1:]
-        diag_dists_vert = state.py[:-1, :-1] - state.py[1:, 1:]
-        diag_dists = np.sqrt(diag_dists_horiz**2 + diag_dists_vert**2)
+        constants = self._structure.get_constants(self._params)
+        workspace = self._workspace
+        shape = state.px[..., :-1, :-1].shape
+        dtype = state.px.dtype
 
-        # decomposed unit vector
-        normed_diag_dists_horiz = diag_dists_horiz / diag_dists
-        normed_diag_dists_vert = diag_dists_vert / diag_dists
+        # how far apart are pairs of cells along ascending diagonals?
+        diag_dists_horiz = np.subtract(
+            state.px[..., :-1, :-1],
+            state.px[..., 1:, 1:],
+            out=workspace.get("dists_horiz", shape, dtype),
+        )
+        diag_dists_vert = np.subtract(
+            state.py[..., :-1, :-1],
+            state.py[..., 1:, 1:],
+            out=workspace.get("dists_vert", shape, dtype),
+        )
+        diag_dists = np.hypot(
+            diag_dists_horiz,
+            diag_dists_vert,
+            out=workspace.get("dists", shape, dtype),
+        )
 
         # net forces: negative is repulsion, positive is attraction
-        l_naught = self._structure.la  # natural len of springs, on diagonal
-        f = self._structure.ka * (diag_dists - l_naught)
+        # scaled by inverse distance to decompose along unit vector
+        l_naught = self._structure.la  # natural length of springs
+        f = np.subtract(
+            diag_dists, l_naught, out=workspace.get("f", shape, dtype)
+        )
+        if state.energy is not None:  # extension, before scaling
+            state.energy.record_springs("asc", f, self._structure.ka)
+        f *= constants.ka_dt  # scaled by dt, for impulse
+        f /= diag_dists
 
         # decompose force into horizontal and vertical components
-        fx = f * normed_diag_dists_horiz
-        fy = f * normed_diag_dists_vert
-
-        # is clipping necessary?
-        # fx = np.clip(fx, -1e12, 1e12)
-        # fy = np.clip(fy, -1e12, 1e12)
+        fx = np.multiply(f, diag_dists_horiz, out=diag_dists_horiz)
+        fy = np.multiply(f, diag_dists_vert, out=diag_dists_vert)
 
         # horizontal components of acceleration
-        ax = np.zeros_like(state.vx)
-        ax[:-1, :-1] -= fx[:, :]  # up-right facing forces
-        ax[1:, 1:] += fx[:, :]  # down-left facing forces
-        ax /= self._structure.m
-        # apply acceleration to state
-        state.vx += ax * self._params.dt
+        ax = workspace.get("ax", state.vx.shape, dtype)
+        ax.fill(0.0)
+        ax[..., :-1, :-1] -= fx  # up-right facing forces
+        ax[..., 1:, 1:] += fx  # down-left facing forces
+        ax *= constants.inv_m
+        # apply change in velocity to state
+        state.vx += ax
 
         # vertical components of acceleration
-        ay = np.zeros_like(state.vy)
-        ay[:-1, :-1] -= fy[:, :]  # up-right facing forces
-        ay[1:, 1:] += fy[:, :]  # down-left facing forces
-        ay /= self._structure.m
-        # apply acceleration to state
-        state.vy += ay * self._params.dt
+        ay = workspace.get("ay", state.vy.shape, dtype)
+        ay.fill(0.0)
+        ay[..., :-1, :-1] -= fy  # up-right facing forces
+        ay[..., 1:, 1:] += fy  # down-left facing forces
+        ay *= constants.inv_m
+        # apply change in velocity to state
+        state.vy += ay
@@ -0,0 +1,158 @@
+import typing
+
+import numpy as np
+
+from ...State import State
+from ...events import EventBuffer, RenderTerrainEvent
+
+
+class ApplyTerrain:
+    """Bounce cells off piecewise-linear terrain.
+
+    Replaces stacks of `ApplyFloorBounce` instances approximating a course.
+    Terrain is given as a polyline through breakpoints, and extends beyond
+    the first and last breakpoints along the first and last segments. Each
+    cell's segment is found with one `np.searchsorted` over interior
+    breakpoint x-coordinates, so per-step cost grows only logarithmically
+    with segment count. Penetration and reflection are resolved in a single
+    pass against each cell's own segment, and one `RenderTerrainEvent` is
+    emitted.
+
+    Operates on `State` or `BatchState`.
+
+    Notes
+    -----
+    As in `ApplyFloorBounce`, penetration is corrected by shifting whole
+    individuals, here vertically only, by their deepest penetration. A
+    vertical shift leaves every cell's terrain height unchanged, so one
+    shift clears all segments at once.
+    """
+
+    _elasticity: float
+    _event: RenderTerrainEvent
+    _interior_x: np.ndarray
+    _normal_x: np.ndarray
+    _normal_y: np.ndarray
+    _slope: np.ndarray
+    _x: np.ndarray
+    _y: np.ndarray
+
+    def __init__(
+        self: "ApplyTerrain",
+        x: typing.Sequence[float],
+        y: typing.Sequence[float],
+        e: float = 1.0,
+    ) -> None:
+        """Initialize functor.
+
+        Parameters
+        ----------
+        x : Sequence[float]
+            Breakpoint x-coordinates, strictly increasing.
+        y : Sequence[float]
+            Breakpoint y-coordinates (i.e., terrain heights at `x`).
+        e : float, default 1.0
+            Elasticity coefficient of the bounce.
+
+            Specifies proportion of kinetic energy retained after collision.
+
+        Raises
+        ------
+        ValueError
+            If `x` and `y` differ in length or have fewer than two
+            breakpoints, if `x` is not strictly increasing, or if elasticity
+            is negative.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if x.ndim != 1 or x.shape != y.shape or len(x) < 2:
+            raise ValueError(
+                f"{x.shape=} and {y.shape=} must match, "
+                "with at least two breakpoints",
+            )
+        if not np.all(np.diff(x) > 0):
+            raise ValueError(f"{x=} must be strictly increasing")
+        if e < 0:
+            raise ValueError(
+                f"ApplyTerrain elasticity {e=} must be non-negative."
+            )
+
+        self._elasticity = float(e)
+        self._x = x
+        self._y = y
+        self._interior_x = x[1:-1]
+        self._slope = np.diff(y) / np.diff(x)
+
+        # unit normals to each segment, pointing up
+        norm = np.hypot(self._slope, 1.0)
+        self._normal_x = -self._slope / norm
+        self._normal_y = 1.0 / norm
+
+        self._event = RenderTerrainEvent(
+            x=tuple(map(float, x)), y=tuple(map(float, y))
+        )
+
+    def _get_terrain_y(
+        self: "ApplyTerrain",
+        px: np.ndarray,
+        segments: np.ndarray,
+    ) -> np.ndarray:
+        """Get terrain height beneath each cell, given cell segments."""
+        dtype = px.dtype
+        res = px - self._x.astype(dtype, copy=False)[segments]
+        res *= self._slope.astype(dtype, copy=False)[segments]
+        res += self._y.astype(dtype, copy=False)[segments]
+        return res
+
+    def __call__(
+        self: "ApplyTerrain",
+        state: State,
+        event_buffer: typing.Optional[EventBuffer] = None,
+    ) -> None:
+        """If any tresspass past terrain has occurred, correct cell positions
+        (i.e., retroactively) and reflect cell velocities off terrain
+        surface."""
+        if event_buffer is not None:
+            event_buffer.enqueue(self._event)
+
+        # find segment beneath each cell, and cells below terrain
+        segments = np.searchsorted(self._interior_x, state.px, side="right")
+        y_terrain = self._get_terrain_y(state.px, segments)
+        below_terrain_mask = state.py < y_terrain
+        if not below_terrain_mask.any():
+            return
+
+        dtype = state.px.dtype
+        tolerance_factor = 1e-12
+        if dtype != np.float64:  # widen to cover rounding at low precision
+            magnitude = max(abs(y_terrain.max()), abs(y_terrain.min()), 1.0)
+            tolerance_factor = max(
+                tolerance_factor, 8 * magnitude * float(np.finfo(dtype).eps)
+            )
+
+        # shift any leading (i.e., batch) axes independently, so reduce only
+        # over trailing cell row and column axes
+        penetration = np.where(
+            below_terrain_mask, y_terrain - state.py, -np.inf
+        )
+        max_penetration = np.max(penetration, axis=(-2, -1), keepdims=True)
+        max_penetration += tolerance_factor
+        max_penetration[~np.isfinite(max_penetration)] = 0.0
+        state.py += max_penetration
+        assert not np.any(state.py < y_terrain)
+
+        # reflect velocities of cells below terrain off their own segments
+        below = np.nonzero(below_terrain_mask)
+        normal_x = self._normal_x[segments[below]]
+        normal_y = self._normal_y[segments[below]]
+        vx, vy = state.vx[below], state.vy[below]
+        dot_product = vx * normal_x + vy * normal_y
+        reflection_x = vx - 2 * dot_product * normal_x
+        reflection_y = vy - 2 * dot_product * normal_y
+
+        # correct sign to ensure upwards bounce, as in ApplyFloorBounce
+        np.abs(reflection_y, out=reflection_y)
+
+        # apply velocity loss to imperfect elasticity
+        state.vx[below] = reflection_x * self._elasticity
+        state.vy[below] = reflection_y * self._elasticity
@@ -1,21 +1,29 @@
 import typing
 
+import numpy as np
+
 from ...State import State
 from ...Params import Params
+from ...Workspace import Workspace
 
 
 class ApplyVelocity:
     """Advance position one simulation step under state velocities."""
 
     _params: Params
+    _workspace: Workspace
 
     def __init__(
         self: "ApplyVelocity",
         params: typing.Optional[Params] = None,
+        workspace: typing.Optional[Workspace] = None,
     ) -> None:
         if params is None:
             params = Params()
         self._params = params
+        if workspace is None:
+            workspace = Workspace()
+        self._workspace = workspace
 
     def __call__(
         self: "ApplyVelocity",
@@ -23,5 +31,6 @@ class ApplyVelocity:
         event_buffer: typing.Optional = None,
     ) -> None:
         params = self._params
-        state.px += state.vx * params.dt
-        state.py += state.vy * params.dt
+        dp = self._workspace.get("dp", state.px.shape, state.px.dtype)
+        state.px += np.multiply(state.vx, params.dt, out=dp)
+        state.py += np.multiply(state.vy, params.dt, out=dp)
@@ -6,6 +6,7 @@ from ...events import EventBuffer, RenderFloorEvent
 from ...State import State
 from ...Structure import Structure
 from ...Params import Params
+from ...Workspace import Workspace
 
 
 class ApplyViscousLayer:
@@ -16,6 +17,7 @@ class ApplyViscousLayer:
     _slope: float
     _params: Params
     _structure: Structure
+    _workspace: Workspace
 
     def __init__(
         self: "ApplyViscousLayer",
@@ -24,6 +26,7 @@ class ApplyViscousLayer:
         b: float = 0.0,
         params: typing.Optional[Params] = None,
         structure: typing.Optional[Structure] = None,
+        workspace: typing.Optional[Workspace] = None,
     ) -> None:
         """Initialize functor.
 
@@ -37,6 +40,10 @@ class ApplyViscousLayer:
             Slope of the upper boundary of the layer, default flat.
         b : float, default 1.0
             Y-intercept of the upper bound of the layer.
+        workspace : Workspace, optional
+            Holds scratch buffers for temporaries.
+
+            If not provided, a private workspace is used.
 
         Raises:
         ------
@@ -56,6 +63,9 @@ class ApplyViscousLayer:
         if structure is None:
             structure = Structure(params=params)
         self._structure = structure
+        if workspace is None:
+            workspace = Workspace()
+        self._workspace = workspace
 
     def __call__(
         self: "ApplyViscousLayer",
@@ -70,27 +80,36 @@ class ApplyViscousLayer:
                 RenderFloorEvent(m=m, b=b, flavor="viscous layer")
             )
 
+        workspace = self._workspace
+        shape = state.px.shape
+        dtype = state.px.dtype
+
         # Get the floor y-values for all x-positions
-        y_floor = m * state.px + b
+        y_floor = np.multiply(
+            state.px, m, out=workspace.get("y_floor", shape, dtype)
+        )
+        y_floor += b
 
         # Find the cells which are below the floor
-        below_floor_mask = state.py < y_floor
+        below_floor_mask = np.less(
+            state.py, y_floor, out=workspace.get("below_floor", shape, bool)
+        )
 
         # if no cells are below floor, we are done
-        if not np.any(below_floor_mask):
+        if not below_floor_mask.any():
             return
 
+        constants = self._structure.get_constants(self._params)
+        dt_per_m = constants.dt_per_m
         dt = self._params.dt
         # damping constant, clipped to prevent any overshoot
-        mu = np.minimum(self._mu, 1 / dt)
-        fx = -state.vx[below_floor_mask] * mu
-        fy = -state.vy[below_floor_mask] * mu
-
-        ax = fx / self._structure.m[below_floor_mask]
-        ay = fy / self._structure.m[below_floor_mask]
+        mu = min(self._mu, 1 / dt)
 
-        dvx = ax * dt
-        dvy = ay * dt
-
-        state.vx[below_floor_mask] += dvx
-        state.vy[below_floor_mask] += dvy
+        # change in velocity is computed for all cells, but only applied to
+        # cells below the floor
+        for v in state.vx, state.vy:
+            dv = np.multiply(  # force
+                v, -mu, out=workspace.get("dv", shape, dtype)
+            )
+            dv *= dt_per_m  # acceleration times dt
+            np.add(v, dv, out=v, where=below_floor_mask)
@@ -1,26 +1,52 @@
+from .ApplyAdaptiveTimestep import ApplyAdaptiveTimestep
+from .ApplyBodyContact import ApplyBodyContact
 from .ApplyFloorBounce import ApplyFloorBounce
 from .ApplyGravity import ApplyGravity
+from .ApplyHalfTimestep import ApplyHalfTimestep
 from .ApplyIncrementElapsedTime import ApplyIncrementElapsedTime
+from .ApplyMultilevel import ApplyMultilevel
+from .ApplyObstacleSDF import ApplyObstacleSDF
+from .ApplySelfCollision import ApplySelfCollision
 from .ApplySpringDampingCol import ApplySpringDampingCol
 from .ApplySpringDampingRow import ApplySpringDampingRow
+from .ApplySpringGraph import ApplySpringGraph
+from .ApplySpringNetwork import ApplySpringNetwork
+from .ApplySpringNetworkImplicit import ApplySpringNetworkImplicit
+from .ApplySpringNetworkMultiprocess import ApplySpringNetworkMultiprocess
+from .ApplySpringNetworkSleeping import ApplySpringNetworkSleeping
+from .ApplySpringNetworkTiled import ApplySpringNetworkTiled
 from .ApplySpringsCol import ApplySpringsCol
 from .ApplySpringsDiagAsc import ApplySpringsDiagAsc
 from .ApplySpringsDiagDesc import ApplySpringsDiagDesc
 from .ApplySpringsRow import ApplySpringsRow
+from .ApplyTerrain import ApplyTerrain
 from .ApplyVelocity import ApplyVelocity
 from .ApplyViscousLayer import ApplyViscousLayer
 
 
 __all__ = [
+    "ApplyAdaptiveTimestep",
+    "ApplyBodyContact",
     "ApplyFloorBounce",
     "ApplyGravity",
+    "ApplyHalfTimestep",
     "ApplyIncrementElapsedTime",
+    "ApplyMultilevel",
+    "ApplyObstacleSDF",
+    "ApplySelfCollision",
     "ApplySpringDampingCol",
     "ApplySpringDampingRow",
+    "ApplySpringGraph",
+    "ApplySpringNetwork",
+    "ApplySpringNetworkImplicit",
+    "ApplySpringNetworkMultiprocess",
+    "ApplySpringNetworkSleeping",
+    "ApplySpringNetworkTiled",
     "ApplySpringsCol",
     "ApplySpringsDiagAsc",
     "ApplySpringsDiagDesc",
     "ApplySpringsRow",
+    "ApplyTerrain",
     "ApplyVelocity",
     "ApplyViscousLayer",
 ]
@@ -0,0 +1,36 @@
+import typing
+
+from ...EnergyTracker import EnergyTracker
+from ...Params import Params
+from ...State import State
+
+
+class ApplyEnergyTracking:
+    """Opt State in to incremental energy accounting, by attaching an
+    `EnergyTracker` as `state.energy`."""
+
+    _params: typing.Optional[Params]
+    _structure: typing.Optional[typing.Any]
+
+    def __init__(
+        self: "ApplyEnergyTracking",
+        params: typing.Optional[Params] = None,
+        structure: typing.Optional[typing.Any] = None,
+    ) -> None:
+        """Initialize functor.
+
+        Parameters
+        ----------
+        params : Params, optional
+            Configuration parameters, from which gravitational constant is
+            taken. If not provided, a default `Params` instance will be used.
+        structure : Structure or GraphStructure, optional
+            Structure from which cell masses are taken. If not provided, a
+            default `Structure` instance will be used.
+        """
+        self._params = params
+        self._structure = structure
+
+    def __call__(self: "ApplyEnergyTracking", state: State) -> None:
+        """Attach fresh `EnergyTracker` to state."""
+        state.energy = EnergyTracker(self._params, self._structure)
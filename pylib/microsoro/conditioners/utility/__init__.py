@@ -1,7 +1,9 @@
+from .ApplyEnergyTracking import ApplyEnergyTracking
 from .BundleConditioners import BundleConditioners
 from .NopConditioner import NopConditioner
 
 __all__ = [
+    "ApplyEnergyTracking",
     "BundleConditioners",
     "NopConditioner",
 ]
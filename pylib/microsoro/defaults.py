@@ -11,6 +11,9 @@ b_lim: typing.Tuple[float, float] = (0.0, 1e2)
 dt: float = 1e-3
 dt_lim: typing.Tuple[float, float] = (sys.float_info.min, sys.float_info.max)
 
+# floating point type of simulation arrays
+dtype: str = "float64"
+
 # gravitational constant
 g: float = 1e1
 g_lim: typing.Tuple[float, float] = (0, sys.float_info.max)
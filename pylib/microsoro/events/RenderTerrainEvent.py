@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+import typing
+
+import numpy as np
+
+
+@dataclass(frozen=True, eq=True)
+class RenderTerrainEvent:
+    """Reports piecewise-linear terrain component of simulation to be drawn.
+
+    Terrain passes through breakpoints `(x[i], y[i])`, and extends beyond the
+    first and last breakpoints along the first and last segments.
+
+    See Also
+    --------
+    ApplyTerrain
+        Originates event.
+    """
+
+    x: typing.Tuple[float, ...]  # breakpoint x-coordinates, ascending
+    y: typing.Tuple[float, ...]  # breakpoint y-coordinates
+    flavor: typing.Literal["floor"] = "floor"  # default value
+
+    def get_terrain_y(self: "RenderTerrainEvent", x: float) -> float:
+        """Get terrain height at simulation-space x-coordinate."""
+        segment = int(
+            np.clip(np.searchsorted(self.x, x) - 1, 0, len(self.x) - 2)
+        )
+        x1, x2 = self.x[segment : segment + 2]
+        y1, y2 = self.y[segment : segment + 2]
+        return y1 + (y2 - y1) / (x2 - x1) * (x - x1)
+
+    def get_underfloor_polygon(
+        self: "RenderTerrainEvent",
+        xlim: typing.Tuple[float, float],
+        ylim: typing.Tuple[float, float],
+        scale: float,
+    ) -> typing.List[typing.Tuple[float, float]]:
+        """Get points to render terrain as a polygon within a viewing window.
+
+        Parameters
+        ----------
+        xlim: tuple[float, float]
+            The simulation-space x bounds of viewing window, in ascending order.
+        ylim: tuple[float, float]
+            The simulation-space y bounds of viewing window, in ascending order.
+        scale: float
+            Scale-up factor between simulation space and render space.
+
+        Returns
+        -------
+        list[tuple[float, float]]
+            Underfloor fill vertices as list of (x, y) tuples in render space.
+
+            If underfloor fill falls entirely outside viewing window, an empty
+            list is returned.
+
+        Notes
+        -----
+        Assumes origin of render space falls at the viewing window's upper-left
+        corner. Surface vertices below the viewing window are raised to its
+        lower bound.
+        """
+        x1, x2 = xlim
+        if x2 - x1 < 0:
+            raise ValueError
+        y1, y2 = ylim
+        if y2 - y1 < 0:
+            raise ValueError
+
+        # surface vertices at window edges and at breakpoints within window
+        surface_x = [x1, *(x for x in self.x if x1 < x < x2), x2]
+        surface_y = [self.get_terrain_y(x) for x in surface_x]
+
+        # terrain is completely below viewing window
+        if all(y <= y1 for y in surface_y):
+            return []
+
+        return [
+            (0, 0),
+            *(
+                ((x - x1) * scale, (max(y, y1) - y1) * scale)
+                for x, y in zip(surface_x, surface_y)
+            ),
+            ((x2 - x1) * scale, 0),
+        ]
@@ -1,9 +1,11 @@
 from .EventBuffer import EventBuffer
 from .RenderFloorEvent import RenderFloorEvent
+from .RenderTerrainEvent import RenderTerrainEvent
 from .RenderThresholdEvent import RenderThresholdEvent
 
 __all__ = [
     "EventBuffer",
     "RenderFloorEvent",
+    "RenderTerrainEvent",
     "RenderThresholdEvent",
 ]
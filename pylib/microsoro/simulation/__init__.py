@@ -1,8 +1,14 @@
+from .compile_regimen import compile_regimen
 from .get_default_update_regimen import get_default_update_regimen
+from .perform_arena_simulation import perform_arena_simulation
+from .perform_batch_simulation import perform_batch_simulation
 from .perform_simulation import perform_simulation
 
 
 __all__ = [
+    "compile_regimen",
     "get_default_update_regimen",
+    "perform_arena_simulation",
+    "perform_batch_simulation",
     "perform_simulation",
 ]
@@ -0,0 +1,152 @@
+import typing
+
+from .. import components
+
+
+# known components that only update state or events, and never halt
+_pure_update_component_types = (
+    components.ApplyAdaptiveTimestep,
+    components.ApplyFloorBounce,
+    components.ApplyGravity,
+    components.ApplyHalfTimestep,
+    components.ApplyIncrementElapsedTime,
+    components.ApplyMultilevel,
+    components.ApplyObstacleSDF,
+    components.ApplySelfCollision,
+    components.ApplySpringDampingCol,
+    components.ApplySpringDampingRow,
+    components.ApplySpringGraph,
+    components.ApplySpringNetwork,
+    components.ApplySpringNetworkImplicit,
+    components.ApplySpringNetworkMultiprocess,
+    components.ApplySpringNetworkSleeping,
+    components.ApplySpringNetworkTiled,
+    components.ApplySpringsCol,
+    components.ApplySpringsDiagAsc,
+    components.ApplySpringsDiagDesc,
+    components.ApplySpringsRow,
+    components.ApplyTerrain,
+    components.ApplyVelocity,
+    components.ApplyViscousLayer,
+    components.ClearEventBuffer,
+    components.NopComponent,
+)
+
+_spring_component_types = (
+    components.ApplySpringsCol,
+    components.ApplySpringsDiagAsc,
+    components.ApplySpringsDiagDesc,
+    components.ApplySpringsRow,
+)
+
+
+def _is_spring_network(run: typing.Sequence[typing.Callable]) -> bool:
+    """Is `run` exactly the six spring and spring damping components fused by
+    `ApplySpringNetwork`, sharing params and structure?
+
+    Springs only read positions, so may appear in any order. Damping reads
+    velocities, so must be applied column then row.
+    """
+    if len(run) != 6:
+        return False
+    *springs, damping_col, damping_row = run
+    return (
+        {type(spring) for spring in springs} == {*_spring_component_types}
+        and type(damping_col) is components.ApplySpringDampingCol
+        and type(damping_row) is components.ApplySpringDampingRow
+        and all(
+            component._params is run[0]._params
+            and component._structure is run[0]._structure
+            for component in run
+        )
+    )
+
+
+def _fuse_update_run(
+    run: typing.Sequence[typing.Callable],
+) -> typing.List[typing.Callable]:
+    """Rewrite a run of adjacent pure-update components into an equivalent,
+    shorter sequence of fused components."""
+    res = []
+    index = 0
+    while index < len(run):
+        component = run[index]
+        window = run[index : index + 6]
+        if _is_spring_network(window):
+            res.append(
+                components.ApplySpringNetwork(
+                    component._params, component._structure
+                ),
+            )
+            index += len(window)
+        else:
+            if type(component) is not components.NopComponent:  # drop no-ops
+                res.append(component)
+            index += 1
+
+    return res
+
+
+def compile_regimen(
+    update_regimen_components: typing.Sequence[typing.Callable],
+) -> typing.Callable:
+    """Compile update regimen into a single callable step component.
+
+    Adjacent known pure-update components (i.e., those from
+    `components.update`, along with `ClearEventBuffer` and `NopComponent`) are
+    merged into fused stages. Within these stages, the four spring components
+    followed by column and row spring damping are replaced with a single
+    vectorized `ApplySpringNetwork`, and no-ops are dropped. Other components,
+    such as halting and observer components, are called as-is in between
+    fused stages.
+
+    Parameters
+    ----------
+    update_regimen_components : list[Callable]
+        Sequence of callable components to be applied each update step.
+
+    Returns
+    -------
+    Callable
+        Component with signature `step(state, event_buffer)` that applies
+        the update regimen once, returning the first non-None component
+        return value, if any.
+
+    Notes
+    -----
+    Spring components are fused only if they share the same `Params` and
+    `Structure` instances, as set up by `get_default_update_regimen`.
+
+    Because compiled regimens are a single component, `perform_simulation`
+    checks State validity once per update step rather than after every
+    component. Validation failures report the compiled step as the offending
+    component.
+
+    Examples
+    --------
+    >>> perform_simulation(
+        update_regimen_components=[
+            compile_regimen(
+                [*get_default_update_regimen(), HaltAfterElapsedTime(10.0)],
+            ),
+        ],
+    )
+    """
+    stages = []
+    run = []
+    for component in [*update_regimen_components, None]:  # None flushes run
+        if isinstance(component, _pure_update_component_types):
+            run.append(component)
+            continue
+
+        fused_run = _fuse_update_run(run)
+        if len(fused_run) == 1:
+            stages.extend(fused_run)
+        elif fused_run:
+            stages.append(components.BundleComponents(*fused_run))
+        run = []
+
+        if component is not None:
+            stages.append(component)
+
+    return components.BundleComponents(*stages)
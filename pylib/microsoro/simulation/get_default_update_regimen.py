@@ -1,13 +1,29 @@
+import copy
 import typing
 
+from ..BatchStructure import BatchStructure
+from ..Coarsening import Coarsening
+from ..GraphStructure import GraphStructure
 from ..Params import Params
 from ..Structure import Structure
+from ..Workspace import Workspace
 from .. import components
 
 
+_integrators = ("explicit", "implicit", "verlet")
+
+
 def get_default_update_regimen(
     params: typing.Optional[Params] = None,
-    structure: typing.Optional[Structure] = None,
+    structure: typing.Union[
+        Structure, BatchStructure, GraphStructure, None
+    ] = None,
+    integrator: str = "explicit",
+    auto_dt: bool = False,
+    num_tiles: typing.Optional[int] = None,
+    num_processes: typing.Optional[int] = None,
+    coarsen_factor: typing.Optional[int] = None,
+    sleep_threshold: typing.Optional[float] = None,
 ) -> typing.List[typing.Callable]:
     """Lists core simulation components as ordered, callable objects.
 
@@ -16,6 +32,81 @@ def get_default_update_regimen(
     params : Params, optional
         Configuration parameters for the update regimen. If not provided,
         a default `Params` instance will be used.
+    structure : Structure, BatchStructure, or GraphStructure, optional
+        Cell and inter-cell configuration for the update regimen. If not
+        provided, a default `Structure` instance will be used.
+
+        Components built from a `BatchStructure` operate on `BatchState`.
+        Springs of a `GraphStructure` are applied by a single
+        `ApplySpringGraph`, in place of per-family spring components.
+    integrator : str, default "explicit"
+        Integration scheme for spring and spring damping forces.
+
+        - "explicit": semi-implicit Euler, applying each spring family and
+          damping direction as separate components.
+        - "implicit": linearized backward Euler via a single
+          `ApplySpringNetworkImplicit`, which remains stable at much larger
+          `params.dt` for stiff springs and light cells.
+        - "verlet": velocity Verlet, applying gravity and springs as
+          half-step kicks (via `ApplyHalfTimestep`) on either side of
+          `ApplyVelocity`. Second-order accurate, with velocity synchronized
+          to position, so energy is conserved much more closely at a given
+          `params.dt`, at the cost of evaluating forces twice per step.
+    auto_dt : bool, default False
+        Should timestep size be set to the largest expected to keep
+        integration stable for `structure` (see `Structure.stable_dt`),
+        instead of `params.dt`?
+
+        If set, components share a copy of `params` with adjusted `dt`, so
+        `params` itself is left unchanged.
+    num_tiles : int, optional
+        If provided, springs and spring damping are applied by a single
+        `ApplySpringNetworkTiled`, which splits the grid into `num_tiles` row
+        bands processed concurrently on a thread pool. Under "explicit"
+        integration, positions are advanced within the same tiled pass.
+
+        Worthwhile only for large grids (i.e., 1024x1024).
+    num_processes : int, optional
+        If provided, springs and spring damping are applied by a single
+        `ApplySpringNetworkMultiprocess`, which decomposes the grid into
+        `num_processes` row blocks stepped by worker processes over shared
+        memory. Under "explicit" integration, positions are advanced within
+        workers.
+
+        Worthwhile only for very large grids (i.e., 4096x4096).
+    coarsen_factor : int, optional
+        If provided, a single `ApplyMultilevel` is returned, which steps a
+        lattice coarsened by merging `coarsen_factor` x `coarsen_factor`
+        blocks of cells (see `Coarsening`) while gross motion suffices, and
+        switches to the full regimen while strain or floor contact demands
+        it. Other arguments apply to both levels, except `num_tiles`,
+        `num_processes`, and `sleep_threshold`, which apply to the full
+        regimen only.
+
+        For screening evaluations, where gross motion (i.e., distance
+        traveled) matters more than fine-scale detail.
+    sleep_threshold : float, optional
+        If provided, springs, spring damping, and velocity are applied by a
+        single `ApplySpringNetworkSleeping`, which skips row tiles whose
+        kinetic energy per cell stays below `sleep_threshold`, until they are
+        disturbed. If `num_tiles` is also provided, it sets the number of
+        tiles.
+
+        Worthwhile for large bodies that spend most of simulation resting
+        on the floor.
+
+    Raises
+    ------
+    ValueError
+        If `integrator` is not recognized, if "implicit" is requested for a
+        `GraphStructure`, or if `auto_dt` is requested for "implicit", which
+        is stable for any `params.dt`. Also, if `num_tiles` or `num_processes`
+        is requested for "implicit" or for a `GraphStructure` or
+        `BatchStructure`, or if both are requested. Also, if
+        `coarsen_factor` is requested for a `GraphStructure` or
+        `BatchStructure`. Also, if `sleep_threshold` is requested for other
+        than "explicit", for a `GraphStructure` or `BatchStructure`, or
+        alongside `num_processes`.
 
     Returns
     -------
@@ -24,24 +115,165 @@ def get_default_update_regimen(
 
     Notes
     -----
+    Components share a single `Workspace` for scratch buffers, so update steps
+    do not allocate arrays once buffers are warmed up.
+
+    Measured on a default 8x8 structure, spinning and stretched without spring
+    damping, over 1 second of free flight under gravity: at `dt=1e-3`, maximum
+    energy error was 114 under "explicit" versus 3.4 under "verlet", with
+    "verlet" at `dt=4e-3` (56) still better than "explicit" at `dt=1e-3`.
+    Throughput per step was about 4000 versus 2400 steps per second, so
+    "verlet" reaches a given energy accuracy about 2x faster.
+
+    With `coarsen_factor`, see `ApplyMultilevel` for measured speedups.
+
     Does not include any halting component to terminate simulation. Users
     should append an appropriate halting component for their application.
     """
+    if integrator not in _integrators:
+        raise ValueError(f"{integrator=} not one of {_integrators}")
+
+    if integrator == "implicit" and isinstance(structure, GraphStructure):
+        raise ValueError(f"{integrator=} not supported for GraphStructure")
+
+    if auto_dt and integrator == "implicit":
+        raise ValueError(f"{auto_dt=} not supported for {integrator=}")
+
+    is_decomposed = num_tiles is not None or num_processes is not None
+    if num_tiles is not None and num_processes is not None:
+        raise ValueError(f"{num_tiles=} and {num_processes=} both requested")
+    if is_decomposed and (
+        integrator == "implicit"
+        or isinstance(structure, (BatchStructure, GraphStructure))
+    ):
+        raise ValueError(
+            f"{num_tiles=} and {num_processes=} not supported for "
+            f"{integrator=} or {type(structure).__name__}",
+        )
+
+    if coarsen_factor is not None and isinstance(
+        structure, (BatchStructure, GraphStructure)
+    ):
+        raise ValueError(
+            f"{coarsen_factor=} not supported for {type(structure).__name__}"
+        )
+
+    if sleep_threshold is not None and (
+        integrator != "explicit"
+        or isinstance(structure, (BatchStructure, GraphStructure))
+        or num_processes is not None
+    ):
+        raise ValueError(
+            f"{sleep_threshold=} not supported for {integrator=}, "
+            f"{type(structure).__name__}, or {num_processes=}",
+        )
+
     if params is None:
         params = Params()
     if structure is None:
         structure = Structure(params=params)
+    if auto_dt:
+        params = copy.copy(params)
+        params.dt = structure.stable_dt(params)
+
+    if coarsen_factor is not None:
+        coarsening = Coarsening(structure, coarsen_factor)
+        fine_components = get_default_update_regimen(
+            params,
+            structure,
+            integrator,
+            num_tiles=num_tiles,
+            num_processes=num_processes,
+            sleep_threshold=sleep_threshold,
+        )
+        coarse_components = get_default_update_regimen(
+            params, coarsening.structure, integrator
+        )
+        return [
+            components.ApplyMultilevel(
+                fine_components, coarse_components, coarsening, params
+            ),
+        ]
+
+    workspace = Workspace()
+
+    if sleep_threshold is not None:
+        spring_components = [
+            components.ApplySpringNetworkSleeping(
+                params,
+                structure,
+                num_tiles,
+                sleep_threshold=sleep_threshold,
+                workspace=workspace,
+            ),
+        ]
+    elif num_tiles is not None:
+        spring_components = [
+            components.ApplySpringNetworkTiled(
+                params,
+                structure,
+                num_tiles,
+                apply_velocity=integrator == "explicit",
+            ),
+        ]
+    elif num_processes is not None:
+        spring_components = [
+            components.ApplySpringNetworkMultiprocess(
+                params,
+                structure,
+                num_processes,
+                apply_velocity=integrator == "explicit",
+            ),
+        ]
+    elif integrator == "implicit":
+        spring_components = [
+            components.ApplySpringNetworkImplicit(params, structure),
+        ]
+    elif isinstance(structure, GraphStructure):
+        spring_components = [components.ApplySpringGraph(params, structure)]
+    elif integrator == "verlet":
+        spring_components = [
+            components.ApplySpringNetwork(params, structure, workspace),
+        ]
+    else:
+        spring_components = [
+            components.ApplySpringsCol(params, structure, workspace),
+            components.ApplySpringsRow(params, structure, workspace),
+            components.ApplySpringsDiagAsc(params, structure, workspace),
+            components.ApplySpringsDiagDesc(params, structure, workspace),
+            components.ApplySpringDampingCol(params, structure, workspace),
+            components.ApplySpringDampingRow(params, structure, workspace),
+        ]
+
+    if integrator == "verlet":
+        force_components = [
+            components.ApplyGravity(params),
+            *spring_components,
+        ]
+        return [
+            components.ClearEventBuffer(),  # 1st so handle events after
+            components.ApplyHalfTimestep(force_components, params),
+            components.ApplyVelocity(params, workspace),
+            components.ApplyHalfTimestep(force_components, params),
+            components.ApplyFloorBounce(workspace=workspace),
+            components.ApplyIncrementElapsedTime(params),
+        ]
+
+    if is_decomposed or sleep_threshold is not None:
+        # velocity applied within spring component
+        return [
+            components.ClearEventBuffer(),  # 1st so handle events after
+            components.ApplyGravity(params),
+            *spring_components,
+            components.ApplyFloorBounce(workspace=workspace),
+            components.ApplyIncrementElapsedTime(params),
+        ]
 
     return [
         components.ClearEventBuffer(),  # 1st (not last) so handle events after
         components.ApplyGravity(params),
-        components.ApplySpringsCol(params, structure),
-        components.ApplySpringsRow(params, structure),
-        components.ApplySpringsDiagAsc(params, structure),
-        components.ApplySpringsDiagDesc(params, structure),
-        components.ApplySpringDampingCol(params, structure),
-        components.ApplySpringDampingRow(params, structure),
-        components.ApplyVelocity(params),
-        components.ApplyFloorBounce(),
+        *spring_components,
+        components.ApplyVelocity(params, workspace),
+        components.ApplyFloorBounce(workspace=workspace),
         components.ApplyIncrementElapsedTime(params),
     ]
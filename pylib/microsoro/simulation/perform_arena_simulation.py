@@ -0,0 +1,162 @@
+import typing
+
+from ..components import ApplyBodyContact, HaltAfterElapsedTime
+from ..conditioners import ApplyTranslate
+from ..events import EventBuffer
+from ..State import State
+from .get_default_update_regimen import get_default_update_regimen
+
+
+def _default_update_regimen_factory(
+    structure: typing.Any,
+) -> typing.List[typing.Callable]:
+    return [
+        *get_default_update_regimen(structure=structure),
+        HaltAfterElapsedTime(10.0),
+    ]
+
+
+def _make_default_setup_regimens(
+    structures: typing.Sequence[typing.Any],
+    gap: float = 2.0,
+) -> typing.List[typing.List[typing.Callable]]:
+    """Place bodies side by side along x, `gap` apart, translated as in
+    `perform_simulation` defaults."""
+    res = []
+    dpx = 0.0
+    for structure in structures:
+        res.append([ApplyTranslate(dpx=dpx, dpy=-5.0)])
+        dpx += structure.width - 1 + gap
+    return res
+
+
+def perform_arena_simulation(
+    structures: typing.Sequence[typing.Any],
+    setup_regimen_conditioners: typing.Optional[
+        typing.Sequence[typing.List[typing.Callable]]
+    ] = None,
+    update_regimen_factory: typing.Optional[
+        typing.Callable[[typing.Any], typing.List[typing.Callable]]
+    ] = None,
+    contact_component: typing.Optional[typing.Callable] = None,
+) -> typing.List[typing.Any]:
+    """Perform simulation of several soft bodies interacting in a shared
+    world.
+
+    Multi-body counterpart to `perform_simulation`. Each body has its own
+    `State`, structure, and update regimen, and may differ in height and
+    width. Each update step, contact between bodies is applied first, then
+    body update regimens are stepped in lockstep, component by component,
+    sharing one event buffer. So, world components (i.e., floors and
+    `ClearEventBuffer`) at the same position in each regimen act together.
+
+    A body halts at its first update component to return a non-None value.
+    Halted bodies are removed from the arena, and no longer take part in
+    contact. Remaining bodies complete the current update step. Simulation
+    continues until all bodies have halted.
+
+    Parameters
+    ----------
+    structures : list[Structure or GraphStructure]
+        Structure of each body.
+    setup_regimen_conditioners : list[list[Callable]], optional
+        Sequence of callable conditioners to set up the initial state of each
+        body, one sequence per body.
+
+        If not specified, default behavior will place bodies side by side
+        along x, two units apart, with a translation of `dpy=-5.0`.
+    update_regimen_factory : Callable, optional
+        Creates sequence of callable components to be applied to a body's
+        State each update loop, given the body's structure.
+
+        Called once per body. Regimens may differ (e.g., in spring
+        components for lattice and graph structures), but should have world
+        components in matching positions. Defaults to
+        `get_default_update_regimen()` components, halting after 10 seconds
+        of simulation time, which gives all bodies the same floors.
+    contact_component : Callable, optional
+        Applies contact between bodies, called with sequences of State and
+        of structures for bodies remaining in the arena and with the event
+        buffer.
+
+        Defaults to `ApplyBodyContact()`.
+
+    Raises
+    ------
+    AssertionError
+        If State is invalid after any conditioner or component, with that
+        conditioner or component as argument.
+    ValueError
+        If there is not one setup regimen per body.
+
+    Returns
+    -------
+    list
+        Halting result for each body, in order of `structures`.
+
+    Examples
+    --------
+    >>> perform_arena_simulation(
+        [Structure.make_random(), Structure.make_random(6, 10)],
+        update_regimen_factory=lambda structure: [
+            *get_default_update_regimen(structure=structure),
+            EvaluateDuration(HaltPastFinishLine()),
+        ],
+    )
+    """
+
+    # setup defaults as necessary
+    if setup_regimen_conditioners is None:
+        setup_regimen_conditioners = _make_default_setup_regimens(structures)
+    if len(setup_regimen_conditioners) != len(structures):
+        raise ValueError(
+            f"{len(setup_regimen_conditioners)=} must match "
+            f"{len(structures)=}",
+        )
+
+    if update_regimen_factory is None:
+        update_regimen_factory = _default_update_regimen_factory
+
+    if contact_component is None:
+        contact_component = ApplyBodyContact()
+
+    # perform setup individually using conditioner regimens
+    states = [
+        State(structure.height, structure.width, dtype=structure.dtype)
+        for structure in structures
+    ]
+    for state, conditioners in zip(states, setup_regimen_conditioners):
+        for conditioner in conditioners:
+            conditioner(state)
+            assert state.validate(), conditioner
+
+    update_regimens = [
+        update_regimen_factory(structure) for structure in structures
+    ]
+    num_components = max(map(len, update_regimens), default=0)
+
+    # perform simulation, looping until all bodies have halted
+    results = [None] * len(structures)
+    remaining_bodies = list(range(len(structures)))
+    event_buffer = EventBuffer()
+    while remaining_bodies:
+        contact_component(
+            [states[body] for body in remaining_bodies],
+            [structures[body] for body in remaining_bodies],
+            event_buffer,
+        )
+        for body in remaining_bodies:
+            assert states[body].validate(), contact_component
+
+        for component_index in range(num_components):
+            for body in [*remaining_bodies]:
+                if component_index >= len(update_regimens[body]):
+                    continue
+                component = update_regimens[body][component_index]
+                res = component(states[body], event_buffer)
+                assert states[body].validate(), component
+                if res is not None:
+                    results[body] = res
+                    remaining_bodies.remove(body)
+
+    return results
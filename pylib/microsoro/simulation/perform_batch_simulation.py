@@ -0,0 +1,140 @@
+import typing
+
+import numpy as np
+
+from ..BatchState import BatchState
+from ..BatchStructure import BatchStructure
+from ..components import HaltAfterElapsedTime
+from ..conditioners import ApplyTranslate
+from ..events import EventBuffer
+from ..State import State
+from ..Structure import Structure
+from .get_default_update_regimen import get_default_update_regimen
+
+
+def _default_update_regimen_factory(
+    structure: BatchStructure,
+) -> typing.List[typing.Callable]:
+    return [
+        *get_default_update_regimen(structure=structure),
+        HaltAfterElapsedTime(10.0),
+    ]
+
+
+def perform_batch_simulation(
+    structures: typing.Union[BatchStructure, typing.Sequence[Structure]],
+    setup_regimen_conditioners: typing.Optional[
+        typing.List[typing.Callable]
+    ] = None,
+    update_regimen_factory: typing.Optional[
+        typing.Callable[[BatchStructure], typing.List[typing.Callable]]
+    ] = None,
+) -> typing.List[typing.Any]:
+    """Perform simulation of a population of individuals in lockstep.
+
+    Batched counterpart to `perform_simulation`. Individual States are set up
+    separately using conditioners, then stacked into a `BatchState` that is
+    stepped by update components all at once.
+
+    Halting components receive the `BatchState` and report per-individual
+    results as a list, with None for individuals that should continue. Halted
+    individuals are dropped from the batch and their results are collected.
+    Remaining individuals complete the current update step.
+
+    Parameters
+    ----------
+    structures : BatchStructure or list[Structure]
+        Structure of each individual in population.
+
+        All individuals must share the same height and width.
+    setup_regimen_conditioners : list[Callable], optional
+        Sequence of callable conditioners to set up the initial state of each
+        individual.
+
+        If not specified, default behavior will apply a translation of
+        `dpy=-5.0`.
+    update_regimen_factory : Callable, optional
+        Creates sequence of batch-aware callable components to be applied to
+        simulation state each update loop, given the `BatchStructure` of
+        individuals remaining in the batch.
+
+        Called once initially, then again each time individuals halt and are
+        removed from the batch. Defaults to `get_default_update_regimen()`
+        components, halting after 10 seconds of simulation time.
+
+    Returns
+    -------
+    list
+        Halting result for each individual, in population order.
+
+    Examples
+    --------
+    >>> perform_batch_simulation(
+        [Structure.make_random() for __ in range(100)],
+        update_regimen_factory=lambda structure: [
+            *get_default_update_regimen(structure=structure),
+            EvaluateDuration(HaltPastFinishLine()),
+        ],
+    )
+    """
+
+    # setup defaults as necessary
+    if not isinstance(structures, BatchStructure):
+        structures = BatchStructure.from_structures(structures)
+    batch_structure = structures
+
+    if setup_regimen_conditioners is None:
+        setup_regimen_conditioners = [ApplyTranslate(dpy=-5.0)]
+
+    if update_regimen_factory is None:
+        update_regimen_factory = _default_update_regimen_factory
+
+    population_size = batch_structure.population_size
+    height, width = batch_structure.height, batch_structure.width
+
+    # perform setup individually using conditioner regimen
+    states = [
+        State(height, width, dtype=batch_structure.dtype)
+        for __ in range(population_size)
+    ]
+    for state in states:
+        for conditioner in setup_regimen_conditioners:
+            conditioner(state)
+            assert state.validate(), conditioner
+
+    batch_state = BatchState.from_states(states)
+
+    # perform simulation, looping until all individuals have halted
+    results = [None] * population_size
+    remaining_indices = np.arange(population_size)
+    update_regimen_components = update_regimen_factory(batch_structure)
+    event_buffer = EventBuffer()
+    while remaining_indices.size:
+        for component_index in range(len(update_regimen_components)):
+            component = update_regimen_components[component_index]
+            res = component(batch_state, event_buffer)
+            assert batch_state.validate(), component
+            if res is None:
+                continue
+
+            # collect results of halted individuals and remove from batch
+            halted = np.fromiter(
+                (individual_res is not None for individual_res in res),
+                dtype=bool,
+                count=len(res),
+            )
+            for batch_index in np.flatnonzero(halted):
+                results[remaining_indices[batch_index]] = res[batch_index]
+
+            remaining = ~halted
+            remaining_indices = remaining_indices[remaining]
+            if not remaining_indices.size:
+                break
+
+            batch_state = batch_state.select(remaining)
+            batch_structure = batch_structure.select(remaining)
+            update_regimen_components = update_regimen_factory(
+                batch_structure,
+            )
+
+    return results
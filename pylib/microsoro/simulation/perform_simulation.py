@@ -1,14 +1,39 @@
+import copy
 import typing
 
 from iterpop import iterpop as ip
+import numpy as np
 
 from ..components import HaltAfterElapsedTime
 from ..conditioners import ApplyTranslate
 from ..events import EventBuffer
+from ..GraphStructure import GraphStructure
+from ..Params import Params
 from ..State import State
+from ..Structure import Structure
+from .compile_regimen import _pure_update_component_types
 from .get_default_update_regimen import get_default_update_regimen
 
 
+_validation_policies = ("always", "every_n_steps", "on_halt_only", "off")
+
+
+def _find_invalidating_component(
+    snapshot: typing.Tuple[State, EventBuffer],
+    num_steps: int,
+    update_regimen_components: typing.List[typing.Callable],
+) -> typing.Optional[typing.Callable]:
+    """Replay update steps from a known-valid snapshot, checking State after
+    every component to find the first that produces invalid State."""
+    state, event_buffer = copy.deepcopy(snapshot)
+    for __ in range(num_steps):
+        for component in update_regimen_components:
+            component(state, event_buffer)
+            if not state.validate():
+                return component
+    return None
+
+
 def perform_simulation(
     setup_regimen_conditioners: typing.Optional[
         typing.List[typing.Callable]
@@ -17,6 +42,16 @@ def perform_simulation(
         typing.List[typing.Callable]
     ] = None,
     yield_intermediate_states: bool = False,
+    validation: str = "always",
+    validation_interval: int = 1,
+    check_every: int = 1,
+    dtype: typing.Union[np.dtype, type, str, None] = None,
+    structure: typing.Union[Structure, GraphStructure, None] = None,
+    auto_dt: bool = False,
+    num_tiles: typing.Optional[int] = None,
+    num_processes: typing.Optional[int] = None,
+    coarsen_factor: typing.Optional[int] = None,
+    sleep_threshold: typing.Optional[float] = None,
 ) -> typing.Union[State, typing.Any, typing.Iterator]:
     """Perform simulation through composition of callable ingredients.
 
@@ -45,6 +80,115 @@ def perform_simulation(
     yield_intermediate_states : bool, default False
         Should intermediate state instances be yielded from the simulation loop? Defaults to False.
 
+    validation : str, default "always"
+        When should State be checked for invalid (i.e., NaN) values? One of
+        "always", "every_n_steps", "on_halt_only", or "off":
+
+        - "always": after every component, every update step.
+        - "every_n_steps": after every `validation_interval` update steps,
+          and when simulation halts.
+        - "on_halt_only": only when simulation halts.
+        - "off": never.
+
+        Under "every_n_steps" and "on_halt_only", if invalid State is
+        detected, update steps since the last successful check are replayed
+        from a snapshot with checks after every component, in order to report
+        which component produced invalid State. Replay requires components to
+        be deterministic, and will repeat any side effects they have.
+
+    validation_interval : int, default 1
+        Number of update steps between checks under "every_n_steps" policy.
+
+    check_every : int, default 1
+        Number of update steps to advance between halting checks.
+
+        If greater than 1, known pure-update components (see
+        `compile_regimen`) are applied for `check_every` steps without calling
+        other components. Other components are then called once to check for
+        halt. If any returns non-None, simulation is rolled back to a snapshot
+        taken at the start of the chunk and replayed step by step with all
+        components, so halting results exactly match `check_every=1`.
+
+        Assumes halting conditions are monotonic, i.e., once triggered they
+        remain triggered through the end of a chunk (e.g., elapsed time
+        passing a threshold). Non-halting components, such as observers, are
+        only called at chunk ends (and again during any replay), and
+        intermediate states are only yielded at chunk ends.
+
+    dtype : np.dtype, type, or str, optional
+        Floating point type of simulation State arrays, i.e., "float32" for
+        single precision simulation.
+
+        Defaults to `defaults.dtype` (float64). Default update regimen
+        components are built with `Params(dtype=dtype)`. User-specified
+        regimens should be built from a matching `Params`.
+
+        Elapsed time `t` is kept in double precision. Under the default
+        update regimen with random structures, float32 cell positions drift
+        from float64 by less than 1e-4 over one second of simulation and
+        about 1e-2 over five seconds, and `EvaluateDuration` fitnesses match
+        to within a timestep (see `test_perform_simulation_float32_drift`).
+        Float32 steps are about 1.8x faster for 256x256 structures, but no
+        faster for small (i.e., 8x8) structures, where per-component overhead
+        dominates.
+
+    structure : Structure or GraphStructure, optional
+        Cell and inter-cell configuration for default update regimen
+        components, which also sets State shape.
+
+        If not provided, a default `Structure` instance will be used.
+        User-specified regimens should be built from `structure` directly.
+
+    auto_dt : bool, default False
+        Should default update regimen components use the largest timestep
+        size expected to keep integration stable for `structure`, instead of
+        `defaults.dt`?
+
+        See `Structure.stable_dt`. For user-specified regimens, use
+        `get_default_update_regimen(..., auto_dt=True)` instead.
+
+    num_tiles : int, optional
+        If provided, default update regimen components split spring, spring
+        damping, and velocity updates into `num_tiles` row bands processed
+        concurrently on a thread pool. Worthwhile only for large structures.
+
+        See `ApplySpringNetworkTiled`.
+
+    num_processes : int, optional
+        If provided, default update regimen components split spring, spring
+        damping, and velocity updates into `num_processes` row blocks stepped
+        by worker processes over shared memory. Worthwhile only for very large
+        structures.
+
+        See `ApplySpringNetworkMultiprocess`.
+
+    coarsen_factor : int, optional
+        If provided, default update regimen components step a lattice
+        coarsened by `coarsen_factor` while gross motion suffices, refining
+        to the full lattice while strain or floor contact demands it. For
+        screening evaluations, where fine-scale detail is not needed.
+
+        See `ApplyMultilevel`.
+
+    sleep_threshold : float, optional
+        If provided, default update regimen components skip spring, spring
+        damping, and velocity updates for row tiles whose kinetic energy per
+        cell stays below `sleep_threshold`, until they are disturbed. For
+        large structures resting on the floor for much of simulation.
+
+        See `ApplySpringNetworkSleeping`.
+
+    Raises
+    ------
+    AssertionError
+        If validation detects invalid State, with the component that produced
+        it as argument.
+    ValueError
+        If `validation` is not a recognized policy, or if `validation_interval`
+        or `check_every` is not positive. Also, if `structure`, `auto_dt`,
+        `num_tiles`, `num_processes`, `coarsen_factor`, or `sleep_threshold`
+        is provided alongside `update_regimen_components`.
+
     Returns
     -------
     State, Any, Iterator
@@ -64,33 +208,155 @@ def perform_simulation(
 
     """
 
+    if validation not in _validation_policies:
+        raise ValueError(f"{validation=} not one of {_validation_policies}")
+    if validation_interval < 1:
+        raise ValueError(f"{validation_interval=} must be positive")
+    if check_every < 1:
+        raise ValueError(f"{check_every=} must be positive")
+
     # setup defaults as necessary
     if setup_regimen_conditioners is None:
         setup_regimen_conditioners = [ApplyTranslate(dpy=-5.0)]
 
     if update_regimen_components is None:
+        params = Params(dtype=dtype)
+        if structure is None:
+            structure = Structure(params=params)
         update_regimen_components = [
-            *get_default_update_regimen(),
+            *get_default_update_regimen(
+                params,
+                structure,
+                auto_dt=auto_dt,
+                num_tiles=num_tiles,
+                num_processes=num_processes,
+                coarsen_factor=coarsen_factor,
+                sleep_threshold=sleep_threshold,
+            ),
             HaltAfterElapsedTime(10.0),
         ]
+    elif (
+        structure is not None
+        or auto_dt
+        or num_tiles is not None
+        or num_processes is not None
+        or coarsen_factor is not None
+        or sleep_threshold is not None
+    ):
+        raise ValueError(
+            f"{auto_dt=}, {num_tiles=}, {num_processes=}, {coarsen_factor=}, "
+            f"{sleep_threshold=}, and structure only apply to default update "
+            "regimen",
+        )
 
-    state = State()
+    if structure is None:
+        state = State(dtype=dtype)
+    else:
+        state = State(structure.height, structure.width, dtype=dtype)
 
     # perform setup using conditioner regimen
     for conditioner in setup_regimen_conditioners:
         conditioner(state)
         assert state.validate(), conditioner
 
+    # under chunked execution, known pure-update components advance several
+    # steps between calls to other (i.e., halting) components
+    update_components = [
+        component
+        for component in update_regimen_components
+        if isinstance(component, _pure_update_component_types)
+    ]
+    checking_components = [
+        component
+        for component in update_regimen_components
+        if not isinstance(component, _pure_update_component_types)
+    ]
+
     # perform simulation, looping until a component returns non-None
     def do_run() -> typing.Iterable:
+        nonlocal state
         event_buffer = EventBuffer()
+
+        # last validated state, from which to replay if validation fails
+        snapshot = None
+        if validation in ("every_n_steps", "on_halt_only"):
+            snapshot = copy.deepcopy((state, event_buffer))
+        num_unvalidated_steps = 0
+
+        def check_unvalidated_steps() -> None:
+            if not state.validate():
+                component = _find_invalidating_component(
+                    snapshot, num_unvalidated_steps, update_regimen_components
+                )
+                raise AssertionError(
+                    component
+                    or f"invalid state within {num_unvalidated_steps} steps",
+                )
+
+        def do_step(components: typing.List[typing.Callable]) -> typing.Any:
+            nonlocal snapshot, num_unvalidated_steps
+            num_unvalidated_steps += 1
+            for component in components:
+                res = component(state, event_buffer)
+                if validation == "always":
+                    assert state.validate(), component
+                if res is not None:
+                    if snapshot is not None:
+                        check_unvalidated_steps()
+                    return res
+
+            if (
+                validation == "every_n_steps"
+                and num_unvalidated_steps >= validation_interval
+            ):
+                check_unvalidated_steps()
+                snapshot = copy.deepcopy((state, event_buffer))
+                num_unvalidated_steps = 0
+
+            return None
+
         while True:
-            for component in update_regimen_components:
+            if check_every == 1:
+                res = do_step(update_regimen_components)
+                if res is not None:
+                    yield res
+                    return
+                if yield_intermediate_states:
+                    yield state
+                continue
+
+            # advance chunk without checking for halt
+            chunk_snapshot = copy.deepcopy(
+                (state, event_buffer, snapshot, num_unvalidated_steps),
+            )
+            for __ in range(check_every):
+                do_step(update_components)
+
+            for component in checking_components:
                 res = component(state, event_buffer)
-                assert state.validate(), component
+                if validation == "always":
+                    assert state.validate(), component
+                if res is not None:
+                    break
+            else:
+                if yield_intermediate_states:
+                    yield state
+                continue
+
+            # halt occurred within chunk, so roll back and replay chunk step
+            # by step to find exact halting step
+            (
+                state,
+                event_buffer,
+                snapshot,
+                num_unvalidated_steps,
+            ) = chunk_snapshot
+            for __ in range(check_every):
+                res = do_step(update_regimen_components)
                 if res is not None:
                     yield res
                     return
+
             if yield_intermediate_states:
                 yield state
 
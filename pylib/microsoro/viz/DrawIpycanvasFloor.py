@@ -4,7 +4,7 @@ from ipycanvas import Canvas as ipy_Canvas
 from ipycanvas import hold_canvas as ipy_hold_canvas
 
 from ...auxlib import decorate_with_context
-from ..events import RenderFloorEvent
+from ..events import RenderFloorEvent, RenderTerrainEvent
 from .Style import Style
 
 
@@ -44,13 +44,13 @@ class DrawIpycanvasFloor:
     @decorate_with_context(ipy_hold_canvas, idempotify_decorated_context=True)
     def __call__(
         self: "DrawIpycanvasFloor",
-        event: RenderFloorEvent,
+        event: typing.Union[RenderFloorEvent, RenderTerrainEvent],
     ) -> ipy_Canvas:
         """Draw floor to ipycanvas Canvas.
 
         Parameters
         ----------
-        event : RenderFloorEvent
+        event : RenderFloorEvent or RenderTerrainEvent
             The event object containing floor details.
 
         Returns
@@ -3,7 +3,7 @@ import typing
 from pyglet.graphics import Batch as pyg_Batch
 from pyglet.shapes import Polygon as pyg_Polygon
 
-from ..events import RenderFloorEvent
+from ..events import RenderFloorEvent, RenderTerrainEvent
 from .Style import Style
 
 
@@ -30,13 +30,13 @@ class DrawPygletFloor:
 
     def __call__(
         self: "DrawPygletFloor",
-        event: RenderFloorEvent,
+        event: typing.Union[RenderFloorEvent, RenderTerrainEvent],
     ) -> pyg_Batch:
         """Setup pyglet render of floor.
 
         Parameters
         ----------
-        event : RenderFloorEvent
+        event : RenderFloorEvent or RenderTerrainEvent
             The event object with floor details.
 
         Returns
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from pylib.microsoro import BatchState, State
+from pylib.microsoro.conditioners import ApplyPropel, ApplyTranslate
+
+
+def test_init():
+    batch_state = BatchState(3, height=8, width=10)
+    assert batch_state.validate()
+
+    assert batch_state.population_size == 3
+    assert batch_state.height == 8
+    assert batch_state.width == 10
+    assert batch_state.ncells == 80
+
+    for attr in ["px", "py", "vx", "vy"]:
+        assert getattr(batch_state, attr).shape == (3, 8, 10)
+    assert batch_state.t.shape == (3,)
+
+    for index in range(3):
+        assert batch_state.get_state(index) == State(height=8, width=10)
+
+
+def test_init_invalid():
+    with pytest.raises(ValueError):
+        BatchState(-1)
+
+    with pytest.raises(ValueError):
+        BatchState(3, height=0)
+
+
+def test_eq():
+    assert BatchState(3) == BatchState(3)
+    assert BatchState(3) != BatchState(4)
+    assert BatchState(3, height=4) != BatchState(3)
+
+    batch_state = BatchState(3)
+    batch_state.vx[1, 0, 0] = 4.2
+    assert batch_state == batch_state
+    assert batch_state != BatchState(3)
+
+    batch_state = BatchState(3)
+    batch_state.t[2] = 4.2
+    assert batch_state != BatchState(3)
+
+
+def test_from_states_get_state():
+    states = [State(height=4, width=5) for __ in range(3)]
+    ApplyTranslate(dpx=1.0)(states[0])
+    ApplyPropel(dvy=-2.0)(states[2])
+    states[1].t = 4.2
+
+    batch_state = BatchState.from_states(states)
+    assert batch_state.population_size == 3
+    for index, state in enumerate(states):
+        assert batch_state.get_state(index) == state
+
+    # should be copies
+    batch_state.px[0, 0, 0] = 42.0
+    assert batch_state.get_state(0) != states[0]
+    assert batch_state.get_state(0).px[0, 0] == 42.0
+    state = batch_state.get_state(0)
+    state.px[0, 0] = 0.0
+    assert batch_state.px[0, 0, 0] == 42.0
+
+    with pytest.raises(ValueError):
+        BatchState.from_states([])
+
+
+def test_select():
+    states = [State() for __ in range(4)]
+    for index, state in enumerate(states):
+        ApplyTranslate(dpx=index)(state)
+        state.t = float(index)
+    batch_state = BatchState.from_states(states)
+
+    selected = batch_state.select(np.array([True, False, False, True]))
+    assert selected.population_size == 2
+    assert selected.get_state(0) == states[0]
+    assert selected.get_state(1) == states[3]
+    assert batch_state == BatchState.from_states(states)
+
+
+@pytest.mark.parametrize("array_name", ["px", "py", "vx", "vy"])
+def test_validate_with_nans(array_name: str):
+    batch_state = BatchState(3)
+    array = getattr(batch_state, array_name)
+    array[2, 0, 0] = np.nan
+    assert not batch_state.validate()
+
+
+def test_validate_with_bad_time():
+    batch_state = BatchState(3)
+    batch_state.t[1] = np.nan
+    assert not batch_state.validate()
+
+    batch_state = BatchState(3)
+    batch_state.t[1] = -1
+    assert not batch_state.validate()
+
+
+def test_dtype():
+    batch_state = BatchState(3, dtype=np.float32)
+    assert batch_state.dtype == np.float32
+    for arr in batch_state.px, batch_state.py, batch_state.vx:
+        assert arr.dtype == np.float32
+    assert batch_state.t.dtype == np.float64
+    assert batch_state.get_state(1).dtype == np.float32
+    assert batch_state.select([True, False, True]).dtype == np.float32
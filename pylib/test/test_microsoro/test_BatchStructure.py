@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from pylib.microsoro import BatchStructure, Params, Structure
+
+
+def test_init():
+    params = Params(m=0.42)
+    batch_structure = BatchStructure(3, height=8, width=10, params=params)
+
+    assert batch_structure.population_size == 3
+    assert batch_structure.height == 8
+    assert batch_structure.width == 10
+    assert batch_structure.m.shape == (3, 8, 10)
+    assert batch_structure.kc.shape == (3, 7, 10)
+    assert batch_structure.kr.shape == (3, 8, 9)
+    assert batch_structure.ka.shape == (3, 7, 9)
+
+    for index in range(3):
+        assert batch_structure.get_structure(index) == Structure(
+            height=8, width=10, params=params
+        )
+
+
+def test_init_invalid():
+    with pytest.raises(ValueError):
+        BatchStructure(-1)
+
+    with pytest.raises(ValueError):
+        BatchStructure(3, width=0)
+
+
+def test_eq():
+    assert BatchStructure(3) == BatchStructure(3)
+    assert BatchStructure(3) != BatchStructure(4)
+    assert BatchStructure(3) != BatchStructure(3, params=Params(b=42.0))
+
+
+def test_from_structures_get_structure():
+    np.random.seed(1)
+    structures = [Structure.make_random(4, 5) for __ in range(3)]
+
+    batch_structure = BatchStructure.from_structures(structures)
+    assert batch_structure.population_size == 3
+    for index, structure in enumerate(structures):
+        assert batch_structure.get_structure(index) == structure
+
+    # should be copies
+    batch_structure.m[0, 0, 0] = 4.2
+    assert batch_structure.get_structure(0) != structures[0]
+
+    with pytest.raises(ValueError):
+        BatchStructure.from_structures([])
+
+
+def test_select():
+    np.random.seed(1)
+    structures = [Structure.make_random() for __ in range(4)]
+    batch_structure = BatchStructure.from_structures(structures)
+
+    selected = batch_structure.select(np.array([False, True, False, True]))
+    assert selected.population_size == 2
+    assert selected.get_structure(0) == structures[1]
+    assert selected.get_structure(1) == structures[3]
+    assert batch_structure == BatchStructure.from_structures(structures)
+
+
+def test_dtype():
+    params = Params(dtype=np.float32)
+    batch_structure = BatchStructure(3, params=params)
+    assert batch_structure.dtype == np.float32
+    assert batch_structure.kc.dtype == np.float32
+    assert batch_structure.get_structure(1).dtype == np.float32
+    assert batch_structure.get_structure(1).validate(params)
+
+    structures = [Structure.make_random(params=params) for __ in range(2)]
+    assert BatchStructure.from_structures(structures).dtype == np.float32
+
+
+def test_get_constants():
+    params = Params()
+    batch_structure = BatchStructure.from_structures(
+        [Structure.make_random(params=params) for __ in range(3)],
+    )
+    constants = batch_structure.get_constants(params)
+    assert constants.inv_m.shape == (3, 8, 8)
+    assert np.allclose(constants.inv_m, 1 / batch_structure.m)
+    assert batch_structure.get_constants(params) is constants
+
+    params.dt /= 2
+    assert batch_structure.get_constants(params) is not constants
+    assert batch_structure.get_constants(params).dt == params.dt
+
+    constants = batch_structure.get_constants(params)
+    batch_structure.kc[0] *= 2
+    assert batch_structure.get_constants(params) is constants
+    batch_structure.invalidate_constants()
+    assert np.allclose(
+        batch_structure.get_constants(params).kc_dt,
+        batch_structure.kc * params.dt,
+    )
+
+
+def test_stable_dt():
+    params = Params(dt_lim=(1e-9, 1.0))
+    structures = [Structure.make_random(params=params) for __ in range(3)]
+    batch_structure = BatchStructure.from_structures(structures)
+    assert np.isclose(
+        batch_structure.stable_dt(params),
+        min(structure.stable_dt(params) for structure in structures),
+    )
@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+
+from pylib.microsoro import Coarsening, Params, State, Structure
+from pylib.microsoro.conditioners import (
+    ApplyPropel,
+    ApplyRotate,
+    ApplySpin,
+    ApplyStretch,
+    ApplyTranslate,
+)
+
+
+@pytest.mark.parametrize(
+    "height, width, factor, coarse_shape",
+    [
+        (8, 8, 2, (4, 4)),
+        (8, 8, 4, (2, 2)),
+        (9, 8, 2, (4, 4)),
+        (7, 12, 3, (2, 4)),
+        (1, 5, 2, (1, 2)),
+        (3, 3, 8, (1, 1)),
+        (8, 8, 1, (8, 8)),
+    ],
+)
+def test_coarse_structure_shape(
+    height: int, width: int, factor: int, coarse_shape: tuple
+):
+    np.random.seed(1)
+    structure = Structure.make_random(height, width)
+    coarsening = Coarsening(structure, factor)
+    assert coarsening.factor == factor
+    assert coarsening.structure.m.shape == coarse_shape
+    h, w = coarse_shape
+    assert coarsening.structure.kc.shape == (h - 1, w)
+    assert coarsening.structure.lr.shape == (h, w - 1)
+    assert coarsening.structure.ld.shape == (h - 1, w - 1)
+    assert np.isclose(coarsening.structure.m.sum(), structure.m.sum())
+
+
+def test_coarse_structure_uniform():
+    params = Params()
+    structure = Structure(height=8, width=8, params=params)
+    coarse = Coarsening(structure, 2).structure
+    assert np.allclose(coarse.m, 4 * params.m)
+    for field in "kc", "kr", "ka", "kd", "bc", "br", "ba", "bd":
+        assert np.allclose(
+            getattr(coarse, field), getattr(structure, field)[0, 0]
+        )
+    assert np.allclose(coarse.lc, 2 * params.l)
+    assert np.allclose(coarse.lr, 2 * params.l)
+    assert np.allclose(coarse.la, 2 * np.sqrt(2) * params.l)
+    assert np.allclose(coarse.ld, 2 * np.sqrt(2) * params.l)
+
+
+def test_factor_one_identity():
+    np.random.seed(1)
+    structure = Structure.make_random(6, 5)
+    coarsening = Coarsening(structure, 1)
+    assert np.allclose(coarsening.structure.m, structure.m)
+
+    state = State(6, 5)
+    ApplySpin()(state)
+    for res in coarsening.restrict(state), coarsening.prolong(state):
+        assert res.same_position_as(state)
+        assert res.same_velocity_as(state)
+
+
+@pytest.mark.parametrize("height, width", [(8, 8), (9, 8), (16, 9)])
+@pytest.mark.parametrize("factor", [2, 3, 4])
+def test_restrict_prolong_affine(height: int, width: int, factor: int):
+    structure = Structure(height=height, width=width)
+    coarsening = Coarsening(structure, factor)
+
+    state = State(height, width)
+    for conditioner in (
+        ApplyStretch(mx=1.5, my=0.8),
+        ApplyRotate(),
+        ApplySpin(),
+        ApplyPropel(),
+        ApplyTranslate(dpx=3.0, dpy=2.0),
+    ):
+        conditioner(state)
+    state.t = 1.5
+
+    coarse_state = coarsening.restrict(state)
+    assert coarse_state.px.shape == coarsening.structure.m.shape
+    assert coarse_state.t == state.t
+
+    res = coarsening.prolong(coarse_state)
+    assert res.t == state.t
+    for field in "px", "py", "vx", "vy":
+        assert np.allclose(getattr(res, field), getattr(state, field))
+
+
+def test_restrict_conserves_momentum():
+    np.random.seed(1)
+    structure = Structure.make_random(9, 7)
+    coarsening = Coarsening(structure, 2)
+    state = State(9, 7)
+    ApplyStretch(mx=1.2)(state)
+    ApplySpin()(state)
+    ApplyPropel()(state)
+
+    coarse_state = coarsening.restrict(state)
+    coarse_m = coarsening.structure.m
+    for coarse, fine in (
+        (coarse_state.px, state.px),
+        (coarse_state.py, state.py),
+        (coarse_state.vx, state.vx),
+        (coarse_state.vy, state.vy),
+    ):
+        assert np.isclose(
+            np.sum(coarse * coarse_m), np.sum(fine * structure.m)
+        )
+
+
+def test_restrict_prolong_out():
+    structure = Structure(height=8, width=8)
+    coarsening = Coarsening(structure, 2)
+    state = State(8, 8)
+    ApplySpin()(state)
+
+    coarse_state = State(4, 4)
+    assert coarsening.restrict(state, out=coarse_state) is coarse_state
+    fine_state = State(8, 8)
+    assert coarsening.prolong(coarse_state, out=fine_state) is fine_state
+    assert fine_state.same_position_as(state)
+
+
+@pytest.mark.parametrize("factor", [0, -1, 1.5])
+def test_bad_factor(factor: object):
+    with pytest.raises(ValueError):
+        Coarsening(Structure(), factor)
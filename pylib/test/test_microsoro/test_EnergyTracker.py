@@ -0,0 +1,218 @@
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    components,
+    BatchState,
+    BatchStructure,
+    EnergyTracker,
+    get_default_update_regimen,
+    GraphStructure,
+    Params,
+    State,
+    Structure,
+)
+from pylib.microsoro.conditioners import (
+    ApplyEnergyTracking,
+    ApplySpin,
+    ApplyStretch,
+    ApplyTranslate,
+)
+
+
+def _spring_energy(state: State, structure: Structure) -> float:
+    res = 0.0
+    for k, l_naught, head, tail in (
+        (structure.kc, structure.lc, np.s_[:-1, :], np.s_[1:, :]),
+        (structure.kr, structure.lr, np.s_[:, :-1], np.s_[:, 1:]),
+        (structure.ka, structure.la, np.s_[:-1, :-1], np.s_[1:, 1:]),
+        (structure.kd, structure.ld, np.s_[:-1, 1:], np.s_[1:, :-1]),
+    ):
+        dists = np.hypot(
+            state.px[tail] - state.px[head], state.py[tail] - state.py[head]
+        )
+        res += 0.5 * np.sum(k * (dists - l_naught) ** 2)
+    return res
+
+
+def _make_state() -> State:
+    state = State()
+    ApplyStretch(mx=1.1, my=0.9)(state)
+    ApplyTranslate(dpy=2)(state)
+    ApplySpin()(state)
+    return state
+
+
+def test_init():
+    tracker = EnergyTracker()
+    assert np.isnan(tracker.elastic)
+    assert np.isnan(tracker.gravitational)
+    assert np.isnan(tracker.kinetic)
+    assert np.isnan(tracker.total)
+
+
+def test_record_springs():
+    tracker = EnergyTracker()
+    tracker.record_springs("a", np.full((2, 3), 2.0), np.full((2, 3), 3.0))
+    tracker.record_springs("b", np.ones(4), np.ones(4), num_spring_axes=1)
+    tracker.record_elastic("c", 0.5)
+    tracker.record_springs("a", np.ones((2, 3)), np.full((2, 3), 3.0))
+
+    tracker.close_step(State())
+    assert tracker.elastic == pytest.approx(9.0 + 2.0 + 0.5)
+
+    with pytest.raises(ValueError):
+        tracker.record_springs("d", np.ones(4), np.ones(4), num_spring_axes=3)
+
+
+def test_close_step():
+    params = Params(g=2.0)
+    structure = Structure(params=params)
+    structure.m[...] = np.random.uniform(1.0, 2.0, structure.m.shape)
+    state = _make_state()
+
+    tracker = EnergyTracker(params, structure)
+    tracker.close_step(state)
+    m = structure.m
+    assert tracker.kinetic == pytest.approx(
+        0.5 * np.sum(m * (state.vx**2 + state.vy**2))
+    )
+    assert tracker.gravitational == pytest.approx(2.0 * np.sum(m * state.py))
+    assert tracker.elastic == 0.0  # no springs recorded
+    assert tracker.total == pytest.approx(
+        tracker.kinetic + tracker.gravitational
+    )
+
+
+@pytest.mark.parametrize("integrator", ["explicit", "verlet"])
+def test_matches_recomputation(integrator: str):
+    np.random.seed(1)
+    params = Params()
+    structure = Structure.make_random()
+    regimen = get_default_update_regimen(params, structure, integrator)
+    state = _make_state()
+    ApplyEnergyTracking(params, structure)(state)
+
+    for __ in range(50):
+        before = _spring_energy(state, structure)
+        for component in regimen:
+            component(state)
+        after = _spring_energy(state, structure)
+
+    # explicit springs act at positions from start of step, verlet springs
+    # are reapplied at updated positions
+    expected = before if integrator == "explicit" else after
+    assert state.energy.elastic == pytest.approx(expected)
+    assert state.energy.kinetic == pytest.approx(
+        0.5 * np.sum(structure.m * (state.vx**2 + state.vy**2))
+    )
+
+
+@pytest.mark.parametrize(
+    "make_components",
+    [
+        lambda params, structure: [
+            components.ApplySpringsCol(params, structure),
+            components.ApplySpringsRow(params, structure),
+            components.ApplySpringsDiagAsc(params, structure),
+            components.ApplySpringsDiagDesc(params, structure),
+        ],
+        lambda params, structure: [
+            components.ApplySpringNetwork(params, structure),
+        ],
+        lambda params, structure: [
+            components.ApplySpringGraph(
+                params, GraphStructure.from_structure(structure)
+            ),
+        ],
+        lambda params, structure: [
+            components.ApplySpringNetworkImplicit(params, structure),
+        ],
+    ],
+)
+def test_spring_components(make_components: typing.Callable):
+    np.random.seed(1)
+    params = Params()
+    structure = Structure.make_random()
+    state = _make_state()
+    expected = _spring_energy(state, structure)
+
+    ApplyEnergyTracking(params, structure)(state)
+    for component in make_components(params, structure):
+        component(state)
+    state.energy.close_step(state)
+    assert state.energy.elastic == pytest.approx(expected)
+
+
+def test_verlet_conserves_energy():
+    params = Params(dt=2e-3, b=0.0, g=0.0)
+    structure = Structure(params=params)
+
+    totals = dict()
+    for integrator in "explicit", "verlet":
+        state = _make_state()
+        ApplyEnergyTracking(params, structure)(state)
+        regimen = get_default_update_regimen(params, structure, integrator)
+        totals[integrator] = []
+        for __ in range(200):
+            for component in regimen:
+                component(state)
+            totals[integrator].append(state.energy.total)
+
+    assert np.ptp(totals["verlet"]) < np.ptp(totals["explicit"]) / 10
+
+
+def test_batch():
+    np.random.seed(1)
+    params = Params()
+    structures = [Structure.make_random() for __ in range(3)]
+    states = [_make_state() for __ in structures]
+    for state, structure in zip(states, structures):
+        ApplyEnergyTracking(params, structure)(state)
+
+    for state, structure in zip(states, structures):
+        for component in get_default_update_regimen(params, structure):
+            component(state)
+
+    batch_state = BatchState.from_states(states)
+    batch_structure = BatchStructure.from_structures(structures)
+    for component in get_default_update_regimen(params, batch_structure):
+        component(batch_state)
+    for state, structure in zip(states, structures):
+        for component in get_default_update_regimen(params, structure):
+            component(state)
+
+    assert batch_state.energy.total.shape == (3,)
+    for index, state in enumerate(states):
+        for field in "elastic", "gravitational", "kinetic":
+            assert getattr(batch_state.energy, field)[index] == pytest.approx(
+                getattr(state.energy, field)
+            )
+        individual = batch_state.get_state(index)
+        assert individual.energy.total == pytest.approx(state.energy.total)
+
+    selected = batch_state.select(np.array([True, False, True]))
+    assert selected.energy.kinetic == pytest.approx(
+        batch_state.energy.kinetic[[0, 2]]
+    )
+    for component in get_default_update_regimen(
+        params, batch_structure.select(np.array([True, False, True]))
+    ):
+        component(selected)
+    assert selected.energy.total.shape == (2,)
+
+
+def test_stack_invalid():
+    with pytest.raises(ValueError):
+        EnergyTracker.stack([])
+    with pytest.raises(ValueError):
+        EnergyTracker.stack(
+            [EnergyTracker(Params(g=1.0)), EnergyTracker(Params(g=2.0))]
+        )
+
+    states = [State(), State()]
+    ApplyEnergyTracking()(states[0])
+    with pytest.raises(ValueError):
+        BatchState.from_states(states)
@@ -0,0 +1,165 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import GraphStructure, Params, Structure
+
+
+def test_init():
+    params = Params()
+    structure = GraphStructure(
+        mask=np.array([[True, True], [False, True]]),
+        i=[0, 1],
+        j=[1, 3],
+        k=[params.k, params.k],
+        l=[params.l, params.l],
+        b=[0.0, params.b],
+        m=np.full((2, 2), params.m),
+    )
+    assert structure.height == 2
+    assert structure.width == 2
+    assert structure.num_edges == 2
+    assert structure.dtype == np.float64
+    assert structure.i.dtype == np.intp
+    assert structure.validate()
+
+
+@pytest.mark.parametrize(
+    "i, j",
+    [
+        ([0, 1], [1]),  # shape mismatch
+        ([0], [4]),  # out of range
+        ([0], [0]),  # self loop
+        ([0], [2]),  # masked out
+    ],
+)
+def test_init_invalid(i: list, j: list):
+    with pytest.raises(ValueError):
+        GraphStructure(
+            mask=np.array([[True, True], [False, True]]),
+            i=i,
+            j=j,
+            k=np.full(len(i), 10.0),
+            l=np.full(len(i), 1.0),
+            b=np.full(len(i), 1.0),
+            m=np.ones((2, 2)),
+        )
+
+
+def test_eq():
+    structure = Structure.make_random()
+    assert GraphStructure.from_structure(
+        structure,
+    ) == GraphStructure.from_structure(structure)
+    assert GraphStructure.from_structure(
+        structure,
+    ) != GraphStructure.from_structure(Structure())
+
+
+@pytest.mark.parametrize("height, width", [(8, 8), (1, 5), (5, 1), (7, 13)])
+def test_from_structure(height: int, width: int):
+    np.random.seed(1)
+    structure = Structure.make_random(height, width)
+    graph_structure = GraphStructure.from_structure(structure)
+
+    assert graph_structure.height == height
+    assert graph_structure.width == width
+    assert np.all(graph_structure.mask)
+    assert np.array_equal(graph_structure.m, structure.m)
+    assert graph_structure.num_edges == sum(
+        getattr(structure, k).size for k in ("kc", "kr", "ka", "kd")
+    )
+    assert np.isclose(
+        graph_structure.k.sum(),
+        sum(getattr(structure, k).sum() for k in ("kc", "kr", "ka", "kd")),
+    )
+    assert np.isclose(
+        graph_structure.b.sum(), structure.bc.sum() + structure.br.sum()
+    )
+    assert graph_structure.validate()
+
+    # springs join lattice neighbors
+    rows_i, cols_i = np.divmod(graph_structure.i, width)
+    rows_j, cols_j = np.divmod(graph_structure.j, width)
+    assert np.all(np.abs(rows_i - rows_j) <= 1)
+    assert np.all(np.abs(cols_i - cols_j) <= 1)
+
+
+def test_from_structure_mask():
+    mask = np.ones((8, 8), dtype=bool)
+    mask[3:5, 3:5] = False
+    graph_structure = GraphStructure.from_structure(Structure(), mask=mask)
+
+    assert np.array_equal(graph_structure.mask, mask)
+    ends = np.concatenate([graph_structure.i, graph_structure.j])
+    assert np.all(mask.ravel()[ends])
+    assert set(np.flatnonzero(mask)) == set(ends)
+    assert graph_structure.num_edges < 210
+    assert graph_structure.validate()
+
+    with pytest.raises(ValueError):
+        GraphStructure.from_structure(Structure(), mask=mask[:-1])
+
+
+def test_make_from_bytes():
+    mask = np.full((4, 4), 255)
+    mask[0, 0] = 0
+    graph_structure = GraphStructure.make_from_bytes(
+        b=np.full((8, 8), 0),
+        k=np.full((8, 8), 255),
+        l=np.full((8, 8), 17),
+        m=np.full((8, 8), 255),
+        mask=mask,
+    )
+    params = Params()
+    assert graph_structure.validate(params)
+    assert np.all(graph_structure.k == params.k_lim[1])
+    assert np.all(graph_structure.m == params.m_lim[1])
+
+    # mask interpolated by nearest neighbor
+    assert graph_structure.mask.shape == (8, 8)
+    assert not graph_structure.mask[:2, :2].any()
+    assert graph_structure.mask.sum() == 60
+
+
+def test_make_from_bytes_default_mask():
+    assert GraphStructure.make_from_bytes() == GraphStructure.from_structure(
+        Structure(),
+    )
+
+
+def test_make_from_bytes_invalid():
+    with pytest.raises(ValueError):
+        GraphStructure.make_from_bytes(mask=np.full((8, 8), 256))
+
+
+def test_dtype():
+    params = Params(dtype=np.float32)
+    graph_structure = GraphStructure.from_structure(
+        Structure.make_random(params=params),
+    )
+    assert graph_structure.dtype == np.float32
+    for field in "klbm":
+        assert getattr(graph_structure, field).dtype == np.float32
+    assert graph_structure.validate(params)
+
+
+def test_stable_dt():
+    params = Params(dt_lim=(1e-9, 1.0))
+    structure = Structure.make_random(params=params)
+    graph_structure = GraphStructure.from_structure(structure)
+    assert np.isclose(
+        graph_structure.stable_dt(params), structure.stable_dt(params)
+    )
+
+
+def test_stable_dt_masked():
+    mask = np.ones((8, 8), dtype=bool)
+    mask[2, 3] = False
+    graph_structure = GraphStructure.from_structure(Structure(), mask=mask)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        res = graph_structure.stable_dt()
+    assert np.isfinite(res)
+    assert res >= Structure().stable_dt()
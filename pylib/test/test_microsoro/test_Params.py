@@ -1,6 +1,7 @@
 import copy
 import math
 
+import numpy as np
 import pytest
 
 from pylib.microsoro import defaults, Params
@@ -85,3 +86,13 @@ def test_l_lim_diag():
 
         params = Params(l=0.0)
         assert params.l_lim_diag[i] == math.sqrt(2 * l**2)
+
+
+def test_dtype():
+    assert Params().dtype == np.dtype(defaults.dtype)
+    assert Params(dtype="float32").dtype == np.float32
+    assert Params(dtype=np.float32) == Params(dtype="float32")
+    assert not Params(dtype=np.float32) == Params()
+
+    with pytest.raises(ValueError):
+        Params(dtype=int)
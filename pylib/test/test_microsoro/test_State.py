@@ -131,3 +131,17 @@ def test_validate_with_negative_time():
     state = State()
     state.t = -1
     assert not state.validate()
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, "float32"])
+def test_dtype(dtype: type):
+    state = State(height=8, width=10, dtype=dtype)
+    assert state.dtype == dtype
+    for arr in state.px, state.py, state.vx, state.vy:
+        assert arr.dtype == dtype
+    assert isinstance(state.t, float)
+    assert state.validate()
+    assert state.same_position_as(State(height=8, width=10))
+
+    with pytest.raises(ValueError):
+        State(dtype=int)
@@ -273,3 +273,126 @@ def test_make_from_bytes_m():
 
     assert structure.height == 4
     assert structure.width == defaults.ncol
+
+
+@pytest.mark.parametrize(
+    "make_structure",
+    [
+        lambda params: Structure(params=params),
+        lambda params: Structure(7, 5, params=params),
+        lambda params: Structure.make_random(params=params),
+        lambda params: Structure.make_random(
+            params=params, interpolate_from_height=3
+        ),
+        lambda params: Structure.make_from_bytes(
+            params=params,
+            b=np.full((8, 8), 0),
+            k=np.full((8, 8), 255),
+            l=np.full((8, 8), 17),
+            m=np.full((8, 8), 255),
+        ),
+    ],
+)
+def test_dtype(make_structure: typing.Callable):
+    np.random.seed(1)
+    params = Params(dtype=np.float32)
+    structure = make_structure(params)
+    assert structure.dtype == np.float32
+    for field in "bc br ba bd kc kr ka kd lc lr la ld m".split():
+        assert getattr(structure, field).dtype == np.float32
+    assert structure.validate(params)
+
+    np.random.seed(1)
+    reference = make_structure(Params())
+    assert reference.dtype == np.float64
+    assert np.allclose(structure.la, reference.la)
+    assert np.allclose(structure.m, reference.m)
+
+
+def test_get_constants():
+    params = Params()
+    structure = Structure.make_random(params=params)
+    constants = structure.get_constants(params)
+    assert np.allclose(constants.inv_m, 1 / structure.m)
+    assert structure.get_constants(params) is constants
+    assert structure.get_constants() is constants  # default dt
+
+    # rebuilt on change in timestep size
+    params.dt /= 2
+    rebuilt = structure.get_constants(params)
+    assert rebuilt is not constants
+    assert rebuilt.dt == params.dt
+    assert structure.get_constants(params) is rebuilt
+
+    # rebuilt on reassignment of structure arrays
+    structure.set_m_to_norms(np.full((8, 8), 0.5))
+    rebuilt = structure.get_constants(params)
+    assert structure.get_constants(params) is rebuilt
+    assert np.allclose(rebuilt.inv_m, 1 / structure.m)
+
+    # in-place modification requires explicit invalidation
+    structure.m *= 2
+    assert structure.get_constants(params) is rebuilt
+    structure.invalidate_constants()
+    assert structure.get_constants(params) is not rebuilt
+    assert np.allclose(structure.get_constants(params).inv_m, 1 / structure.m)
+
+
+def test_stable_dt_uniform():
+    params = Params(dt_lim=(1e-9, 1.0))
+    structure = Structure(params=params)
+
+    # interior cells are joined by 8 springs, 4 of them damped
+    omega_squared = 2 * 8 * params.k / params.m
+    c = 2 * 4 * params.b / params.m
+    expected = 4 / (c + np.sqrt(c * c + 4 * omega_squared))
+
+    assert np.isclose(structure.stable_dt(params, safety=1.0), expected)
+    assert np.isclose(structure.stable_dt(params), 0.9 * expected)
+    assert np.isclose(structure.stable_dt(params, safety=0.5), expected / 2)
+
+
+def test_stable_dt_random():
+    params = Params(dt_lim=(1e-9, 1.0))
+    structure = Structure(params=params)
+    stiffer = Structure(params=params)
+    stiffer.kc[3, 4] *= 10
+    stiffer.invalidate_constants()
+    assert stiffer.stable_dt(params) < structure.stable_dt(params)
+
+    random_structure = Structure.make_random(params=params)
+    assert 0 < random_structure.stable_dt(params) < np.inf
+
+
+def test_stable_dt_clipped():
+    params = Params(dt_lim=(1e-4, 1e-2))
+    structure = Structure(params=params)
+    assert structure.stable_dt(params, safety=1e9) == params.dt_lim[1]
+    assert structure.stable_dt(params, safety=1e-9) == params.dt_lim[0]
+
+
+@pytest.mark.parametrize("safety", [0.0, -1.0, np.nan])
+def test_stable_dt_invalid_safety(safety: float):
+    with pytest.raises(ValueError):
+        Structure().stable_dt(safety=safety)
+
+
+def test_get_rows():
+    structure = Structure.make_random(height=10, width=6)
+    rows = structure.get_rows(3, 7)
+    assert rows.height == 4
+    assert rows.width == 6
+    assert rows.validate()
+    assert np.shares_memory(rows.m, structure.m)
+    assert np.array_equal(rows.m, structure.m[3:7])
+    assert np.array_equal(rows.kr, structure.kr[3:7])
+    assert np.array_equal(rows.kc, structure.kc[3:6])
+    assert np.array_equal(rows.ld, structure.ld[3:6])
+    assert structure.get_rows(0, 10) == structure
+    assert structure.get_rows(9, 10).kc.shape == (0, 6)
+
+
+@pytest.mark.parametrize("start, stop", [(-1, 3), (3, 3), (4, 3), (0, 11)])
+def test_get_rows_invalid(start: int, stop: int):
+    with pytest.raises(ValueError):
+        Structure(height=10).get_rows(start, stop)
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    BatchStructure,
+    Params,
+    Structure,
+    StructureConstants,
+)
+
+
+@pytest.mark.parametrize(
+    "structure",
+    [
+        Structure(),
+        Structure(7, 5),
+        Structure.make_random(),
+        BatchStructure(3),
+    ],
+)
+def test_init(structure):
+    params = Params(dt=0.02)
+    constants = StructureConstants(structure, params)
+
+    assert constants.dt == 0.02
+    assert np.allclose(constants.inv_m, 1 / structure.m)
+    assert np.allclose(constants.dt_per_m, 0.02 / structure.m)
+    for k in "kc kr ka kd".split():
+        assert np.allclose(
+            getattr(constants, f"{k}_dt"), getattr(structure, k) * 0.02
+        )
+    for b in "bc br".split():
+        assert np.allclose(
+            getattr(constants, f"{b}_clipped"),
+            np.minimum(getattr(structure, b), 50.0),
+        )
+        assert getattr(constants, f"{b}_clipped").shape == (
+            getattr(structure, b).shape
+        )
+
+
+def test_is_current():
+    params = Params()
+    structure = Structure()
+    constants = StructureConstants(structure, params)
+    assert constants.is_current(structure, params)
+    assert constants.is_current(structure, Params())
+
+    assert not constants.is_current(structure, Params(dt=params.dt / 2))
+    assert not constants.is_current(Structure(), params)
+
+    structure.set_k_to_norms(np.full((8, 8), 0.5))
+    assert not constants.is_current(structure, params)
+
+
+def test_dtype():
+    params = Params(dtype=np.float32)
+    structure = Structure.make_random(params=params)
+    constants = StructureConstants(structure, params)
+    for field in (
+        "inv_m dt_per_m kc_dt kr_dt ka_dt kd_dt bc_clipped br_clipped"
+    ).split():
+        assert getattr(constants, field).dtype == np.float32
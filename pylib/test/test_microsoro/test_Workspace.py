@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from pylib.microsoro import Workspace
+
+
+def test_get():
+    workspace = Workspace()
+    assert len(workspace) == 0
+
+    buffer = workspace.get("a", (3, 4))
+    assert buffer.shape == (3, 4)
+    assert buffer.dtype == float
+    assert len(workspace) == 1
+
+
+def test_get_reuse():
+    workspace = Workspace()
+    buffer = workspace.get("a", (3, 4))
+    buffer[...] = 42.0
+    assert workspace.get("a", (3, 4)) is buffer
+    assert np.all(workspace.get("a", (3, 4)) == 42.0)
+    assert len(workspace) == 1
+
+
+@pytest.mark.parametrize(
+    "name, shape, dtype",
+    [("b", (3, 4), float), ("a", (4, 3), float), ("a", (3, 4), bool)],
+)
+def test_get_distinct(name: str, shape: tuple, dtype: type):
+    workspace = Workspace()
+    buffer = workspace.get("a", (3, 4), float)
+    other = workspace.get(name, shape, dtype)
+    assert other is not buffer
+    assert other.shape == shape
+    assert other.dtype == dtype
+    assert len(workspace) == 2
+
+
+def test_clear():
+    workspace = Workspace()
+    buffer = workspace.get("a", (3, 4))
+    workspace.clear()
+    assert len(workspace) == 0
+    assert workspace.get("a", (3, 4)) is not buffer
@@ -0,0 +1,84 @@
+import copy
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import BatchState, State, components
+from pylib.microsoro.backends import numba as backend
+from pylib.microsoro.backends.numba import _kernels
+from pylib.microsoro.conditioners import (
+    ApplyPropel,
+    ApplyRotate,
+    ApplyTranslate,
+    BundleConditioners,
+)
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.mark.parametrize(
+    "conditioner",
+    [
+        ApplyTranslate(dpy=1.0),  # entirely above floor
+        ApplyTranslate(dpy=-5.0),
+        BundleConditioners(
+            ApplyRotate(30.0),
+            ApplyTranslate(dpy=-3.0),
+            ApplyPropel(dvx=1.0, dvy=-2.0),
+        ),
+    ],
+)
+@pytest.mark.parametrize("e", [0.0, 0.5, 1.0])
+@pytest.mark.parametrize("m", [-1.0, -0.25, 0.0])
+@pytest.mark.parametrize("b", [-1.0, 0.0, 2.0])
+def test_equivalent_to_numpy(
+    conditioner: typing.Callable, e: float, m: float, b: float
+):
+    state1 = State()
+    conditioner(state1)
+    state2 = copy.deepcopy(state1)
+
+    event_buffer1, event_buffer2 = EventBuffer(), EventBuffer()
+    components.ApplyFloorBounce(e=e, m=m, b=b)(state1, event_buffer1)
+    res = backend.ApplyFloorBounce(e=e, m=m, b=b)(state2, event_buffer2)
+    assert res is None
+
+    assert State.same_position_as(state1, state2)
+    assert State.same_velocity_as(state1, state2)
+    assert not np.any(state2.py < m * state2.px + b)
+    assert event_buffer1 == event_buffer2 != EventBuffer()
+
+
+def test_reuse_between_shapes():
+    ftor = backend.ApplyFloorBounce()
+    for height, width in (8, 8), (3, 5), (8, 8):
+        state = State(height, width)
+        ApplyTranslate(dpy=-5.0)(state)
+        ftor(state)
+        assert not np.any(state.py < 0.0)
+
+
+def test_fallback(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_kernels, "is_available", lambda: False)
+    state1 = State()
+    ApplyTranslate(dpy=-5.0)(state1)
+    state2 = copy.deepcopy(state1)
+
+    components.ApplyFloorBounce()(state1)
+    backend.ApplyFloorBounce()(state2)
+    assert state1 == state2
+
+
+def test_batch():
+    states = [State() for __ in range(3)]
+    ApplyTranslate(dpy=-5.0)(states[1])
+    ApplyTranslate(dpy=-2.0)(states[2])
+    batch_state = BatchState.from_states(states)
+
+    res = backend.ApplyFloorBounce()(batch_state)
+    assert res is None
+
+    for index, state in enumerate(states):
+        backend.ApplyFloorBounce()(state)
+        assert State.same_position_as(batch_state.get_state(index), state)
+        assert State.same_velocity_as(batch_state.get_state(index), state)
@@ -0,0 +1,63 @@
+import copy
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import BatchState, Params, State, components
+from pylib.microsoro.backends import numba as backend
+from pylib.microsoro.backends.numba import _kernels
+from pylib.microsoro.conditioners import ApplyPropel, ApplySpin, ApplyTorsion
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "conditioner", [ApplyPropel(dvx=1.0, dvy=-2.0), ApplySpin()]
+)
+@pytest.mark.parametrize("dt", [1e-3, 1e-2])
+def test_equivalent_to_numpy(
+    conditioner: typing.Callable,
+    dt: float,
+    event_buffer: typing.Optional[EventBuffer],
+):
+    params = Params(dt=dt)
+    state1 = State()
+    conditioner(state1)
+    state2 = copy.deepcopy(state1)
+
+    components.ApplyGravity(params)(state1, event_buffer)
+    res = backend.ApplyGravity(params)(state2, event_buffer)
+    assert res is None
+
+    assert State.same_position_as(state1, state2)
+    assert State.same_velocity_as(state1, state2)
+
+
+def test_fallback(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_kernels, "is_available", lambda: False)
+    state1 = State()
+    ApplyTorsion()(state1)
+    state2 = copy.deepcopy(state1)
+
+    components.ApplyGravity()(state1)
+    backend.ApplyGravity()(state2)
+    assert state1 == state2
+
+
+def test_batch(event_buffer: typing.Optional[EventBuffer]):
+    states = [State() for __ in range(3)]
+    ApplySpin()(states[1])
+    batch_state = BatchState.from_states(states)
+
+    res = backend.ApplyGravity()(batch_state, event_buffer)
+    assert res is None
+
+    for index, state in enumerate(states):
+        backend.ApplyGravity()(state, event_buffer)
+        assert State.same_position_as(batch_state.get_state(index), state)
+        assert State.same_velocity_as(batch_state.get_state(index), state)
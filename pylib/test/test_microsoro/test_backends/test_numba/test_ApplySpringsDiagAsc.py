@@ -0,0 +1,98 @@
+import copy
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    BatchState,
+    BatchStructure,
+    Params,
+    State,
+    Structure,
+    components,
+)
+from pylib.microsoro.backends import numba as backend
+from pylib.microsoro.backends.numba import _kernels
+from pylib.microsoro.conditioners import (
+    ApplyPropel,
+    ApplyRotate,
+    ApplySpin,
+    ApplyStretch,
+    ApplyTorsion,
+    BundleConditioners,
+)
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "conditioner",
+    [
+        ApplyPropel(dvx=1.0, dvy=-2.0),
+        ApplyStretch(mx=1.5, my=2.0),
+        ApplyTorsion(),
+        BundleConditioners(ApplyRotate(30.0), ApplySpin()),
+    ],
+)
+@pytest.mark.parametrize("height, width", [(8, 8), (1, 5), (5, 1), (7, 13)])
+@pytest.mark.parametrize("random_structure", [False, True])
+def test_equivalent_to_numpy(
+    conditioner: typing.Callable,
+    height: int,
+    width: int,
+    random_structure: bool,
+    event_buffer: typing.Optional[EventBuffer],
+):
+    np.random.seed(1)
+    params = Params(dt=1e-3)
+    if random_structure:
+        structure = Structure.make_random(height, width, params=params)
+    else:
+        structure = Structure(height, width, params=params)
+
+    state1 = State(height, width)
+    conditioner(state1)
+    state1.vx += np.random.rand(height, width)
+    state2 = copy.deepcopy(state1)
+
+    components.ApplySpringsDiagAsc(params, structure)(state1, event_buffer)
+    res = backend.ApplySpringsDiagAsc(params, structure)(state2, event_buffer)
+    assert res is None
+
+    assert State.same_position_as(state1, state2)
+    assert State.same_velocity_as(state1, state2)
+
+
+def test_fallback(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_kernels, "is_available", lambda: False)
+    state1 = State()
+    ApplyTorsion()(state1)
+    state2 = copy.deepcopy(state1)
+
+    components.ApplySpringsDiagAsc()(state1)
+    backend.ApplySpringsDiagAsc()(state2)
+    assert state1 == state2
+
+
+def test_batch(event_buffer: typing.Optional[EventBuffer]):
+    np.random.seed(1)
+    structures = [Structure.make_random() for __ in range(3)]
+    states = [State() for __ in range(3)]
+    ApplyStretch(mx=1.5, my=2.0)(states[0])
+    ApplyTorsion()(states[1])
+    ApplyRotate(30.0)(states[2])
+    batch_state = BatchState.from_states(states)
+
+    res = backend.ApplySpringsDiagAsc(
+        structure=BatchStructure.from_structures(structures),
+    )(batch_state, event_buffer)
+    assert res is None
+
+    for index, (state, structure) in enumerate(zip(states, structures)):
+        backend.ApplySpringsDiagAsc(structure=structure)(state, event_buffer)
+        assert State.same_velocity_as(batch_state.get_state(index), state)
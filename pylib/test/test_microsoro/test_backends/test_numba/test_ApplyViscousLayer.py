@@ -0,0 +1,89 @@
+import copy
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    BatchState,
+    BatchStructure,
+    Params,
+    State,
+    Structure,
+    components,
+)
+from pylib.microsoro.backends import numba as backend
+from pylib.microsoro.backends.numba import _kernels
+from pylib.microsoro.conditioners import (
+    ApplyPropel,
+    ApplyRotate,
+    ApplyTranslate,
+    BundleConditioners,
+)
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.mark.parametrize(
+    "conditioner",
+    [
+        ApplyPropel(dvx=1.0, dvy=-2.0),
+        BundleConditioners(
+            ApplyRotate(30.0),
+            ApplyTranslate(dpy=-3.0),
+            ApplyPropel(dvx=1.0, dvy=-2.0),
+        ),
+    ],
+)
+@pytest.mark.parametrize("mu", [0.0, 0.1, 1e6])
+@pytest.mark.parametrize("m", [-1.0, 0.0, 0.5])
+@pytest.mark.parametrize("b", [-1.0, 4.0])
+def test_equivalent_to_numpy(
+    conditioner: typing.Callable, mu: float, m: float, b: float
+):
+    np.random.seed(1)
+    params = Params()
+    structure = Structure.make_random(params=params)
+    state1 = State()
+    conditioner(state1)
+    state2 = copy.deepcopy(state1)
+
+    event_buffer1, event_buffer2 = EventBuffer(), EventBuffer()
+    components.ApplyViscousLayer(mu, m, b, params, structure)(
+        state1, event_buffer1
+    )
+    res = backend.ApplyViscousLayer(mu, m, b, params, structure)(
+        state2, event_buffer2
+    )
+    assert res is None
+
+    assert State.same_position_as(state1, state2)
+    assert State.same_velocity_as(state1, state2)
+    assert event_buffer1 == event_buffer2 != EventBuffer()
+
+
+def test_fallback(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_kernels, "is_available", lambda: False)
+    state1 = State()
+    ApplyPropel(dvx=1.0, dvy=-2.0)(state1)
+    state2 = copy.deepcopy(state1)
+
+    components.ApplyViscousLayer(b=4.0)(state1)
+    backend.ApplyViscousLayer(b=4.0)(state2)
+    assert state1 == state2
+
+
+def test_batch():
+    states = [State() for __ in range(3)]
+    ApplyPropel(dvx=1.0, dvy=-2.0)(states[1])
+    ApplyTranslate(dpy=-2.0)(states[2])
+    batch_state = BatchState.from_states(states)
+
+    batch_structure = BatchStructure(len(states))
+    res = backend.ApplyViscousLayer(b=4.0, structure=batch_structure)(
+        batch_state
+    )
+    assert res is None
+
+    for index, state in enumerate(states):
+        backend.ApplyViscousLayer(b=4.0)(state)
+        assert State.same_velocity_as(batch_state.get_state(index), state)
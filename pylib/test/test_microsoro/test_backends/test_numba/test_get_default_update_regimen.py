@@ -0,0 +1,56 @@
+import copy
+
+import numpy as np
+
+from pylib.microsoro import (
+    Params,
+    State,
+    Structure,
+    get_default_update_regimen,
+)
+from pylib.microsoro.backends import numba as backend
+from pylib.microsoro.conditioners import ApplySpin, ApplyTranslate
+from pylib.microsoro.events import EventBuffer
+
+
+def test_equivalent_to_numpy():
+    np.random.seed(1)
+    params = Params()
+    structure = Structure.make_random(params=params)
+
+    state1 = State()
+    ApplyTranslate(dpy=-2)(state1)
+    ApplySpin()(state1)
+    state2 = copy.deepcopy(state1)
+
+    regimen1 = get_default_update_regimen(params, structure)
+    regimen2 = backend.get_default_update_regimen(params, structure)
+    event_buffer1, event_buffer2 = EventBuffer(), EventBuffer()
+    for _update in range(100):
+        for step in regimen1:
+            step(state1, event_buffer1)
+        for step in regimen2:
+            step(state2, event_buffer2)
+
+    assert State.same_position_as(state1, state2)
+    assert State.same_velocity_as(state1, state2)
+    assert state1.t == state2.t
+    assert event_buffer1 == event_buffer2
+
+
+def test_get_default_update_regimen_params():
+    state1 = State()
+    ApplyTranslate(dpy=-2)(state1)
+    for _update in range(100):  # need several updates to get past np.isclose
+        for step in backend.get_default_update_regimen():
+            step(state1)
+
+    state2 = State()
+    ApplyTranslate(dpy=-2)(state2)
+    regimen2 = backend.get_default_update_regimen(params=Params(g=100.0))
+    for _update in range(100):  # need several updates to get past np.isclose
+        for step in regimen2:
+            step(state2)
+
+    assert not State.same_position_as(state1, state2)
+    assert not State.same_velocity_as(state1, state2)
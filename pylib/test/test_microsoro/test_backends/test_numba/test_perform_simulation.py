@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from pylib.microsoro import State, perform_simulation
+from pylib.microsoro.backends import numba as backend
+from pylib.microsoro.backends.numba import _kernels
+from pylib.microsoro.components import (
+    ApplyIncrementElapsedTime,
+    ApplyVelocity,
+    EvaluateDuration,
+    HaltAfterElapsedTime,
+)
+from pylib.microsoro.conditioners import (
+    ApplyPropel,
+    ApplySpin,
+    ApplyTranslate,
+)
+
+
+@pytest.mark.parametrize(
+    "setup_regimen_conditioners",
+    [
+        None,
+        [ApplyTranslate(dpy=-2.0), ApplySpin(), ApplyPropel(dvx=1.0)],
+    ],
+)
+def test_default_equivalent_to_numpy(setup_regimen_conditioners):
+    state1 = perform_simulation(setup_regimen_conditioners)
+    state2 = backend.perform_simulation(setup_regimen_conditioners)
+    assert State.same_position_as(state1, state2)
+    assert State.same_velocity_as(state1, state2)
+    assert state1.t == state2.t
+
+
+def test_default_fallback(monkeypatch: pytest.MonkeyPatch):
+    state1 = backend.perform_simulation()
+    monkeypatch.setattr(_kernels, "is_available", lambda: False)
+    state2 = backend.perform_simulation()
+    assert State.same_position_as(state1, state2)
+    assert State.same_velocity_as(state1, state2)
+
+
+def test_custom_update():
+    res = backend.perform_simulation(
+        update_regimen_components=[
+            ApplyVelocity(),
+            ApplyIncrementElapsedTime(),
+            EvaluateDuration(HaltAfterElapsedTime(1.0)),
+        ],
+    )
+    assert res == pytest.approx(1.0, abs=1e-2)
+
+
+def test_yield_intermediate_states():
+    states = [*backend.perform_simulation(yield_intermediate_states=True)]
+    assert len(states) > 1
+    assert isinstance(states[-1], State)
+    assert states[-1].t > 10.0
+
+
+def test_default_float32():
+    state1 = perform_simulation(dtype="float32")
+    state2 = backend.perform_simulation(dtype="float32")
+    assert state2.dtype == np.float32
+    assert np.allclose(state1.px, state2.px, atol=1e-2)
+    assert np.allclose(state1.py, state2.py, atol=1e-2)
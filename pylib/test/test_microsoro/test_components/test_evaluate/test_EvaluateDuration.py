@@ -1,9 +1,15 @@
 import typing
 
+import numpy as np
 import pytest
 
-from pylib.microsoro import State
-from pylib.microsoro.components import EvaluateDuration, HaltAfterElapsedTime
+from pylib.microsoro import BatchState, State
+from pylib.microsoro.components import (
+    DivergenceFailure,
+    EvaluateDuration,
+    HaltAfterElapsedTime,
+    HaltOnDivergence,
+)
 from pylib.microsoro.events import EventBuffer
 
 
@@ -13,7 +19,6 @@ def event_buffer(request: pytest.FixtureRequest):
 
 
 def test_HaltAfterElapsedTime(event_buffer: typing.Optional[EventBuffer]):
-
     state = State()
     ftor_factory = lambda t_thresh: EvaluateDuration(
         halting_component=HaltAfterElapsedTime(t_thresh),
@@ -26,3 +31,66 @@ def test_HaltAfterElapsedTime(event_buffer: typing.Optional[EventBuffer]):
 
     state.t = 16.5
     assert ftor_factory(15.0)(state, event_buffer) == 16.5
+
+
+def test_batch(event_buffer: typing.Optional[EventBuffer]):
+    batch_state = BatchState(3)
+    ftor = EvaluateDuration(halting_component=HaltAfterElapsedTime(15.0))
+    assert ftor(batch_state, event_buffer) is None
+
+    batch_state.t[:] = [14.5, 16.5, 17.5]
+    assert ftor(batch_state, event_buffer) == [None, 16.5, 17.5]
+
+
+def test_sentinel_duration(event_buffer: typing.Optional[EventBuffer]):
+    state = State()
+    state.t = 4.0
+
+    ftor = EvaluateDuration(lambda state, event_buffer: "quiescent")
+    assert ftor(state, event_buffer) == 4.0
+
+    ftor = EvaluateDuration(
+        lambda state, event_buffer: "quiescent", sentinel_duration=10.0
+    )
+    assert ftor(state, event_buffer) == 10.0
+
+    ftor = EvaluateDuration(
+        lambda state, event_buffer: "other", sentinel_duration=10.0
+    )
+    assert ftor(state, event_buffer) == 4.0
+
+    ftor = EvaluateDuration(
+        lambda state, event_buffer: state,
+        sentinel=0,
+        sentinel_duration=10.0,
+    )
+    assert ftor(state, event_buffer) == 4.0
+
+
+def test_sentinel_duration_batch(event_buffer: typing.Optional[EventBuffer]):
+    batch_state = BatchState(3)
+    batch_state.t[:] = [1.0, 2.0, 3.0]
+    ftor = EvaluateDuration(
+        lambda state, event_buffer: [None, "quiescent", "finished"],
+        sentinel_duration=10.0,
+    )
+    assert ftor(batch_state, event_buffer) == [None, 10.0, 3.0]
+
+
+def test_failure_duration(event_buffer: typing.Optional[EventBuffer]):
+    state = State()
+    state.vx[0, 0] = np.nan
+
+    ftor = EvaluateDuration(HaltOnDivergence())
+    assert isinstance(ftor(state, event_buffer), DivergenceFailure)
+
+    ftor = EvaluateDuration(HaltOnDivergence(), failure_duration=1e9)
+    assert ftor(state, event_buffer) == 1e9
+
+
+def test_failure_duration_batch(event_buffer: typing.Optional[EventBuffer]):
+    batch_state = BatchState(3)
+    batch_state.t[:] = [1.0, 2.0, 3.0]
+    batch_state.vx[1, 0, 0] = np.nan
+    ftor = EvaluateDuration(HaltOnDivergence(), failure_duration=1e9)
+    assert ftor(batch_state, event_buffer) == [None, 1e9, None]
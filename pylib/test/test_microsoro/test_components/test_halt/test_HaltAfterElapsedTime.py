@@ -2,7 +2,7 @@ import typing
 
 import pytest
 
-from pylib.microsoro import State
+from pylib.microsoro import BatchState, State
 from pylib.microsoro.components import HaltAfterElapsedTime
 from pylib.microsoro.events import EventBuffer
 
@@ -13,7 +13,6 @@ def event_buffer(request: pytest.FixtureRequest):
 
 
 def test_HaltAfterElapsedTime(event_buffer: typing.Optional[EventBuffer]):
-
     state = State()
     assert HaltAfterElapsedTime(15.0)(state, event_buffer) is None
 
@@ -22,3 +21,12 @@ def test_HaltAfterElapsedTime(event_buffer: typing.Optional[EventBuffer]):
 
     state.t = 16.5
     assert HaltAfterElapsedTime(15.0)(state, event_buffer) is state
+
+
+def test_batch(event_buffer: typing.Optional[EventBuffer]):
+    batch_state = BatchState(3)
+    assert HaltAfterElapsedTime(15.0)(batch_state, event_buffer) is None
+
+    batch_state.t[:] = [14.5, 16.5, 15.0]
+    res = HaltAfterElapsedTime(15.0)(batch_state, event_buffer)
+    assert res == [None, batch_state.get_state(1), None]
@@ -0,0 +1,160 @@
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    BatchState,
+    get_default_update_regimen,
+    GraphStructure,
+    Params,
+    perform_simulation,
+    State,
+    Structure,
+)
+from pylib.microsoro.components import (
+    DivergenceFailure,
+    EvaluateDuration,
+    HaltAfterElapsedTime,
+    HaltOnDivergence,
+)
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(speed_fraction=0.0),
+        dict(length_factor=-1.0),
+        dict(speed_fraction=np.nan),
+    ],
+)
+def test_bad_init(kwargs: dict):
+    with pytest.raises(ValueError):
+        HaltOnDivergence(**kwargs)
+
+
+def test_still(event_buffer: typing.Optional[EventBuffer]):
+    assert HaltOnDivergence()(State(), event_buffer) is None
+
+
+def test_speed(event_buffer: typing.Optional[EventBuffer]):
+    params = Params(dt=1e-2)  # speed limit 0.5 * 2.0 / 1e-2 = 100
+    ftor = HaltOnDivergence(params=params)
+    state = State()
+    state.t = 1.5
+
+    state.vy[3, 4] = 99.0
+    assert ftor(state, event_buffer) is None
+
+    state.vy[3, 4] = 101.0
+    res = ftor(state, event_buffer)
+    assert res == DivergenceFailure(
+        t=1.5,
+        reason="speed",
+        max_speed=101.0,
+        max_length=1.0,
+        speed_limit=100.0,
+        length_limit=8.0,
+    )
+
+
+@pytest.mark.parametrize("axis", ["px", "py"])
+def test_length(event_buffer: typing.Optional[EventBuffer], axis: str):
+    ftor = HaltOnDivergence(length_factor=2.0)  # length limit 4.0
+    state = State()
+
+    getattr(state, axis)[2:, 2:] += 2.9
+    assert ftor(state, event_buffer) is None
+
+    getattr(state, axis)[2:, 2:] += 0.2
+    res = ftor(state, event_buffer)
+    assert isinstance(res, DivergenceFailure)
+    assert res.reason == "length"
+    assert res.max_length == pytest.approx(4.1)
+    assert res.length_limit == 4.0
+
+
+@pytest.mark.parametrize("field", ["px", "py", "vx", "vy"])
+def test_nonfinite(event_buffer: typing.Optional[EventBuffer], field: str):
+    state = State()
+    getattr(state, field)[1, 1] = np.nan
+    res = HaltOnDivergence()(state, event_buffer)
+    assert isinstance(res, DivergenceFailure)
+    assert res.reason == "nonfinite"
+
+
+def test_graph_structure(event_buffer: typing.Optional[EventBuffer]):
+    mask = np.ones((8, 8), dtype=bool)
+    mask[:, 4] = False
+    structure = GraphStructure.from_structure(Structure(), mask=mask)
+    state = State()
+    state.px[:, 5:] += 10.0  # detached cells drift apart
+
+    assert HaltOnDivergence()(state, event_buffer) is not None
+    ftor = HaltOnDivergence(structure=structure)
+    assert ftor(state, event_buffer) is None
+
+    state.px[:, 7] += 10.0
+    assert ftor(state, event_buffer).reason == "length"
+
+
+def test_batch(event_buffer: typing.Optional[EventBuffer]):
+    ftor = HaltOnDivergence()
+    batch_state = BatchState(3)
+    assert ftor(batch_state, event_buffer) is None
+
+    batch_state.t[:] = [1.0, 2.0, 3.0]
+    batch_state.vx[2, 0, 0] = np.inf
+    batch_state.py[0, 0, 0] -= 100.0
+    res = ftor(batch_state, event_buffer)
+    assert len(res) == 3
+    assert res[0].reason == "length" and res[0].t == 1.0
+    assert res[1] is None
+    assert res[2].reason == "nonfinite" and res[2].t == 3.0
+
+
+def test_perform_simulation_unstable():
+    params = Params(dt=1e-2)  # too coarse for default stiffness
+    structure = Structure(params=params)
+    regimen = get_default_update_regimen(params=params, structure=structure)
+
+    res = perform_simulation(
+        update_regimen_components=[
+            *regimen,
+            HaltOnDivergence(params=params),
+            HaltAfterElapsedTime(3.0),
+        ],
+    )
+    assert isinstance(res, DivergenceFailure)
+    assert res.reason in ("speed", "length")
+    assert res.t < 0.5  # aborted within steps of instability onset
+
+    res = perform_simulation(
+        update_regimen_components=[
+            *regimen,
+            EvaluateDuration(
+                HaltOnDivergence(params=params), failure_duration=1e9
+            ),
+            HaltAfterElapsedTime(3.0),
+        ],
+    )
+    assert res == 1e9
+
+
+def test_perform_simulation_stable():
+    np.random.seed(1)
+    structure = Structure.make_random()
+    res = perform_simulation(
+        update_regimen_components=[
+            *get_default_update_regimen(structure=structure),
+            HaltOnDivergence(),
+            HaltAfterElapsedTime(3.0),
+        ],
+    )
+    assert isinstance(res, State)
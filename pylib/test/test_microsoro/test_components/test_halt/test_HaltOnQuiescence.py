@@ -0,0 +1,140 @@
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    BatchState,
+    get_default_update_regimen,
+    perform_simulation,
+    State,
+    Structure,
+)
+from pylib.microsoro.components import (
+    EvaluateDuration,
+    HaltAfterElapsedTime,
+    HaltOnQuiescence,
+)
+from pylib.microsoro.conditioners import ApplyPropel
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+def _advance(state: State, dt: float, dpx: float = 0.0) -> None:
+    state.t += dt
+    state.px += dpx
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(window=-1.0),
+        dict(kinetic_energy_threshold=-1.0),
+        dict(displacement_threshold=-1.0),
+        dict(window=np.nan),
+    ],
+)
+def test_bad_init(kwargs: dict):
+    with pytest.raises(ValueError):
+        HaltOnQuiescence(**kwargs)
+
+
+def test_still(event_buffer: typing.Optional[EventBuffer]):
+    ftor = HaltOnQuiescence(window=1.0, sentinel="still")
+    state = State()
+    for __ in range(4):
+        assert ftor(state, event_buffer) is None
+        _advance(state, 0.25)
+    assert ftor(state, event_buffer) == "still"
+
+
+def test_kinetic_energy_restarts_window(
+    event_buffer: typing.Optional[EventBuffer],
+):
+    ftor = HaltOnQuiescence(window=1.0, kinetic_energy_threshold=0.5)
+    state = State()
+    ApplyPropel(dvx=1.5)(state)  # kinetic energy 1.125
+
+    for __ in range(8):
+        assert ftor(state, event_buffer) is None
+        _advance(state, 0.25)
+
+    state.vx[...] = 0.9  # kinetic energy 0.405
+    for __ in range(3):
+        assert ftor(state, event_buffer) is None
+        _advance(state, 0.25)
+    assert ftor(state, event_buffer) == "quiescent"
+
+
+def test_displacement_restarts_window(
+    event_buffer: typing.Optional[EventBuffer],
+):
+    ftor = HaltOnQuiescence(window=1.0, displacement_threshold=0.1)
+
+    # slow drift accumulates past displacement threshold
+    state = State()
+    for __ in range(8):
+        assert ftor(state, event_buffer) is None
+        _advance(state, 0.25, dpx=0.12)
+
+    # jitter about a fixed point does not
+    for step in range(4):
+        assert ftor(state, event_buffer) is None
+        _advance(state, 0.25, dpx=0.06 * (-1) ** step)
+    assert ftor(state, event_buffer) == "quiescent"
+
+
+def test_restarts_on_replay():
+    ftor = HaltOnQuiescence(window=1.0)
+    state = State()
+    for __ in range(3):
+        assert ftor(state) is None
+        _advance(state, 0.25)
+
+    state.t = 0.25  # i.e., rolled back to snapshot
+    for __ in range(4):
+        assert ftor(state) is None
+        _advance(state, 0.25)
+    assert ftor(state) == "quiescent"
+
+
+def test_batch(event_buffer: typing.Optional[EventBuffer]):
+    ftor = HaltOnQuiescence(window=1.0)
+    states = [State() for __ in range(3)]
+    ApplyPropel(dvx=1.0)(states[1])
+    batch_state = BatchState.from_states(states)
+
+    for __ in range(4):
+        assert ftor(batch_state, event_buffer) is None
+        batch_state.t += 0.25
+    assert ftor(batch_state, event_buffer) == ["quiescent", None, "quiescent"]
+
+
+def test_perform_simulation():
+    np.random.seed(0)
+    structure = Structure.make_random()
+
+    # settles after falling onto floor, well before timeout
+    res = perform_simulation(
+        update_regimen_components=[
+            *get_default_update_regimen(structure=structure),
+            EvaluateDuration(HaltOnQuiescence(), sentinel_duration=10.0),
+            HaltAfterElapsedTime(10.0),
+        ],
+    )
+    assert res == 10.0
+
+    res = perform_simulation(
+        update_regimen_components=[
+            *get_default_update_regimen(structure=structure),
+            HaltOnQuiescence(),
+            HaltAfterElapsedTime(10.0),
+        ],
+        yield_intermediate_states=True,
+    )
+    num_steps = sum(1 for __ in res)
+    assert num_steps < 8000
@@ -1,7 +1,7 @@
 import pytest
 import numpy as np
 
-from pylib.microsoro import conditioners, components, State
+from pylib.microsoro import BatchState, conditioners, components, State
 
 
 def test_cell_beyond_finish_line():
@@ -82,3 +82,18 @@ def test_independent_axis_x_not_past():
 def test_invalid_independent_axis():
     with pytest.raises(ValueError):
         components.HaltPastFinishLine(independent_axis="z")
+
+
+def test_batch():
+    states = [State(height=4, width=4) for __ in range(3)]
+    conditioners.ApplyTranslate(dpx=9, dpy=-1)(states[1])
+    batch_state = BatchState.from_states(states)
+    ftor = components.HaltPastFinishLine(b=10)
+
+    res = ftor(batch_state)
+    assert len(res) == 3
+    assert res[0] is None
+    assert res[1] == states[1]
+    assert res[2] is None
+
+    assert ftor(BatchState.from_states([State(height=4, width=4)])) is None
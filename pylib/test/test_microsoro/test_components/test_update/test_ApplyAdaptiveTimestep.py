@@ -0,0 +1,166 @@
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    BatchState,
+    BatchStructure,
+    Params,
+    State,
+    Structure,
+    get_default_update_regimen,
+    perform_simulation,
+)
+from pylib.microsoro.components import (
+    ApplyAdaptiveTimestep,
+    EvaluateDuration,
+    HaltAfterElapsedTime,
+)
+from pylib.microsoro.conditioners import ApplyTranslate
+from pylib.microsoro.events import EventBuffer, RenderFloorEvent
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+def make_params(**kwargs) -> Params:
+    return Params(dt_lim=(1e-5, 2e-3), **kwargs)
+
+
+def make_ftor(params: Params, **kwargs) -> ApplyAdaptiveTimestep:
+    return ApplyAdaptiveTimestep(
+        get_default_update_regimen(params), params, **kwargs
+    )
+
+
+@pytest.mark.parametrize("tolerance", [0.0, -1.0, np.nan])
+def test_bad_tolerance(tolerance: float):
+    with pytest.raises(ValueError):
+        make_ftor(make_params(), tolerance=tolerance)
+
+
+def test_free_fall_grows_dt(event_buffer: typing.Optional[EventBuffer]):
+    params = make_params()
+    ftor = make_ftor(params)
+    state = State()
+    ApplyTranslate(dpy=5.0)(state)
+
+    dts = []
+    while state.t < 0.5:
+        res = ftor(state, event_buffer)
+        assert res is None
+        dts.append(params.dt)
+
+    assert all(np.clip(dt, *params.dt_lim) == dt for dt in dts)
+    assert dts == sorted(dts)
+    assert dts[-1] == params.dt_lim[1]
+    assert np.isclose(state.t, 2 * sum(dts))
+
+    # free fall, without any spring forces
+    assert np.allclose(state.vy, -params.g * state.t, rtol=1e-3)
+    assert np.allclose(state.vx, 0.0)
+
+
+def test_contact_shrinks_dt(event_buffer: typing.Optional[EventBuffer]):
+    params = make_params()
+    ftor = make_ftor(params)
+    state = State()
+    ApplyTranslate(dpy=1.0)(state)
+
+    dts, max_vy = [], -np.inf
+    while state.t < 1.0:
+        ftor(state, event_buffer)
+        dts.append(params.dt)
+        max_vy = max(max_vy, state.vy.max())
+    assert state.validate()
+
+    assert all(np.clip(dt, *params.dt_lim) == dt for dt in dts)
+    assert max(dts) == params.dt_lim[1]
+    assert min(dts) < params.dt_lim[1] / 10
+
+    # cells bounced, and have stayed above floor
+    assert state.py.min() >= 0.0
+    assert max_vy > 0.0
+
+
+def test_stiff_rejects_unstable_dt():
+    params = Params(dt=1e-2, dt_lim=(1e-5, 1e-2), k_lim=(1e3, 5e4), k=5e4)
+    ftor = make_ftor(params)
+    state = State()
+    state.px[0, 0] -= 0.2
+
+    ftor(state)
+    assert params.dt < 1e-2
+    assert np.isclose(state.t, 2 * params.dt)
+    assert state.validate()
+
+    while state.t < 0.2:
+        ftor(state)
+    assert state.validate()
+    assert np.abs(state.vx).max() < 10.0
+
+
+@pytest.mark.parametrize("dpy", [0.0, 1.0])
+def test_tolerance_controls_num_steps(dpy: float):
+    def count_steps(tolerance: float) -> int:
+        ftor = make_ftor(make_params(), tolerance=tolerance)
+        state = State()
+        ApplyTranslate(dpy=dpy)(state)
+        state.px[0, 0] -= 0.2
+        num_steps = 0
+        while state.t < 0.2:
+            ftor(state)
+            num_steps += 1
+        assert state.validate()
+        return num_steps
+
+    assert count_steps(1e-3) < count_steps(1e-4) < count_steps(1e-5)
+
+
+def test_render_floor_events():
+    params = make_params()
+    ftor = make_ftor(params)
+    state = State()
+    event_buffer = EventBuffer()
+
+    for __ in range(10):
+        ftor(state, event_buffer)
+        events = []
+        event_buffer.consume(RenderFloorEvent, events.append)
+        assert len(events) == 1  # event buffer cleared at each half step
+
+
+def test_batch():
+    params = make_params()
+    structure = BatchStructure(3, params=params)
+    ftor = ApplyAdaptiveTimestep(
+        get_default_update_regimen(params, structure), params
+    )
+    batch_state = BatchState(3)
+    ApplyTranslate(dpy=1.0)(batch_state)
+    state = State()
+    ApplyTranslate(dpy=1.0)(state)
+    single = make_ftor(make_params())
+
+    for __ in range(20):
+        ftor(batch_state)
+        single(state)
+
+    assert batch_state.validate()
+    for index in range(3):
+        assert batch_state.get_state(index).same_position_as(state)
+
+
+@pytest.mark.parametrize("target_duration", [0.0, 0.5])
+def test_perform_simulation(target_duration: float):
+    params = make_params()
+    res = perform_simulation(
+        update_regimen_components=[
+            make_ftor(params),
+            EvaluateDuration(HaltAfterElapsedTime(target_duration)),
+        ],
+    )
+    assert target_duration < res <= target_duration + 2 * params.dt_lim[1]
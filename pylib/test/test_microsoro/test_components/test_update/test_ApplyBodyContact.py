@@ -0,0 +1,134 @@
+import copy
+import itertools as it
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import GraphStructure, Params, State, Structure
+from pylib.microsoro.components import ApplyBodyContact
+from pylib.microsoro.conditioners import ApplyTranslate
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+@pytest.mark.parametrize("radius", [0.0, -1.0, np.nan])
+def test_bad_radius(radius: float):
+    with pytest.raises(ValueError):
+        ApplyBodyContact(radius=radius)
+
+
+def test_bad_k():
+    with pytest.raises(ValueError):
+        ApplyBodyContact(k=-1.0)
+
+
+def test_mismatched_lengths():
+    with pytest.raises(ValueError):
+        ApplyBodyContact()([State(), State()], [Structure()])
+
+
+@pytest.mark.parametrize("num_bodies", [0, 1])
+def test_too_few_bodies_no_effect(num_bodies: int):
+    states = [State() for __ in range(num_bodies)]
+    reference = copy.deepcopy(states)
+    ApplyBodyContact()(states, [Structure() for __ in range(num_bodies)])
+    for state, ref in zip(states, reference):
+        assert state == ref
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_find_body_pairs_equivalent_to_all_pairs(seed: int):
+    np.random.seed(seed)
+    lower = np.random.uniform(-10.0, 10.0, (30, 2))
+    upper = lower + np.random.uniform(0.0, 4.0, (30, 2))
+    bounds = np.stack([lower[:, 0], upper[:, 0], lower[:, 1], upper[:, 1]], 1)
+
+    first, second = ApplyBodyContact()._find_body_pairs(bounds)
+    assert np.all(first < second)
+    expected = {
+        (a, b)
+        for a, b in it.combinations(range(30), 2)
+        if bounds[a, 0] <= bounds[b, 1]
+        and bounds[b, 0] <= bounds[a, 1]
+        and bounds[a, 2] <= bounds[b, 3]
+        and bounds[b, 2] <= bounds[a, 3]
+    }
+    assert set(zip(first.tolist(), second.tolist())) == expected
+    assert len(first) == len(expected)
+
+
+def test_separated_no_effect(event_buffer: typing.Optional[EventBuffer]):
+    states = [State(), State(), State(5, 3)]
+    ApplyTranslate(dpx=7.6)(states[1])
+    ApplyTranslate(dpy=-7.6)(states[2])
+    reference = copy.deepcopy(states)
+
+    res = ApplyBodyContact()(
+        states, [Structure(), Structure(), Structure(5, 3)], event_buffer
+    )
+    assert res is None
+    for state, ref in zip(states, reference):
+        assert state == ref
+
+
+@pytest.mark.parametrize("offset", [7.1, 7.25, 7.4])
+def test_overlapping_repel(offset: float):
+    params = Params()
+    structures = [Structure(), GraphStructure.from_structure(Structure(6, 4))]
+    states = [State(), State(6, 4)]
+    ApplyTranslate(dpx=offset)(states[1])
+    positions = copy.deepcopy(states)
+
+    ApplyBodyContact(params=params)(states, structures)
+
+    # bodies pushed apart along x only, at facing edge columns
+    assert np.all(states[0].vx[:, :-1] == 0.0)
+    assert np.all(states[0].vx[:6, -1] < 0.0)
+    assert np.all(states[0].vx[6:, -1] == 0.0)
+    assert np.all(states[1].vx[:, 0] > 0.0)
+    assert np.all(states[1].vx[:, 1:] == 0.0)
+    for state in states:
+        assert np.allclose(state.vy, 0.0)
+
+    # equal and opposite impulses, for equal masses
+    assert np.isclose(states[0].vx.sum(), -states[1].vx.sum())
+    for state, position in zip(states, positions):
+        assert State.same_position_as(state, position)
+
+    # penalty force proportional to overlap
+    overlap = params.l / 2 - (offset - 7.0)
+    assert np.allclose(states[1].vx[:, 0], params.k * overlap * params.dt)
+
+
+def test_equivalent_to_pairwise():
+    np.random.seed(1)
+    states = [State() for __ in range(4)]
+    for state, (dpx, dpy) in zip(
+        states, [(0, 0), (6.0, 0.5), (3, 6.2), (40, 0)]
+    ):
+        ApplyTranslate(dpx=dpx, dpy=dpy)(state)
+        state.px += np.random.uniform(-0.3, 0.3, state.px.shape)
+    structures = [Structure() for __ in range(4)]
+
+    contact = ApplyBodyContact()
+    together = copy.deepcopy(states)
+    contact(together, structures)
+
+    pairwise = copy.deepcopy(states)
+    for a, b in it.combinations(range(4), 2):
+        pair = [copy.deepcopy(states[a]), copy.deepcopy(states[b])]
+        contact(pair, [structures[a], structures[b]])
+        for body, updated in zip((a, b), pair):
+            pairwise[body].vx += updated.vx
+            pairwise[body].vy += updated.vy
+
+    for state, reference in zip(together, pairwise):
+        assert np.allclose(state.vx, reference.vx)
+        assert np.allclose(state.vy, reference.vy)
+    assert not np.all(together[0].vx == 0.0)
+    assert np.all(together[3].vx == 0.0)
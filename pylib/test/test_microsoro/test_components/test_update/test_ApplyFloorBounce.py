@@ -4,7 +4,7 @@ import typing
 import pytest
 import numpy as np
 
-from pylib.microsoro import conditioners, State, Structure
+from pylib.microsoro import BatchState, conditioners, State, Structure
 from pylib.microsoro.components import ApplyFloorBounce
 from pylib.microsoro.events import EventBuffer
 
@@ -153,3 +153,42 @@ def test_slanted_trajectory_flat_floor(
     # -in current implementation, all cells shifted back
     # assert np.all(state.py[1:, 1:] == prestate.py[1:, 1:])  # old test
     assert np.all(state.py[1:, 1:] > prestate.py[1:, 1:])  # new test
+
+
+@pytest.mark.parametrize("m", [-1.0, -0.25, 0.0])
+def test_batch(m: float, event_buffer: typing.Optional[EventBuffer]):
+    states = [State() for __ in range(3)]
+    conditioners.ApplyTranslate(dpy=100.0)(states[0])
+    conditioners.ApplyTranslate(dpy=-0.5)(states[1])
+    conditioners.BundleConditioners(
+        conditioners.ApplyRotate(theta_degrees=-30.0),
+        conditioners.ApplyTranslate(dpy=-2.0),
+    )(states[2])
+    for state in states:
+        conditioners.ApplyPropel(dvx=0.5, dvy=-1.0)(state)
+    batch_state = BatchState.from_states(states)
+
+    ftor = ApplyFloorBounce(m=m, e=0.9)
+    res = ftor(batch_state, event_buffer)
+    assert res is None
+
+    for index, state in enumerate(states):
+        ftor(state, event_buffer)
+        assert State.same_position_as(batch_state.get_state(index), state)
+        assert State.same_velocity_as(batch_state.get_state(index), state)
+
+
+@pytest.mark.parametrize("m, b", [(0.0, 0.0), (-0.3, 0.5), (-2.0, 7.0)])
+def test_float32(m: float, b: float):
+    np.random.seed(1)
+    ftor = ApplyFloorBounce(m=m, b=b)
+    for __ in range(100):
+        state = State(dtype=np.float32)
+        state.px += np.random.uniform(-20.0, 20.0)
+        state.py += np.random.uniform(-20.0, 20.0)
+        state.vy -= 1.0
+        ftor(state)  # asserts all cells are above floor
+
+        for arr in state.px, state.py, state.vx, state.vy:
+            assert arr.dtype == np.float32
+        assert not (state.py < m * state.px + b).any()
@@ -0,0 +1,65 @@
+import copy
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import Params, State
+from pylib.microsoro.components import (
+    ApplyGravity,
+    ApplyHalfTimestep,
+    ApplyVelocity,
+)
+from pylib.microsoro.conditioners import ApplyPropel
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+def test_equivalent_to_half_dt(event_buffer: typing.Optional[EventBuffer]):
+    params = Params(dt=1e-2)
+    state1 = State()
+    ApplyPropel(dvx=1.0, dvy=2.0)(state1)
+    state2 = copy.deepcopy(state1)
+
+    ftor = ApplyHalfTimestep(
+        [ApplyGravity(params), ApplyVelocity(params)], params
+    )
+    res = ftor(state1, event_buffer)
+    assert res is None
+    assert params.dt == 1e-2
+
+    half_params = Params(dt=5e-3)
+    ApplyGravity(half_params)(state2)
+    ApplyVelocity(half_params)(state2)
+
+    assert state1 == state2
+
+
+def test_restores_dt_on_exception():
+    params = Params(dt=1e-2)
+    seen_dts = []
+
+    def component(state: State, event_buffer: EventBuffer) -> None:
+        seen_dts.append(params.dt)
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        ApplyHalfTimestep([component], params)(State())
+
+    assert seen_dts == [5e-3]
+    assert params.dt == 1e-2
+
+
+def test_ignores_return_values():
+    def component(state: State, event_buffer: EventBuffer) -> str:
+        state.t += 1.0
+        return "halt"
+
+    state = State()
+    res = ApplyHalfTimestep([component, component])(state)
+    assert res is None
+    assert np.isclose(state.t, 2.0)
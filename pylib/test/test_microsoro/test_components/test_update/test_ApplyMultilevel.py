@@ -0,0 +1,173 @@
+import copy
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    Coarsening,
+    get_default_update_regimen,
+    Params,
+    State,
+    Structure,
+)
+from pylib.microsoro.components import ApplyMultilevel
+from pylib.microsoro.conditioners import ApplyStretch, ApplyTranslate
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+def _make_multilevel(
+    structure: Structure, params: Params, **kwargs: typing.Any
+) -> ApplyMultilevel:
+    coarsening = Coarsening(structure, 2)
+    return ApplyMultilevel(
+        get_default_update_regimen(params, structure),
+        get_default_update_regimen(params, coarsening.structure),
+        coarsening,
+        params,
+        **kwargs,
+    )
+
+
+def test_free_fall_stays_coarse(event_buffer: typing.Optional[EventBuffer]):
+    params = Params()
+    structure = Structure(params=params)
+    ftor = _make_multilevel(structure, params)
+
+    state = State()
+    ApplyTranslate(dpy=20.0)(state)
+    reference = copy.deepcopy(state)
+    regimen = get_default_update_regimen(params, structure)
+    for _update in range(500):
+        assert ftor(state, event_buffer) is None
+        assert not ftor.is_refined
+        for component in regimen:
+            component(reference, event_buffer)
+
+    assert state.validate()
+    assert state.t == reference.t
+    assert np.isclose(state.py.mean(), reference.py.mean())
+    assert np.isclose(state.vy.mean(), reference.vy.mean())
+    assert state.same_position_as(reference)
+
+
+def test_impact_refines(event_buffer: typing.Optional[EventBuffer]):
+    params = Params()
+    structure = Structure(params=params)
+    ftor = _make_multilevel(structure, params, window=0.05)
+
+    state = State()
+    ApplyTranslate(dpy=5.0)(state)
+    refined_at = None
+    for _update in range(5000):
+        ftor(state, event_buffer)
+        if ftor.is_refined and refined_at is None:
+            refined_at = state.t
+            assert state.py.min() < 2 * params.l
+            assert state.vy.mean() < -1.0
+        if refined_at is not None and not ftor.is_refined:
+            break
+    else:
+        assert False, "never refined and returned to coarse level"
+
+    assert state.validate()
+    assert state.t - refined_at >= 0.05
+
+    # resting on floor at coarse level, bottom cells stay at floor
+    for _update in range(100):
+        ftor(state, event_buffer)
+    assert not ftor.is_refined
+    assert abs(state.py.min()) < 0.5 * params.l
+
+
+def test_strain_refines():
+    params = Params()
+    structure = Structure(params=params)
+    ftor = _make_multilevel(structure, params, window=0.0)
+
+    state = State()
+    ApplyTranslate(dpy=20.0)(state)
+    ApplyStretch(mx=1.5)(state)
+    ftor(state)
+    assert ftor.is_refined
+
+    for _update in range(2000):
+        ftor(state)
+        if not ftor.is_refined:
+            break
+    else:
+        assert False, "never returned to coarse level"
+    assert state.validate()
+
+
+def test_restarts_on_new_state():
+    params = Params()
+    structure = Structure(params=params)
+    ftor = _make_multilevel(structure, params)
+
+    state1 = State()
+    ApplyTranslate(dpy=20.0)(state1)
+    for _update in range(10):
+        ftor(state1)
+
+    state2 = State()
+    ApplyTranslate(dpy=10.0)(state2)
+    reference = copy.deepcopy(state2)
+    ftor(state2)
+    for component in get_default_update_regimen(params, structure):
+        component(reference)
+    assert state2.t == reference.t
+    assert state2.same_position_as(reference)
+
+
+def test_prolong_interval():
+    params = Params()
+    structure = Structure(params=params)
+    ftor1 = _make_multilevel(structure, params)
+    ftor2 = _make_multilevel(structure, params, prolong_interval=3)
+
+    state1 = State()
+    ApplyTranslate(dpy=20.0)(state1)
+    state2 = copy.deepcopy(state1)
+    for update in range(1, 10):
+        ftor1(state1)
+        ftor2(state2)
+        assert state1.t == state2.t
+        assert np.array_equal(state1.py, state2.py) == (update % 3 == 0)
+
+
+@pytest.mark.parametrize("mx, expected", [(1.0, "coarse"), (1.5, "fine")])
+def test_returns_component_result(mx: float, expected: str):
+    params = Params()
+    coarsening = Coarsening(Structure(params=params), 2)
+    ftor = ApplyMultilevel(
+        [lambda state, event_buffer: "fine"],
+        [lambda state, event_buffer: "coarse"],
+        coarsening,
+        params,
+    )
+
+    state = State()
+    ApplyTranslate(dpy=20.0)(state)
+    ApplyStretch(mx=mx)(state)
+    assert ftor(state) == expected
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"strain_threshold": -0.1},
+        {"impact_speed": -1.0},
+        {"window": -1.0},
+        {"prolong_interval": 0},
+    ],
+)
+def test_bad_args(kwargs: typing.Dict[str, float]):
+    coarsening = Coarsening(Structure(), 2)
+    with pytest.raises(ValueError):
+        ApplyMultilevel([], [], coarsening, **kwargs)
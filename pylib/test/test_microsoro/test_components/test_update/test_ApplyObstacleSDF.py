@@ -0,0 +1,203 @@
+import copy
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    BatchState,
+    conditioners,
+    get_default_update_regimen,
+    perform_simulation,
+    State,
+)
+from pylib.microsoro.components import (
+    ApplyFloorBounce,
+    ApplyObstacleSDF,
+    HaltAfterElapsedTime,
+)
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+def _make_disk_sdf(
+    center: typing.Tuple[float, float],
+    radius: float,
+    origin: typing.Tuple[float, float] = (-10.0, -10.0),
+    spacing: float = 0.25,
+    size: int = 121,
+) -> np.ndarray:
+    x = origin[0] + spacing * np.arange(size)
+    y = origin[1] + spacing * np.arange(size)
+    xx, yy = np.meshgrid(x, y)
+    return np.hypot(xx - center[0], yy - center[1]) - radius
+
+
+def test_init():
+    ApplyObstacleSDF(np.zeros((2, 2)))
+
+    with pytest.raises(ValueError):
+        ApplyObstacleSDF(np.zeros((2, 2)), e=-0.5)
+    with pytest.raises(ValueError):
+        ApplyObstacleSDF(np.zeros((1, 5)))
+    with pytest.raises(ValueError):
+        ApplyObstacleSDF(np.zeros(5))
+    with pytest.raises(ValueError):
+        ApplyObstacleSDF(np.full((2, 2), np.nan))
+    with pytest.raises(ValueError):
+        ApplyObstacleSDF(np.zeros((2, 2)), spacing=0.0)
+
+
+def test_no_cells_in_obstacle(event_buffer: typing.Optional[EventBuffer]):
+    ftor = ApplyObstacleSDF(
+        _make_disk_sdf((20.0, 0.0), 3.0), origin=(-10.0, -10.0), spacing=0.25
+    )
+    state = State()
+    conditioners.ApplyPropel(dvx=1.0, dvy=-1.0)(state)
+    prestate = copy.deepcopy(state)
+
+    res = ftor(state, event_buffer)
+    assert res is None
+    assert State.same_position_as(state, prestate)
+    assert State.same_velocity_as(state, prestate)
+
+
+def test_cells_outside_grid_unaffected():
+    ftor = ApplyObstacleSDF(-np.ones((4, 4)), origin=(100.0, 100.0))
+    state = State()
+    prestate = copy.deepcopy(state)
+    ftor(state)
+    assert State.same_position_as(state, prestate)
+    assert State.same_velocity_as(state, prestate)
+
+
+@pytest.mark.parametrize("elasticity", [0.5, 1.0])
+def test_disk_obstacle(
+    elasticity: float, event_buffer: typing.Optional[EventBuffer]
+):
+    center, radius = (3.5, -1.0), 2.0
+    ftor = ApplyObstacleSDF(
+        _make_disk_sdf(center, radius),
+        origin=(-10.0, -10.0),
+        spacing=0.25,
+        e=elasticity,
+    )
+    state = State()
+    conditioners.ApplyPropel(dvy=-1.0)(state)
+    prestate = copy.deepcopy(state)
+
+    dist = np.hypot(prestate.px - center[0], prestate.py - center[1])
+    inside = dist < radius
+    assert inside.any()
+
+    res = ftor(state, event_buffer)
+    assert res is None
+
+    # untouched cells outside obstacle
+    for field in "px", "py", "vx", "vy":
+        assert np.all(
+            getattr(state, field)[~inside] == getattr(prestate, field)[~inside]
+        )
+
+    # penetrating cells moved radially out to surface
+    new_dist = np.hypot(state.px - center[0], state.py - center[1])
+    assert np.allclose(new_dist[inside], radius, atol=0.02)
+    assert np.allclose(
+        np.arctan2(state.py - center[1], state.px - center[0])[inside],
+        np.arctan2(prestate.py - center[1], prestate.px - center[0])[inside],
+        atol=0.02,
+    )
+
+    # inward velocity components reflected, outward components kept
+    normal_x = (state.px - center[0]) / new_dist
+    normal_y = (state.py - center[1]) / new_dist
+    pre_dot = normal_x * prestate.vx + normal_y * prestate.vy
+    dot = normal_x * state.vx + normal_y * state.vy
+    assert np.allclose(
+        dot[inside], np.abs(pre_dot[inside]) * elasticity, atol=0.02
+    )
+    assert np.allclose(
+        np.hypot(state.vx, state.vy)[inside], elasticity, atol=1e-12
+    )
+
+
+@pytest.mark.parametrize("b", [0.0, -1.5])
+def test_half_plane_equivalent_to_floor(b: float):
+    # linear signed distance field is interpolated exactly
+    sdf = np.tile((np.arange(-20.0, 21.0) - b)[:, None], (1, 41))
+    ftor = ApplyObstacleSDF(sdf, origin=(-20.0, -20.0))
+    floor = ApplyFloorBounce(b=b)
+
+    state1 = State()
+    conditioners.ApplyTranslate(dpy=b - 0.5)(state1)
+    conditioners.ApplyPropel(dvx=0.3, dvy=-1.0)(state1)
+    state2 = copy.deepcopy(state1)
+
+    ftor(state1)
+    floor(state2)
+    assert np.allclose(state1.py[0], b)
+    assert State.same_velocity_as(state1, state2)
+
+
+def test_from_mask():
+    mask = np.zeros((40, 40), dtype=bool)
+    mask[10:20, 15:30] = True
+    ftor = ApplyObstacleSDF.from_mask(mask, origin=(-5.0, -5.0), spacing=0.5)
+
+    sdf = ftor._sdf.reshape(mask.shape)
+    assert np.all(sdf[mask] < 0)
+    assert np.all(sdf[~mask] > 0)
+    assert sdf[15, 22] == pytest.approx(-0.5 * 4.5)
+    assert sdf[0, 0] == pytest.approx(0.5 * (np.hypot(10, 15) - 0.5))
+
+    for mask in np.zeros((5, 5), dtype=bool), np.ones((5, 5), dtype=bool):
+        ftor = ApplyObstacleSDF.from_mask(mask)
+        assert np.all(np.sign(ftor._sdf) == np.where(mask.ravel(), -1, 1))
+
+
+def test_batch(event_buffer: typing.Optional[EventBuffer]):
+    ftor = ApplyObstacleSDF(
+        _make_disk_sdf((3.5, -1.0), 2.0),
+        origin=(-10.0, -10.0),
+        spacing=0.25,
+        e=0.8,
+    )
+    states = [State() for __ in range(3)]
+    conditioners.ApplyTranslate(dpy=100.0)(states[0])
+    conditioners.ApplyRotate(theta_degrees=30.0)(states[2])
+    for state in states:
+        conditioners.ApplyPropel(dvx=0.5, dvy=-1.0)(state)
+    batch_state = BatchState.from_states(states)
+
+    res = ftor(batch_state, event_buffer)
+    assert res is None
+
+    for index, state in enumerate(states):
+        ftor(state, event_buffer)
+        assert State.same_position_as(batch_state.get_state(index), state)
+        assert State.same_velocity_as(batch_state.get_state(index), state)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_perform_simulation_rests_on_obstacle(dtype: type):
+    # wide block obstacle, below body and above floor
+    mask = np.zeros((20, 60), dtype=bool)
+    mask[:13, :] = True
+    ftor = ApplyObstacleSDF.from_mask(mask, origin=(-20.0, -10.0))
+
+    state = perform_simulation(
+        setup_regimen_conditioners=[conditioners.ApplyTranslate(dpy=4.0)],
+        update_regimen_components=[
+            *get_default_update_regimen(),
+            ftor,
+            HaltAfterElapsedTime(2.0),
+        ],
+        dtype=dtype,
+    )
+    assert state.px.dtype == dtype
+    # obstacle surface lies at y = 2.5
+    assert 2.4 < state.py.min() < 3.0
@@ -0,0 +1,165 @@
+import copy
+import itertools as it
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    BatchState,
+    BatchStructure,
+    get_default_update_regimen,
+    Params,
+    State,
+    Structure,
+)
+from pylib.microsoro.components import ApplySelfCollision
+from pylib.microsoro.conditioners import (
+    ApplySpin,
+    ApplyStretch,
+    ApplyTorsion,
+    ApplyTranslate,
+)
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+@pytest.mark.parametrize("radius", [0.0, -1.0, np.nan])
+def test_bad_radius(radius: float):
+    with pytest.raises(ValueError):
+        ApplySelfCollision(radius=radius)
+
+
+def test_bad_k():
+    with pytest.raises(ValueError):
+        ApplySelfCollision(k=-1.0)
+
+
+def test_relaxed_no_effect(event_buffer: typing.Optional[EventBuffer]):
+    state = State()
+    ApplySpin()(state)
+    reference = copy.deepcopy(state)
+
+    res = ApplySelfCollision()(state, event_buffer)
+    assert res is None
+    assert State.same_velocity_as(state, reference)
+    assert State.same_position_as(state, reference)
+
+
+@pytest.mark.parametrize("radius", [0.2, 0.5, 1.5])
+@pytest.mark.parametrize("seed", range(3))
+def test_find_pairs_equivalent_to_all_pairs(radius: float, seed: int):
+    np.random.seed(seed)
+    px = np.random.uniform(-3.0, 3.0, 200)
+    py = np.random.uniform(-3.0, 3.0, 200)
+    individuals = np.arange(200) // 50
+
+    first, second = ApplySelfCollision(radius=radius)._find_pairs(
+        px, py, individuals
+    )
+    assert np.all(first < second)
+
+    expected = {
+        (a, b)
+        for a, b in it.combinations(range(200), 2)
+        if individuals[a] == individuals[b]
+        and np.hypot(px[a] - px[b], py[a] - py[b]) < radius
+    }
+    assert expected  # ensure test is meaningful
+    assert set(zip(first.tolist(), second.tolist())) == expected
+    assert len(first) == len(expected)  # no duplicates
+
+
+def test_repels_overlapping_cells():
+    params = Params()
+    state = State(1, 2)
+    state.px[0, 1] = state.px[0, 0] + 0.1  # overlapping
+
+    ApplySelfCollision(params=params, structure=Structure(1, 2))(state)
+    assert state.vx[0, 0] < 0.0 < state.vx[0, 1]
+    assert np.allclose(state.vy, 0.0)
+
+    # magnitude as penalty spring with overlap 0.5 - 0.1
+    assert np.isclose(state.vx[0, 1], params.k * 0.4 * params.dt / params.m)
+
+
+@pytest.mark.parametrize(
+    "conditioner",
+    [ApplyStretch(mx=0.3, my=0.3), ApplyStretch(mx=0.2, my=1.0)],
+)
+def test_conservation_of_momentum(conditioner: typing.Callable):
+    np.random.seed(1)
+    structure = Structure.make_random()
+    state = State()
+    conditioner(state)
+
+    ApplySelfCollision(structure=structure)(state)
+    assert not np.allclose(state.vx, 0.0)
+    assert np.isclose(np.sum(state.vx * structure.m), 0.0)
+    assert np.isclose(np.sum(state.vy * structure.m), 0.0)
+
+
+@pytest.mark.parametrize(
+    "conditioner", [ApplyTorsion(), ApplySpin(100.0)], ids=["torsion", "spin"]
+)
+def test_prevents_pass_through(conditioner: typing.Callable):
+    def min_separation(with_self_collision: bool) -> float:
+        params = Params(k=1e3)  # soft lattice, folds readily
+        regimen = get_default_update_regimen(params)
+        if with_self_collision:
+            regimen.insert(-3, ApplySelfCollision(params=params))
+        state = State()
+        ApplyTranslate(dpy=5.0)(state)
+        conditioner(state)
+
+        res = np.inf
+        for __ in range(2000):
+            for component in regimen:
+                component(state)
+            dists = np.hypot(
+                state.px.ravel()[:, None] - state.px.ravel()[None, :],
+                state.py.ravel()[:, None] - state.py.ravel()[None, :],
+            )
+            np.fill_diagonal(dists, np.inf)
+            res = min(res, dists.min())
+        assert state.validate()
+        return res
+
+    assert min_separation(True) > 3 * min_separation(False)
+
+
+def test_batch(event_buffer: typing.Optional[EventBuffer]):
+    np.random.seed(1)
+    structures = [Structure.make_random() for __ in range(3)]
+    states = [State() for __ in range(3)]
+    ApplyStretch(mx=0.3, my=0.3)(states[0])
+    ApplyStretch(mx=0.2, my=1.0)(states[1])
+    ApplyTorsion()(states[2])
+    batch_state = BatchState.from_states(states)
+
+    res = ApplySelfCollision(
+        structure=BatchStructure.from_structures(structures),
+    )(batch_state, event_buffer)
+    assert res is None
+
+    for index, (state, structure) in enumerate(zip(states, structures)):
+        ApplySelfCollision(structure=structure)(state, event_buffer)
+        assert State.same_velocity_as(batch_state.get_state(index), state)
+
+
+def test_float32():
+    params = Params(dtype=np.float32)
+    state = State(dtype=np.float32)
+    ApplyStretch(mx=0.3, my=0.3)(state)
+    reference = State()
+    ApplyStretch(mx=0.3, my=0.3)(reference)
+
+    ApplySelfCollision(params=params)(state)
+    ApplySelfCollision()(reference)
+    assert state.vx.dtype == np.float32
+    assert np.allclose(state.vx, reference.vx, atol=1e-4)
+    assert np.allclose(state.vy, reference.vy, atol=1e-4)
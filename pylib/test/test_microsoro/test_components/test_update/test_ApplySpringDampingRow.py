@@ -6,7 +6,13 @@ import numpy as np
 import pytest
 
 from pylib.auxlib import all_rows_equivalent
-from pylib.microsoro import State, Structure, Params
+from pylib.microsoro import (
+    BatchState,
+    BatchStructure,
+    Params,
+    State,
+    Structure,
+)
 from pylib.microsoro.components import ApplySpringDampingRow
 from pylib.microsoro.conditioners import (
     ApplyDeflect,
@@ -25,7 +31,6 @@ def event_buffer(request: pytest.FixtureRequest):
 
 
 def test_no_v_no_v(event_buffer: typing.Optional[EventBuffer]):
-
     state = State()
 
     ftor = ApplySpringDampingRow()
@@ -37,7 +42,6 @@ def test_no_v_no_v(event_buffer: typing.Optional[EventBuffer]):
 
 
 def test_no_differential_no_v(event_buffer: typing.Optional[EventBuffer]):
-
     state = State()
     ApplyPropel(dvx=1.0, dvy=1.0)(state)
 
@@ -201,3 +205,25 @@ def test_param_Structure(
 
     # should be in increasing order as b is added
     assert hstrat_aux.is_strictly_decreasing(sum_speeds)
+
+
+def test_batch(event_buffer: typing.Optional[EventBuffer]):
+    np.random.seed(1)
+    structures = [Structure.make_random() for __ in range(3)]
+    states = [State() for __ in range(3)]
+    ApplyStretch(mx=1.5, my=2.0)(states[0])
+    ApplyTorsion()(states[1])
+    ApplyRotate(30.0)(states[2])
+    for state in states:
+        state.vx, state.vy = state.px.copy(), state.py.copy()
+    batch_state = BatchState.from_states(states)
+
+    res = ApplySpringDampingRow(
+        structure=BatchStructure.from_structures(structures),
+    )(batch_state, event_buffer)
+    assert res is None
+
+    for index, (state, structure) in enumerate(zip(states, structures)):
+        ApplySpringDampingRow(structure=structure)(state, event_buffer)
+        assert State.same_position_as(batch_state.get_state(index), state)
+        assert State.same_velocity_as(batch_state.get_state(index), state)
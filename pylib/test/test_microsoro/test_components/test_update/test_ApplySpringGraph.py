@@ -0,0 +1,226 @@
+import copy
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    BatchState,
+    GraphStructure,
+    Params,
+    State,
+    Structure,
+)
+from pylib.microsoro.components import (
+    ApplySpringGraph,
+    ApplySpringNetwork,
+    ApplySpringsCol,
+    ApplySpringsDiagAsc,
+    ApplySpringsDiagDesc,
+    ApplySpringsRow,
+    ApplyVelocity,
+)
+from pylib.microsoro.conditioners import (
+    ApplyDeflect,
+    ApplyPropel,
+    ApplyRotate,
+    ApplySpin,
+    ApplyStretch,
+    ApplyTorsion,
+    ApplyTranslate,
+    BundleConditioners,
+)
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+def test_no_stretch_no_v(event_buffer: typing.Optional[EventBuffer]):
+    state = State()
+
+    ftor = ApplySpringGraph()
+    res = ftor(state, event_buffer)
+    assert res is None
+
+    assert np.allclose(state.vy, 0.0)
+    assert np.allclose(state.vx, 0.0)
+
+
+@pytest.mark.parametrize(
+    "conditioner",
+    [
+        ApplyTranslate(dpx=1.0, dpy=-2.0),
+        ApplyStretch(mx=1.5, my=2.0),
+        ApplyTorsion(),
+        BundleConditioners(ApplyRotate(30.0), ApplySpin()),
+    ],
+)
+@pytest.mark.parametrize("height, width", [(8, 8), (1, 5), (5, 1), (7, 13)])
+@pytest.mark.parametrize("random_structure", [False, True])
+def test_springs_equivalent_to_component_chain(
+    conditioner: typing.Callable,
+    height: int,
+    width: int,
+    random_structure: bool,
+):
+    np.random.seed(1)
+    params = Params(dt=1e-3, b=0.0)
+    if random_structure:
+        structure = Structure.make_random(height, width, params=params)
+        structure.bc[...] = 0.0
+        structure.br[...] = 0.0
+    else:
+        structure = Structure(height, width, params=params)
+
+    state1 = State(height, width)
+    conditioner(state1)
+    state2 = copy.deepcopy(state1)
+
+    for component in (
+        ApplySpringsCol(params, structure),
+        ApplySpringsRow(params, structure),
+        ApplySpringsDiagAsc(params, structure),
+        ApplySpringsDiagDesc(params, structure),
+    ):
+        component(state1)
+
+    graph_structure = GraphStructure.from_structure(structure)
+    ApplySpringGraph(params, graph_structure)(state2)
+
+    assert np.allclose(state1.vx, state2.vx)
+    assert np.allclose(state1.vy, state2.vy)
+    assert State.same_position_as(state1, state2)
+
+
+@pytest.mark.parametrize(
+    "conditioner",
+    [
+        ApplyPropel(dvx=1.0, dvy=-2.0),
+        BundleConditioners(ApplyStretch(mx=0.5), ApplyDeflect(), ApplySpin()),
+    ],
+)
+def test_damping_close_to_spring_network(conditioner: typing.Callable):
+    params = Params(dt=1e-3)
+    structure = Structure(params=params)
+    state1 = State()
+    conditioner(state1)
+    state2 = copy.deepcopy(state1)
+
+    ApplySpringNetwork(params, structure)(state1)
+    ApplySpringGraph(params, GraphStructure.from_structure(structure))(state2)
+    assert np.allclose(state1.vx, state2.vx, atol=1e-2)
+    assert np.allclose(state1.vy, state2.vy, atol=1e-2)
+
+
+@pytest.mark.parametrize(
+    "conditioner",
+    [
+        ApplyStretch(mx=1.5, my=2.0),
+        ApplyTorsion(),
+        BundleConditioners(ApplyTorsion(), ApplySpin()),
+    ],
+)
+def test_conservation_of_momentum(
+    conditioner: typing.Callable,
+    event_buffer: typing.Optional[EventBuffer],
+):
+    state = State()
+    conditioner(state)
+    res = ApplySpringGraph()(state, event_buffer)
+    assert res is None
+
+    # ensure springs having effect
+    assert not (np.allclose(state.vx, 0.0) and np.allclose(state.vy, 0.0))
+
+    # conservation of momentum -- sum velocities should cancel
+    assert np.isclose(np.sum(state.vx.flat), 0.0)
+    assert np.isclose(np.sum(state.vy.flat), 0.0)
+
+
+def test_masked_cells_unaffected():
+    mask = np.ones((8, 8), dtype=bool)
+    mask[2:5, 3:6] = False  # hole
+    mask[:, 7] = False  # missing column
+    structure = GraphStructure.from_structure(Structure(), mask=mask)
+    state = State()
+    ApplyTorsion()(state)
+    ApplySpin()(state)
+    vx, vy = state.vx.copy(), state.vy.copy()
+
+    ApplySpringGraph(structure=structure)(state)
+    assert np.array_equal(state.vx[~mask], vx[~mask])
+    assert np.array_equal(state.vy[~mask], vy[~mask])
+    assert not np.allclose(state.vx[mask], vx[mask])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_stiff_damping_stable(seed: int):
+    np.random.seed(seed)
+    params = Params()
+    structure = GraphStructure.from_structure(
+        Structure.make_random(params=params),
+    )
+    components = [ApplySpringGraph(params, structure), ApplyVelocity(params)]
+    state = State()
+    ApplySpin()(state)
+    for __ in range(3000):
+        for component in components:
+            component(state)
+    assert state.validate()
+    assert np.abs(state.vx).max() < 10.0
+    assert np.abs(state.vy).max() < 10.0
+
+
+def test_structure_reassignment():
+    structure = GraphStructure.from_structure(Structure())
+    ftor = ApplySpringGraph(structure=structure)
+    state = State()
+    ApplyStretch(mx=1.5, my=2.0)(state)
+    ftor(copy.deepcopy(state))
+
+    # drop all springs
+    for field in "ijklb":
+        setattr(structure, field, getattr(structure, field)[:0])
+    ftor(state)
+    assert np.allclose(state.vx, 0.0)
+    assert np.allclose(state.vy, 0.0)
+
+
+def test_float32():
+    params = Params(dtype=np.float32)
+    structure = GraphStructure.from_structure(Structure(params=params))
+    assert structure.dtype == np.float32
+    state = State(dtype=np.float32)
+    ApplyTorsion()(state)
+    reference = copy.deepcopy(state)
+
+    ApplySpringGraph(params, structure)(state)
+    ApplySpringGraph()(reference)
+    assert state.vx.dtype == np.float32
+    assert np.allclose(state.vx, reference.vx, atol=1e-3)
+    assert np.allclose(state.vy, reference.vy, atol=1e-3)
+
+
+def test_batch(event_buffer: typing.Optional[EventBuffer]):
+    np.random.seed(1)
+    mask = np.random.rand(8, 8) < 0.7
+    structure = GraphStructure.from_structure(Structure.make_random(), mask)
+    states = [State() for __ in range(3)]
+    ApplyStretch(mx=1.5, my=2.0)(states[0])
+    ApplyTorsion()(states[1])
+    ApplyRotate(30.0)(states[2])
+    for state in states:
+        state.vx, state.vy = state.px.copy(), state.py.copy()
+    batch_state = BatchState.from_states(states)
+
+    ftor = ApplySpringGraph(structure=structure)
+    res = ftor(batch_state, event_buffer)
+    assert res is None
+
+    for index, state in enumerate(states):
+        ftor(state, event_buffer)
+        assert State.same_position_as(batch_state.get_state(index), state)
+        assert State.same_velocity_as(batch_state.get_state(index), state)
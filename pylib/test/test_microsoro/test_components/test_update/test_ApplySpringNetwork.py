@@ -0,0 +1,145 @@
+import copy
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    BatchState,
+    BatchStructure,
+    Params,
+    State,
+    Structure,
+)
+from pylib.microsoro.components import (
+    ApplySpringDampingCol,
+    ApplySpringDampingRow,
+    ApplySpringNetwork,
+    ApplySpringsCol,
+    ApplySpringsDiagAsc,
+    ApplySpringsDiagDesc,
+    ApplySpringsRow,
+)
+from pylib.microsoro.conditioners import (
+    ApplyDeflect,
+    ApplyPropel,
+    ApplyRotate,
+    ApplySpin,
+    ApplyStretch,
+    ApplyTorsion,
+    ApplyTranslate,
+    BundleConditioners,
+)
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+def test_no_stretch_no_v(event_buffer: typing.Optional[EventBuffer]):
+    state = State()
+
+    ftor = ApplySpringNetwork()
+    res = ftor(state, event_buffer)
+    assert res is None
+
+    assert np.allclose(state.vy, 0.0)
+    assert np.allclose(state.vx, 0.0)
+
+
+@pytest.mark.parametrize(
+    "conditioner",
+    [
+        ApplyTranslate(dpx=1.0, dpy=-2.0),
+        ApplyPropel(dvx=1.0, dvy=-2.0),
+        ApplyStretch(mx=1.5, my=2.0),
+        ApplyTorsion(),
+        BundleConditioners(ApplyRotate(30.0), ApplySpin()),
+        BundleConditioners(ApplyStretch(mx=0.5), ApplyDeflect(), ApplySpin()),
+    ],
+)
+@pytest.mark.parametrize("height, width", [(8, 8), (1, 5), (5, 1), (7, 13)])
+@pytest.mark.parametrize("random_structure", [False, True])
+def test_equivalent_to_component_chain(
+    conditioner: typing.Callable,
+    height: int,
+    width: int,
+    random_structure: bool,
+    event_buffer: typing.Optional[EventBuffer],
+):
+    np.random.seed(1)
+    params = Params(dt=1e-3)
+    if random_structure:
+        structure = Structure.make_random(height, width, params=params)
+    else:
+        structure = Structure(height, width, params=params)
+
+    state1 = State(height, width)
+    conditioner(state1)
+    state2 = copy.deepcopy(state1)
+
+    for component in (
+        ApplySpringsCol(params, structure),
+        ApplySpringsRow(params, structure),
+        ApplySpringsDiagAsc(params, structure),
+        ApplySpringsDiagDesc(params, structure),
+        ApplySpringDampingCol(params, structure),
+        ApplySpringDampingRow(params, structure),
+    ):
+        component(state1, event_buffer)
+
+    res = ApplySpringNetwork(params, structure)(state2, event_buffer)
+    assert res is None
+
+    assert np.allclose(state1.vx, state2.vx)
+    assert np.allclose(state1.vy, state2.vy)
+    assert State.same_position_as(state1, state2)
+
+
+@pytest.mark.parametrize(
+    "conditioner",
+    [
+        ApplyStretch(mx=1.5, my=2.0),
+        ApplyTorsion(),
+        BundleConditioners(ApplyTorsion(), ApplySpin()),
+    ],
+)
+def test_conservation_of_momentum(
+    conditioner: typing.Callable,
+    event_buffer: typing.Optional[EventBuffer],
+):
+    state = State()
+    conditioner(state)
+    res = ApplySpringNetwork()(state, event_buffer)
+    assert res is None
+
+    # ensure springs having effect
+    assert not (np.allclose(state.vx, 0.0) and np.allclose(state.vy, 0.0))
+
+    # conservation of momentum -- sum velocities should cancel
+    assert np.isclose(np.sum(state.vx.flat), 0.0)
+    assert np.isclose(np.sum(state.vy.flat), 0.0)
+
+
+def test_batch(event_buffer: typing.Optional[EventBuffer]):
+    np.random.seed(1)
+    structures = [Structure.make_random() for __ in range(3)]
+    states = [State() for __ in range(3)]
+    ApplyStretch(mx=1.5, my=2.0)(states[0])
+    ApplyTorsion()(states[1])
+    ApplyRotate(30.0)(states[2])
+    for state in states:
+        state.vx, state.vy = state.px.copy(), state.py.copy()
+    batch_state = BatchState.from_states(states)
+
+    res = ApplySpringNetwork(
+        structure=BatchStructure.from_structures(structures),
+    )(batch_state, event_buffer)
+    assert res is None
+
+    for index, (state, structure) in enumerate(zip(states, structures)):
+        ApplySpringNetwork(structure=structure)(state, event_buffer)
+        assert State.same_position_as(batch_state.get_state(index), state)
+        assert State.same_velocity_as(batch_state.get_state(index), state)
@@ -0,0 +1,178 @@
+import copy
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    BatchState,
+    BatchStructure,
+    Params,
+    State,
+    Structure,
+)
+from pylib.microsoro.components import (
+    ApplySpringNetwork,
+    ApplySpringNetworkImplicit,
+    ApplyVelocity,
+)
+from pylib.microsoro.conditioners import (
+    ApplyDeflect,
+    ApplyRotate,
+    ApplySpin,
+    ApplyStretch,
+    ApplyTorsion,
+    BundleConditioners,
+)
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+@pytest.fixture(params=["banded", "sparse"])
+def solver(request: pytest.FixtureRequest):
+    return request.param
+
+
+def test_bad_solver():
+    with pytest.raises(ValueError):
+        ApplySpringNetworkImplicit(solver="dense")
+
+
+def test_no_stretch_no_v(
+    event_buffer: typing.Optional[EventBuffer], solver: str
+):
+    state = State()
+
+    ftor = ApplySpringNetworkImplicit(solver=solver)
+    res = ftor(state, event_buffer)
+    assert res is None
+
+    assert np.allclose(state.vy, 0.0)
+    assert np.allclose(state.vx, 0.0)
+    assert State.same_position_as(state, State())
+
+
+@pytest.mark.parametrize(
+    "conditioner",
+    [
+        ApplyStretch(mx=1.5, my=2.0),
+        ApplyTorsion(),
+        BundleConditioners(ApplyStretch(mx=0.5), ApplyDeflect(), ApplySpin()),
+    ],
+)
+@pytest.mark.parametrize("height, width", [(8, 8), (1, 5), (5, 1), (7, 13)])
+def test_small_dt_equivalent_to_explicit(
+    conditioner: typing.Callable,
+    height: int,
+    width: int,
+    solver: str,
+):
+    np.random.seed(1)
+    params = Params(dt=1e-6)
+    structure = Structure.make_random(height, width, params=params)
+
+    state1 = State(height, width)
+    conditioner(state1)
+    state2 = copy.deepcopy(state1)
+
+    ApplySpringNetwork(params, structure)(state1)
+    ApplySpringNetworkImplicit(params, structure, solver)(state2)
+
+    assert np.allclose(state1.vx, state2.vx, rtol=1e-3, atol=1e-9)
+    assert np.allclose(state1.vy, state2.vy, rtol=1e-3, atol=1e-9)
+    assert State.same_position_as(state1, state2)
+
+
+def test_solvers_equivalent():
+    np.random.seed(1)
+    params = Params(dt=1e-2)
+    structure = Structure.make_random(params=params)
+    state1 = State()
+    ApplyTorsion()(state1)
+    ApplySpin()(state1)
+    state2 = copy.deepcopy(state1)
+
+    ApplySpringNetworkImplicit(params, structure, "banded")(state1)
+    ApplySpringNetworkImplicit(params, structure, "sparse")(state2)
+
+    assert State.same_velocity_as(state1, state2)
+
+
+@pytest.mark.parametrize(
+    "conditioner",
+    [
+        ApplyStretch(mx=1.5, my=2.0),
+        ApplyTorsion(),
+        BundleConditioners(ApplyTorsion(), ApplySpin()),
+    ],
+)
+def test_conservation_of_momentum(conditioner: typing.Callable, solver: str):
+    state = State()
+    conditioner(state)
+    res = ApplySpringNetworkImplicit(solver=solver)(state)
+    assert res is None
+
+    # ensure springs having effect
+    assert not (np.allclose(state.vx, 0.0) and np.allclose(state.vy, 0.0))
+
+    # conservation of momentum -- sum velocities should cancel
+    assert np.isclose(np.sum(state.vx.flat), 0.0)
+    assert np.isclose(np.sum(state.vy.flat), 0.0)
+
+
+def test_stable_at_large_dt(solver: str):
+    # explicit stability limit is about 2 * sqrt(m / k) ~= 2.8e-3
+    params = Params(
+        dt=2e-2, k_lim=(1e3, 5e4), k=5e4, m_lim=(1e-2, 1e1), m=1e-1
+    )
+    structure = Structure(params=params)
+
+    def run(spring_component: typing.Callable) -> State:
+        state = State()
+        ApplyStretch(mx=1.2, my=0.9)(state)
+        velocity_component = ApplyVelocity(params)
+        with np.errstate(all="ignore"):
+            for __ in range(100):
+                spring_component(state)
+                velocity_component(state)
+        return state
+
+    explicit = run(ApplySpringNetwork(params, structure))
+    assert not (np.abs(explicit.px) < 1e3).all()
+
+    implicit = run(ApplySpringNetworkImplicit(params, structure, solver))
+    assert implicit.validate()
+    assert np.abs(implicit.vx).max() < 1.0
+    assert np.abs(implicit.vy).max() < 1.0
+
+    # relaxed toward rest configuration, without drift
+    assert np.allclose(np.diff(implicit.px, axis=1), 1.0, atol=1e-2)
+    assert np.allclose(np.diff(implicit.py, axis=0), 1.0, atol=1e-2)
+    assert np.isclose(implicit.px.mean(), State().px.mean())
+    assert np.isclose(implicit.py.mean(), State().py.mean())
+
+
+def test_batch(event_buffer: typing.Optional[EventBuffer]):
+    np.random.seed(1)
+    structures = [Structure.make_random() for __ in range(3)]
+    states = [State() for __ in range(3)]
+    ApplyStretch(mx=1.5, my=2.0)(states[0])
+    ApplyTorsion()(states[1])
+    ApplyRotate(30.0)(states[2])
+    for state in states:
+        state.vx, state.vy = state.px.copy(), state.py.copy()
+    batch_state = BatchState.from_states(states)
+
+    res = ApplySpringNetworkImplicit(
+        structure=BatchStructure.from_structures(structures),
+    )(batch_state, event_buffer)
+    assert res is None
+
+    for index, (state, structure) in enumerate(zip(states, structures)):
+        ApplySpringNetworkImplicit(structure=structure)(state, event_buffer)
+        assert State.same_position_as(batch_state.get_state(index), state)
+        assert State.same_velocity_as(batch_state.get_state(index), state)
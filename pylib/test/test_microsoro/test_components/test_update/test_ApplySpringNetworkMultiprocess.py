@@ -0,0 +1,165 @@
+import copy
+import multiprocessing
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import Params, State, Structure
+from pylib.microsoro.components import (
+    ApplyHalfTimestep,
+    ApplySpringNetwork,
+    ApplySpringNetworkMultiprocess,
+    ApplyVelocity,
+)
+from pylib.microsoro.conditioners import (
+    ApplyDeflect,
+    ApplySpin,
+    ApplyStretch,
+    BundleConditioners,
+)
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+def test_no_stretch_no_v(event_buffer: typing.Optional[EventBuffer]):
+    state = State()
+
+    ftor = ApplySpringNetworkMultiprocess(num_processes=2)
+    res = ftor(state, event_buffer)
+    assert res is None
+    ftor.close()
+
+    assert state == State()
+
+
+@pytest.mark.parametrize("height, width", [(8, 8), (1, 5), (17, 6)])
+@pytest.mark.parametrize("num_processes", [1, 3, 20])
+@pytest.mark.parametrize("apply_velocity", [False, True])
+def test_equivalent_to_untiled(
+    height: int,
+    width: int,
+    num_processes: int,
+    apply_velocity: bool,
+    event_buffer: typing.Optional[EventBuffer],
+):
+    np.random.seed(1)
+    params = Params(dt=1e-3)
+    structure = Structure.make_random(height, width, params=params)
+
+    state1 = State(height, width)
+    BundleConditioners(ApplyStretch(mx=0.5), ApplyDeflect(), ApplySpin())(
+        state1
+    )
+    state2 = copy.deepcopy(state1)
+
+    reference = [ApplySpringNetwork(params, structure)]
+    if apply_velocity:
+        reference.append(ApplyVelocity(params))
+    ftor = ApplySpringNetworkMultiprocess(
+        params, structure, num_processes, apply_velocity=apply_velocity
+    )
+    for _step in range(20):
+        for component in reference:
+            component(state1, event_buffer)
+        ftor(state2, event_buffer)
+    ftor.close()
+
+    assert state1 == state2
+
+
+def test_close():
+    np.random.seed(1)
+    params = Params()
+    structure = Structure.make_random(params=params)
+    ftor = ApplySpringNetworkMultiprocess(params, structure, num_processes=2)
+    reference = ApplySpringNetwork(params, structure)
+
+    state1 = State()
+    ApplySpin()(state1)
+    state2 = copy.deepcopy(state1)
+    reference(state1)
+    ftor(state2)
+    shared_px = state2.px
+
+    ftor.close()
+    assert state2.px is not shared_px
+    assert state1 == state2
+    assert np.array_equal(shared_px, state2.px)  # still readable
+    ftor.close()  # no-op
+
+    # restarts on use after close
+    reference(state1)
+    ftor(state2)
+    assert state1 == state2
+    del ftor  # shuts down on garbage collection
+    assert state1 == state2
+
+
+def test_multiple_states():
+    np.random.seed(1)
+    params = Params()
+    structure = Structure.make_random(params=params)
+    ftor = ApplySpringNetworkMultiprocess(params, structure, num_processes=2)
+    reference = ApplySpringNetwork(params, structure)
+
+    states1 = [State(), State()]
+    ApplySpin()(states1[0])
+    ApplyStretch()(states1[1])
+    states2 = copy.deepcopy(states1)
+    for _step in range(3):
+        for state1, state2 in zip(states1, states2):
+            reference(state1)
+            ftor(state2)
+    ftor.close()
+
+    assert states1 == states2
+
+
+def test_half_timestep():
+    np.random.seed(1)
+    params = Params()
+    structure = Structure.make_random(params=params)
+    state1 = State()
+    ApplySpin()(state1)
+    state2 = copy.deepcopy(state1)
+
+    ftor = ApplySpringNetworkMultiprocess(params, structure, num_processes=2)
+    reference = ApplyHalfTimestep(
+        [ApplySpringNetwork(params, structure)], params
+    )
+    for _step in range(5):
+        reference(state1)
+        ApplyHalfTimestep([ftor], params)(state2)
+        ftor(state2)
+        ApplySpringNetwork(params, structure)(state1)
+    ftor.close()
+    assert state1 == state2
+
+
+def test_worker_failure():
+    ftor = ApplySpringNetworkMultiprocess(num_processes=2, timeout=1.0)
+    state = State()
+    ftor(state)
+    multiprocessing.active_children()[0].kill()  # a worker process
+
+    with pytest.raises(RuntimeError):
+        ftor(state)
+    assert state.validate()
+
+
+def test_shape_mismatch():
+    ftor = ApplySpringNetworkMultiprocess(num_processes=2)
+    with pytest.raises(ValueError):
+        ftor(State(4, 8))
+    ftor.close()
+
+
+@pytest.mark.parametrize("num_processes", [0, -1])
+def test_invalid_num_processes(num_processes: int):
+    with pytest.raises(ValueError):
+        ApplySpringNetworkMultiprocess(num_processes=num_processes)
@@ -0,0 +1,214 @@
+import copy
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import Params, State, Structure
+from pylib.microsoro.components import (
+    ApplyFloorBounce,
+    ApplyGravity,
+    ApplyIncrementElapsedTime,
+    ApplySpringNetwork,
+    ApplySpringNetworkSleeping,
+    ApplyVelocity,
+)
+from pylib.microsoro.conditioners import (
+    ApplyDeflect,
+    ApplySpin,
+    ApplyStretch,
+    ApplyTorsion,
+    ApplyTranslate,
+    BundleConditioners,
+)
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+def _settle(
+    ftor: ApplySpringNetworkSleeping,
+    state: State,
+    params: Params,
+    num_updates: int = 3000,
+) -> None:
+    """Rest `state` on an inelastic floor until all tiles are asleep."""
+    regimen = [
+        ApplyGravity(params),
+        ftor,
+        ApplyFloorBounce(e=0.2),
+        ApplyIncrementElapsedTime(params),
+    ]
+    for _update in range(num_updates):
+        for component in regimen:
+            component(state)
+        if not ftor.awake.any():
+            return
+    assert False, "never fell asleep"
+
+
+def test_no_stretch_no_v(event_buffer: typing.Optional[EventBuffer]):
+    state = State()
+
+    ftor = ApplySpringNetworkSleeping()
+    res = ftor(state, event_buffer)
+    assert res is None
+
+    assert np.allclose(state.vy, 0.0)
+    assert np.allclose(state.vx, 0.0)
+    assert state == State()
+
+
+@pytest.mark.parametrize(
+    "conditioner",
+    [
+        ApplyTorsion(),
+        BundleConditioners(ApplyStretch(mx=0.5), ApplyDeflect(), ApplySpin()),
+    ],
+)
+@pytest.mark.parametrize("height, width", [(8, 8), (1, 5), (5, 1), (37, 13)])
+@pytest.mark.parametrize("num_tiles", [1, 3, 100])
+def test_equivalent_while_awake(
+    conditioner: typing.Callable,
+    height: int,
+    width: int,
+    num_tiles: int,
+    event_buffer: typing.Optional[EventBuffer],
+):
+    np.random.seed(1)
+    params = Params(dt=1e-3)
+    structure = Structure.make_random(height, width, params=params)
+
+    state1 = State(height, width)
+    conditioner(state1)
+    state2 = copy.deepcopy(state1)
+
+    reference = [ApplySpringNetwork(params, structure), ApplyVelocity(params)]
+    ftor = ApplySpringNetworkSleeping(
+        params, structure, num_tiles, sleep_threshold=0.0
+    )
+    for _step in range(20):
+        for component in reference:
+            component(state1, event_buffer)
+        ftor(state2, event_buffer)
+        state1.t = state2.t = state1.t + params.dt
+
+    assert ftor.awake.all()
+    assert state1 == state2
+
+
+@pytest.mark.parametrize(
+    "height, num_tiles, expected",
+    [
+        (16, None, [(0, 8), (8, 16)]),
+        (8, 100, [(0, 2), (2, 4), (4, 6), (6, 8)]),
+        (3, 2, [(0, 3)]),
+        (1, 1, [(0, 1)]),
+    ],
+)
+def test_tiles(height: int, num_tiles: typing.Optional[int], expected: list):
+    structure = Structure(height=height, width=4)
+    ftor = ApplySpringNetworkSleeping(structure=structure, num_tiles=num_tiles)
+    assert ftor.tiles == expected
+    assert len(ftor.awake) == len(expected)
+
+
+def test_resting_falls_asleep():
+    params = Params()
+    structure = Structure(height=8, width=8, params=params)
+    ftor = ApplySpringNetworkSleeping(params, structure, num_tiles=2)
+
+    state = State(8, 8)
+    _settle(ftor, state, params)
+    assert state.validate()
+    assert state.py.min() >= 0.0
+
+    # sleeping tiles hold position under gravity
+    reference = copy.deepcopy(state)
+    ApplyGravity(params)(state)
+    ftor(state)
+    assert not ftor.awake.any()
+    assert state.same_position_as(reference)
+    assert np.all(state.vx == 0.0)
+    assert np.all(state.vy == 0.0)
+
+
+def test_disturbance_wakes():
+    params = Params()
+    structure = Structure(height=8, width=8, params=params)
+    ftor = ApplySpringNetworkSleeping(params, structure, num_tiles=4)
+    state = State(8, 8)
+    _settle(ftor, state, params)
+
+    state.vx[2:4, 3] += 1.0  # as by contact with another body
+    ftor(state)
+    assert ftor.awake.tolist() == [False, True, False, False]
+    assert not np.array_equal(state.vx[2:4], 0.0)
+    assert np.all(state.vx[4:] == 0.0)
+
+
+def test_moving_neighbor_wakes():
+    params = Params()
+    structure = Structure(height=8, width=8, params=params)
+    ftor = ApplySpringNetworkSleeping(
+        params, structure, num_tiles=4, sample_interval=5
+    )
+    state = State(8, 8)
+    _settle(ftor, state, params)
+
+    state.vx[6:] += 5.0  # shear top tile against tiles beneath
+    for _step in range(20):
+        ftor(state)
+        state.t += params.dt
+    assert ftor.awake[3]
+    assert ftor.awake[2]
+    assert not ftor.awake[0]
+
+
+def test_wake():
+    params = Params()
+    structure = Structure(height=8, width=8, params=params)
+    ftor = ApplySpringNetworkSleeping(params, structure, num_tiles=4)
+    state = State(8, 8)
+    _settle(ftor, state, params)
+
+    ftor.wake(1)
+    assert ftor.awake.tolist() == [False, True, False, False]
+    ftor.wake()
+    assert ftor.awake.all()
+
+
+def test_restarts_on_new_state():
+    params = Params()
+    structure = Structure(height=8, width=8, params=params)
+    ftor = ApplySpringNetworkSleeping(params, structure, num_tiles=2)
+    _settle(ftor, State(8, 8), params)
+
+    state = State(8, 8)
+    ApplyTranslate(dpy=5.0)(state)
+    ApplyStretch(mx=1.2)(state)
+    reference = copy.deepcopy(state)
+    ftor(state)
+    ApplySpringNetwork(params, structure)(reference)
+    ApplyVelocity(params)(reference)
+    assert ftor.awake.all()
+    assert state == reference
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"num_tiles": 0},
+        {"num_tiles": -1},
+        {"sleep_threshold": -1.0},
+        {"wake_threshold": -1.0},
+        {"sleep_delay": -1.0},
+        {"sample_interval": 0},
+    ],
+)
+def test_bad_args(kwargs: typing.Dict[str, float]):
+    with pytest.raises(ValueError):
+        ApplySpringNetworkSleeping(**kwargs)
@@ -0,0 +1,150 @@
+from concurrent import futures
+import copy
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import Params, State, Structure
+from pylib.microsoro.components import (
+    ApplyHalfTimestep,
+    ApplySpringNetwork,
+    ApplySpringNetworkTiled,
+    ApplyVelocity,
+)
+from pylib.microsoro.conditioners import (
+    ApplyDeflect,
+    ApplySpin,
+    ApplyStretch,
+    ApplyTorsion,
+    BundleConditioners,
+)
+from pylib.microsoro.events import EventBuffer
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+def test_no_stretch_no_v(event_buffer: typing.Optional[EventBuffer]):
+    state = State()
+
+    ftor = ApplySpringNetworkTiled(num_tiles=3)
+    res = ftor(state, event_buffer)
+    assert res is None
+
+    assert np.allclose(state.vy, 0.0)
+    assert np.allclose(state.vx, 0.0)
+    assert state == State()
+
+
+@pytest.mark.parametrize(
+    "conditioner",
+    [
+        ApplyTorsion(),
+        BundleConditioners(ApplyStretch(mx=0.5), ApplyDeflect(), ApplySpin()),
+    ],
+)
+@pytest.mark.parametrize("height, width", [(8, 8), (1, 5), (5, 1), (37, 13)])
+@pytest.mark.parametrize("num_tiles", [1, 2, 3, 8, 100])
+@pytest.mark.parametrize("apply_velocity", [False, True])
+def test_equivalent_to_untiled(
+    conditioner: typing.Callable,
+    height: int,
+    width: int,
+    num_tiles: int,
+    apply_velocity: bool,
+    event_buffer: typing.Optional[EventBuffer],
+):
+    np.random.seed(1)
+    params = Params(dt=1e-3)
+    structure = Structure.make_random(height, width, params=params)
+
+    state1 = State(height, width)
+    conditioner(state1)
+    state2 = copy.deepcopy(state1)
+
+    reference = [ApplySpringNetwork(params, structure)]
+    if apply_velocity:
+        reference.append(ApplyVelocity(params))
+    tiled = ApplySpringNetworkTiled(
+        params, structure, num_tiles, apply_velocity=apply_velocity
+    )
+    for _step in range(20):
+        for component in reference:
+            component(state1, event_buffer)
+        tiled(state2, event_buffer)
+
+    assert np.array_equal(state1.px, state2.px)
+    assert np.array_equal(state1.py, state2.py)
+    assert np.array_equal(state1.vx, state2.vx)
+    assert np.array_equal(state1.vy, state2.vy)
+
+
+def test_shared_executor():
+    np.random.seed(1)
+    params = Params()
+    structure = Structure.make_random(16, 8, params=params)
+    state1 = State(16, 8)
+    ApplySpin()(state1)
+    state2 = copy.deepcopy(state1)
+
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        tiled = ApplySpringNetworkTiled(
+            params, structure, num_tiles=4, executor=executor
+        )
+        tiled(state2)
+    ApplySpringNetwork(params, structure)(state1)
+    assert state1 == state2
+
+
+def test_structure_changes():
+    np.random.seed(1)
+    params = Params()
+    structure = Structure.make_random(16, 8, params=params)
+    tiled = ApplySpringNetworkTiled(params, structure, num_tiles=4)
+    reference = ApplySpringNetwork(params, structure)
+
+    state1 = State(16, 8)
+    ApplySpin()(state1)
+    state2 = copy.deepcopy(state1)
+    reference(state1)
+    tiled(state2)
+
+    # reassignment, in-place modification, and timestep change
+    structure.set_k_to_norms(np.random.rand(16, 8))
+    structure.m *= 2
+    structure.invalidate_constants()
+    params.dt /= 2
+    for _step in range(3):
+        reference(state1)
+        tiled(state2)
+
+    assert state1 == state2
+
+
+def test_verlet_half_timestep():
+    np.random.seed(1)
+    params = Params()
+    structure = Structure.make_random(params=params)
+    state1 = State()
+    ApplySpin()(state1)
+    state2 = copy.deepcopy(state1)
+
+    reference = ApplyHalfTimestep(
+        [ApplySpringNetwork(params, structure)], params
+    )
+    tiled = ApplyHalfTimestep(
+        [ApplySpringNetworkTiled(params, structure, num_tiles=3)], params
+    )
+    for _step in range(5):
+        reference(state1)
+        tiled(state2)
+    assert state1 == state2
+
+
+@pytest.mark.parametrize("num_tiles", [0, -1])
+def test_invalid_num_tiles(num_tiles: int):
+    with pytest.raises(ValueError):
+        ApplySpringNetworkTiled(num_tiles=num_tiles)
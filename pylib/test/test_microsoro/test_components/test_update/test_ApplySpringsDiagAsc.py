@@ -5,7 +5,13 @@ import numpy as np
 import pytest
 
 from pylib.auxlib import all_rows_equivalent
-from pylib.microsoro import State, Structure, Params
+from pylib.microsoro import (
+    BatchState,
+    BatchStructure,
+    Params,
+    State,
+    Structure,
+)
 from pylib.microsoro.components import ApplySpringsDiagAsc
 from pylib.microsoro.conditioners import (
     ApplyRotate,
@@ -208,3 +214,23 @@ def test_param_k(
 
     # should be in increasing order as k is added
     assert hstrat_aux.is_strictly_increasing(sum_speeds)
+
+
+def test_batch(event_buffer: typing.Optional[EventBuffer]):
+    np.random.seed(1)
+    structures = [Structure.make_random() for __ in range(3)]
+    states = [State() for __ in range(3)]
+    ApplyStretch(mx=1.5, my=2.0)(states[0])
+    ApplyTorsion()(states[1])
+    ApplyRotate(30.0)(states[2])
+    batch_state = BatchState.from_states(states)
+
+    res = ApplySpringsDiagAsc(
+        structure=BatchStructure.from_structures(structures),
+    )(batch_state, event_buffer)
+    assert res is None
+
+    for index, (state, structure) in enumerate(zip(states, structures)):
+        ApplySpringsDiagAsc(structure=structure)(state, event_buffer)
+        assert State.same_position_as(batch_state.get_state(index), state)
+        assert State.same_velocity_as(batch_state.get_state(index), state)
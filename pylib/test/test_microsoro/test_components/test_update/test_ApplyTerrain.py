@@ -0,0 +1,165 @@
+import copy
+import typing
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import BatchState, conditioners, State
+from pylib.microsoro.components import ApplyFloorBounce, ApplyTerrain
+from pylib.microsoro.events import EventBuffer, RenderTerrainEvent
+
+
+@pytest.fixture(params=[EventBuffer(), None])
+def event_buffer(request: pytest.FixtureRequest):
+    return request.param
+
+
+def _make_random_state(dtype: type = np.float64) -> State:
+    state = State(dtype=dtype)
+    conditioners.ApplyRotate(theta_degrees=np.random.uniform(0, 360))(state)
+    conditioners.ApplyTranslate(
+        dpx=np.random.uniform(-20.0, 20.0), dpy=np.random.uniform(-3.0, 3.0)
+    )(state)
+    state.vx += np.random.uniform(-1.0, 1.0, state.vx.shape).astype(dtype)
+    state.vy += np.random.uniform(-1.0, 1.0, state.vy.shape).astype(dtype)
+    return state
+
+
+def test_init():
+    ApplyTerrain([0.0, 1.0], [0.0, 0.0])
+
+    with pytest.raises(ValueError):
+        ApplyTerrain([0.0, 1.0], [0.0, 0.0], e=-0.5)
+    with pytest.raises(ValueError):
+        ApplyTerrain([0.0], [0.0])
+    with pytest.raises(ValueError):
+        ApplyTerrain([0.0, 1.0, 2.0], [0.0, 0.0])
+    with pytest.raises(ValueError):
+        ApplyTerrain([0.0, 2.0, 1.0], [0.0, 0.0, 0.0])
+    with pytest.raises(ValueError):
+        ApplyTerrain([0.0, 1.0, 1.0], [0.0, 0.0, 0.0])
+
+
+def test_event():
+    event_buffer = EventBuffer()
+    ftor = ApplyTerrain([0.0, 2.0, 5.0], [1.0, 0.0, 3.0])
+    ftor(State(), event_buffer)
+
+    events = event_buffer.consume(RenderTerrainEvent, lambda event: event)
+    assert events == [RenderTerrainEvent(x=(0.0, 2.0, 5.0), y=(1.0, 0.0, 3.0))]
+
+
+def test_no_cells_below_terrain(event_buffer: typing.Optional[EventBuffer]):
+    ftor = ApplyTerrain([-5.0, 0.0, 5.0, 10.0], [10.0, 20.0, 0.0, 5.0])
+    state = State()
+
+    conditioners.ApplyTranslate(dpy=100.0)(state)
+    conditioners.ApplyPropel(dvy=-1.0)(state)
+    prestate = copy.deepcopy(state)
+
+    res = ftor(state, event_buffer)
+    assert res is None
+    assert State.same_position_as(state, prestate)
+    assert State.same_velocity_as(state, prestate)
+
+
+@pytest.mark.parametrize("elasticity", [0.5, 1.0, 1.5])
+@pytest.mark.parametrize("b", [0.0, -2.0, 3.0])
+def test_flat_terrain_equivalent_to_floor(elasticity: float, b: float):
+    np.random.seed(1)
+    terrain = ApplyTerrain([-1.0, 1.0], [b, b], e=elasticity)
+    floor = ApplyFloorBounce(b=b, e=elasticity)
+    for __ in range(20):
+        state1 = _make_random_state()
+        conditioners.ApplyTranslate(dpy=b)(state1)
+        state2 = copy.deepcopy(state1)
+
+        terrain(state1)
+        floor(state2)
+        assert State.same_position_as(state1, state2)
+        assert State.same_velocity_as(state1, state2)
+
+
+@pytest.mark.parametrize("m", [-2.0, -1.0, -0.25])
+def test_sloped_terrain_reflects_as_floor(m: float):
+    np.random.seed(1)
+    terrain = ApplyTerrain([0.0, 1.0], [0.0, m], e=0.9)
+    floor = ApplyFloorBounce(m=m, e=0.9)
+    for __ in range(20):
+        state1 = _make_random_state()
+        state2 = copy.deepcopy(state1)
+
+        terrain(state1)
+        floor(state2)
+        assert np.allclose(state1.vx, state2.vx)
+        assert np.allclose(state1.vy, state2.vy)
+        assert np.all(state1.py >= m * state1.px)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_reflects_off_own_segments(seed: int):
+    np.random.seed(seed)
+    x = np.cumsum(np.random.uniform(0.5, 4.0, 12)) - 20.0
+    y = np.random.uniform(-3.0, 3.0, 12)
+    ftor = ApplyTerrain(x, y, e=0.8)
+
+    state = _make_random_state()
+    prestate = copy.deepcopy(state)
+    ftor(state)
+
+    # reference, cell by cell
+    for px, py, vx, vy, px_, py_, vx_, vy_ in zip(
+        *(arr.ravel() for arr in (prestate.px, prestate.py)),
+        *(arr.ravel() for arr in (prestate.vx, prestate.vy)),
+        *(arr.ravel() for arr in (state.px, state.py)),
+        *(arr.ravel() for arr in (state.vx, state.vy)),
+    ):
+        segment = min(max(np.searchsorted(x, px) - 1, 0), len(x) - 2)
+        slope = (y[segment + 1] - y[segment]) / (x[segment + 1] - x[segment])
+        y_terrain = y[segment] + slope * (px - x[segment])
+
+        # shifted vertically only, to above terrain
+        assert px_ == px
+        assert py_ >= y_terrain
+        if py >= y_terrain:
+            assert (vx_, vy_) == (vx, vy)
+            continue
+
+        normal = np.array([-slope, 1.0]) / np.hypot(slope, 1.0)
+        reflection = np.array([vx, vy]) - 2 * np.dot([vx, vy], normal) * normal
+        reflection[1] = abs(reflection[1])
+        assert np.allclose((vx_, vy_), reflection * 0.8)
+
+    shift = state.py - prestate.py
+    assert np.allclose(shift, shift.flat[0])
+
+
+@pytest.mark.parametrize("num_segments", [1, 10, 1000])
+def test_batch(num_segments: int, event_buffer: typing.Optional[EventBuffer]):
+    np.random.seed(1)
+    x = np.linspace(-30.0, 30.0, num_segments + 1)
+    y = np.random.uniform(-1.0, 1.0, num_segments + 1)
+    ftor = ApplyTerrain(x, y, e=0.9)
+
+    states = [_make_random_state() for __ in range(4)]
+    conditioners.ApplyTranslate(dpy=100.0)(states[0])
+    batch_state = BatchState.from_states(states)
+
+    res = ftor(batch_state, event_buffer)
+    assert res is None
+
+    for index, state in enumerate(states):
+        ftor(state, event_buffer)
+        assert State.same_position_as(batch_state.get_state(index), state)
+        assert State.same_velocity_as(batch_state.get_state(index), state)
+
+
+def test_float32():
+    np.random.seed(1)
+    ftor = ApplyTerrain([-10.0, -2.0, 3.0, 10.0], [5.0, -1.0, 2.0, -4.0])
+    for __ in range(100):
+        state = _make_random_state(dtype=np.float32)
+        ftor(state)  # asserts all cells are above terrain
+
+        for arr in state.px, state.py, state.vx, state.vy:
+            assert arr.dtype == np.float32
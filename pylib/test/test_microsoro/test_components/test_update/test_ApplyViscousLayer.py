@@ -5,7 +5,15 @@ from hstrat import _auxiliary_lib as hstrat_aux
 import numpy as np
 import pytest
 
-from pylib.microsoro import components, conditioners, Params, State
+from pylib.microsoro import (
+    BatchState,
+    BatchStructure,
+    components,
+    conditioners,
+    Params,
+    State,
+    Structure,
+)
 from pylib.microsoro.events import EventBuffer
 
 
@@ -42,7 +50,6 @@ def test_interaction(
     mu: float,
     dt: float,
 ) -> None:
-
     state = State()
     conditioner(state)
     prestate = copy.deepcopy(state)
@@ -103,3 +110,25 @@ def test_param_m(
 
     # should be in increasing order as m is added
     assert hstrat_aux.is_strictly_increasing(sum_speeds)
+
+
+def test_batch(event_buffer: typing.Optional[EventBuffer]):
+    np.random.seed(1)
+    structures = [Structure.make_random() for __ in range(3)]
+    states = [State() for __ in range(3)]
+    conditioners.ApplySpin()(states[0])
+    conditioners.ApplyPropel(dvx=1.0, dvy=-1.0)(states[1])
+    conditioners.ApplyTranslate(dpy=100.0)(states[2])
+    batch_state = BatchState.from_states(states)
+
+    res = components.ApplyViscousLayer(
+        b=4.0,
+        structure=BatchStructure.from_structures(structures),
+    )(batch_state, event_buffer)
+    assert res is None
+
+    for index, (state, structure) in enumerate(zip(states, structures)):
+        components.ApplyViscousLayer(b=4.0, structure=structure)(
+            state, event_buffer
+        )
+        assert State.same_velocity_as(batch_state.get_state(index), state)
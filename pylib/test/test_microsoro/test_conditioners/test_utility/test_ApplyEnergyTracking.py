@@ -0,0 +1,26 @@
+import numpy as np
+
+from pylib.microsoro import EnergyTracker, Params, State, Structure
+from pylib.microsoro.components import ApplyIncrementElapsedTime
+from pylib.microsoro.conditioners import ApplyEnergyTracking
+
+
+def test_ApplyEnergyTracking():
+    state = State()
+    assert state.energy is None
+
+    ApplyEnergyTracking()(state)
+    assert isinstance(state.energy, EnergyTracker)
+    assert state == State()
+
+
+def test_ApplyEnergyTracking_params_structure():
+    params = Params(g=2.0)
+    structure = Structure(params=params)
+    structure.m[...] = 3.0
+    state = State()
+    ApplyEnergyTracking(params, structure)(state)
+
+    ApplyIncrementElapsedTime(params)(state)
+    assert state.energy.gravitational == 2.0 * 3.0 * np.sum(state.py)
+    assert state.energy.kinetic == 0.0
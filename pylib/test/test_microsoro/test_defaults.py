@@ -1,3 +1,5 @@
+import numpy as np
+
 from pylib.microsoro import defaults
 
 
@@ -47,3 +49,7 @@ def test_nrow():
     nrow1, nrow2 = defaults.nrow_lim
     assert nrow1 <= nrow2
     assert nrow1 <= defaults.nrow <= nrow2
+
+
+def test_dtype():
+    assert np.issubdtype(defaults.dtype, np.floating)
@@ -0,0 +1,75 @@
+import typing
+
+import pytest
+
+from pylib.microsoro.events import RenderFloorEvent, RenderTerrainEvent
+
+
+def _scaleup(
+    points: typing.List[typing.Tuple[float, float]],
+    scale: float,
+) -> typing.List[typing.Tuple[float, float]]:
+    return [tuple(map(lambda x: x * scale, point)) for point in points]
+
+
+def test_render_terrain_event_properties():
+    event = RenderTerrainEvent(x=(0.0, 1.0), y=(2.0, 3.0))
+    assert event.x == (0.0, 1.0)
+    assert event.y == (2.0, 3.0)
+    assert event.flavor == "floor"
+    assert hash(event) == hash(RenderTerrainEvent(x=(0.0, 1.0), y=(2.0, 3.0)))
+
+
+def test_get_terrain_y():
+    event = RenderTerrainEvent(x=(0.0, 2.0, 4.0), y=(0.0, 2.0, 1.0))
+    assert event.get_terrain_y(0.0) == 0.0
+    assert event.get_terrain_y(1.0) == 1.0
+    assert event.get_terrain_y(2.0) == 2.0
+    assert event.get_terrain_y(3.0) == 1.5
+    # extends along end segments
+    assert event.get_terrain_y(-1.0) == -1.0
+    assert event.get_terrain_y(6.0) == 0.0
+
+
+@pytest.mark.parametrize("scale", [1.0, 0.5, 2.0])
+def test_get_underfloor_polygon(scale: float):
+    event = RenderTerrainEvent(x=(0.0, 2.0, 4.0, 8.0), y=(3.0, 5.0, 4.0, 4.0))
+    polygon_points = event.get_underfloor_polygon((1, 6), (0, 10), scale)
+    expected_points = _scaleup(
+        [(0, 0), (0, 4), (1, 5), (3, 4), (5, 4), (5, 0)], scale
+    )
+    assert polygon_points == expected_points
+
+
+@pytest.mark.parametrize("scale", [1.0, 0.5, 2.0])
+@pytest.mark.parametrize("m, b", [(2.0, 1.0), (-1.0, 24.0), (0.0, 5.0)])
+def test_get_underfloor_polygon_matches_floor(
+    m: float, b: float, scale: float
+):
+    xlim, ylim = (2, 8), (0, 30)
+    terrain_event = RenderTerrainEvent(x=(0.0, 1.0), y=(b, m + b))
+    floor_event = RenderFloorEvent(m=m, b=b)
+    assert terrain_event.get_underfloor_polygon(
+        xlim, ylim, scale
+    ) == pytest.approx(floor_event.get_underfloor_polygon(xlim, ylim, scale))
+
+
+@pytest.mark.parametrize("scale", [1.0, 0.5, 2.0])
+def test_get_underfloor_polygon_clipped_below(scale: float):
+    event = RenderTerrainEvent(x=(0.0, 4.0, 8.0), y=(-4.0, 4.0, -4.0))
+    polygon_points = event.get_underfloor_polygon((0, 8), (0, 10), scale)
+    expected_points = _scaleup([(0, 0), (0, 0), (4, 4), (8, 0), (8, 0)], scale)
+    assert polygon_points == expected_points
+
+
+def test_get_underfloor_polygon_below_window():
+    event = RenderTerrainEvent(x=(0.0, 4.0, 8.0), y=(-4.0, -1.0, -4.0))
+    assert event.get_underfloor_polygon((0, 8), (0, 10), 1.0) == []
+
+
+def test_get_underfloor_polygon_bad_window():
+    event = RenderTerrainEvent(x=(0.0, 1.0), y=(0.0, 0.0))
+    with pytest.raises(ValueError):
+        event.get_underfloor_polygon((1, 0), (0, 10), 1.0)
+    with pytest.raises(ValueError):
+        event.get_underfloor_polygon((0, 1), (10, 0), 1.0)
@@ -0,0 +1,200 @@
+import copy
+
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    BatchState,
+    BatchStructure,
+    compile_regimen,
+    get_default_update_regimen,
+    Params,
+    perform_batch_simulation,
+    perform_simulation,
+    State,
+    Structure,
+)
+from pylib.microsoro.components import (
+    ApplyGravity,
+    ApplyIncrementElapsedTime,
+    ApplySpringDampingCol,
+    ApplySpringDampingRow,
+    ApplySpringNetwork,
+    ApplySpringsCol,
+    ApplySpringsDiagAsc,
+    ApplySpringsDiagDesc,
+    ApplySpringsRow,
+    ApplyVelocity,
+    BundleComponents,
+    EvaluateDuration,
+    HaltAfterElapsedTime,
+    HaltPastFinishLine,
+    NopComponent,
+)
+from pylib.microsoro.conditioners import ApplySpin, ApplyTranslate
+from pylib.microsoro.events import EventBuffer
+
+
+def test_compile_regimen_default():
+    np.random.seed(1)
+    params = Params()
+    structure = Structure.make_random(params=params)
+    state1 = State()
+    ApplyTranslate(dpy=-2)(state1)
+    ApplySpin()(state1)
+    state2 = copy.deepcopy(state1)
+
+    regimen = get_default_update_regimen(params, structure)
+    step = compile_regimen(regimen)
+    # pure-update components fused into one stage, before halting component
+    assert (
+        len(compile_regimen([*regimen, HaltAfterElapsedTime()])._components)
+        == 2
+    )
+
+    event_buffer1, event_buffer2 = EventBuffer(), EventBuffer()
+    for _update in range(100):
+        for component in regimen:
+            component(state1, event_buffer1)
+        assert step(state2, event_buffer2) is None
+
+    assert State.same_position_as(state1, state2)
+    assert State.same_velocity_as(state1, state2)
+    assert state1.t == state2.t
+    assert event_buffer1 == event_buffer2
+
+
+def test_compile_regimen_spring_network():
+    params = Params()
+    structure = Structure(params=params)
+    springs = [
+        ApplySpringsDiagDesc(params, structure),
+        ApplySpringsCol(params, structure),
+        ApplySpringsRow(params, structure),
+        ApplySpringsDiagAsc(params, structure),
+        ApplySpringDampingCol(params, structure),
+        ApplySpringDampingRow(params, structure),
+    ]
+    stage = compile_regimen(springs)._components[0]
+    assert isinstance(stage, ApplySpringNetwork)
+
+    state1 = State()
+    ApplySpin()(state1)
+    state2 = copy.deepcopy(state1)
+    for component in springs:
+        component(state1)
+    stage(state2)
+    assert State.same_velocity_as(state1, state2)
+
+
+@pytest.mark.parametrize(
+    "springs",
+    [
+        # damping out of order
+        [
+            ApplySpringsCol(),
+            ApplySpringsRow(),
+            ApplySpringsDiagAsc(),
+            ApplySpringsDiagDesc(),
+            ApplySpringDampingRow(),
+            ApplySpringDampingCol(),
+        ],
+        # missing spring family
+        [
+            ApplySpringsCol(),
+            ApplySpringsRow(),
+            ApplySpringsDiagAsc(),
+            ApplySpringsCol(),
+            ApplySpringDampingCol(),
+            ApplySpringDampingRow(),
+        ],
+        # params and structure not shared
+        [
+            ApplySpringsCol(),
+            ApplySpringsRow(),
+            ApplySpringsDiagAsc(),
+            ApplySpringsDiagDesc(),
+            ApplySpringDampingCol(),
+            ApplySpringDampingRow(),
+        ],
+    ],
+)
+def test_compile_regimen_no_spring_network(springs: list):
+    (stage,) = compile_regimen(springs)._components
+    assert isinstance(stage, BundleComponents)
+    assert list(stage._components) == springs
+
+
+def test_compile_regimen_halt_and_observe():
+    observed = []
+
+    def observe(state: State, event_buffer: EventBuffer) -> None:
+        observed.append(state.t)
+
+    step = compile_regimen(
+        [
+            NopComponent(),
+            ApplyGravity(),
+            ApplyVelocity(),
+            observe,
+            ApplyIncrementElapsedTime(),
+            EvaluateDuration(HaltAfterElapsedTime(1.0)),
+            ApplyVelocity(),
+        ],
+    )
+    assert len(step._components) == 5
+    assert step._components[1] is observe
+
+    res = perform_simulation(update_regimen_components=[step])
+    assert 1.0 <= res <= 1.0 + Params().dt
+    assert len(observed) == pytest.approx(1.0 / Params().dt, abs=2)
+
+
+def test_compile_regimen_empty():
+    state = State()
+    assert compile_regimen([])(state, EventBuffer()) is None
+    assert state == State()
+
+
+def test_compile_regimen_perform_simulation():
+    state1 = perform_simulation(
+        update_regimen_components=[
+            *get_default_update_regimen(),
+            HaltAfterElapsedTime(1.0),
+        ],
+    )
+    state2 = perform_simulation(
+        update_regimen_components=[
+            compile_regimen(
+                [*get_default_update_regimen(), HaltAfterElapsedTime(1.0)],
+            ),
+        ],
+    )
+    assert State.same_position_as(state1, state2)
+    assert State.same_velocity_as(state1, state2)
+    assert state1.t == state2.t
+
+
+def test_compile_regimen_batch():
+    np.random.seed(1)
+    structures = [Structure.make_random() for __ in range(3)]
+
+    def make_regimen(structure: BatchStructure) -> list:
+        return [
+            *get_default_update_regimen(structure=structure),
+            EvaluateDuration(HaltPastFinishLine()),
+            HaltAfterElapsedTime(1.0),
+        ]
+
+    res1 = perform_batch_simulation(
+        structures,
+        update_regimen_factory=make_regimen,
+    )
+    res2 = perform_batch_simulation(
+        structures,
+        update_regimen_factory=lambda structure: [
+            compile_regimen(make_regimen(structure)),
+        ],
+    )
+    for individual_res1, individual_res2 in zip(res1, res2):
+        assert State.same_position_as(individual_res1, individual_res2)
@@ -1,12 +1,24 @@
 import copy
+import tracemalloc
+import typing
+
+import numpy as np
+import pytest
 
 from pylib.microsoro import (
+    BatchStructure,
     get_default_update_regimen,
+    GraphStructure,
     State,
     Structure,
     Params,
 )
-from pylib.microsoro.conditioners import ApplySpin, ApplyTranslate
+from pylib.microsoro.components import ApplySpringNetworkSleeping
+from pylib.microsoro.conditioners import (
+    ApplySpin,
+    ApplyStretch,
+    ApplyTranslate,
+)
 
 
 def test_get_default_update_regimen():
@@ -36,7 +48,6 @@ def test_get_default_update_regimen():
 
 
 def test_get_default_update_regimen_params():
-
     state1 = State()
     ApplyTranslate(dpy=-2)(state1)
     regimen1 = get_default_update_regimen()
@@ -76,3 +87,324 @@ def test_get_default_update_regimen_structure():
 
     assert not State.same_position_as(state1, state2)
     assert not State.same_velocity_as(state1, state2)
+
+
+def test_get_default_update_regimen_no_array_allocations():
+    height, width = 256, 256
+    params = Params()
+    regimen = get_default_update_regimen(
+        params=params,
+        structure=Structure(height, width, params=params),
+    )
+    state = State(height, width)
+    ApplyTranslate(dpy=-2)(state)
+    ApplySpin()(state)
+    for _update in range(3):  # warm up workspace buffers
+        for step in regimen:
+            step(state)
+
+    tracemalloc.start()
+    try:
+        baseline, __ = tracemalloc.get_traced_memory()
+        for _update in range(3):
+            for step in regimen:
+                step(state)
+        __, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # no temporaries as large as a state array should have been allocated
+    assert peak - baseline < state.px.nbytes
+
+
+def test_get_default_update_regimen_implicit():
+    params = Params(dt=1e-2)  # too large for explicit integration
+    structure = Structure(params=params)
+    state = State()
+    ApplyTranslate(dpy=2)(state)
+    ApplySpin()(state)
+
+    regimen = get_default_update_regimen(params, structure, "implicit")
+    for _update in range(100):
+        for step in regimen:
+            step(state)
+
+    assert state.validate()
+    assert state.py.min() >= 0.0
+    assert np.isclose(state.t, 100 * params.dt)
+
+
+def test_get_default_update_regimen_bad_integrator():
+    with pytest.raises(ValueError):
+        get_default_update_regimen(integrator="rk4")
+
+
+@pytest.mark.parametrize("integrator", ["explicit", "verlet"])
+def test_get_default_update_regimen_graph_structure(integrator: str):
+    params = Params()
+    mask = np.ones((8, 8), dtype=bool)
+    mask[2:6, 2:6] = False  # hollow body
+    structure = GraphStructure.from_structure(Structure(), mask=mask)
+    state = State()
+    ApplyTranslate(dpy=2)(state)
+    ApplySpin()(state)
+
+    regimen = get_default_update_regimen(params, structure, integrator)
+    for _update in range(1000):
+        for step in regimen:
+            step(state)
+
+    assert state.validate()
+    assert state.py[mask].min() >= 0.0
+    assert np.isclose(state.t, 1000 * params.dt)
+
+
+def test_get_default_update_regimen_graph_structure_implicit():
+    with pytest.raises(ValueError):
+        get_default_update_regimen(
+            structure=GraphStructure.from_structure(Structure()),
+            integrator="implicit",
+        )
+
+
+def test_get_default_update_regimen_verlet_conserves_energy():
+    def spring_energy(state: State, structure: Structure) -> float:
+        res = 0.0
+        for k, l_naught, dx, dy in (
+            (
+                structure.kc,
+                structure.lc,
+                *np.diff([state.px, state.py], axis=1),
+            ),
+            (
+                structure.kr,
+                structure.lr,
+                *np.diff([state.px, state.py], axis=2),
+            ),
+        ):
+            res += 0.5 * np.sum(k * (np.hypot(dx, dy) - l_naught) ** 2)
+        return res
+
+    def max_energy_drift(integrator: str) -> float:
+        params = Params(dt=2e-3, b=0.0, g=0.0)
+        structure = Structure(params=params)
+        structure.ka[...] = structure.kd[...] = 0.0
+        regimen = get_default_update_regimen(params, structure, integrator)
+        state = State()
+        ApplyStretch(mx=1.1, my=0.9)(state)
+        ApplyTranslate(dpy=2)(state)
+
+        def energy() -> float:
+            kinetic = 0.5 * np.sum(
+                structure.m * (state.vx**2 + state.vy**2)
+            )
+            return kinetic + spring_energy(state, structure)
+
+        initial_energy = energy()
+        res = 0.0
+        for _update in range(200):
+            for step in regimen:
+                step(state)
+            res = max(res, abs(energy() - initial_energy))
+        assert state.validate()
+        return res
+
+    assert max_energy_drift("verlet") < max_energy_drift("explicit") / 10
+
+
+def test_get_default_update_regimen_verlet_bounce_damping():
+    params = Params(dt=2e-3)
+    structure = Structure(params=params)
+    state = State()
+    ApplyTranslate(dpy=1)(state)
+    ApplySpin()(state)
+
+    regimen = get_default_update_regimen(params, structure, "verlet")
+    max_vy = -np.inf
+    for _update in range(500):
+        for step in regimen:
+            step(state)
+        max_vy = max(max_vy, state.vy.max())
+
+    assert state.validate()
+    assert state.py.min() >= 0.0
+    assert max_vy > 0.0  # bounced
+    assert np.isclose(state.t, 500 * params.dt)
+    assert params.dt == 2e-3
+
+
+@pytest.mark.parametrize("integrator", ["explicit", "verlet"])
+def test_get_default_update_regimen_auto_dt(integrator: str):
+    params = Params()
+    np.random.seed(1)
+    structure = Structure.make_random(params=params)
+    expected_dt = structure.stable_dt(params)
+    assert expected_dt != params.dt
+
+    regimen = get_default_update_regimen(
+        params, structure, integrator, auto_dt=True
+    )
+    assert params.dt == Params().dt  # not modified
+
+    state = State()
+    ApplyTranslate(dpy=1)(state)
+    ApplySpin()(state)
+    for step in regimen:
+        step(state)
+    assert np.isclose(state.t, expected_dt)
+
+    for _update in range(1000):
+        for step in regimen:
+            step(state)
+    assert state.validate()
+    assert np.abs(state.vx).max() < 100
+
+
+def test_get_default_update_regimen_auto_dt_implicit():
+    with pytest.raises(ValueError):
+        get_default_update_regimen(integrator="implicit", auto_dt=True)
+
+
+@pytest.mark.parametrize("integrator", ["explicit", "verlet"])
+@pytest.mark.parametrize(
+    "decomposition", [{"num_tiles": 3}, {"num_processes": 3}]
+)
+def test_get_default_update_regimen_num_tiles(
+    integrator: str, decomposition: typing.Dict[str, int]
+):
+    np.random.seed(1)
+    params = Params()
+    structure = Structure.make_random(20, 10, params=params)
+    state1 = State(20, 10)
+    ApplyTranslate(dpy=1)(state1)
+    ApplySpin()(state1)
+    state2 = copy.deepcopy(state1)
+
+    regimen1 = get_default_update_regimen(params, structure, integrator)
+    regimen2 = get_default_update_regimen(
+        params, structure, integrator, **decomposition
+    )
+    for _update in range(100):
+        for step in regimen1:
+            step(state1)
+        for step in regimen2:
+            step(state2)
+
+    assert state2.validate()
+    assert np.allclose(state1.px, state2.px)
+    assert np.allclose(state1.vy, state2.vy)
+    assert state1.t == state2.t
+
+
+@pytest.mark.parametrize(
+    "integrator, structure",
+    [
+        ("implicit", Structure()),
+        ("explicit", GraphStructure.from_structure(Structure())),
+    ],
+)
+def test_get_default_update_regimen_num_tiles_unsupported(
+    integrator: str, structure: typing.Any
+):
+    with pytest.raises(ValueError):
+        get_default_update_regimen(
+            Params(), structure, integrator, num_tiles=2
+        )
+    with pytest.raises(ValueError):
+        get_default_update_regimen(
+            Params(), structure, integrator, num_processes=2
+        )
+
+
+def test_get_default_update_regimen_num_tiles_num_processes():
+    with pytest.raises(ValueError):
+        get_default_update_regimen(num_tiles=2, num_processes=2)
+
+
+@pytest.mark.parametrize("integrator", ["explicit", "verlet"])
+def test_get_default_update_regimen_coarsen_factor(integrator: str):
+    params = Params()
+    structure = Structure(params=params)
+    state1 = State()
+    ApplyTranslate(dpy=20.0)(state1)
+    state2 = copy.deepcopy(state1)
+
+    regimen1 = get_default_update_regimen(params, structure, integrator)
+    regimen2 = get_default_update_regimen(
+        params, structure, integrator, coarsen_factor=2
+    )
+    assert len(regimen2) == 1
+    for _update in range(100):
+        for step in regimen1:
+            step(state1)
+        for step in regimen2:
+            step(state2)
+
+    assert state2.validate()
+    assert state1.same_position_as(state2)
+    assert state1.t == state2.t
+
+
+@pytest.mark.parametrize(
+    "structure",
+    [
+        GraphStructure.from_structure(Structure()),
+        BatchStructure.from_structures([Structure(), Structure()]),
+    ],
+)
+def test_get_default_update_regimen_coarsen_factor_unsupported(
+    structure: typing.Any,
+):
+    with pytest.raises(ValueError):
+        get_default_update_regimen(Params(), structure, coarsen_factor=2)
+
+
+def test_get_default_update_regimen_sleep_threshold():
+    np.random.seed(1)
+    params = Params()
+    structure = Structure.make_random(20, 10, params=params)
+    state1 = State(20, 10)
+    ApplyTranslate(dpy=1)(state1)
+    ApplySpin()(state1)
+    state2 = copy.deepcopy(state1)
+
+    regimen1 = get_default_update_regimen(params, structure)
+    regimen2 = get_default_update_regimen(
+        params, structure, num_tiles=4, sleep_threshold=0.0
+    )
+    assert any(
+        isinstance(step, ApplySpringNetworkSleeping) for step in regimen2
+    )
+    for _update in range(100):
+        for step in regimen1:
+            step(state1)
+        for step in regimen2:
+            step(state2)
+
+    assert state2.validate()
+    assert np.allclose(state1.px, state2.px)
+    assert np.allclose(state1.vy, state2.vy)
+    assert state1.t == state2.t
+
+
+@pytest.mark.parametrize(
+    "integrator, structure, kwargs",
+    [
+        ("implicit", Structure(), {}),
+        ("verlet", Structure(), {}),
+        ("explicit", GraphStructure.from_structure(Structure()), {}),
+        (
+            "explicit",
+            BatchStructure.from_structures([Structure(), Structure()]),
+            {},
+        ),
+        ("explicit", Structure(), {"num_processes": 2}),
+    ],
+)
+def test_get_default_update_regimen_sleep_threshold_unsupported(
+    integrator: str, structure: typing.Any, kwargs: typing.Dict[str, int]
+):
+    with pytest.raises(ValueError):
+        get_default_update_regimen(
+            Params(), structure, integrator, sleep_threshold=1e-2, **kwargs
+        )
@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    get_default_update_regimen,
+    GraphStructure,
+    perform_arena_simulation,
+    perform_simulation,
+    State,
+    Structure,
+)
+from pylib.microsoro.conditioners import ApplyPropel, ApplyTranslate
+from pylib.microsoro.components import (
+    ApplyIncrementElapsedTime,
+    HaltAfterElapsedTime,
+)
+
+
+def make_update_regimen(structure):
+    return [
+        *get_default_update_regimen(structure=structure),
+        HaltAfterElapsedTime(0.5),
+    ]
+
+
+def test_perform_arena_simulation_default():
+    results = perform_arena_simulation([Structure(), Structure(6, 10)])
+
+    assert len(results) == 2
+    for result, shape in zip(results, [(8, 8), (6, 10)]):
+        assert isinstance(result, State)
+        assert result.px.shape == shape
+        assert result.t > 10.0
+
+    # bodies placed side by side, without overlap
+    assert results[0].px.max() < results[1].px.min()
+
+
+def test_perform_arena_simulation_single_body_equivalence():
+    np.random.seed(1)
+    structure = Structure.make_random()
+    setup_regimen_conditioners = [ApplyTranslate(dpy=-5.0), ApplyPropel(3.0)]
+
+    (arena_result,) = perform_arena_simulation(
+        [structure],
+        setup_regimen_conditioners=[setup_regimen_conditioners],
+        update_regimen_factory=make_update_regimen,
+    )
+    result = perform_simulation(
+        setup_regimen_conditioners=setup_regimen_conditioners,
+        update_regimen_components=make_update_regimen(structure),
+    )
+
+    assert State.same_position_as(arena_result, result)
+    assert State.same_velocity_as(arena_result, result)
+    assert arena_result.t == result.t
+
+
+def test_perform_arena_simulation_separated_equivalence():
+    np.random.seed(1)
+    structures = [Structure.make_random() for __ in range(3)]
+    setup_regimens = [
+        [ApplyTranslate(dpx=20.0 * i, dpy=-5.0)] for i in range(3)
+    ]
+
+    arena_results = perform_arena_simulation(
+        structures,
+        setup_regimen_conditioners=setup_regimens,
+        update_regimen_factory=make_update_regimen,
+    )
+    for arena_result, structure, setup in zip(
+        arena_results, structures, setup_regimens
+    ):
+        result = perform_simulation(
+            setup_regimen_conditioners=setup,
+            update_regimen_components=make_update_regimen(structure),
+        )
+        assert State.same_position_as(arena_result, result)
+        assert State.same_velocity_as(arena_result, result)
+
+
+def test_perform_arena_simulation_collision():
+    setup_regimens = [
+        [ApplyTranslate(dpy=-5.0), ApplyPropel(dvx=5.0)],
+        [ApplyTranslate(dpx=12.0, dpy=-5.0), ApplyPropel(dvx=-5.0)],
+    ]
+    structures = [Structure(), GraphStructure.from_structure(Structure())]
+
+    def make_update_regimen(structure):
+        return [
+            *get_default_update_regimen(structure=structure),
+            HaltAfterElapsedTime(2.0),
+        ]
+
+    results = perform_arena_simulation(
+        structures,
+        setup_regimen_conditioners=setup_regimens,
+        update_regimen_factory=make_update_regimen,
+    )
+    # bodies bounce off each other
+    assert results[0].vx.mean() < 0.0
+    assert results[1].vx.mean() > 0.0
+    assert results[0].px.max() < results[1].px.min()
+
+    # bodies pass through each other without contact
+    results = perform_arena_simulation(
+        structures,
+        setup_regimen_conditioners=setup_regimens,
+        update_regimen_factory=make_update_regimen,
+        contact_component=lambda states, structures, event_buffer: None,
+    )
+    assert results[0].vx.mean() > 0.0
+    assert results[1].vx.mean() < 0.0
+    assert results[0].px.min() > results[1].px.max()
+
+
+def test_perform_arena_simulation_staggered_halting():
+    num_contact_calls = []
+
+    def make_update_regimen(structure):
+        return [
+            ApplyIncrementElapsedTime(),
+            HaltAfterElapsedTime(structure.width * 0.01),
+        ]
+
+    def count_contact_calls(states, structures, event_buffer):
+        num_contact_calls.append(len(states))
+
+    results = perform_arena_simulation(
+        [Structure(4, width) for width in (3, 6, 5)],
+        update_regimen_factory=make_update_regimen,
+        contact_component=count_contact_calls,
+    )
+    assert [result.t for result in results] == pytest.approx(
+        [0.03, 0.06, 0.05], abs=0.0015
+    )
+    # halted bodies drop out of contact
+    assert num_contact_calls == sorted(num_contact_calls, reverse=True)
+    assert set(num_contact_calls) == {1, 2, 3}
+
+
+def test_perform_arena_simulation_bad_args():
+    with pytest.raises(ValueError):
+        perform_arena_simulation(
+            [Structure(), Structure()],
+            setup_regimen_conditioners=[[]],
+        )
+
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from pylib.microsoro import (
+    BatchStructure,
+    defaults,
+    get_default_update_regimen,
+    Params,
+    perform_batch_simulation,
+    perform_simulation,
+    State,
+    Structure,
+)
+from pylib.microsoro.conditioners import ApplyPropel, ApplySpin
+from pylib.microsoro.components import (
+    ApplyIncrementElapsedTime,
+    EvaluateDuration,
+    HaltAfterElapsedTime,
+    HaltPastFinishLine,
+)
+
+
+def test_perform_batch_simulation_default():
+    np.random.seed(1)
+    structures = [Structure.make_random() for __ in range(3)]
+    results = perform_batch_simulation(structures)
+
+    assert len(results) == 3
+    for result in results:
+        assert isinstance(result, State)
+        assert result.t > 10.0
+
+
+@pytest.mark.parametrize("population_size", [1, 2, 13])
+def test_perform_batch_simulation_equivalence(population_size: int):
+    np.random.seed(1)
+    structures = [Structure.make_random() for __ in range(population_size)]
+    setup_regimen_conditioners = [ApplySpin(30.0), ApplyPropel(dvy=-2.0)]
+
+    def make_update_regimen(structure):
+        return [
+            *get_default_update_regimen(structure=structure),
+            EvaluateDuration(HaltPastFinishLine(b=7.2)),
+            HaltAfterElapsedTime(0.5),
+        ]
+
+    batch_results = perform_batch_simulation(
+        BatchStructure.from_structures(structures),
+        setup_regimen_conditioners=setup_regimen_conditioners,
+        update_regimen_factory=make_update_regimen,
+    )
+    results = [
+        perform_simulation(
+            setup_regimen_conditioners=setup_regimen_conditioners,
+            update_regimen_components=make_update_regimen(structure),
+        )
+        for structure in structures
+    ]
+
+    assert len(batch_results) == population_size
+    for batch_result, result in zip(batch_results, results):
+        assert type(batch_result) == type(result)
+        if isinstance(result, State):
+            assert State.same_position_as(batch_result, result)
+            assert State.same_velocity_as(batch_result, result)
+            assert batch_result.t == result.t
+        else:
+            assert batch_result == result
+
+
+def test_perform_batch_simulation_staggered_halting():
+    # halts the leading individual in batch each update
+    def halt_first(batch_state, event_buffer):
+        return [batch_state.t[0]] + [None] * (batch_state.population_size - 1)
+
+    results = perform_batch_simulation(
+        [Structure() for __ in range(4)],
+        update_regimen_factory=lambda structure: [
+            ApplyIncrementElapsedTime(),
+            halt_first,
+        ],
+    )
+    assert np.allclose(results, np.arange(1, 5) * defaults.dt)
+
+    results = perform_batch_simulation(
+        [Structure() for __ in range(4)],
+        update_regimen_factory=lambda structure: [
+            halt_first,
+            ApplyIncrementElapsedTime(),
+        ],
+    )
+    assert np.allclose(results, np.arange(4) * defaults.dt)
+
+
+def test_perform_batch_simulation_dtype():
+    np.random.seed(1)
+    params = Params(dtype=np.float32)
+    structures = [Structure.make_random(params=params) for __ in range(2)]
+    results = perform_batch_simulation(
+        structures,
+        update_regimen_factory=lambda structure: [
+            *get_default_update_regimen(params, structure),
+            HaltAfterElapsedTime(1.0),
+        ],
+    )
+
+    for result, structure in zip(results, structures):
+        assert result.dtype == np.float32
+        reference = perform_simulation(
+            update_regimen_components=[
+                *get_default_update_regimen(params, structure),
+                HaltAfterElapsedTime(1.0),
+            ],
+            dtype=np.float32,
+        )
+        assert State.same_position_as(result, reference)
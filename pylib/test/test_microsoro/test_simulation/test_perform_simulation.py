@@ -1,6 +1,16 @@
+import typing
+
+import numpy as np
 import pytest
 
-from pylib.microsoro import defaults, Params, perform_simulation, State
+from pylib.microsoro import (
+    defaults,
+    get_default_update_regimen,
+    Params,
+    perform_simulation,
+    State,
+    Structure,
+)
 from pylib.microsoro.conditioners import ApplyPropel, ApplySpin
 from pylib.microsoro.components import (
     ApplyGravity,
@@ -8,6 +18,7 @@ from pylib.microsoro.components import (
     ApplyVelocity,
     EvaluateDuration,
     HaltAfterElapsedTime,
+    HaltPastFinishLine,
 )
 from pylib.microsoro.events import EventBuffer
 
@@ -155,3 +166,345 @@ def test_perform_simulation_evaluation():
     )
 
     assert 1.0 <= evaluation <= 1.0 + defaults.dt
+
+
+def _make_nan_after(t: float) -> typing.Callable:
+    def make_nan_after(state: State, event_buffer: EventBuffer) -> None:
+        if state.t > t:
+            state.vx[0, 0] = np.nan
+
+    return make_nan_after
+
+
+@pytest.mark.parametrize(
+    "validation, validation_interval",
+    [
+        ("always", 1),
+        ("every_n_steps", 1),
+        ("every_n_steps", 7),
+        ("every_n_steps", 10_000),
+        ("on_halt_only", 1),
+        ("off", 1),
+    ],
+)
+def test_perform_simulation_validation_valid(
+    validation: str, validation_interval: int
+):
+    state1 = perform_simulation(
+        update_regimen_components=[
+            *get_default_update_regimen(),
+            HaltAfterElapsedTime(1.0),
+        ],
+    )
+    state2 = perform_simulation(
+        update_regimen_components=[
+            *get_default_update_regimen(),
+            HaltAfterElapsedTime(1.0),
+        ],
+        validation=validation,
+        validation_interval=validation_interval,
+    )
+    assert state1 == state2
+
+
+@pytest.mark.parametrize(
+    "validation, validation_interval",
+    [
+        ("always", 1),
+        ("every_n_steps", 1),
+        ("every_n_steps", 7),
+        ("every_n_steps", 10_000),
+        ("on_halt_only", 1),
+    ],
+)
+def test_perform_simulation_validation_invalid(
+    validation: str, validation_interval: int
+):
+    make_nan = _make_nan_after(0.5)
+    with pytest.raises(AssertionError) as excinfo:
+        perform_simulation(
+            update_regimen_components=[
+                ApplyVelocity(),
+                make_nan,
+                ApplyIncrementElapsedTime(),
+                HaltAfterElapsedTime(1.0),
+            ],
+            validation=validation,
+            validation_interval=validation_interval,
+        )
+    assert excinfo.value.args == (make_nan,)
+
+
+def test_perform_simulation_validation_off():
+    state = perform_simulation(
+        update_regimen_components=[
+            _make_nan_after(0.5),
+            ApplyIncrementElapsedTime(),
+            HaltAfterElapsedTime(1.0),
+        ],
+        validation="off",
+    )
+    assert not state.validate()
+
+
+def test_perform_simulation_validation_intermediate_states():
+    states = perform_simulation(
+        update_regimen_components=[
+            ApplyIncrementElapsedTime(),
+            HaltAfterElapsedTime(1.0),
+        ],
+        yield_intermediate_states=True,
+        validation="every_n_steps",
+        validation_interval=3,
+    )
+    assert len([*states]) == len(
+        [
+            *perform_simulation(
+                update_regimen_components=[
+                    ApplyIncrementElapsedTime(),
+                    HaltAfterElapsedTime(1.0),
+                ],
+                yield_intermediate_states=True,
+            ),
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "validation, validation_interval",
+    [("sometimes", 1), ("every_n_steps", 0), ("always", -1)],
+)
+def test_perform_simulation_validation_bad_args(
+    validation: str, validation_interval: int
+):
+    with pytest.raises(ValueError):
+        perform_simulation(
+            validation=validation, validation_interval=validation_interval
+        )
+
+
+@pytest.mark.parametrize("check_every", [1, 2, 7, 100, 10_000])
+@pytest.mark.parametrize(
+    "halting_component",
+    [
+        HaltAfterElapsedTime(1.0),
+        HaltPastFinishLine(),
+        HaltPastFinishLine(m=0.2, b=12.0),
+    ],
+)
+def test_perform_simulation_check_every(
+    check_every: int, halting_component: typing.Callable
+):
+    setup_regimen_conditioners = [ApplyPropel(dvx=5.0, dvy=5.0)]
+    update_regimen_components = [
+        *get_default_update_regimen(),
+        EvaluateDuration(halting_component),
+        HaltAfterElapsedTime(2.0),  # fallback
+    ]
+    res1 = perform_simulation(
+        setup_regimen_conditioners=setup_regimen_conditioners,
+        update_regimen_components=update_regimen_components,
+    )
+    res2 = perform_simulation(
+        setup_regimen_conditioners=setup_regimen_conditioners,
+        update_regimen_components=update_regimen_components,
+        check_every=check_every,
+    )
+    assert res1 == res2
+
+
+@pytest.mark.parametrize("check_every", [1, 3, 10_000])
+def test_perform_simulation_check_every_state(check_every: int):
+    update_regimen_components = [
+        *get_default_update_regimen(),
+        HaltAfterElapsedTime(0.5),
+    ]
+    state1 = perform_simulation(
+        update_regimen_components=update_regimen_components,
+    )
+    state2 = perform_simulation(
+        update_regimen_components=update_regimen_components,
+        check_every=check_every,
+    )
+    assert state1 == state2
+
+
+def test_perform_simulation_check_every_intermediate_states():
+    update_regimen_components = [
+        ApplyIncrementElapsedTime(),
+        HaltAfterElapsedTime(1.0),
+    ]
+    *intermediate_states1, final_state1 = perform_simulation(
+        update_regimen_components=update_regimen_components,
+        yield_intermediate_states=True,
+    )
+    *intermediate_states2, final_state2 = perform_simulation(
+        update_regimen_components=update_regimen_components,
+        yield_intermediate_states=True,
+        check_every=10,
+    )
+    assert len(intermediate_states2) == len(intermediate_states1) // 10
+    assert final_state1 == final_state2
+
+
+@pytest.mark.parametrize("validation", ["always", "on_halt_only"])
+def test_perform_simulation_check_every_validation(validation: str):
+    make_nan = _make_nan_after(0.5)
+    with pytest.raises(AssertionError) as excinfo:
+        perform_simulation(
+            update_regimen_components=[
+                ApplyVelocity(),
+                make_nan,
+                ApplyIncrementElapsedTime(),
+                HaltAfterElapsedTime(1.0),
+            ],
+            validation=validation,
+            check_every=10,
+        )
+    assert excinfo.value.args == (make_nan,)
+
+
+def test_perform_simulation_check_every_bad_args():
+    with pytest.raises(ValueError):
+        perform_simulation(check_every=0)
+
+
+def test_perform_simulation_dtype():
+    state = perform_simulation(dtype=np.float32)
+    assert state.dtype == np.float32
+    assert state.t > 10.0
+    assert state.validate()
+
+
+def test_perform_simulation_float32_drift():
+    # float32 trajectories and fitnesses should closely track float64;
+    # measured position drift is below 1e-4 over one second of simulation
+    # and below about 1e-2 over five seconds, and fitnesses match
+    def run(dtype: type, seed: int) -> typing.Tuple[State, float]:
+        params = Params(dtype=dtype)
+        np.random.seed(seed)
+        structure = Structure.make_random(params=params)
+        setup_regimen_conditioners = [ApplyPropel(dvx=5, dvy=5)]
+        state = perform_simulation(
+            setup_regimen_conditioners,
+            [
+                *get_default_update_regimen(params, structure),
+                HaltAfterElapsedTime(1.0),
+            ],
+            dtype=dtype,
+        )
+        fitness = perform_simulation(
+            setup_regimen_conditioners,
+            [
+                *get_default_update_regimen(params, structure),
+                EvaluateDuration(HaltPastFinishLine(m=0.2, b=12.0)),
+            ],
+            dtype=dtype,
+        )
+        return state, fitness
+
+    for seed in range(3):
+        state64, fitness64 = run(np.float64, seed)
+        state32, fitness32 = run(np.float32, seed)
+        assert state32.dtype == np.float32
+        assert np.allclose(state32.px, state64.px, rtol=0, atol=1e-4)
+        assert np.allclose(state32.py, state64.py, rtol=0, atol=1e-4)
+        assert np.isclose(fitness32, fitness64, rtol=0, atol=1e-2)
+
+
+def test_perform_simulation_auto_dt():
+    np.random.seed(1)
+    structure = Structure.make_random()
+    state = perform_simulation(structure=structure, auto_dt=True)
+    assert state.validate()
+    assert state.t >= 10.0
+    assert state.px.shape == (structure.height, structure.width)
+
+
+def test_perform_simulation_structure_shape():
+    structure = Structure(height=4, width=6)
+    state = perform_simulation(structure=structure)
+    assert state.px.shape == (4, 6)
+
+
+def test_perform_simulation_auto_dt_bad_args():
+    regimen = [ApplyIncrementElapsedTime(), HaltAfterElapsedTime(1.0)]
+    with pytest.raises(ValueError):
+        perform_simulation(update_regimen_components=regimen, auto_dt=True)
+    with pytest.raises(ValueError):
+        perform_simulation(update_regimen_components=regimen, num_tiles=2)
+    with pytest.raises(ValueError):
+        perform_simulation(update_regimen_components=regimen, num_processes=2)
+    with pytest.raises(ValueError):
+        perform_simulation(update_regimen_components=regimen, coarsen_factor=2)
+    with pytest.raises(ValueError):
+        perform_simulation(
+            update_regimen_components=regimen, sleep_threshold=1e-2
+        )
+    with pytest.raises(ValueError):
+        perform_simulation(
+            update_regimen_components=regimen, structure=Structure()
+        )
+
+
+def test_perform_simulation_num_tiles():
+    np.random.seed(1)
+    structure = Structure.make_random(height=24, width=12)
+    state1 = perform_simulation(structure=structure)
+    state2 = perform_simulation(structure=structure, num_tiles=4)
+    assert state2.validate()
+    assert state1.same_position_as(state2)
+
+
+def test_perform_simulation_num_processes():
+    np.random.seed(1)
+    structure = Structure.make_random(height=24, width=12)
+    state1 = perform_simulation(structure=structure)
+    state2 = perform_simulation(structure=structure, num_processes=3)
+    assert state2.validate()
+    assert state1.same_position_as(state2)
+    assert state1.same_velocity_as(state2)
+
+
+def test_perform_simulation_coarsen_factor():
+    structure = Structure(height=12, width=12)
+    state1 = perform_simulation(structure=structure)
+    state2 = perform_simulation(structure=structure, coarsen_factor=2)
+    assert state2.validate()
+    assert state2.t == state1.t
+    assert np.isclose(state2.px.mean(), state1.px.mean(), atol=0.5)
+    assert np.isclose(state2.py.mean(), state1.py.mean(), atol=0.5)
+
+
+def test_perform_simulation_sleep_threshold():
+    structure = Structure(height=12, width=8)
+    state1 = perform_simulation(structure=structure)
+    state2 = perform_simulation(structure=structure, sleep_threshold=0.1)
+    assert state2.validate()
+    assert state2.t == state1.t
+    assert state2.py.min() >= 0.0
+    assert np.isclose(state2.px.mean(), state1.px.mean(), atol=0.5)
+    assert np.isclose(state2.py.mean(), state1.py.mean(), atol=0.5)
+
+
+@pytest.mark.parametrize("kwargs", [{"num_tiles": 2}, {"num_processes": 2}])
+def test_perform_simulation_check_every_decomposed(
+    kwargs: typing.Dict[str, int],
+):
+    structure = Structure(height=12, width=8)
+    state1 = perform_simulation(structure=structure, **kwargs)
+    state2 = perform_simulation(structure=structure, check_every=7, **kwargs)
+    assert state1.t == state2.t
+    assert state1.same_position_as(state2)
+    assert state1.same_velocity_as(state2)
+
+
+def test_perform_simulation_check_every_coarsen_factor():
+    structure = Structure(height=12, width=8)
+    state1 = perform_simulation(structure=structure, coarsen_factor=2)
+    state2 = perform_simulation(
+        structure=structure, coarsen_factor=2, check_every=7
+    )
+    assert state1.t == state2.t
+    assert np.allclose(state1.px, state2.px, atol=1e-2)
+    assert np.allclose(state1.py, state2.py, atol=1e-2)
@@ -1,5 +1,5 @@
 from pylib.microsoro import State, Style
-from pylib.microsoro.events import RenderFloorEvent
+from pylib.microsoro.events import RenderFloorEvent, RenderTerrainEvent
 from pylib.microsoro.viz import DrawPygletFloor
 
 
@@ -18,3 +18,10 @@ def test_smoke():
     ftor(RenderFloorEvent(m=0, b=0))
     ftor(RenderFloorEvent(m=1, b=0))
     ftor(RenderFloorEvent(m=1, b=1))
+
+
+def test_smoke_terrain():
+    ftor = DrawPygletFloor()
+    ftor(RenderTerrainEvent(x=(0.0, 1.0), y=(0.0, 0.0)))
+    ftor(RenderTerrainEvent(x=(-5.0, 2.0, 4.0, 30.0), y=(1.0, -1.0, 3.0, 2.0)))
+    ftor(RenderTerrainEvent(x=(0.0, 1.0), y=(-100.0, -100.0)))